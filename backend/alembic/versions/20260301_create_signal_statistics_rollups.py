@@ -0,0 +1,121 @@
+"""create signal_statistics_rollups table
+
+Revision ID: 20260301_signal_statistics_rollups
+Revises: 20260222_add_low_history_flag_to_ohlcv, 20260220_journal_entries
+Create Date: 2026-03-01
+
+Pre-aggregated signal statistics for the performance dashboard, one row per
+day x signal_type x symbol x lifecycle_state x rejection stage/reason.
+Maintained incrementally by Signal mapper events (src/orm/signal_statistics.py);
+this migration backfills it from the existing signals.
+
+Table Structure:
+- day, signal_type, symbol, lifecycle_state, rejection_stage,
+  rejection_reason: Composite primary key (rejection columns are '' except
+  for rejected signals with validation results)
+- signal_count, confidence_sum: Counts and confidence totals
+- winning_count, r_multiple_sum, r_multiple_count, pnl_sum: trade_outcome
+  aggregates
+- updated_at: Last change (TIMESTAMPTZ)
+
+Indexes:
+- idx_signal_statistics_rollups_symbol_day: Per-symbol range reads
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260301_signal_statistics_rollups"
+down_revision: Union[str, Sequence[str], None] = (
+    "20260222_add_low_history_flag_to_ohlcv",
+    "20260220_journal_entries",
+)
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create signal_statistics_rollups table and backfill it from signals."""
+
+    op.create_table(
+        "signal_statistics_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("signal_type", sa.String(10), primary_key=True),
+        sa.Column("symbol", sa.String(20), primary_key=True),
+        sa.Column("lifecycle_state", sa.String(20), primary_key=True),
+        sa.Column("rejection_stage", sa.String(50), primary_key=True, server_default=""),
+        sa.Column("rejection_reason", sa.String(255), primary_key=True, server_default=""),
+        sa.Column("signal_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("confidence_sum", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("winning_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("r_multiple_sum", sa.NUMERIC(24, 8), nullable=False, server_default="0"),
+        sa.Column("r_multiple_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("pnl_sum", sa.NUMERIC(24, 8), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+
+    op.create_index(
+        "idx_signal_statistics_rollups_symbol_day",
+        "signal_statistics_rollups",
+        ["symbol", "day"],
+        unique=False,
+    )
+
+    # Backfill with the same contribution rules as signal_rollup_row()
+    op.execute(
+        """
+        WITH contributions AS (
+            SELECT
+                (created_at AT TIME ZONE 'UTC')::date AS day,
+                signal_type,
+                symbol,
+                lifecycle_state,
+                CASE WHEN lifecycle_state = 'rejected' AND validation_results IS NOT NULL
+                    THEN LEFT(COALESCE(
+                        NULLIF(validation_results->>'rejection_stage', ''), 'Unknown'), 50)
+                    ELSE '' END AS rejection_stage,
+                CASE WHEN lifecycle_state = 'rejected' AND validation_results IS NOT NULL
+                    THEN LEFT(COALESCE(
+                        NULLIF(validation_results->>'rejection_reason', ''), 'Unknown'), 255)
+                    ELSE '' END AS rejection_reason,
+                confidence_score,
+                (trade_outcome->>'pnl_dollars')::numeric AS pnl,
+                (trade_outcome->>'r_multiple')::numeric AS r_multiple
+            FROM signals
+        )
+        INSERT INTO signal_statistics_rollups (
+            day, signal_type, symbol, lifecycle_state, rejection_stage, rejection_reason,
+            signal_count, confidence_sum, winning_count,
+            r_multiple_sum, r_multiple_count, pnl_sum
+        )
+        SELECT
+            day, signal_type, symbol, lifecycle_state, rejection_stage, rejection_reason,
+            COUNT(*),
+            COALESCE(SUM(confidence_score), 0),
+            COUNT(*) FILTER (WHERE pnl > 0),
+            COALESCE(SUM(r_multiple), 0),
+            COUNT(r_multiple),
+            COALESCE(SUM(pnl), 0)
+        FROM contributions
+        GROUP BY day, signal_type, symbol, lifecycle_state, rejection_stage, rejection_reason
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove signal_statistics_rollups table."""
+
+    op.drop_index(
+        "idx_signal_statistics_rollups_symbol_day", table_name="signal_statistics_rollups"
+    )
+    op.drop_table("signal_statistics_rollups")
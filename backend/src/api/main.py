@@ -705,7 +705,8 @@ async def shutdown_event() -> None:
     FastAPI shutdown event handler.
 
     Gracefully stops the real-time pattern scanner, market data feed,
-    signal approval expiration task, and circuit breaker scheduler.
+    signal approval expiration task, circuit breaker scheduler and worker
+    process pools.
     """
     global _coordinator
 
@@ -751,6 +752,22 @@ async def shutdown_event() -> None:
         except Exception as e:
             logger.error("market_data_coordinator_stop_failed", error=str(e))
 
+    # Stop orchestrator stage worker pools (executor_mode="process")
+    try:
+        from src.orchestrator.process_executor import shutdown_process_pools
+
+        await asyncio.to_thread(shutdown_process_pools)
+    except Exception as e:
+        logger.error("orchestrator_process_pool_stop_failed", error=str(e))
+
+    # Stop backtest job runner worker pool
+    try:
+        from src.backtesting.job_runner import shutdown_backtest_job_runner
+
+        await shutdown_backtest_job_runner()
+    except Exception as e:
+        logger.error("backtest_job_runner_stop_failed", error=str(e))
+
     # Disconnect broker adapters (Story 23.12)
     broker_router = getattr(app.state, "broker_router", None)
     if broker_router:
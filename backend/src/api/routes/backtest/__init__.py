@@ -9,6 +9,7 @@ This package organizes backtest-related endpoints into focused modules:
 - walk_forward.py: Walk-forward testing endpoints (Story 12.4)
 - regression.py: Regression testing endpoints (Story 12.7)
 - baseline.py: Regression baseline endpoints (Story 12.7)
+- jobs.py: Job runner status and cancellation endpoints
 - utils.py: Shared utilities (in-memory tracking, data fetching)
 
 All routes are aggregated under the /api/v1/backtest prefix.
@@ -19,6 +20,7 @@ from fastapi import APIRouter
 from .baseline import router as baseline_router
 from .compare import router as compare_router
 from .full import router as full_router
+from .jobs import router as jobs_router
 from .preview import router as preview_router
 from .regression import router as regression_router
 from .reports import router as reports_router
@@ -35,6 +37,7 @@ router.include_router(walk_forward_router)
 router.include_router(regression_router)
 router.include_router(baseline_router)
 router.include_router(compare_router)
+router.include_router(jobs_router)
 
 # Export in-memory tracking dicts for backwards compatibility
 from .utils import backtest_runs, cleanup_stale_entries, regression_test_runs, walk_forward_runs
@@ -17,15 +17,21 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.websocket import manager
 from src.backtesting.engine.backtest_engine import UnifiedBacktestEngine
 from src.backtesting.engine.cost_model import ZeroCostModel
 from src.backtesting.engine.interfaces import EngineConfig
 from src.backtesting.engine.validated_detector import ValidatedSignalDetector
 from src.backtesting.engine.wyckoff_detector import WyckoffSignalDetector
+from src.backtesting.job_runner import (
+    JobCancelledError,
+    ProgressReporter,
+    get_backtest_job_runner,
+)
 from src.backtesting.position_manager import PositionManager
 from src.backtesting.risk_integration import BacktestRiskManager
 from src.database import async_session_maker, get_db
-from src.models.backtest import BacktestConfig
+from src.models.backtest import BacktestConfig, BacktestProgressUpdate, BacktestResult
 from src.repositories.backtest_repository import BacktestRepository
 
 from .utils import backtest_runs, cleanup_stale_entries, fetch_historical_bars
@@ -154,7 +160,8 @@ async def get_backtest_result(
 
     Example Response (Running):
         {
-            "status": "RUNNING"
+            "status": "RUNNING",
+            "progress": {"bars_analyzed": 120, "total_bars": 250, "percent_complete": 48}
         }
 
     Example Response (Completed):
@@ -170,10 +177,15 @@ async def get_backtest_result(
     if backtest_run_id in backtest_runs:
         run_status = backtest_runs[backtest_run_id]["status"]
         if run_status == "RUNNING":
-            return {"status": "RUNNING"}
+            progress = backtest_runs[backtest_run_id].get("progress")
+            return (
+                {"status": "RUNNING", "progress": progress} if progress else {"status": "RUNNING"}
+            )
         elif run_status == "FAILED":
             error = backtest_runs[backtest_run_id].get("error", "Unknown error")
             return {"status": "FAILED", "error": error}
+        elif run_status == "CANCELLED":
+            return {"status": "CANCELLED"}
 
     # Check database for completed result
     repository = BacktestRepository(session)
@@ -293,6 +305,50 @@ async def list_backtest_results(
     }
 
 
+def execute_backtest(
+    config: BacktestConfig,
+    bars: list,
+    *,
+    progress: ProgressReporter,
+) -> BacktestResult:
+    """
+    Job function: build the Wyckoff pipeline and run the unified engine.
+
+    Runs in a backtest job runner worker process, so everything it needs is
+    constructed here from picklable arguments.
+
+    Args:
+        config: Backtest configuration
+        bars: Historical OHLCV bars (chronological)
+        progress: Job progress reporter
+
+    Returns:
+        BacktestResult from UnifiedBacktestEngine
+    """
+    # Build Wyckoff signal detection pipeline
+    wyckoff_detector = WyckoffSignalDetector()
+    validated_detector = ValidatedSignalDetector(wyckoff_detector)
+
+    # Build engine dependencies
+    cost_model = ZeroCostModel()
+    position_manager = PositionManager(config.initial_capital)
+    engine_config = EngineConfig(
+        initial_capital=config.initial_capital,
+        max_position_size=config.max_position_size,
+        timeframe=config.timeframe,  # Story 13.5 C-2 Fix: Pass timeframe for Sharpe calculation
+    )
+    risk_manager = BacktestRiskManager(initial_capital=config.initial_capital)
+
+    engine = UnifiedBacktestEngine(
+        signal_detector=validated_detector,
+        cost_model=cost_model,
+        position_manager=position_manager,
+        config=engine_config,
+        risk_manager=risk_manager,
+    )
+    return engine.run(bars, progress_callback=progress.bar_progress_callback())
+
+
 async def run_backtest_task(
     run_id: UUID,
     config: BacktestConfig,
@@ -302,6 +358,10 @@ async def run_backtest_task(
 
     AC7 Subtask 8.4-8.10: Execute engine, save to database via repository.
 
+    The CPU-bound engine run is submitted to the backtest job runner (worker
+    process pool), so it never blocks the event loop. Progress is mirrored
+    into backtest_runs and broadcast over WebSocket.
+
     Bug C-3 (verified 2026-02): This task creates its own database session
     via ``async with async_session_maker() as session`` rather than accepting
     the request-scoped session (which is closed after the HTTP 202 response).
@@ -317,37 +377,46 @@ async def run_backtest_task(
     try:
         logger.info("Starting backtest execution", extra={"backtest_run_id": str(run_id)})
 
-        # Fetch historical data
-        bars = await fetch_historical_bars(config.symbol, config.start_date, config.end_date)
+        # Fetch historical data (own session, closed before the engine runs)
+        async with async_session_maker() as session:
+            bars = await fetch_historical_bars(
+                config.symbol, config.start_date, config.end_date, session=session
+            )
 
         if not bars:
             raise ValueError(f"No historical data found for {config.symbol}")
 
-        # Build Wyckoff signal detection pipeline
-        wyckoff_detector = WyckoffSignalDetector()
-        validated_detector = ValidatedSignalDetector(wyckoff_detector)
-
-        # Build engine dependencies
-        cost_model = ZeroCostModel()
-        position_manager = PositionManager(config.initial_capital)
-        engine_config = EngineConfig(
-            initial_capital=config.initial_capital,
-            max_position_size=config.max_position_size,
-            timeframe=config.timeframe,  # Story 13.5 C-2 Fix: Pass timeframe for Sharpe calculation
-        )
-        risk_manager = BacktestRiskManager(initial_capital=config.initial_capital)
-
-        # Create and run unified backtest engine.
-        # engine.run() is synchronous and CPU-bound, so run it in a thread
-        # to avoid blocking the async event loop.
-        engine = UnifiedBacktestEngine(
-            signal_detector=validated_detector,
-            cost_model=cost_model,
-            position_manager=position_manager,
-            config=engine_config,
-            risk_manager=risk_manager,
+        sequence_number = 0
+
+        async def progress_callback(bars_analyzed: int, total_bars: int, percent_complete: int):
+            nonlocal sequence_number
+            sequence_number += 1
+
+            backtest_runs[run_id]["progress"] = {
+                "bars_analyzed": bars_analyzed,
+                "total_bars": total_bars,
+                "percent_complete": percent_complete,
+            }
+
+            progress_msg = BacktestProgressUpdate(
+                sequence_number=sequence_number,
+                backtest_run_id=run_id,
+                bars_analyzed=bars_analyzed,
+                total_bars=total_bars,
+                percent_complete=percent_complete,
+                timestamp=datetime.now(UTC),
+            )
+            await manager.broadcast(progress_msg.model_dump(mode="json"))
+
+        # Run the unified backtest engine in the job runner's worker pool
+        result = await get_backtest_job_runner().run(
+            "backtest",
+            execute_backtest,
+            config,
+            bars,
+            job_id=run_id,
+            on_progress=progress_callback,
         )
-        result = await asyncio.to_thread(engine.run, bars)
 
         # Update result with correct run_id
         result.backtest_run_id = run_id
@@ -369,6 +438,10 @@ async def run_backtest_task(
             },
         )
 
+    except JobCancelledError:
+        backtest_runs[run_id]["status"] = "CANCELLED"
+        logger.info("Backtest cancelled", extra={"backtest_run_id": str(run_id)})
+
     except Exception as e:
         # Handle errors
         backtest_runs[run_id]["status"] = "FAILED"
@@ -0,0 +1,103 @@
+"""
+Backtest job endpoints.
+
+Endpoints:
+- GET /jobs: List backtest jobs and per-type queue stats
+- GET /jobs/{job_id}: Get job status and latest progress
+- DELETE /jobs/{job_id}: Cancel a queued or running job
+
+Jobs are the worker-pool executions behind POST /run, /preview,
+/regression and /walk-forward; a job's ID is the run/test ID returned by
+those endpoints.
+"""
+
+import logging
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, status
+
+from src.backtesting.job_runner import get_backtest_job_runner
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("/jobs")
+async def list_backtest_jobs(job_type: str | None = None) -> dict:
+    """
+    List backtest jobs, newest first.
+
+    Args:
+        job_type: Optional filter ("backtest", "preview", "regression", "walk_forward")
+
+    Returns:
+        Jobs plus queued/running counts and concurrency limit per job type
+
+    Example Response:
+        {
+            "jobs": [{"job_id": "...", "job_type": "backtest", "status": "RUNNING", ...}],
+            "stats": {"backtest": {"queued": 1, "running": 2, "limit": 2}, ...}
+        }
+    """
+    runner = get_backtest_job_runner()
+    return {
+        "jobs": [job.to_dict() for job in runner.list_jobs(job_type)],
+        "stats": runner.get_stats(),
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_backtest_job(job_id: UUID) -> dict:
+    """
+    Get a backtest job's status and latest progress.
+
+    Args:
+        job_id: Job identifier (run/test ID)
+
+    Returns:
+        Job status record
+
+    Raises:
+        404 Not Found: Unknown job
+    """
+    job = get_backtest_job_runner().get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Backtest job {job_id} not found"
+        )
+    return job.to_dict()
+
+
+@router.delete("/jobs/{job_id}")
+async def cancel_backtest_job(job_id: UUID) -> dict:
+    """
+    Cancel a queued or running backtest job.
+
+    Queued jobs are removed immediately; running jobs stop at their next
+    progress checkpoint.
+
+    Args:
+        job_id: Job identifier (run/test ID)
+
+    Returns:
+        Job status record after cancellation
+
+    Raises:
+        404 Not Found: Unknown job
+        409 Conflict: Job already finished
+    """
+    runner = get_backtest_job_runner()
+    job = runner.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Backtest job {job_id} not found"
+        )
+
+    if not runner.cancel(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Backtest job {job_id} already {job.status.value}",
+        )
+
+    logger.info("Backtest job cancelled", extra={"job_id": str(job_id)})
+    return job.to_dict()
@@ -11,6 +11,7 @@ Provides quick backtest previews without full execution.
 import asyncio
 import logging
 from datetime import UTC, date, datetime
+from typing import Any
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -18,8 +19,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.websocket import manager
 from src.backtesting.engine import BacktestEngine as PreviewEngine
+from src.backtesting.job_runner import (
+    JobCancelledError,
+    ProgressReporter,
+    get_backtest_job_runner,
+)
 from src.database import async_session_maker, get_db
 from src.models.backtest import (
+    BacktestComparison,
     BacktestCompletedMessage,
     BacktestConfig,
     BacktestPreviewRequest,
@@ -173,6 +180,45 @@ async def get_backtest_status(run_id: UUID) -> dict:
     return {"status": run["status"], "progress": run["progress"], "error": run.get("error")}
 
 
+async def execute_preview(
+    run_id: UUID,
+    current_config: dict[str, Any],
+    proposed_config: dict[str, Any],
+    historical_bars: list[dict[str, Any]],
+    *,
+    progress: ProgressReporter,
+) -> BacktestComparison:
+    """
+    Job function: run the preview engine in a job runner worker.
+
+    Args:
+        run_id: Backtest run identifier
+        current_config: Current system configuration
+        proposed_config: Proposed configuration changes
+        historical_bars: Historical bars as dicts
+        progress: Job progress reporter
+
+    Returns:
+        BacktestComparison from the preview engine
+    """
+
+    async def progress_callback(bars_analyzed: int, total_bars: int, percent_complete: int):
+        progress.report(
+            bars_analyzed=bars_analyzed,
+            total_bars=total_bars,
+            percent_complete=percent_complete,
+        )
+
+    engine = PreviewEngine(progress_callback=progress_callback)
+    return await engine.run_preview(
+        backtest_run_id=run_id,
+        current_config=current_config,
+        proposed_config=proposed_config,
+        historical_bars=historical_bars,
+        timeout_seconds=300,  # 5 minutes
+    )
+
+
 async def run_backtest_preview_task(run_id: UUID, request: BacktestPreviewRequest) -> None:
     """
     Background task to execute backtest preview.
@@ -233,21 +279,20 @@ async def run_backtest_preview_task(run_id: UUID, request: BacktestPreviewReques
 
             await manager.broadcast(progress_msg.model_dump(mode="json"))
 
-        # Initialize and run backtest engine (Story 11.2 preview engine)
-        print("[TASK DEBUG] Creating PreviewEngine", flush=True)
-        engine = PreviewEngine(progress_callback=progress_callback)
-        print("[TASK DEBUG] PreviewEngine created", flush=True)
-
+        # Run the preview engine (Story 11.2) in the job runner's worker pool
         try:
-            print("[TASK DEBUG] About to call engine.run_preview()", flush=True)
-            comparison = await engine.run_preview(
-                backtest_run_id=run_id,
-                current_config=current_config,
-                proposed_config=request.proposed_config,
-                historical_bars=historical_bars,
-                timeout_seconds=300,  # 5 minutes
+            logger.debug("Submitting preview job", extra={"backtest_run_id": str(run_id)})
+            comparison = await get_backtest_job_runner().run(
+                "preview",
+                execute_preview,
+                run_id,
+                current_config,
+                request.proposed_config,
+                historical_bars,
+                job_id=run_id,
+                on_progress=progress_callback,
             )
-            print("[TASK DEBUG] engine.run_preview() completed", flush=True)
+            logger.debug("Preview job completed", extra={"backtest_run_id": str(run_id)})
 
             # Mark as completed
             print("[TASK DEBUG] Marking backtest as completed", flush=True)
@@ -343,6 +388,10 @@ async def run_backtest_preview_task(run_id: UUID, request: BacktestPreviewReques
                 },
             )
 
+    except JobCancelledError:
+        backtest_runs[run_id]["status"] = "CANCELLED"
+        logger.info("Backtest preview cancelled", extra={"backtest_run_id": str(run_id)})
+
     except Exception as e:
         # Handle errors
         backtest_runs[run_id]["status"] = "failed"
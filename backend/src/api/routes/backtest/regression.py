@@ -17,8 +17,13 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import async_session_maker, get_db
-from src.models.backtest import RegressionTestConfig
+from src.backtesting.job_runner import (
+    JobCancelledError,
+    ProgressReporter,
+    get_backtest_job_runner,
+)
+from src.database import get_db, isolated_session
+from src.models.backtest import RegressionTestConfig, RegressionTestResult
 from src.repositories.regression_baseline_repository import RegressionBaselineRepository
 from src.repositories.regression_test_repository import RegressionTestRepository
 
@@ -119,6 +124,45 @@ async def run_regression_test(
     return {"test_id": test_id, "status": "RUNNING"}
 
 
+async def execute_regression_test(
+    config: RegressionTestConfig,
+    *,
+    progress: ProgressReporter,
+) -> RegressionTestResult:
+    """
+    Job function: run a regression test in a job runner worker.
+
+    Creates its own database session on a per-job engine (inside the
+    worker process, on this job's event loop) rather than using the
+    request-scoped session, which is closed after the HTTP 202 response is
+    sent. Progress is reported, and cancellation checked, once per symbol.
+
+    Args:
+        config: RegressionTestConfig
+        progress: Job progress reporter
+
+    Returns:
+        RegressionTestResult
+    """
+    from src.backtesting.regression_test_engine import RegressionTestEngine
+
+    async with isolated_session() as session:
+        # Create repositories
+        test_repo = RegressionTestRepository(session)
+        baseline_repo = RegressionBaselineRepository(session)
+
+        # Create engine
+        engine = RegressionTestEngine(
+            test_repository=test_repo,
+            baseline_repository=baseline_repo,
+        )
+
+        # Run regression test
+        return await engine.run_regression_test(
+            config, progress_callback=progress.step_progress_callback()
+        )
+
+
 async def run_regression_test_task(
     test_id: UUID,
     config: RegressionTestConfig,
@@ -126,32 +170,22 @@ async def run_regression_test_task(
     """
     Background task to execute regression test.
 
-    Creates its own database session rather than using the request-scoped
-    session, which is closed after the HTTP 202 response is sent.
+    Submits execute_regression_test to the backtest job runner (worker
+    process pool) and records the outcome in regression_test_runs.
 
     Args:
         test_id: Test identifier
         config: RegressionTestConfig
     """
-    from src.backtesting.regression_test_engine import RegressionTestEngine
-
     try:
         logger.info("Starting regression test execution", extra={"test_id": str(test_id)})
 
-        # Create a fresh session for the background task (not request-scoped)
-        async with async_session_maker() as session:
-            # Create repositories
-            test_repo = RegressionTestRepository(session)
-            baseline_repo = RegressionBaselineRepository(session)
-
-            # Create engine
-            engine = RegressionTestEngine(
-                test_repository=test_repo,
-                baseline_repository=baseline_repo,
-            )
-
-            # Run regression test
-            result = await engine.run_regression_test(config)
+        result = await get_backtest_job_runner().run(
+            "regression",
+            execute_regression_test,
+            config,
+            job_id=test_id,
+        )
 
         # Update status
         regression_test_runs[test_id]["status"] = result.status
@@ -166,6 +200,10 @@ async def run_regression_test_task(
             },
         )
 
+    except JobCancelledError:
+        regression_test_runs[test_id]["status"] = "CANCELLED"
+        logger.info("Regression test cancelled", extra={"test_id": str(test_id)})
+
     except Exception as e:
         logger.error(
             "Regression test failed",
@@ -227,6 +265,8 @@ async def get_regression_test_result(
                 "status": "FAILED",
                 "error": run_info.get("error"),
             }
+        elif run_info["status"] == "CANCELLED":
+            return {"test_id": test_id, "status": "CANCELLED"}
 
     # Query database
     repository = RegressionTestRepository(session)
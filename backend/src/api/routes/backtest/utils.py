@@ -8,6 +8,7 @@ This module provides common functionality used across backtest route modules:
 - Synthetic data generation
 """
 
+import asyncio
 import logging
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
@@ -183,21 +184,72 @@ async def get_current_configuration(session: AsyncSession) -> dict:
     }
 
 
-async def fetch_historical_bars(symbol: str, start_date: date, end_date: date) -> list[OHLCVBar]:
+async def fetch_historical_bars(
+    symbol: str,
+    start_date: date,
+    end_date: date,
+    session: AsyncSession | None = None,
+    timeframe: str = "1d",
+) -> list[OHLCVBar]:
     """
     Fetch historical OHLCV bars for backtest.
 
-    In production, this would query the OHLCV repository.
-    For MVP, generates sample data.
+    When the local Parquet bar store is enabled (settings.bar_store_path),
+    bars are read from it, after syncing any database bars missing at
+    either end of the stored range when a session is given. If the store
+    does not cover start_date (the sync failed), or the store is disabled,
+    stored bars are read from the database through the repository's lean
+    read path (no per-row validation). If no bars are found, generates
+    sample daily data (MVP).
 
     Args:
         symbol: Trading symbol
         start_date: Start date
         end_date: End date
+        session: Optional database session for stored bars
+        timeframe: Bar timeframe for stored bars (default: "1d")
 
     Returns:
         List of OHLCV bars
     """
+    from src.backtesting.bar_store import get_bar_store
+    from src.repositories.ohlcv_repository import OHLCVRepository
+
+    range_start = datetime.combine(start_date, datetime.min.time(), tzinfo=UTC)
+    range_end = datetime.combine(end_date, datetime.max.time(), tzinfo=UTC)
+
+    bar_store = get_bar_store()
+    stored_bars: list[OHLCVBar] = []
+    if bar_store is not None and session is not None:
+        try:
+            await bar_store.sync_from_repository(
+                OHLCVRepository(session), symbol, timeframe, start_date=range_start
+            )
+        except Exception as e:
+            logger.warning(
+                "Bar store sync failed, reading bars from the database",
+                extra={"symbol": symbol, "timeframe": timeframe, "error": str(e)},
+            )
+
+    if bar_store is not None and (
+        session is None or bar_store.covers_start(symbol, timeframe, range_start)
+    ):
+        stored_bars = await asyncio.to_thread(
+            bar_store.read_bars, symbol, timeframe, range_start, range_end
+        )
+    elif session is not None:
+        stored_bars = await OHLCVRepository(session).get_bars_lean(
+            symbol, timeframe, start_date=range_start, end_date=range_end
+        )
+
+    if stored_bars:
+        return stored_bars
+    if bar_store is not None or session is not None:
+        logger.info(
+            "No stored bars for backtest range, using sample data",
+            extra={"symbol": symbol, "timeframe": timeframe},
+        )
+
     bars = []
     current_date = start_date
 
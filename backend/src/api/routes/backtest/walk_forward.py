@@ -19,8 +19,13 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.backtesting.job_runner import (
+    JobCancelledError,
+    ProgressReporter,
+    get_backtest_job_runner,
+)
 from src.database import async_session_maker, get_db
-from src.models.backtest import WalkForwardConfig
+from src.models.backtest import WalkForwardConfig, WalkForwardResult
 from src.repositories.walk_forward_repository import WalkForwardRepository
 
 from .utils import cleanup_stale_entries, walk_forward_runs
@@ -29,6 +34,36 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def execute_walk_forward(
+    config: WalkForwardConfig,
+    bars_by_symbol: dict[str, list],
+    *,
+    progress: ProgressReporter,
+) -> WalkForwardResult:
+    """
+    Job function: run a walk-forward test in a job runner worker.
+
+    Windows run sequentially: the job runner already sizes its worker pool
+    to the host, so a nested per-job pool would oversubscribe the CPUs and
+    copy every symbol's bars into each of its workers. Progress is reported,
+    and cancellation checked, once per window.
+
+    Args:
+        config: Walk-forward configuration
+        bars_by_symbol: Historical OHLCV bars per symbol covering the overall date range
+        progress: Job progress reporter
+
+    Returns:
+        WalkForwardResult
+    """
+    from src.backtesting.walk_forward_engine import WalkForwardEngine
+
+    engine = WalkForwardEngine(market_data=bars_by_symbol)
+    return engine.walk_forward_test(
+        config.symbols, config, progress_callback=progress.step_progress_callback()
+    )
+
+
 @router.post(
     "/walk-forward",
     status_code=status.HTTP_202_ACCEPTED,
@@ -61,8 +96,6 @@ async def start_walk_forward_test(
             "estimated_duration_seconds": 300
         }
     """
-    from src.backtesting.walk_forward_engine import WalkForwardEngine
-
     # Check for concurrent test limit (MVP: max 3 concurrent)
     running_tests = sum(1 for run in walk_forward_runs.values() if run["status"] == "RUNNING")
     if running_tests >= 3:
@@ -88,13 +121,24 @@ async def start_walk_forward_test(
         try:
             from .utils import fetch_historical_bars
 
-            bars = await fetch_historical_bars(
-                config.symbols[0],
-                config.overall_start_date,
-                config.overall_end_date,
+            async with async_session_maker() as bg_session:
+                bars_by_symbol = {
+                    symbol: await fetch_historical_bars(
+                        symbol,
+                        config.overall_start_date,
+                        config.overall_end_date,
+                        session=bg_session,
+                    )
+                    for symbol in config.symbols
+                }
+            # CPU-bound window loop runs in the job runner's worker pool
+            result = await get_backtest_job_runner().run(
+                "walk_forward",
+                execute_walk_forward,
+                config,
+                bars_by_symbol,
+                job_id=walk_forward_id,
             )
-            engine = WalkForwardEngine(market_data=bars)
-            result = engine.walk_forward_test(config.symbols, config)
 
             # Save to database using a fresh session (not request-scoped)
             async with async_session_maker() as bg_session:
@@ -105,6 +149,9 @@ async def start_walk_forward_test(
             walk_forward_runs[walk_forward_id]["status"] = "COMPLETED"
             walk_forward_runs[walk_forward_id]["result"] = result
 
+        except JobCancelledError:
+            walk_forward_runs[walk_forward_id]["status"] = "CANCELLED"
+
         except Exception as e:
             logger.error(f"Walk-forward test failed: {e}")
             walk_forward_runs[walk_forward_id]["status"] = "FAILED"
@@ -170,6 +217,11 @@ async def get_walk_forward_result(
                 "status": "FAILED",
                 "error": run_info.get("error"),
             }
+        elif run_info["status"] == "CANCELLED":
+            return {
+                "walk_forward_id": str(walk_forward_id),
+                "status": "CANCELLED",
+            }
 
     # Query database
     repository = WalkForwardRepository(session)
@@ -251,6 +303,7 @@ async def start_walk_forward_suite():
     Returns:
         Response with suite_id and status
     """
+    from src.backtesting.bar_store import get_bar_store
     from src.backtesting.walk_forward_config import get_default_suite_config
     from src.backtesting.walk_forward_suite import WalkForwardSuite
 
@@ -263,7 +316,7 @@ async def start_walk_forward_suite():
         )
 
     config = get_default_suite_config()
-    suite = WalkForwardSuite(config)
+    suite = WalkForwardSuite(config, bar_store=get_bar_store())
     suite_id = uuid4()
 
     # Cleanup stale entries before inserting (same pattern as walk_forward_runs)
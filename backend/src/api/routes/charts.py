@@ -8,12 +8,12 @@ from datetime import datetime
 from typing import Literal, Optional
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies import get_db_session
 from src.models.chart import ChartDataResponse
-from src.repositories.chart_repository import ChartRepository
+from src.services.chart_data_service import ChartDataService
 
 logger = structlog.get_logger(__name__)
 
@@ -34,8 +34,11 @@ router = APIRouter(prefix="/api/v1/charts", tags=["charts"])
     - Includes trading range levels (Creek, Ice, Jump)
     - Includes Wyckoff phase annotations (A, B, C, D, E)
     - Includes preliminary events (PS, SC, AR, ST)
+    - max_points: load the whole date range and downsample it to at most that
+      many candles (for wide zoom levels)
 
-    Performance: Response time < 100ms for 500 bars (p95)
+    Performance: Response time < 100ms for 500 bars (p95); repeated requests
+    for the same window are served from cache until new bars arrive
     """,
 )
 async def get_chart_data(
@@ -48,8 +51,14 @@ async def get_chart_data(
     limit: int = Query(
         500, ge=50, le=2000, description="Maximum number of bars (default: 500, max: 2000)"
     ),
+    max_points: Optional[int] = Query(
+        None,
+        ge=50,
+        le=5000,
+        description="Downsample the full date range to at most this many bars (overrides limit)",
+    ),
     session: AsyncSession = Depends(get_db_session),
-) -> ChartDataResponse:
+) -> Response:
     """Get chart data for symbol and timeframe.
 
     Args:
@@ -58,10 +67,11 @@ async def get_chart_data(
         start_date: Optional start date
         end_date: Optional end date
         limit: Max number of bars (50-2000)
+        max_points: Optional downsampling target (50-5000)
         session: Database session (injected)
 
     Returns:
-        ChartDataResponse with all chart data
+        Serialized ChartDataResponse with all chart data
 
     Raises:
         HTTPException 400: Invalid parameters
@@ -76,6 +86,7 @@ async def get_chart_data(
             start_date=start_date,
             end_date=end_date,
             limit=limit,
+            max_points=max_points,
         )
 
         # Validate symbol
@@ -83,25 +94,24 @@ async def get_chart_data(
         if not symbol:
             raise HTTPException(status_code=400, detail="Symbol is required")
 
-        # Create repository and fetch data
-        repository = ChartRepository(session)
-        chart_data = await repository.get_chart_data(
+        # Cached, pre-serialized payload (skips response model serialization)
+        service = ChartDataService(session)
+        payload = await service.get_chart_payload(
             symbol=symbol,
             timeframe=timeframe,
             start_date=start_date,
             end_date=end_date,
             limit=limit,
+            max_points=max_points,
         )
 
         logger.info(
             "Chart data retrieved successfully",
             symbol=symbol,
-            bar_count=chart_data.bar_count,
-            pattern_count=len(chart_data.patterns),
-            level_line_count=len(chart_data.level_lines),
+            payload_bytes=len(payload),
         )
 
-        return chart_data
+        return Response(content=payload, media_type="application/json")
 
     except ValueError as e:
         logger.warning("Invalid chart data request", symbol=symbol, error=str(e))
@@ -263,7 +263,7 @@ async def get_signal_statistics(
     from src.services.signal_statistics_service import SignalStatisticsService
 
     try:
-        service = SignalStatisticsService(db)
+        service = SignalStatisticsService(db, use_rollups=True)
         response = await service.get_statistics(
             start_date=start_date,
             end_date=end_date,
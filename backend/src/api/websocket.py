@@ -11,6 +11,11 @@ Architecture:
 -------------
 - Native FastAPI WebSocket support (NOT Socket.IO)
 - ConnectionManager: Tracks active connections with UUID + sequence numbers
+- Fan-out broadcast: each event is serialized once and queued per connection;
+  writer tasks drain the bounded queues so a slow client only delays itself
+- Topic subscriptions: clients may narrow their stream to symbols, event types
+  and campaigns; a topic → connections index routes each event to interested
+  sockets only
 - Event emission methods: Integrate with Pattern Engine, Signal Generator, Risk Management
 - Heartbeat/ping every 30 seconds to keep connections alive
 - Graceful disconnect handling with cleanup
@@ -23,6 +28,16 @@ All WebSocket messages include:
 - timestamp: ISO 8601 UTC timestamp
 - data: Message-specific payload (optional)
 
+Subscriptions:
+--------------
+Clients receive every event until they subscribe. After subscribing they only
+receive events matching at least one of their topics:
+- {"action": "subscribe", "topics": ["symbol:AAPL", "type:portfolio:updated"]}
+- {"action": "unsubscribe", "topics": ["symbol:AAPL"]}
+Topics are "symbol:<ticker>", "type:<event type>" or "campaign:<campaign id>".
+The server replies with {"type": "subscriptions", "topics": [...]}; removing the
+last topic returns the client to the full stream.
+
 Event Types:
 ------------
 - connected: Connection established
@@ -44,12 +59,17 @@ Integration Points:
 Author: Story 10.9
 """
 
+import asyncio
+import json
 import time
-from collections import deque
+from bisect import bisect_right, insort
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any, Optional
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Literal, Optional
 from uuid import uuid4
 
+import structlog
 from fastapi import Query, WebSocket, WebSocketDisconnect
 
 from src.api.dependencies import decode_access_token
@@ -57,6 +77,138 @@ from src.api.dependencies import decode_access_token
 if TYPE_CHECKING:
     from src.orm.models import Notification
 
+logger = structlog.get_logger(__name__)
+
+# Recovery buffer TTL (Story 25.13)
+MESSAGE_TTL_SECONDS = 900
+
+# What broadcast does when a client's send queue is full
+OverflowPolicy = Literal["drop_oldest", "disconnect"]
+
+# Subscription topic kinds ("<kind>:<value>")
+TOPIC_KINDS = ("symbol", "type", "campaign")
+
+
+def normalize_topic(topic: str) -> str:
+    """
+    Validate a subscription topic and return its canonical form.
+
+    Symbols are upper-cased; event types and campaign ids are kept as given
+    (event types may themselves contain colons, e.g. "type:signal:new").
+
+    Raises:
+        ValueError: If the topic kind is unknown or the value is empty
+    """
+    kind, _, value = topic.partition(":")
+    kind = kind.strip().lower()
+    value = value.strip()
+    if kind not in TOPIC_KINDS or not value:
+        kinds = ", ".join(TOPIC_KINDS)
+        raise ValueError(f"Invalid topic {topic!r}: expected '<kind>:<value>' with kind in {kinds}")
+    if kind == "symbol":
+        value = value.upper()
+    return f"{kind}:{value}"
+
+
+def message_topics(message: dict[str, Any]) -> set[str]:
+    """
+    Topics an outgoing event belongs to.
+
+    Reads the event type plus any symbol and campaign_id found at the top
+    level of the message or in its "data" payload.
+    """
+    topics: set[str] = set()
+    if message.get("type"):
+        topics.add(f"type:{message['type']}")
+    data = message.get("data")
+    for source in (message, data if isinstance(data, dict) else {}):
+        if source.get("symbol"):
+            topics.add(f"symbol:{str(source['symbol']).upper()}")
+        if source.get("campaign_id"):
+            topics.add(f"campaign:{source['campaign_id']}")
+    return topics
+
+
+class MessageBuffer:
+    """
+    Bounded ring of (global_seq, timestamp, message) entries (Story 25.13).
+
+    Entries are appended in sequence (and therefore time) order, so both
+    recovery filters are binary searches over the ring instead of a scan.
+    Supports the deque operations the manager relies on (append, clear,
+    len, indexing, iteration, maxlen).
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        self.maxlen = maxlen
+        self._entries: list[tuple[int, float, dict[str, Any]]] = []
+        self._start = 0  # Index of the oldest entry once the ring is full
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index: int) -> tuple[int, float, dict[str, Any]]:
+        size = len(self._entries)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("message buffer index out of range")
+        return self._entries[(self._start + index) % size]
+
+    def __iter__(self) -> Iterator[tuple[int, float, dict[str, Any]]]:
+        for index in range(len(self._entries)):
+            yield self[index]
+
+    def append(self, entry: tuple[int, float, dict[str, Any]]) -> None:
+        """Add the newest entry, evicting the oldest when full."""
+        if self._entries and entry[0] < self[-1][0]:
+            # A direct send finished after a later broadcast: restore order
+            ordered = list(self)
+            insort(ordered, entry, key=itemgetter(0))
+            self._entries = ordered[-self.maxlen :]
+            self._start = 0
+        elif len(self._entries) < self.maxlen:
+            self._entries.append(entry)
+        else:
+            self._entries[self._start] = entry
+            self._start = (self._start + 1) % self.maxlen
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._start = 0
+
+    def since(self, since_seq: int, ttl_cutoff: float) -> list[dict[str, Any]]:
+        """Messages with sequence > since_seq and timestamp > ttl_cutoff, oldest first."""
+        first = max(
+            bisect_right(self, since_seq, key=itemgetter(0)),
+            bisect_right(self, ttl_cutoff, key=itemgetter(1)),
+        )
+        return [self[index][2] for index in range(first, len(self._entries))]
+
+
+class ClientConnection:
+    """
+    One WebSocket client: a bounded queue of serialized frames and the
+    writer task that drains it.
+
+    Attributes:
+        websocket: FastAPI WebSocket instance
+        queue: Pending text frames
+        sequence: Number of messages delivered or queued for this client
+        dropped: Frames dropped because the queue was full
+        writer: Task sending queued frames (None until started)
+        topics: Subscribed topics (empty = receive every event)
+    """
+
+    def __init__(self, websocket: WebSocket, queue_size: int) -> None:
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.sequence = 0
+        self.dropped = 0
+        self.writer: asyncio.Task[None] | None = None
+        self.topics: set[str] = set()
+
 
 class ConnectionManager:
     """
@@ -65,16 +217,27 @@ class ConnectionManager:
     Tracks connections with unique IDs and sequence numbers for message ordering.
     Provides methods to emit events to individual connections or broadcast to all.
 
+    Broadcasts serialize each event once and push the frame onto bounded
+    per-connection queues drained by writer tasks, so a slow client only
+    delays itself. When a queue is full the overflow policy either drops the
+    client's oldest frame (it can recover via get_messages_since) or
+    disconnects it.
+
+    Clients that subscribe to topics are indexed by topic, so an event is
+    only queued for connections subscribed to one of its topics plus those
+    that never subscribed.
+
     Attributes:
     -----------
-    active_connections: Dict mapping connection_id to (WebSocket, sequence_number) tuple
+    active_connections: Dict mapping connection_id to ClientConnection
 
     Methods:
     --------
     - connect(websocket): Accept connection, assign UUID, send connected message
     - disconnect(connection_id): Remove connection from tracking
     - send_message(connection_id, message): Send message to specific connection
-    - broadcast(message): Send message to all connected clients
+    - broadcast(message): Send message to all interested clients
+    - subscribe(connection_id, topics) / unsubscribe(connection_id, topics)
     - emit_pattern_detected(...): Emit pattern detection event
     - emit_signal_generated(...): Emit signal generation event
     - emit_signal_executed(...): Emit signal execution event
@@ -84,14 +247,34 @@ class ConnectionManager:
     - emit_campaign_updated(...): Emit campaign update event
     """
 
-    def __init__(self) -> None:
-        """Initialize ConnectionManager with empty connection tracking."""
-        # Maps connection_id to (WebSocket, sequence_number) tuple
-        self.active_connections: dict[str, tuple[WebSocket, int]] = {}
+    def __init__(
+        self,
+        queue_size: int = 256,
+        overflow_policy: OverflowPolicy = "drop_oldest",
+    ) -> None:
+        """
+        Initialize ConnectionManager with empty connection tracking.
+
+        Args:
+            queue_size: Frames buffered per connection before the overflow policy applies
+            overflow_policy: "drop_oldest" drops the client's oldest queued frame,
+                "disconnect" closes the slow client
+        """
+        self.active_connections: dict[str, ClientConnection] = {}
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+
+        # Topic routing: topic -> subscribed connection ids, plus the
+        # connections without subscriptions that receive every event
+        self._subscribers: dict[str, set[str]] = {}
+        self._unfiltered: set[str] = set()
+
+        # Pending closes of slow clients, referenced until they finish
+        self._close_tasks: set[asyncio.Task[None]] = set()
 
         # Story 25.13: Ring buffer for missed message recovery
         # Stores (global_seq, timestamp, message) tuples with 15-min TTL
-        self._message_buffer: deque[tuple[int, float, dict[str, Any]]] = deque(maxlen=500)
+        self._message_buffer = MessageBuffer(maxlen=500)
         self._global_sequence: int = 0  # Global sequence counter for recovery
 
     async def connect(self, websocket: WebSocket, already_accepted: bool = False) -> str:
@@ -113,7 +296,9 @@ class ConnectionManager:
         if not already_accepted:
             await websocket.accept()
         connection_id = str(uuid4())
-        self.active_connections[connection_id] = (websocket, 0)
+        client = ClientConnection(websocket, self.queue_size)
+        self.active_connections[connection_id] = client
+        self._unfiltered.add(connection_id)
 
         # Send connected message (sequence_number = 0) directly without incrementing
         try:
@@ -128,18 +313,148 @@ class ConnectionManager:
         except Exception as e:
             print(f"[WebSocket] Failed to send connected message to {connection_id}: {e}")
             await self.disconnect(connection_id)
+            return connection_id
 
+        client.writer = asyncio.create_task(self._write_frames(connection_id, client))
         return connection_id
 
     async def disconnect(self, connection_id: str) -> None:
         """
-        Remove connection from tracking.
+        Remove connection from tracking and stop its writer task.
 
         Args:
             connection_id: UUID of connection to remove
         """
-        if connection_id in self.active_connections:
-            del self.active_connections[connection_id]
+        client = self._forget(connection_id)
+        if client is not None and client.writer is not None:
+            if client.writer is not asyncio.current_task():
+                client.writer.cancel()
+
+    def _forget(self, connection_id: str) -> ClientConnection | None:
+        """Drop a connection from tracking and from the topic index."""
+        client = self.active_connections.pop(connection_id, None)
+        self._unfiltered.discard(connection_id)
+        if client is not None:
+            self._unindex(connection_id, client.topics)
+            # A writer cancelled before it first runs never reaches its finally
+            self._release_queue(client)
+        return client
+
+    def _unindex(self, connection_id: str, topics: Iterable[str]) -> None:
+        """Remove a connection from the subscriber sets of the given topics."""
+        for topic in topics:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(connection_id)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def subscribe(self, connection_id: str, topics: Iterable[str]) -> set[str]:
+        """
+        Add topics to a connection's subscriptions.
+
+        Once subscribed, the connection only receives events matching at
+        least one of its topics.
+
+        Args:
+            connection_id: UUID of the connection
+            topics: Topics such as "symbol:AAPL", "type:signal:new", "campaign:<id>"
+
+        Returns:
+            The connection's topics after the change (empty if not connected)
+
+        Raises:
+            ValueError: If any topic is invalid (no subscriptions are changed)
+        """
+        normalized = {normalize_topic(topic) for topic in topics}
+        client = self.active_connections.get(connection_id)
+        if client is None:
+            return set()
+
+        for topic in normalized - client.topics:
+            self._subscribers.setdefault(topic, set()).add(connection_id)
+        client.topics |= normalized
+        if client.topics:
+            self._unfiltered.discard(connection_id)
+        return set(client.topics)
+
+    def unsubscribe(self, connection_id: str, topics: Iterable[str]) -> set[str]:
+        """
+        Remove topics from a connection's subscriptions.
+
+        Removing the last topic returns the connection to receiving every event.
+
+        Args:
+            connection_id: UUID of the connection
+            topics: Topics to remove (unknown topics are ignored)
+
+        Returns:
+            The connection's topics after the change (empty if not connected)
+
+        Raises:
+            ValueError: If any topic is invalid (no subscriptions are changed)
+        """
+        normalized = {normalize_topic(topic) for topic in topics}
+        client = self.active_connections.get(connection_id)
+        if client is None:
+            return set()
+
+        removed = client.topics & normalized
+        self._unindex(connection_id, removed)
+        client.topics -= removed
+        if not client.topics:
+            self._unfiltered.add(connection_id)
+        return set(client.topics)
+
+    async def handle_client_message(self, connection_id: str, data: str) -> None:
+        """
+        Apply a subscribe/unsubscribe request received from a client.
+
+        Replies on the client's queue with a "subscriptions" message listing
+        its current topics, or an "error" message for a malformed request.
+        Text that is not a JSON subscription request is ignored.
+
+        Args:
+            connection_id: UUID of the sending connection
+            data: Raw text frame from the client
+        """
+        client = self.active_connections.get(connection_id)
+        try:
+            request = json.loads(data)
+        except ValueError:
+            return
+        if client is None or not isinstance(request, dict):
+            return
+
+        action = request.get("action")
+        if action not in ("subscribe", "unsubscribe"):
+            return
+
+        reply: dict[str, Any]
+        topics = request.get("topics")
+        try:
+            if not isinstance(topics, list) or not all(isinstance(t, str) for t in topics):
+                raise ValueError("'topics' must be a list of strings")
+            if action == "subscribe":
+                current = self.subscribe(connection_id, topics)
+            else:
+                current = self.unsubscribe(connection_id, topics)
+            reply = {"type": "subscriptions", "topics": sorted(current)}
+        except ValueError as e:
+            reply = {"type": "error", "action": action, "message": str(e)}
+
+        reply["timestamp"] = datetime.now(UTC).isoformat()
+        self._enqueue(connection_id, client, json.dumps(reply, separators=(",", ":")))
+
+    async def drain(self) -> None:
+        """Wait until every live connection's queued frames have been sent."""
+        await asyncio.gather(
+            *(
+                client.queue.join()
+                for client in list(self.active_connections.values())
+                if client.writer is None or not client.writer.done()
+            )
+        )
 
     async def send_message(self, connection_id: str, message: dict[str, Any]) -> None:
         """
@@ -162,7 +477,8 @@ class ConnectionManager:
         if connection_id not in self.active_connections:
             return
 
-        ws, per_conn_seq = self.active_connections[connection_id]
+        client = self.active_connections[connection_id]
+        ws = client.websocket
 
         # Story 25.13 FIX: Increment GLOBAL sequence FIRST (before send)
         # This ensures real-time and recovery use the SAME sequence numbers
@@ -170,8 +486,7 @@ class ConnectionManager:
         global_seq = self._global_sequence
 
         # Increment per-connection sequence for internal tracking (optional)
-        per_conn_seq += 1
-        self.active_connections[connection_id] = (ws, per_conn_seq)
+        client.sequence += 1
 
         # Add GLOBAL sequence number and timestamp
         message["sequence_number"] = global_seq  # Global seq for both real-time AND recovery
@@ -190,25 +505,107 @@ class ConnectionManager:
             # Remove dead connection
             await self.disconnect(connection_id)
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
+    async def broadcast(self, message: dict[str, Any], topics: Iterable[str] | None = None) -> None:
         """
-        Send message to all connected clients.
+        Send message to every client interested in it.
+
+        The message gets one global sequence number, is buffered once for
+        recovery and serialized once; every recipient is sent the same frame
+        by its writer task. Does not wait for delivery (see drain()).
+        Without connected clients the message is dropped unnumbered.
+
+        Recipients are the clients without subscriptions plus the clients
+        subscribed to any of the message's topics.
 
         Args:
-            message: Message dictionary (will be enriched with sequence_number per connection)
+            message: Message dictionary (not modified; enriched copy is sent)
+            topics: Topics of the message (derived from its type, symbol and
+                campaign_id when omitted)
+        """
+        if not self.active_connections:
+            return
 
-        Note:
-            Each connection receives the message with its own sequence_number.
+        self._global_sequence += 1
+        message = {**message, "sequence_number": self._global_sequence}
+        if "timestamp" not in message:
+            message["timestamp"] = datetime.now(UTC).isoformat()
+
+        self._message_buffer.append((self._global_sequence, time.time(), message))
+        frame = json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+        recipients = set(self._unfiltered)
+        if self._subscribers:
+            for topic in message_topics(message) if topics is None else topics:
+                recipients |= self._subscribers.get(topic, set())
+
+        for connection_id in recipients:
+            client = self.active_connections.get(connection_id)
+            if client is not None:
+                self._enqueue(connection_id, client, frame)
+
+    def _enqueue(self, connection_id: str, client: ClientConnection, frame: str) -> None:
+        """Queue a frame for one client, applying the overflow policy when full."""
+        if client.queue.full():
+            if self.overflow_policy == "disconnect":
+                logger.warning(
+                    "websocket_slow_client_disconnected",
+                    connection_id=connection_id,
+                    queued=client.queue.qsize(),
+                )
+                self._forget(connection_id)
+                if client.writer is not None:
+                    client.writer.cancel()
+                close_task = asyncio.create_task(self._close(connection_id, client.websocket))
+                self._close_tasks.add(close_task)
+                close_task.add_done_callback(self._close_tasks.discard)
+                return
+
+            # drop_oldest: the client can recover the gap via get_messages_since
+            client.queue.get_nowait()
+            client.queue.task_done()
+            client.dropped += 1
+
+        client.queue.put_nowait(frame)
+        client.sequence += 1
+
+    async def _write_frames(self, connection_id: str, client: ClientConnection) -> None:
         """
-        # Create list of connection IDs to avoid modification during iteration
-        connection_ids = list(self.active_connections.keys())
-        print(f"[WebSocket] Broadcasting to {len(connection_ids)} connections", flush=True)
+        Writer task: send a connection's queued frames in order until it fails.
 
-        for connection_id in connection_ids:
-            # Create copy of message for each connection (different sequence numbers)
-            print(f"[WebSocket] Sending to connection {connection_id}", flush=True)
-            await self.send_message(connection_id, message.copy())
-            print(f"[WebSocket] Sent to connection {connection_id}", flush=True)
+        Frames still queued when the writer stops (send failure or cancellation)
+        are released so queue.join() in drain() does not wait on them.
+        """
+        try:
+            while True:
+                frame = await client.queue.get()
+                try:
+                    await client.websocket.send_text(frame)
+                except Exception as e:
+                    logger.info("websocket_send_failed", connection_id=connection_id, error=str(e))
+                    await self.disconnect(connection_id)
+                    return
+                finally:
+                    client.queue.task_done()
+        finally:
+            self._release_queue(client)
+
+    @staticmethod
+    def _release_queue(client: ClientConnection) -> None:
+        """Discard a client's queued frames, marking each done for queue.join()."""
+        while True:
+            try:
+                client.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            client.queue.task_done()
+
+    @staticmethod
+    async def _close(connection_id: str, websocket: WebSocket) -> None:
+        """Close a slow client's socket (1013: try again later)."""
+        try:
+            await websocket.close(code=1013, reason="Client too slow")
+        except Exception as e:
+            logger.info("websocket_close_failed", connection_id=connection_id, error=str(e))
 
     def get_messages_since(self, since_seq: int) -> list[dict[str, Any]]:
         """
@@ -231,16 +628,8 @@ class ConnectionManager:
             Client reconnects and calls /websocket/messages?since=42
             Returns messages 43, 44, 45 (if within 15-min TTL)
         """
-        now = time.time()
-        ttl_cutoff = now - 900  # 15 minutes = 900 seconds
-
-        result = []
-        for seq, timestamp, message in self._message_buffer:
-            # Filter: sequence > since AND within TTL
-            if seq > since_seq and timestamp > ttl_cutoff:
-                result.append(message)
-
-        return result
+        ttl_cutoff = time.time() - MESSAGE_TTL_SECONDS
+        return self._message_buffer.since(since_seq, ttl_cutoff)
 
     async def emit_pattern_detected(
         self,
@@ -518,8 +907,12 @@ class ConnectionManager:
             - Called when campaign health status changes
         """
         # Message already includes sequence_number from caller
-        # Just broadcast as-is
-        await self.broadcast(campaign_updated_message)
+        # Just broadcast as-is, routed by campaign id and the campaign's symbol
+        topics = message_topics(campaign_updated_message)
+        campaign = campaign_updated_message.get("campaign")
+        if isinstance(campaign, dict):
+            topics |= message_topics({"data": campaign})
+        await self.broadcast(campaign_updated_message, topics)
 
     async def emit_notification_toast(
         self,
@@ -707,7 +1100,12 @@ class ConnectionManager:
             "signals_generated": signals_generated,
         }
 
-        await self.broadcast(message)
+        # Route to subscribers of any symbol or campaign in the batch
+        topics = message_topics(message)
+        for item in (*patterns_detected, *signals_generated):
+            topics |= message_topics({"data": item})
+
+        await self.broadcast(message, topics)
 
 
 # Global singleton instance
@@ -736,7 +1134,8 @@ async def websocket_endpoint(
     3. Server validates JWT token
     4. If invalid: close connection immediately before pool add
     5. If valid: assign connection_id, add to pool, send connected message
-    6. Server emits events as they occur (pattern detected, signal generated, etc.)
+    6. Server emits events as they occur (pattern detected, signal generated, etc.);
+       clients may send subscribe/unsubscribe requests to narrow the stream
     7. Client processes messages, updates UI
     8. On disconnect: Server removes connection from tracking
 
@@ -774,14 +1173,11 @@ async def websocket_endpoint(
     print(f"[WebSocket] Client connected (authenticated): {connection_id}")
 
     try:
-        # Keep connection alive, listen for client messages if needed
+        # Keep connection alive and apply subscribe/unsubscribe requests
         while True:
-            # Wait for messages from client (currently unused, but keeps connection alive)
             data = await websocket.receive_text()
-
-            # Echo back for debugging (remove in production)
             if data:
-                print(f"[WebSocket] Received from {connection_id}: {data}")
+                await manager.handle_client_message(connection_id, data)
 
     except WebSocketDisconnect:
         print(f"[WebSocket] Client disconnected: {connection_id}")
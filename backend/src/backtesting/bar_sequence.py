@@ -9,11 +9,125 @@ Author: Story 12.1 Task 10
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections.abc import Iterator, Sequence
+from typing import Optional, overload
 
 from src.models.ohlcv import OHLCVBar
 
 
+class BarView(Sequence[OHLCVBar]):
+    """
+    Read-only, zero-copy window over a list of OHLCV bars.
+
+    Behaves like an immutable list restricted to ``bars[start:stop]`` without
+    copying the underlying list. Slicing a view returns another view over the
+    same storage, so bounded lookbacks such as ``view[-20:]`` cost O(1)
+    regardless of how much history precedes the window.
+
+    Look-ahead safety: ``stop`` is fixed at construction. Indices at or beyond
+    the end of the view raise IndexError exactly like a list of the visible
+    bars would, so a detector handed ``BarView(bars, 0, index + 1)`` can never
+    observe bars after ``index``.
+
+    Indexing is relative to ``start`` (negative indices count back from
+    ``stop``), matching the semantics of the list slice the view replaces.
+
+    Example:
+        view = BarView(bars, 0, 101)  # bars[0:101] without a copy
+        view[100]                     # current bar
+        recent = view[-20:]           # another view, still no copy
+        view[101]                     # IndexError (future data)
+    """
+
+    __slots__ = ("_bars", "_start", "_stop")
+
+    def __init__(self, bars: list[OHLCVBar], start: int = 0, stop: Optional[int] = None):
+        """
+        Initialize a view over bars[start:stop].
+
+        Args:
+            bars: Backing list of bars (not copied)
+            start: First visible index in the backing list
+            stop: One past the last visible index (defaults to len(bars))
+
+        Raises:
+            ValueError: If bounds are outside the backing list or start > stop
+        """
+        if stop is None:
+            stop = len(bars)
+        if start < 0 or stop > len(bars) or start > stop:
+            raise ValueError(f"Invalid view bounds [{start}:{stop}] for {len(bars)} bars")
+
+        self._bars = bars
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @property
+    def source(self) -> list[OHLCVBar]:
+        """Backing list shared by this view and views sliced from it."""
+        return self._bars
+
+    @property
+    def offset(self) -> int:
+        """Index in the backing list of this view's first bar."""
+        return self._start
+
+    @overload
+    def __getitem__(self, index: int) -> OHLCVBar:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "BarView":
+        ...
+
+    def __getitem__(self, index: int | slice) -> "OHLCVBar | BarView":
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                # Strided access is rare; fall back to an explicit copy
+                return BarView(list(self)[index])
+            return BarView(self._bars, self._start + start, self._start + max(start, stop))
+
+        length = self._stop - self._start
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError(f"Bar index out of range for view of {length} bars")
+        return self._bars[self._start + index]
+
+    def __iter__(self) -> Iterator[OHLCVBar]:
+        bars = self._bars
+        for i in range(self._start, self._stop):
+            yield bars[i]
+
+    def __reversed__(self) -> Iterator[OHLCVBar]:
+        bars = self._bars
+        for i in range(self._stop - 1, self._start - 1, -1):
+            yield bars[i]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BarView(start={self._start}, stop={self._stop}, len={len(self)})"
+
+    def to_list(self) -> list[OHLCVBar]:
+        """
+        Materialize the view as a list (copies; use only when a list is required).
+
+        Returns:
+            List of the bars visible through this view
+        """
+        return self._bars[self._start : self._stop]
+
+
 class BarSequence(ABC):
     """
     Abstract interface for accessing OHLCV bars sequentially.
@@ -227,6 +341,46 @@ class BacktestBarSequence(BarSequence):
         """
         return self._current_index
 
+    def view(self, start_index: int = 0) -> BarView:
+        """
+        Get a zero-copy view of bars from start_index through current_index.
+
+        Unlike get_bars(), no list is copied, so the cost is constant no
+        matter how far into the history the backtest has progressed.
+
+        Args:
+            start_index: First bar index included in the view (0-based)
+
+        Returns:
+            BarView over bars[start_index:current_index+1]
+
+        Raises:
+            IndexError: If start_index is negative or beyond current_index
+        """
+        if start_index < 0 or start_index > self._current_index:
+            raise IndexError(f"start_index ({start_index}) out of range (0-{self._current_index})")
+        return BarView(self._bars, start_index, self._current_index + 1)
+
+    def advance(self, current_index: int) -> None:
+        """
+        Move the current bar pointer forward to current_index.
+
+        Allows a single sequence to be reused across a backtest run instead
+        of allocating one per bar.
+
+        Args:
+            current_index: New current bar index
+
+        Raises:
+            ValueError: If current_index moves backwards or is out of bounds
+        """
+        if current_index < self._current_index or current_index >= len(self._bars):
+            raise ValueError(
+                f"Cannot advance from {self._current_index} to {current_index} "
+                f"(0-{len(self._bars)-1})"
+            )
+        self._current_index = current_index
+
 
 class LiveBarSequence(BarSequence):
     """
@@ -0,0 +1,565 @@
+"""
+Parquet Bar Store - Local columnar bar warehouse for backtests
+
+Purpose:
+--------
+Keeps OHLCV bars on local disk as Parquet so backtests, walk-forward suites
+and regression runs load history without re-querying Postgres or the
+provider adapters on every run.
+
+Layout:
+-------
+One file per symbol/timeframe/year, sorted by timestamp::
+
+    {root}/symbol=AAPL/timeframe=1d/year=2024.parquet
+
+Reads pick only the year files overlapping the requested range, push the
+date predicate down to Parquet row-group statistics, and memory-map the
+files. Timestamp and volume columns come back as read-only NumPy views of
+the Arrow buffers when a range lives in a single file.
+
+Prices, spread and ratios are stored as decimal128 with the database's
+precision (DECIMAL(18,8) / DECIMAL(10,4)), so read_bars() returns exactly
+the Decimals that were written; read_frame() converts them to float64 for
+OHLCVFrame. low_history_flag is kept as a nullable boolean.
+
+Each series records the earliest date it was synced from the database
+(sync.json), so a later request for older history fetches the missing head
+range instead of silently serving a truncated one.
+
+Classes:
+--------
+- ParquetBarStore: Partitioned bar store with append, sync and range reads
+
+Functions:
+----------
+- get_bar_store: Application store configured by settings.bar_store_path
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import structlog
+
+from src.models.ohlcv import OHLCVBar
+from src.pattern_engine.ohlcv_frame import OHLCVFrame, datetime_to_epoch_ns, epoch_ns_to_datetime
+
+if TYPE_CHECKING:
+    from src.repositories.ohlcv_repository import OHLCVRepository
+
+logger = structlog.get_logger(__name__)
+
+# Same precision as the ohlcv_bars columns (DECIMAL(18,8) / DECIMAL(10,4))
+_PRICE_TYPE = pa.decimal128(18, 8)
+_RATIO_TYPE = pa.decimal128(10, 4)
+
+BAR_SCHEMA = pa.schema(
+    [
+        pa.field("timestamp", pa.timestamp("ns", tz="UTC"), nullable=False),
+        pa.field("open", _PRICE_TYPE, nullable=False),
+        pa.field("high", _PRICE_TYPE, nullable=False),
+        pa.field("low", _PRICE_TYPE, nullable=False),
+        pa.field("close", _PRICE_TYPE, nullable=False),
+        pa.field("volume", pa.int64(), nullable=False),
+        pa.field("spread", _PRICE_TYPE, nullable=False),
+        pa.field("spread_ratio", _RATIO_TYPE, nullable=False),
+        pa.field("volume_ratio", _RATIO_TYPE, nullable=False),
+        pa.field("low_history_flag", pa.bool_(), nullable=True),
+    ]
+)
+
+# Rows per row group; keeps date-range pushdown useful for intraday years
+_ROW_GROUP_SIZE = 50_000
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Per-series record of the earliest date synced from the database
+_SYNC_FILE = "sync.json"
+
+
+class ParquetBarStore:
+    """
+    Partitioned Parquet store for OHLCV bars on local disk.
+
+    Files are immutable once written; append_bars() rewrites only the year
+    partitions that receive new bars (write to a temp file, then atomic
+    replace), so concurrent readers never see a partial file.
+
+    Parameters:
+    -----------
+    root : str | Path
+        Store directory (created on first write)
+
+    Example:
+    --------
+    >>> store = ParquetBarStore("/var/lib/bmad/bars")
+    >>> store.append_bars(bars)
+    >>> frame = store.read_frame("AAPL", "1d", start, end)
+    >>> bars = store.read_bars("AAPL", "1d", start, end)
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+
+    def _series_dir(self, symbol: str, timeframe: str) -> Path:
+        # "/" appears in forex symbols (EUR/USD) and would nest directories
+        return self.root / f"symbol={symbol.replace('/', '_')}" / f"timeframe={timeframe}"
+
+    def _partition_path(self, symbol: str, timeframe: str, year: int) -> Path:
+        return self._series_dir(symbol, timeframe) / f"year={year}.parquet"
+
+    def years(self, symbol: str, timeframe: str) -> list[int]:
+        """
+        Year partitions stored for a symbol/timeframe.
+
+        Returns:
+        --------
+        list[int]
+            Years in ascending order (empty if nothing is stored)
+        """
+        series_dir = self._series_dir(symbol, timeframe)
+        if not series_dir.is_dir():
+            return []
+        return sorted(
+            int(path.stem.removeprefix("year=")) for path in series_dir.glob("year=*.parquet")
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append_bars(self, bars: Iterable[OHLCVBar]) -> int:
+        """
+        Add bars to the store, skipping timestamps that are already stored.
+
+        Parameters:
+        -----------
+        bars : Iterable[OHLCVBar]
+            Bars in any order, for any number of symbols/timeframes
+
+        Returns:
+        --------
+        int
+            Number of bars written
+        """
+        partitions: dict[tuple[str, str, int], list[OHLCVBar]] = defaultdict(list)
+        for bar in bars:
+            partitions[(bar.symbol, bar.timeframe, bar.timestamp.astimezone(UTC).year)].append(bar)
+
+        written = 0
+        for (symbol, timeframe, year), partition_bars in partitions.items():
+            written += self._merge_partition(
+                self._partition_path(symbol, timeframe, year), partition_bars
+            )
+
+        if written:
+            logger.info("bar_store_appended", bars=written, partitions=len(partitions))
+        return written
+
+    def _merge_partition(self, path: Path, bars: list[OHLCVBar]) -> int:
+        """Merge bars into one year file; returns the number of new rows."""
+        new_table = _bars_to_table(bars)
+        timestamps = new_table.column("timestamp").cast(pa.int64()).to_numpy()
+        # First occurrence of each timestamp in the batch
+        _, first_rows = np.unique(timestamps, return_index=True)
+        existing = pq.read_table(path, schema=BAR_SCHEMA) if path.exists() else None
+        if existing is not None:
+            stored = existing.column("timestamp").cast(pa.int64()).to_numpy()
+            first_rows = first_rows[~np.isin(timestamps[first_rows], stored)]
+        if len(first_rows) == 0:
+            return 0
+
+        table = new_table.take(pa.array(first_rows))
+        if existing is not None:
+            table = pa.concat_tables([existing, table])
+        table = table.sort_by("timestamp")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp_path, row_group_size=_ROW_GROUP_SIZE)
+        os.replace(tmp_path, path)
+        return len(first_rows)
+
+    async def sync_from_repository(
+        self,
+        repository: OHLCVRepository,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> int:
+        """
+        Append database bars missing at either end of the stored range.
+
+        Bars after the latest stored bar are always fetched. Bars before the
+        stored range are fetched when the series has not yet been synced
+        from start_date, so history backfilled into the database after the
+        first sync still reaches the store. Both reads go through the
+        repository's lean read path.
+
+        Parameters:
+        -----------
+        repository : OHLCVRepository
+            Repository bound to an open session
+        symbol : str
+            Trading symbol
+        timeframe : str
+            Bar timeframe
+        start_date : datetime | None
+            First timestamp the store must cover (default: all history)
+        end_date : datetime | None
+            Last timestamp to sync (default: everything available)
+
+        Returns:
+        --------
+        int
+            Number of bars appended
+        """
+        earliest = self.earliest_timestamp(symbol, timeframe)
+        latest = self.latest_timestamp(symbol, timeframe)
+        needs_head = not self.covers_start(symbol, timeframe, start_date)
+
+        bars: list[OHLCVBar] = []
+        if earliest is None or latest is None:
+            bars = await repository.get_bars_lean(
+                symbol, timeframe, start_date=start_date, end_date=end_date
+            )
+        else:
+            if needs_head and (start_date is None or start_date < earliest):
+                bars += await repository.get_bars_lean(
+                    symbol,
+                    timeframe,
+                    start_date=start_date,
+                    end_date=earliest - _ONE_MICROSECOND,
+                )
+            if end_date is None or end_date > latest:
+                bars += await repository.get_bars_lean(
+                    symbol,
+                    timeframe,
+                    start_date=latest + _ONE_MICROSECOND,
+                    end_date=end_date,
+                )
+
+        # File writes run in a thread so the event loop is not blocked
+        appended = await asyncio.to_thread(self.append_bars, bars) if bars else 0
+        if needs_head:
+            # Recorded after the bars are written, never ahead of them
+            await asyncio.to_thread(self._write_synced_from, symbol, timeframe, start_date)
+        return appended
+
+    def covers_start(self, symbol: str, timeframe: str, start_date: datetime | None) -> bool:
+        """
+        Whether the series has been synced from the database from start_date.
+
+        Parameters:
+        -----------
+        symbol : str
+            Trading symbol
+        timeframe : str
+            Bar timeframe
+        start_date : datetime | None
+            First timestamp required, or None for all history
+
+        Returns:
+        --------
+        bool
+            True if no database bar at or after start_date is missing from
+            the head of the stored range
+        """
+        path = self._series_dir(symbol, timeframe) / _SYNC_FILE
+        if not path.exists():
+            return False
+        synced_from = json.loads(path.read_text())["synced_from"]
+        if synced_from is None:
+            return True
+        return start_date is not None and datetime.fromisoformat(synced_from) <= start_date
+
+    def _write_synced_from(self, symbol: str, timeframe: str, start_date: datetime | None) -> None:
+        series_dir = self._series_dir(symbol, timeframe)
+        series_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = series_dir / f"{_SYNC_FILE}.tmp"
+        tmp_path.write_text(
+            json.dumps(
+                {"synced_from": start_date.astimezone(UTC).isoformat() if start_date else None}
+            )
+        )
+        os.replace(tmp_path, series_dir / _SYNC_FILE)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def earliest_timestamp(self, symbol: str, timeframe: str) -> datetime | None:
+        """
+        Timestamp of the oldest stored bar, or None if nothing is stored.
+        """
+        years = self.years(symbol, timeframe)
+        if not years:
+            return None
+        return self._edge_timestamp(symbol, timeframe, years[0], 0)
+
+    def latest_timestamp(self, symbol: str, timeframe: str) -> datetime | None:
+        """
+        Timestamp of the newest stored bar, or None if nothing is stored.
+        """
+        years = self.years(symbol, timeframe)
+        if not years:
+            return None
+        return self._edge_timestamp(symbol, timeframe, years[-1], -1)
+
+    def _edge_timestamp(
+        self, symbol: str, timeframe: str, year: int, position: int
+    ) -> datetime | None:
+        """Timestamp at position (0 or -1) of a sorted year file."""
+        timestamps = pq.read_table(
+            self._partition_path(symbol, timeframe, year),
+            columns=["timestamp"],
+            memory_map=True,
+        ).column("timestamp")
+        if len(timestamps) == 0:
+            return None
+        return epoch_ns_to_datetime(timestamps.cast(pa.int64())[position].as_py())
+
+    def read_table(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> pa.Table:
+        """
+        Read stored bars in [start_date, end_date] as an Arrow table.
+
+        Only year files overlapping the range are opened; the date filter is
+        pushed down to Parquet row-group statistics.
+
+        Parameters:
+        -----------
+        symbol : str
+            Trading symbol
+        timeframe : str
+            Bar timeframe
+        start_date : datetime | None
+            First timestamp (inclusive), or None for no lower bound
+        end_date : datetime | None
+            Last timestamp (inclusive), or None for no upper bound
+
+        Returns:
+        --------
+        pa.Table
+            Chronological table with BAR_SCHEMA columns
+        """
+        filters = []
+        if start_date is not None:
+            filters.append(("timestamp", ">=", _ns_scalar(start_date)))
+        if end_date is not None:
+            filters.append(("timestamp", "<=", _ns_scalar(end_date)))
+
+        tables = [
+            pq.read_table(
+                self._partition_path(symbol, timeframe, year),
+                schema=BAR_SCHEMA,
+                filters=filters or None,
+                memory_map=True,
+            )
+            for year in self.years(symbol, timeframe)
+            if (start_date is None or year >= start_date.astimezone(UTC).year)
+            and (end_date is None or year <= end_date.astimezone(UTC).year)
+        ]
+        if not tables:
+            return BAR_SCHEMA.empty_table()
+        return pa.concat_tables(tables)
+
+    def read_frame(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> OHLCVFrame:
+        """
+        Read stored bars as an OHLCVFrame (no bar objects are built).
+
+        Timestamps are zero-copy views of the memory-mapped Arrow buffers
+        when the range lies in one year file; decimal price columns are
+        converted to float64.
+
+        Parameters:
+        -----------
+        symbol : str
+            Trading symbol
+        timeframe : str
+            Bar timeframe
+        start_date : datetime | None
+            First timestamp (inclusive)
+        end_date : datetime | None
+            Last timestamp (inclusive)
+
+        Returns:
+        --------
+        OHLCVFrame
+            Chronological frame (empty if nothing matches)
+        """
+        table = self.read_table(symbol, timeframe, start_date, end_date)
+        volume = _column(table, "volume")
+        return OHLCVFrame(
+            symbol=symbol,
+            timeframe=timeframe,
+            timestamp=_column(table, "timestamp"),
+            open=_float_column(table, "open"),
+            high=_float_column(table, "high"),
+            low=_float_column(table, "low"),
+            close=_float_column(table, "close"),
+            volume=volume.astype(np.float64),
+        )
+
+    def read_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[OHLCVBar]:
+        """
+        Read stored bars as OHLCVBar objects built without validation.
+
+        Parameters:
+        -----------
+        symbol : str
+            Trading symbol
+        timeframe : str
+            Bar timeframe
+        start_date : datetime | None
+            First timestamp (inclusive)
+        end_date : datetime | None
+            Last timestamp (inclusive)
+
+        Returns:
+        --------
+        list[OHLCVBar]
+            Chronological bars (empty if nothing matches)
+        """
+        table = self.read_table(symbol, timeframe, start_date, end_date)
+        timestamps = _column(table, "timestamp").tolist()
+        # Decimal columns come back as Decimal, bool as bool/None
+        columns = [table.column(name).to_pylist() for name in BAR_SCHEMA.names[1:]]
+        bars = []
+        for ts, (
+            open_,
+            high,
+            low,
+            close,
+            volume,
+            spread,
+            spread_ratio,
+            volume_ratio,
+            low_history_flag,
+        ) in zip(timestamps, zip(*columns, strict=True), strict=True):
+            bars.append(
+                OHLCVBar.model_construct(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    timestamp=epoch_ns_to_datetime(ts),
+                    open=open_,
+                    high=high,
+                    low=low,
+                    close=close,
+                    volume=volume,
+                    spread=spread,
+                    spread_ratio=spread_ratio,
+                    volume_ratio=volume_ratio,
+                    low_history_flag=low_history_flag,
+                )
+            )
+        return bars
+
+
+def _bars_to_table(bars: list[OHLCVBar]) -> pa.Table:
+    """Build a BAR_SCHEMA table from bars (input order is preserved)."""
+    return pa.Table.from_arrays(
+        [
+            pa.array([datetime_to_epoch_ns(bar.timestamp) for bar in bars], pa.int64()).cast(
+                BAR_SCHEMA.field("timestamp").type
+            ),
+            _decimal_array([bar.open for bar in bars], _PRICE_TYPE),
+            _decimal_array([bar.high for bar in bars], _PRICE_TYPE),
+            _decimal_array([bar.low for bar in bars], _PRICE_TYPE),
+            _decimal_array([bar.close for bar in bars], _PRICE_TYPE),
+            pa.array([bar.volume for bar in bars], pa.int64()),
+            _decimal_array([bar.spread for bar in bars], _PRICE_TYPE),
+            _decimal_array([bar.spread_ratio for bar in bars], _RATIO_TYPE),
+            _decimal_array([bar.volume_ratio for bar in bars], _RATIO_TYPE),
+            pa.array([bar.low_history_flag for bar in bars], pa.bool_()),
+        ],
+        schema=BAR_SCHEMA,
+    )
+
+
+def _decimal_array(values: list[Decimal], decimal_type: pa.Decimal128Type) -> pa.Array:
+    """Decimal column rounded to the column scale, as the database column does."""
+    quantum = Decimal(1).scaleb(-decimal_type.scale)
+    return pa.array(
+        [Decimal(value).quantize(quantum, rounding=ROUND_HALF_UP) for value in values],
+        decimal_type,
+    )
+
+
+def _column(table: pa.Table, name: str) -> np.ndarray:
+    """Column as a NumPy array; zero-copy when the column has one chunk."""
+    column = table.column(name)
+    if name == "timestamp":
+        column = column.cast(pa.int64())
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy()
+    return column.to_numpy()
+
+
+def _float_column(table: pa.Table, name: str) -> np.ndarray:
+    """Decimal column as float64, rounded exactly as float(Decimal) would be."""
+    # Going through the decimal string keeps the conversion correctly rounded,
+    # so frames match OHLCVFrame.from_bars() on the same bars
+    return table.column(name).cast(pa.string()).cast(pa.float64()).to_numpy()
+
+
+def _ns_scalar(value: datetime) -> pa.TimestampScalar:
+    return pa.scalar(datetime_to_epoch_ns(value), pa.int64()).cast(
+        BAR_SCHEMA.field("timestamp").type
+    )
+
+
+# Store configured by settings.bar_store_path (None when disabled)
+_store: ParquetBarStore | None = None
+
+
+def get_bar_store() -> ParquetBarStore | None:
+    """
+    Get the application bar store, if settings.bar_store_path is set.
+
+    Returns:
+    --------
+    ParquetBarStore | None
+        Store singleton, or None when the local store is disabled
+    """
+    global _store
+    if _store is None:
+        from src.config import settings
+
+        if settings.bar_store_path:
+            _store = ParquetBarStore(settings.bar_store_path)
+    return _store
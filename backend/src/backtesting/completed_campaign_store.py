@@ -0,0 +1,293 @@
+"""
+Completed Campaign Store - Columnar Archive
+
+Keeps the outcome of every COMPLETED campaign of an IntradayCampaignDetector
+in flat typed columns (one row per campaign), so campaign statistics never
+walk Campaign objects or their pattern lists.
+
+Columns:
+  r_multiple     float64 (NaN when the R-multiple could not be calculated)
+  duration_bars  int64
+  exit_reason    label code
+  sequence       label code (Spring→SOS, Spring→AR→SOS, ..., Other)
+  entry_phase    label code
+  exit_phase     label code
+  live           1 until the row is discarded
+
+Counts, wins and R-multiple sums (overall, per exit reason, per pattern
+sequence) and the entry/exit phase distributions are updated as rows are
+added or discarded. Only the median and extremes are computed from the
+R-multiple column, when statistics are requested.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections import Counter
+from decimal import Decimal
+from typing import Any, Optional
+
+import numpy as np
+
+__all__ = ["CompletedCampaignStore", "PATTERN_SEQUENCES"]
+
+# Pattern sequences reported by campaign statistics, in report order
+PATTERN_SEQUENCES = ("Spring→SOS", "Spring→AR→SOS", "Spring→AR→SOS→LPS", "Other")
+
+
+class _OutcomeTotals:
+    """Running count / win / R-multiple totals for a group of rows."""
+
+    __slots__ = ("count", "winning", "losing", "r_sum", "r_count")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.winning = 0
+        self.losing = 0
+        self.r_sum = 0.0
+        self.r_count = 0
+
+    def apply(self, r_multiple: float, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one row; r_multiple may be NaN."""
+        self.count += sign
+        if not math.isnan(r_multiple):
+            self.r_sum += sign * r_multiple
+            self.r_count += sign
+            if r_multiple > 0:
+                self.winning += sign
+            elif r_multiple < 0:
+                self.losing += sign
+
+    @property
+    def avg_r_multiple(self) -> float:
+        return self.r_sum / self.r_count if self.r_count else 0.0
+
+    @property
+    def win_rate_pct(self) -> float:
+        return (self.winning / self.count * 100) if self.count > 0 else 0.0
+
+
+class CompletedCampaignStore:
+    """
+    Columnar archive of completed campaign outcomes, addressed by campaign ID.
+
+    Re-adding an ID replaces its row. Discarded rows are masked out rather
+    than compacted (completed campaigns are rarely discarded).
+
+    Example:
+        >>> store = CompletedCampaignStore()
+        >>> store.add("abc123", Decimal("2.5"), 12, "TARGET_HIT", "Spring→SOS", "C", "D")
+        >>> store.performance_stats()["avg_r_multiple"]
+        2.5
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self._row_by_id: dict[str, int] = {}
+        self._r_multiple = array("d")
+        self._duration_bars = array("q")
+        self._exit_reason = array("H")
+        self._sequence = array("H")
+        self._entry_phase = array("H")
+        self._exit_phase = array("H")
+        self._live = array("b")
+
+        # Label dictionary shared by the code columns
+        self._codes: dict[str, int] = {}
+        self._labels: list[str] = []
+
+        # Incrementally maintained aggregates
+        self._totals = _OutcomeTotals()
+        self._duration_sum = 0
+        self._by_exit_reason: dict[str, _OutcomeTotals] = {}
+        self._by_sequence: dict[str, _OutcomeTotals] = {}
+        self._entry_phases: Counter[str] = Counter()
+        self._exit_phases: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._row_by_id)
+
+    def __contains__(self, campaign_id: object) -> bool:
+        return campaign_id in self._row_by_id
+
+    def add(
+        self,
+        campaign_id: str,
+        r_multiple: Optional[Decimal],
+        duration_bars: int,
+        exit_reason: str,
+        sequence: str,
+        entry_phase: str,
+        exit_phase: str,
+    ) -> None:
+        """
+        Archive a completed campaign, replacing any existing row for the ID.
+
+        Args:
+            campaign_id: Campaign identifier
+            r_multiple: Campaign R-multiple (None if not calculable)
+            duration_bars: Campaign duration in bars
+            exit_reason: Exit reason value
+            sequence: Pattern sequence (one of PATTERN_SEQUENCES)
+            entry_phase: Phase label of the first pattern
+            exit_phase: Phase label of the last pattern
+        """
+        self.discard(campaign_id)
+
+        self._row_by_id[campaign_id] = len(self._live)
+        self._r_multiple.append(float(r_multiple) if r_multiple is not None else math.nan)
+        self._duration_bars.append(duration_bars)
+        self._exit_reason.append(self._code(exit_reason))
+        self._sequence.append(self._code(sequence))
+        self._entry_phase.append(self._code(entry_phase))
+        self._exit_phase.append(self._code(exit_phase))
+        self._live.append(1)
+
+        self._apply_row(len(self._live) - 1, 1)
+
+    def discard(self, campaign_id: str) -> None:
+        """
+        Remove a campaign's row if present.
+
+        Args:
+            campaign_id: Campaign identifier
+        """
+        row = self._row_by_id.pop(campaign_id, None)
+        if row is None:
+            return
+        self._live[row] = 0
+        self._apply_row(row, -1)
+
+    def clear(self) -> None:
+        """Remove all rows and aggregates."""
+        self.__init__()
+
+    # ------------------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------------------
+
+    def performance_stats(self) -> dict[str, Any]:
+        """
+        Performance block of campaign statistics.
+
+        Returns:
+            Dictionary with win rate, R-multiple aggregates, average duration
+            and winning/losing counts
+        """
+        totals = self._totals
+        r_multiples = self._live_r_multiples()
+        has_r = r_multiples.size > 0
+
+        return {
+            "win_rate_pct": totals.win_rate_pct,
+            "avg_r_multiple": totals.avg_r_multiple,
+            "median_r_multiple": float(np.median(r_multiples)) if has_r else 0.0,
+            "best_r_multiple": float(r_multiples.max()) if has_r else 0.0,
+            "worst_r_multiple": float(r_multiples.min()) if has_r else 0.0,
+            "total_r": totals.r_sum if has_r else 0.0,
+            "avg_duration_bars": self._duration_sum / totals.count if totals.count else 0,
+            "profitable_campaigns": totals.winning,
+            "losing_campaigns": totals.losing,
+        }
+
+    def exit_reason_stats(self) -> dict[str, Any]:
+        """
+        Statistics by exit reason.
+
+        Returns:
+            {"TARGET_HIT": {"count": 20, "win_rate_pct": 100.0, "avg_r_multiple": 3.0}, ...}
+        """
+        return {
+            reason: {
+                "count": totals.count,
+                "win_rate_pct": totals.win_rate_pct,
+                "avg_r_multiple": totals.avg_r_multiple,
+            }
+            for reason, totals in self._by_exit_reason.items()
+        }
+
+    def pattern_sequence_stats(self) -> dict[str, Any]:
+        """
+        Statistics by pattern sequence (sequences without campaigns omitted).
+
+        Returns:
+            {"Spring→SOS": {"count": 20, "win_rate_pct": 75.0, "avg_r_multiple": 2.0,
+                            "best_r_multiple": 4.0}, ...}
+        """
+        result: dict[str, Any] = {}
+        if not self._by_sequence:
+            return result
+
+        r_multiples = np.array(self._r_multiple, dtype=np.float64)
+        valid = np.array(self._live, dtype=bool) & ~np.isnan(r_multiples)
+        sequence_codes = np.array(self._sequence, dtype=np.int64)
+
+        for sequence in PATTERN_SEQUENCES:
+            totals = self._by_sequence.get(sequence)
+            if totals is None:
+                continue
+            sequence_r = r_multiples[valid & (sequence_codes == self._codes[sequence])]
+            result[sequence] = {
+                "count": totals.count,
+                "win_rate_pct": totals.win_rate_pct,
+                "avg_r_multiple": totals.avg_r_multiple,
+                "best_r_multiple": float(sequence_r.max()) if sequence_r.size else 0.0,
+            }
+        return result
+
+    def phase_stats(self) -> dict[str, Any]:
+        """
+        Entry/exit phase distribution.
+
+        Returns:
+            {"entry_phase_distribution": {"C": 30, "D": 20},
+             "exit_phase_distribution": {"D": 25, "E": 25}}
+        """
+        return {
+            "entry_phase_distribution": dict(self._entry_phases),
+            "exit_phase_distribution": dict(self._exit_phases),
+        }
+
+    # ------------------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------------------
+
+    def _code(self, label: str) -> int:
+        code = self._codes.get(label)
+        if code is None:
+            code = self._codes[label] = len(self._labels)
+            self._labels.append(label)
+        return code
+
+    def _apply_row(self, row: int, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a row's contribution to the aggregates."""
+        r_multiple = self._r_multiple[row]
+        self._totals.apply(r_multiple, sign)
+        self._duration_sum += sign * self._duration_bars[row]
+
+        for groups, code in (
+            (self._by_exit_reason, self._exit_reason[row]),
+            (self._by_sequence, self._sequence[row]),
+        ):
+            label = self._labels[code]
+            totals = groups.get(label)
+            if totals is None:
+                totals = groups[label] = _OutcomeTotals()
+            totals.apply(r_multiple, sign)
+            if totals.count == 0:
+                del groups[label]
+
+        for counter, code in (
+            (self._entry_phases, self._entry_phase[row]),
+            (self._exit_phases, self._exit_phase[row]),
+        ):
+            label = self._labels[code]
+            counter[label] += sign
+            if counter[label] == 0:
+                del counter[label]
+
+    def _live_r_multiples(self) -> np.ndarray:
+        """R-multiples of live rows that have one."""
+        r_multiples = np.array(self._r_multiple, dtype=np.float64)
+        return r_multiples[np.array(self._live, dtype=bool) & ~np.isnan(r_multiples)]
@@ -21,7 +21,6 @@ Author: Story 11.2, Story 18.9.2
 
 import asyncio
 import logging
-import math
 import time
 from collections.abc import Callable
 from datetime import UTC, datetime
@@ -29,9 +28,16 @@ from decimal import Decimal
 from typing import Any
 from uuid import UUID, uuid4
 
+from src.backtesting.bar_sequence import BarView
 from src.backtesting.engine.bar_processor import calculate_stop_fill_price
 from src.backtesting.engine.interfaces import CostModel, EngineConfig, SignalDetector
+from src.backtesting.exit.indicator_state import ExitIndicatorState
 from src.backtesting.metrics import calculate_equity_curve, calculate_metrics
+from src.backtesting.metrics_core.vectorized import (
+    EquityCurveMetrics,
+    VectorizedMetricsCalculator,
+    equity_arrays,
+)
 from src.backtesting.position_manager import PositionManager
 from src.backtesting.risk_integration import BacktestRiskManager
 from src.models.backtest import (
@@ -461,8 +467,16 @@ class UnifiedBacktestEngine:
         self._position_peaks: dict[str, Decimal] = {}
         # Original risk distance for trailing stop (symbol -> abs(entry - initial_stop))
         self._position_initial_risk: dict[str, Decimal] = {}
+        # Incremental per-symbol ATR for the volatility spike exit
+        self._exit_indicators: dict[str, ExitIndicatorState] = {}
+        # ATR when the position was opened (symbol -> entry ATR)
+        self._position_entry_atr: dict[str, Decimal] = {}
 
-    def run(self, bars: list[OHLCVBar]) -> BacktestResult:
+    def run(
+        self,
+        bars: list[OHLCVBar],
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> BacktestResult:
         """
         Execute backtest on historical bar data.
 
@@ -471,6 +485,9 @@ class UnifiedBacktestEngine:
 
         Args:
             bars: Historical OHLCV bars to backtest (chronological order)
+            progress_callback: Optional callback invoked after each bar with
+                (bars_processed, total_bars). Exceptions it raises abort the run,
+                which lets job runners cancel a backtest cooperatively.
 
         Returns:
             BacktestResult with trades, equity curve, and metrics
@@ -479,9 +496,13 @@ class UnifiedBacktestEngine:
         self._bars = bars
         self._equity_curve = []
         self._pending_orders = []
+        self._exit_indicators = {}
 
+        total_bars = len(bars)
         for index, bar in enumerate(bars):
             self._process_bar(bar, index)
+            if progress_callback is not None:
+                progress_callback(index + 1, total_bars)
 
         # Cancel any pending orders that were never filled (no next bar available)
         if self._pending_orders:
@@ -510,6 +531,10 @@ class UnifiedBacktestEngine:
         # Step 1: Fill pending orders from previous bar at current bar's open
         self._fill_pending_orders(bar)
 
+        # Advance the symbol's ATR after fills, so an entry ATR never includes its fill bar
+        if self._config.enable_volatility_exit:
+            self._exit_indicators.setdefault(bar.symbol, ExitIndicatorState()).update(bar)
+
         # Step 1b: Check stop-loss / take-profit exits for open positions
         self._check_position_exits(bar)
 
@@ -518,7 +543,8 @@ class UnifiedBacktestEngine:
 
         # Step 2: Detect potential signal - pass only bars up to current index
         # to prevent look-ahead. This enforces that detectors cannot access future data.
-        visible_bars = self._bars[: index + 1]
+        # BarView is a zero-copy window, so per-bar cost does not grow with history.
+        visible_bars = BarView(self._bars, 0, index + 1)
         signal = self._detector.detect(visible_bars, index)
 
         # Step 2b: Log volume analysis (Story 13.8)
@@ -565,6 +591,10 @@ class UnifiedBacktestEngine:
         If both stop and target are hit in the same bar, the stop is assumed
         to have been hit first (conservative approach).
 
+        With enable_volatility_exit, a position whose stop and target are not
+        hit is closed at the bar's close when its ATR has spiked relative to
+        entry (see _volatility_spike).
+
         Args:
             bar: Current OHLCV bar with high/low for exit checking
         """
@@ -635,6 +665,10 @@ class UnifiedBacktestEngine:
                 positions_to_close.append(
                     (symbol, target_price, position.quantity, position.side, "take_profit")
                 )
+            elif self._volatility_spike(symbol):
+                positions_to_close.append(
+                    (symbol, bar.close, position.quantity, position.side, "volatility_spike")
+                )
 
         # Execute exits: SELL closes LONG, BUY closes SHORT
         for symbol, exit_price, quantity, pos_side, reason in positions_to_close:
@@ -673,6 +707,7 @@ class UnifiedBacktestEngine:
                 self._position_stops.pop(symbol, None)
                 self._position_peaks.pop(symbol, None)
                 self._position_initial_risk.pop(symbol, None)
+                self._position_entry_atr.pop(symbol, None)
 
                 logger.debug(f"Position exit for {symbol}: {reason} at {exit_price}")
 
@@ -915,6 +950,12 @@ class UnifiedBacktestEngine:
                                 )
                                 order.quantity = safe_quantity
 
+            # Cash check: risk-based sizing ignores buying power, so a tight stop or
+            # an ADD on top of open positions can cost more than the cash on hand.
+            # Trim the order to what cash covers instead of failing the fill.
+            if order.status != "REJECTED":
+                self._limit_to_available_cash(order)
+
             # Delegate position tracking
             if order.status == "REJECTED":
                 # Order was cancelled during risk check above
@@ -991,6 +1032,7 @@ class UnifiedBacktestEngine:
                     self._position_stops.pop(order.symbol, None)
                     self._position_peaks.pop(order.symbol, None)
                     self._position_initial_risk.pop(order.symbol, None)
+                    self._position_entry_atr.pop(order.symbol, None)
             else:
                 self._pending_order_stops.pop(order.order_id, None)
                 logger.debug(f"Order skipped for {order.symbol}: cannot process")
@@ -1000,6 +1042,39 @@ class UnifiedBacktestEngine:
         # Clear the pending queue
         self._pending_orders.clear()
 
+    def _limit_to_available_cash(self, order: BacktestOrder) -> None:
+        """
+        Reduce a filled order that opens or adds to a position to what cash covers.
+
+        Closing orders are left alone. An order that cannot afford a single unit
+        is marked REJECTED.
+
+        Args:
+            order: Order filled at the current bar (fill_price and commission set)
+        """
+        position = self._positions.get_position(order.symbol)
+        if position is not None and (order.side == "BUY") != (position.side == "LONG"):
+            return  # Closes the position, no cash needed
+
+        cash = self._positions.cash
+        if Decimal(order.quantity) * order.fill_price + order.commission <= cash:
+            return
+
+        affordable = int((cash - order.commission) / order.fill_price)
+        if affordable <= 0:
+            order.status = "REJECTED"
+            logger.info(f"Order cancelled for {order.symbol}: insufficient cash ({cash})")
+            return
+
+        logger.info(
+            f"Reducing quantity for {order.symbol} from {order.quantity} "
+            f"to {affordable}: insufficient cash ({cash})"
+        )
+        order.quantity = affordable
+        if self._config.enable_cost_model:
+            # Commission for fewer units never exceeds the one reserved above
+            order.commission = self._cost_model.calculate_commission(order)
+
     def _setup_position_stops(self, order: BacktestOrder, bar: OHLCVBar, side: str) -> None:
         """
         Set up stop-loss, take-profit, and risk manager tracking for a newly opened position.
@@ -1058,6 +1133,34 @@ class UnifiedBacktestEngine:
         if order.fill_price is not None:
             self._position_initial_risk[order.symbol] = abs(order.fill_price - stop_loss_price)
 
+        # Entry ATR for the volatility spike exit (None until 15 bars are seen)
+        indicators = self._exit_indicators.get(order.symbol)
+        if indicators is not None and indicators.atr is not None:
+            self._position_entry_atr[order.symbol] = indicators.atr
+
+    def _volatility_spike(self, symbol: str) -> bool:
+        """
+        Check for an ATR expansion since entry (market regime change).
+
+        Same rule as exit_logic_refinements.check_volatility_spike, read from
+        the symbol's ExitIndicatorState instead of rescanning bars.
+
+        Args:
+            symbol: Symbol of the open position
+
+        Returns:
+            True if the current ATR is at least volatility_spike_threshold
+            times the ATR when the position was opened
+        """
+        entry_atr = self._position_entry_atr.get(symbol)
+        if not entry_atr:
+            return False
+        current_atr = self._exit_indicators[symbol].atr
+        return (
+            current_atr is not None
+            and current_atr / entry_atr >= self._config.volatility_spike_threshold
+        )
+
     def _record_equity_point(self, bar: OHLCVBar, portfolio_value: Decimal) -> None:
         """
         Record an equity curve point.
@@ -1254,28 +1357,9 @@ class UnifiedBacktestEngine:
                 exponent = 365.25 / total_days
                 cagr = Decimal(str(ratio**exponent - 1.0))
 
-        # Sharpe ratio: (mean(bar_returns) - bar_rf) / std(bar_returns) * sqrt(bars_per_year)
+        # Sharpe ratio and max drawdown from the vectorized equity-curve pass
         # Story 13.5 C-2 Fix: Timeframe-aware annualization
-        sharpe_ratio = Decimal("0")
-        if len(self._equity_curve) >= 2:
-            bar_returns: list[float] = []
-            for i in range(1, len(self._equity_curve)):
-                prev_val = float(self._equity_curve[i - 1].portfolio_value)
-                curr_val = float(self._equity_curve[i].portfolio_value)
-                if prev_val > 0:
-                    bar_returns.append((curr_val - prev_val) / prev_val)
-            if len(bar_returns) >= 2:
-                # Get bars per year for this timeframe
-                bars_per_year = self._get_bars_per_year(self._config.timeframe)
-
-                mean_ret = sum(bar_returns) / len(bar_returns)
-                bar_rf = 0.02 / bars_per_year  # Annual risk-free rate (2%) / bars per year
-                variance = sum((r - mean_ret) ** 2 for r in bar_returns) / (len(bar_returns) - 1)
-                std_ret = math.sqrt(variance)
-                if std_ret > 0:
-                    sharpe_ratio = Decimal(
-                        str((mean_ret - bar_rf) / std_ret * math.sqrt(bars_per_year))
-                    )
+        equity_metrics = self._equity_curve_metrics()
 
         return BacktestMetrics(
             total_signals=len(trades),
@@ -1284,14 +1368,21 @@ class UnifiedBacktestEngine:
             losing_trades=len(losing),
             win_rate=win_rate,
             average_r_multiple=self._calculate_avg_r_multiple(trades),
-            max_drawdown=self._calculate_max_drawdown(),
+            max_drawdown=equity_metrics.max_drawdown,
             profit_factor=profit_factor,
             total_pnl=total_pnl,
             final_equity=final_equity,
             total_return_pct=total_return_pct,
             cagr=cagr,
-            sharpe_ratio=sharpe_ratio,
+            sharpe_ratio=equity_metrics.sharpe_ratio,
+        )
+
+    def _equity_curve_metrics(self) -> EquityCurveMetrics:
+        """Equity-curve metrics annualized for the configured timeframe."""
+        calculator = VectorizedMetricsCalculator(
+            periods_per_year=self._get_bars_per_year(self._config.timeframe)
         )
+        return calculator.calculate_equity_metrics(*equity_arrays(self._equity_curve))
 
     def _calculate_avg_r_multiple(self, trades: list) -> Decimal:
         """
@@ -1342,18 +1433,4 @@ class UnifiedBacktestEngine:
         Returns:
             Maximum drawdown as decimal (0.10 = 10%)
         """
-        if not self._equity_curve:
-            return Decimal("0")
-
-        peak = Decimal("0")
-        max_dd = Decimal("0")
-
-        for point in self._equity_curve:
-            if point.portfolio_value > peak:
-                peak = point.portfolio_value
-            if peak > 0:
-                drawdown = (peak - point.portfolio_value) / peak
-                if drawdown > max_dd:
-                    max_dd = drawdown
-
-        return max_dd
+        return self._equity_curve_metrics().max_drawdown
@@ -18,6 +18,7 @@ Reference: CF-002 from Critical Foundation Refactoring document.
 Author: Story 18.9.1
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional, Protocol
@@ -52,12 +53,16 @@ class SignalDetector(Protocol):
             ...
     """
 
-    def detect(self, bars: list["OHLCVBar"], index: int) -> Optional["TradeSignal"]:
+    def detect(self, bars: Sequence["OHLCVBar"], index: int) -> Optional["TradeSignal"]:
         """
         Detect a trading signal at the given bar index.
 
         Args:
-            bars: List of OHLCV bars (historical data)
+            bars: Read-only sequence of OHLCV bars (historical data). The
+                UnifiedBacktestEngine passes a zero-copy BarView limited to
+                bars[0:index+1]; slicing it returns further views, so
+                implementations should not mutate it and should call
+                list() only when a real list is required.
             index: Current bar index to analyze (0-based)
 
         Returns:
@@ -159,6 +164,13 @@ class EngineConfig:
         Data timeframe for annualization in Sharpe ratio calculation (default: "1d")
         Supported: "1d", "1h", "4h", "15m", "30m", "5m", "1m", "1w"
 
+    enable_volatility_exit : bool
+        Close a position when its symbol's 14-bar ATR reaches
+        volatility_spike_threshold times the ATR at entry (default: False)
+
+    volatility_spike_threshold : Decimal
+        ATR multiple of the entry ATR treated as a regime change (default: 2.5)
+
     Example:
     --------
     >>> config = EngineConfig(
@@ -176,6 +188,8 @@ class EngineConfig:
     max_open_positions: int = 5
     enable_trailing_stop: bool = False
     timeframe: str = "1d"  # Story 13.5 C-2 Fix: For timeframe-aware Sharpe ratio annualization
+    enable_volatility_exit: bool = False
+    volatility_spike_threshold: Decimal = field(default_factory=lambda: Decimal("2.5"))
 
     def __post_init__(self) -> None:
         """Validate configuration values after initialization."""
@@ -189,3 +203,7 @@ class EngineConfig:
             raise ValueError(
                 f"max_open_positions must be in [1, 100], got {self.max_open_positions}"
             )
+        if self.volatility_spike_threshold <= Decimal("1"):
+            raise ValueError(
+                f"volatility_spike_threshold must be > 1, got {self.volatility_spike_threshold}"
+            )
@@ -0,0 +1,300 @@
+"""
+Streaming rolling-window statistics for bar-by-bar detection.
+
+WyckoffSignalDetector needs, at every bar, the 10th/90th percentile of lows
+and highs over a trailing range window and the mean volume over a trailing
+lookback. Recomputing them sorts and sums the whole window per bar. The
+structures here keep the windows in sync as the backtest advances one bar
+at a time:
+
+- IndexedSkiplist: sorted multiset with O(log w) insert, remove and k-th
+  smallest lookup
+- RollingRangeWindow: trailing low/high skiplists plus an exact running
+  volume sum for one bar series
+
+Parity:
+    Equal values keep insertion (chronological) order and removal takes the
+    oldest equal entry, so rank lookups return exactly the element that
+    ``sorted(...)[k]`` over the same window would, including Decimal
+    representation. The volume sum is an exact integer sum, so the mean is
+    bit-identical to ``sum(volumes) / len(volumes)``.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Sequence
+from typing import Any
+
+from src.models.ohlcv import OHLCVBar
+
+
+class _Infinity:
+    """Sentinel that compares greater than every value."""
+
+    __slots__ = ()
+
+    def __lt__(self, other: object) -> bool:
+        return False
+
+    def __le__(self, other: object) -> bool:
+        return other is self
+
+    def __gt__(self, other: object) -> bool:
+        return other is not self
+
+    def __ge__(self, other: object) -> bool:
+        return True
+
+
+_INF = _Infinity()
+
+
+class _Node:
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value: Any, levels: int, next_node: _Node | None = None) -> None:
+        self.value = value
+        self.next: list[_Node] = [next_node] * levels  # type: ignore[list-item]
+        self.width: list[int] = [1] * levels
+
+
+class IndexedSkiplist:
+    """
+    Sorted multiset supporting O(log n) insert, remove and rank lookup.
+
+    Each link stores how many bottom-level nodes it skips, so the k-th
+    smallest element is found by walking down the levels.
+
+    Example:
+        >>> sl = IndexedSkiplist(expected_size=64)
+        >>> for v in (5, 1, 3):
+        ...     sl.insert(v)
+        >>> sl[1]
+        3
+        >>> sl.remove(1)
+        >>> sl[0]
+        3
+    """
+
+    __slots__ = ("_max_levels", "_head", "_size", "_random")
+
+    def __init__(self, expected_size: int = 100) -> None:
+        """
+        Initialize an empty skiplist.
+
+        Args:
+            expected_size: Typical maximum size (sizes the level count)
+        """
+        self._max_levels = 1 + int(math.log2(max(expected_size, 2)))
+        tail = _Node(_INF, 0)
+        self._head = _Node(None, self._max_levels, tail)
+        self._size = 0
+        # Level choice only affects speed, never results; a private RNG keeps
+        # behaviour reproducible run to run
+        self._random = random.Random(0x5EED)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, i: int) -> Any:
+        """
+        Get the i-th smallest value (0-based; negative counts from the end).
+
+        Raises:
+            IndexError: If i is out of range
+        """
+        if i < 0:
+            i += self._size
+        if i < 0 or i >= self._size:
+            raise IndexError("skiplist index out of range")
+
+        node = self._head
+        i += 1
+        for level in reversed(range(self._max_levels)):
+            while node.width[level] <= i:
+                i -= node.width[level]
+                node = node.next[level]
+        return node.value
+
+    def __iter__(self) -> Any:
+        node = self._head.next[0]
+        while node.value is not _INF:
+            yield node.value
+            node = node.next[0]
+
+    def insert(self, value: Any) -> None:
+        """Insert a value after any equal values already present."""
+        max_levels = self._max_levels
+        chain: list[_Node] = [self._head] * max_levels
+        steps_at_level = [0] * max_levels
+
+        node = self._head
+        for level in reversed(range(max_levels)):
+            while node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        levels = min(max_levels, 1 - int(math.log2(1.0 - self._random.random())))
+        new_node = _Node(value, levels)
+        steps = 0
+        for level in range(levels):
+            prev = chain[level]
+            new_node.next[level] = prev.next[level]
+            prev.next[level] = new_node
+            new_node.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, max_levels):
+            chain[level].width[level] += 1
+
+        self._size += 1
+
+    def remove(self, value: Any) -> None:
+        """
+        Remove the earliest-inserted occurrence of value.
+
+        Raises:
+            KeyError: If value is not present
+        """
+        max_levels = self._max_levels
+        chain: list[_Node] = [self._head] * max_levels
+
+        node = self._head
+        for level in reversed(range(max_levels)):
+            while node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target.value is _INF or target.value != value:
+            raise KeyError(value)
+
+        levels = len(target.next)
+        for level in range(levels):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+        for level in range(levels, max_levels):
+            chain[level].width[level] -= 1
+
+        self._size -= 1
+
+
+class RollingRangeWindow:
+    """
+    Trailing range and volume windows for one bar series.
+
+    For bar ``index`` the window state covers:
+        - lows/highs of ``bars[max(0, index - range_span) : index + 1]``
+        - volumes of ``bars[max(0, index - volume_lookback) : index]``
+          (current bar excluded)
+
+    advance() moves the window forward by one bar in O(log w); rebuild()
+    re-initializes it for an arbitrary index.
+
+    Attributes:
+        source: Backing bar list the window was built from
+        offset: Offset of the caller's view into ``source``
+        index: Bar index (view-relative) the window currently reflects
+    """
+
+    __slots__ = (
+        "source",
+        "offset",
+        "index",
+        "_range_span",
+        "_volume_lookback",
+        "_lows",
+        "_highs",
+        "_volume_sum",
+        "_volume_count",
+    )
+
+    def __init__(self, range_span: int, volume_lookback: int, source: Any, offset: int) -> None:
+        """
+        Initialize an empty window.
+
+        Args:
+            range_span: Bars before the current bar included in the range window
+            volume_lookback: Bars before the current bar averaged for volume
+            source: Backing bar list (identity used to detect continuation)
+            offset: Offset of the caller's view into source
+        """
+        self.source = source
+        self.offset = offset
+        self.index = -1
+        self._range_span = range_span
+        self._volume_lookback = volume_lookback
+        self._lows = IndexedSkiplist(range_span + 1)
+        self._highs = IndexedSkiplist(range_span + 1)
+        self._volume_sum = 0
+        self._volume_count = 0
+
+    @property
+    def range_size(self) -> int:
+        """Number of bars in the range window."""
+        return len(self._lows)
+
+    def low_at_rank(self, k: int) -> Any:
+        """k-th smallest low in the range window."""
+        return self._lows[k]
+
+    def high_at_rank(self, k: int) -> Any:
+        """k-th smallest high in the range window."""
+        return self._highs[k]
+
+    def avg_volume(self) -> float:
+        """Mean volume of the lookback window (0 if empty)."""
+        if self._volume_count == 0:
+            return 0
+        return self._volume_sum / self._volume_count
+
+    def rebuild(self, bars: Sequence[OHLCVBar], index: int) -> None:
+        """
+        Build the window state for ``index`` from scratch.
+
+        Args:
+            bars: Bar history (indexable up to index)
+            index: Current bar index
+        """
+        self._lows = IndexedSkiplist(self._range_span + 1)
+        self._highs = IndexedSkiplist(self._range_span + 1)
+        for i in range(max(0, index - self._range_span), index + 1):
+            bar = bars[i]
+            self._lows.insert(bar.low)
+            self._highs.insert(bar.high)
+
+        start = max(0, index - self._volume_lookback)
+        self._volume_sum = sum(bars[i].volume for i in range(start, index))
+        self._volume_count = index - start
+        self.index = index
+
+    def advance(self, bars: Sequence[OHLCVBar], index: int) -> None:
+        """
+        Move the window from ``index - 1`` to ``index``.
+
+        Args:
+            bars: Bar history (indexable up to index)
+            index: New current bar index (must equal self.index + 1)
+        """
+        bar = bars[index]
+        self._lows.insert(bar.low)
+        self._highs.insert(bar.high)
+        dropped = index - self._range_span - 1
+        if dropped >= 0:
+            old = bars[dropped]
+            self._lows.remove(old.low)
+            self._highs.remove(old.high)
+
+        if index >= 1:
+            self._volume_sum += bars[index - 1].volume
+            dropped = index - 1 - self._volume_lookback
+            if dropped >= 0:
+                self._volume_sum -= bars[dropped].volume
+            else:
+                self._volume_count += 1
+
+        self.index = index
@@ -12,6 +12,7 @@ Author: Critical Backtest Fix - connects validation chain to engine.
 """
 
 import logging
+from collections.abc import Sequence
 from decimal import Decimal
 from typing import Optional
 
@@ -69,7 +70,7 @@ class ValidatedSignalDetector:
         self._inner = inner
         self._volume_lookback = volume_lookback
 
-    def detect(self, bars: list[OHLCVBar], index: int) -> Optional[TradeSignal]:
+    def detect(self, bars: Sequence[OHLCVBar], index: int) -> Optional[TradeSignal]:
         """Detect signal via inner detector, then validate before returning.
 
         Args:
@@ -172,7 +173,7 @@ class ValidatedSignalDetector:
     # Helpers
     # ------------------------------------------------------------------
 
-    def _avg_volume(self, bars: list[OHLCVBar], index: int) -> float:
+    def _avg_volume(self, bars: Sequence[OHLCVBar], index: int) -> float:
         """Average volume over lookback period (excludes current bar)."""
         start = max(0, index - self._volume_lookback)
         lookback = bars[start:index]
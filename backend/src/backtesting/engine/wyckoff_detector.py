@@ -13,12 +13,15 @@ Author: Critical Backtest Fix - replaces buy-and-hold with Wyckoff detection.
 """
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Optional
+from typing import NamedTuple, Optional
 from uuid import uuid4
 
+from src.backtesting.bar_sequence import BarView
+from src.backtesting.engine.rolling_window import RollingRangeWindow
 from src.models.ohlcv import OHLCVBar
 from src.models.signal import ConfidenceComponents, TargetLevels, TradeSignal
 from src.models.validation import (
@@ -62,6 +65,49 @@ class _TradingRange:
     resistance: Decimal
 
 
+class _BarFeatures(NamedTuple):
+    """Detector inputs for one bar that do not depend on detector state."""
+
+    trading_range: _TradingRange
+    volume_ratio: Decimal
+    # (raw phase before Phase C was reached, raw phase after)
+    phase_hint: tuple[str, str]
+
+
+@dataclass(frozen=True)
+class DetectorFeatures:
+    """Precomputed per-bar detector inputs for one bar series.
+
+    Trading ranges, volume ratios and the state-independent part of the
+    phase classification depend only on the bars, ``min_range_bars`` and
+    ``volume_lookback``. Parameter sweeps compute them once per series with
+    WyckoffSignalDetector.compute_features() and hand them to every
+    detector sharing those two parameters.
+
+    Attributes:
+        symbol: Symbol of the series
+        min_range_bars: Detector min_range_bars the features were built with
+        volume_lookback: Detector volume_lookback the features were built with
+        timestamps: Bar timestamps (identify the series a bar belongs to)
+        bars: Features per bar index; None where the detector cannot signal
+              (warm-up, no valid range or no volume baseline)
+    """
+
+    symbol: str
+    min_range_bars: int
+    volume_lookback: int
+    timestamps: tuple[datetime, ...]
+    bars: tuple[Optional[_BarFeatures], ...]
+
+    def covers(self, bar: OHLCVBar, index: int) -> bool:
+        """Whether ``bar`` is bar ``index`` of the series these features describe."""
+        return (
+            index < len(self.timestamps)
+            and self.timestamps[index] == bar.timestamp
+            and bar.symbol == self.symbol
+        )
+
+
 class WyckoffSignalDetector:
     """Wyckoff pattern detector implementing SignalDetector protocol.
 
@@ -74,6 +120,8 @@ class WyckoffSignalDetector:
         volume_lookback: Number of bars for average volume calculation.
         cooldown_bars: Minimum bars between signals for the same symbol.
         max_penetration_pct: Maximum penetration below support for Spring (>5% = break, not spring).
+        features: Optional precomputed features (see compute_features). Bars
+            they cover skip range, volume and phase-history computation.
     """
 
     # Phase ordering for high-water-mark comparison
@@ -88,18 +136,32 @@ class WyckoffSignalDetector:
         volume_lookback: int = 20,
         cooldown_bars: int = 10,
         max_penetration_pct: Decimal = Decimal("0.05"),
+        features: Optional[DetectorFeatures] = None,
     ) -> None:
+        if features is not None and (
+            features.min_range_bars != min_range_bars or features.volume_lookback != volume_lookback
+        ):
+            raise ValueError(
+                "features were computed with min_range_bars="
+                f"{features.min_range_bars}, volume_lookback={features.volume_lookback}"
+            )
+
         self._min_range_bars = min_range_bars
         self._volume_lookback = volume_lookback
         self._cooldown_bars = cooldown_bars
         self._max_penetration_pct = max_penetration_pct
+        self._features = features
 
         # Internal state across bars
         self._last_signal_index: dict[str, int] = {}
         self._detected_sos: dict[str, int] = {}  # symbol -> bar index of SOS
         self._phase_state: dict[str, str] = {}  # symbol -> highest phase reached
 
-    def detect(self, bars: list[OHLCVBar], index: int) -> Optional[TradeSignal]:
+        # Streaming range/volume window, advanced one bar at a time while the
+        # engine walks a series and rebuilt when it jumps or switches series
+        self._rolling: Optional[RollingRangeWindow] = None
+
+    def detect(self, bars: Sequence[OHLCVBar], index: int) -> Optional[TradeSignal]:
         """Detect Wyckoff patterns at the given bar index.
 
         Args:
@@ -115,26 +177,40 @@ class WyckoffSignalDetector:
         bar = bars[index]
         symbol = bar.symbol
 
+        features = self._features
+        precomputed = features is not None and features.covers(bar, index)
+
+        # Keep the rolling window in step even on cooldown bars so the next
+        # bar is an O(log w) update rather than a rebuild
+        if not precomputed:
+            window = self._sync_rolling_window(bars, index)
+
         # Cooldown check
         if symbol in self._last_signal_index:
             if index - self._last_signal_index[symbol] < self._cooldown_bars:
                 return None
 
-        # 1. Identify trading range (support/resistance)
-        lookback_start = max(0, index - self._min_range_bars * 2)
-        range_bars = bars[lookback_start : index + 1]
-        trading_range = self._identify_trading_range(range_bars)
-        if trading_range is None:
-            return None
+        phase_hint: Optional[tuple[str, str]] = None
+        if precomputed:
+            # 1-2. Trading range and volume ratio from the precomputed features
+            bar_features = features.bars[index]
+            if bar_features is None:
+                return None
+            trading_range, volume_ratio, phase_hint = bar_features
+        else:
+            # 1. Identify trading range (support/resistance)
+            trading_range = self._trading_range_from_window(window)
+            if trading_range is None:
+                return None
 
-        # 2. Calculate volume ratio
-        avg_volume = self._avg_volume(bars, index)
-        if avg_volume <= 0:
-            return None
-        volume_ratio = Decimal(str(bar.volume)) / Decimal(str(avg_volume))
+            # 2. Calculate volume ratio
+            avg_volume = window.avg_volume()
+            if avg_volume <= 0:
+                return None
+            volume_ratio = Decimal(str(bar.volume)) / Decimal(str(avg_volume))
 
         # 3. Classify Wyckoff phase
-        phase = self._classify_phase(bars, index, trading_range)
+        phase = self._classify_phase(bars, index, trading_range, phase_hint)
 
         # 4. Try pattern detection in priority order
         signal: Optional[TradeSignal] = None
@@ -156,11 +232,98 @@ class WyckoffSignalDetector:
 
         return signal
 
+    def compute_features(self, bars: Sequence[OHLCVBar]) -> DetectorFeatures:
+        """Precompute the state-independent detector inputs for a bar series.
+
+        The result can be passed as ``features`` to any detector with the same
+        min_range_bars and volume_lookback; its signals are unchanged.
+
+        Args:
+            bars: Complete bar series for one symbol (chronological order).
+
+        Returns:
+            DetectorFeatures covering every bar of the series.
+        """
+        per_bar: list[Optional[_BarFeatures]] = [None] * len(bars)
+        window = RollingRangeWindow(
+            range_span=self._min_range_bars * 2,
+            volume_lookback=self._volume_lookback,
+            source=bars,
+            offset=0,
+        )
+
+        for index in range(self._min_range_bars, len(bars)):
+            if window.index == index - 1:
+                window.advance(bars, index)
+            else:
+                window.rebuild(bars, index)
+
+            trading_range = self._trading_range_from_window(window)
+            avg_volume = window.avg_volume()
+            if trading_range is None or avg_volume <= 0:
+                continue
+
+            volume_ratio = Decimal(str(bars[index].volume)) / Decimal(str(avg_volume))
+            per_bar[index] = _BarFeatures(
+                trading_range, volume_ratio, self._phase_hint(bars, index, trading_range)
+            )
+
+        return DetectorFeatures(
+            symbol=bars[0].symbol if bars else "",
+            min_range_bars=self._min_range_bars,
+            volume_lookback=self._volume_lookback,
+            timestamps=tuple(bar.timestamp for bar in bars),
+            bars=tuple(per_bar),
+        )
+
     # ------------------------------------------------------------------
     # Trading range identification
     # ------------------------------------------------------------------
 
-    def _identify_trading_range(self, bars: list[OHLCVBar]) -> Optional[_TradingRange]:
+    def _sync_rolling_window(self, bars: Sequence[OHLCVBar], index: int) -> RollingRangeWindow:
+        """Bring the rolling range/volume window to ``index``.
+
+        Advances incrementally when called for the bar after the previous
+        call on the same series (the backtest engine's access pattern);
+        otherwise rebuilds the window for ``index``.
+        """
+        if isinstance(bars, BarView):
+            source, offset = bars.source, bars.offset
+        else:
+            source, offset = bars, 0
+
+        window = self._rolling
+        if window is not None and window.source is source and window.offset == offset:
+            if window.index == index:
+                return window
+            if window.index == index - 1:
+                window.advance(bars, index)
+                return window
+
+        window = RollingRangeWindow(
+            range_span=self._min_range_bars * 2,
+            volume_lookback=self._volume_lookback,
+            source=source,
+            offset=offset,
+        )
+        window.rebuild(bars, index)
+        self._rolling = window
+        return window
+
+    def _trading_range_from_window(self, window: RollingRangeWindow) -> Optional[_TradingRange]:
+        """Percentile support/resistance from the rolling window.
+
+        Same result as _identify_trading_range over the window's bars.
+        """
+        n = window.range_size
+        if n < self._min_range_bars:
+            return None
+
+        support = window.low_at_rank(max(0, int(n * 0.10)))
+        resistance = window.high_at_rank(min(n - 1, int(n * 0.90)))
+        return self._validate_range(support, resistance)
+
+    def _identify_trading_range(self, bars: Sequence[OHLCVBar]) -> Optional[_TradingRange]:
         """Identify support/resistance from price history using percentile approach."""
         if len(bars) < self._min_range_bars:
             return None
@@ -171,7 +334,10 @@ class WyckoffSignalDetector:
         n = len(bars)
         support = lows[max(0, int(n * 0.10))]
         resistance = highs[min(n - 1, int(n * 0.90))]
+        return self._validate_range(support, resistance)
 
+    def _validate_range(self, support: Decimal, resistance: Decimal) -> Optional[_TradingRange]:
+        """Reject inverted or too-narrow ranges."""
         if resistance <= support:
             return None
 
@@ -186,7 +352,7 @@ class WyckoffSignalDetector:
     # Volume calculation
     # ------------------------------------------------------------------
 
-    def _avg_volume(self, bars: list[OHLCVBar], index: int) -> float:
+    def _avg_volume(self, bars: Sequence[OHLCVBar], index: int) -> float:
         """Average volume over lookback period (excludes current bar)."""
         start = max(0, index - self._volume_lookback)
         lookback = bars[start:index]
@@ -200,9 +366,10 @@ class WyckoffSignalDetector:
 
     def _classify_phase(
         self,
-        bars: list[OHLCVBar],
+        bars: Sequence[OHLCVBar],
         index: int,
         tr: _TradingRange,
+        phase_hint: Optional[tuple[str, str]] = None,
     ) -> str:
         """Classify current Wyckoff phase from price position and history.
 
@@ -210,6 +377,8 @@ class WyckoffSignalDetector:
         transitions (e.g. D -> C).  The state resets only when price breaks
         more than 5% below support, indicating a new accumulation structure.
 
+        ``phase_hint`` is the precomputed result of _phase_hint, if available.
+
         Returns single-character phase: "B", "C", "D", or "E".
         """
         bar = bars[index]
@@ -222,7 +391,7 @@ class WyckoffSignalDetector:
                 self._phase_state.pop(symbol, None)
 
         # --- Raw phase classification ---
-        raw_phase = self._raw_classify_phase(bars, index, tr)
+        raw_phase = self._raw_classify_phase(bars, index, tr, phase_hint)
 
         # --- Apply high-water-mark state machine ---
         prev_phase = self._phase_state.get(symbol, "B")
@@ -235,41 +404,50 @@ class WyckoffSignalDetector:
 
     def _raw_classify_phase(
         self,
-        bars: list[OHLCVBar],
+        bars: Sequence[OHLCVBar],
         index: int,
         tr: _TradingRange,
+        phase_hint: Optional[tuple[str, str]] = None,
     ) -> str:
         """Classify raw Wyckoff phase without state-machine adjustment.
 
         Returns single-character phase: "B", "C", "D", or "E".
         """
+        if phase_hint is None:
+            phase_hint = self._phase_hint(bars, index, tr)
+
+        # Upper half of range counts as D only if the symbol has already been
+        # through Phase C (prevents premature D during Phase B accumulation)
+        prev_phase = self._phase_state.get(bars[index].symbol, "B")
+        has_seen_c = self._phase_order.get(prev_phase, 0) >= self._phase_order["C"]
+        return phase_hint[1] if has_seen_c else phase_hint[0]
+
+    def _phase_hint(
+        self,
+        bars: Sequence[OHLCVBar],
+        index: int,
+        tr: _TradingRange,
+    ) -> tuple[str, str]:
+        """Raw phase from price history alone.
+
+        Returns:
+            (phase if the symbol has not reached Phase C, phase if it has)
+        """
         bar = bars[index]
-        symbol = bar.symbol
 
         # Below support (close OR low penetration) = Phase C territory (Spring zone)
         if bar.close < tr.support or bar.low < tr.support:
-            return "C"
+            return "C", "C"
 
         # Above resistance = Phase E (markup)
         if bar.close > tr.resistance:
-            return "E"
+            return "E", "E"
 
         # Within range -- check for recent resistance breaks (Phase D)
         recent = bars[max(0, index - 10) : index + 1]
         had_break_above = any(b.high > tr.resistance for b in recent)
         if had_break_above:
-            return "D"
-
-        # Upper half of range -> D, but ONLY if symbol has already been through Phase C.
-        # This prevents premature Phase D classification during Phase B accumulation.
-        range_width = tr.resistance - tr.support
-        position_in_range = (
-            (bar.close - tr.support) / range_width if range_width > 0 else Decimal("0.5")
-        )
-        prev_phase = self._phase_state.get(symbol, "B")
-        has_seen_c = self._phase_order.get(prev_phase, 0) >= self._phase_order["C"]
-        if position_in_range > Decimal("0.5") and has_seen_c:
-            return "D"
+            return "D", "D"
 
         # Been in range long enough for Phase C (min 10 bars)
         range_bars = [
@@ -277,10 +455,16 @@ class WyckoffSignalDetector:
             for b in bars[max(0, index - 30) : index + 1]
             if tr.support <= b.close <= tr.resistance
         ]
-        if len(range_bars) >= 10:
-            return "C"
+        range_phase = "C" if len(range_bars) >= 10 else "B"
 
-        return "B"
+        # Upper half of range -> D once Phase C has been seen
+        range_width = tr.resistance - tr.support
+        position_in_range = (
+            (bar.close - tr.support) / range_width if range_width > 0 else Decimal("0.5")
+        )
+        if position_in_range > Decimal("0.5"):
+            return range_phase, "D"
+        return range_phase, range_phase
 
     # ------------------------------------------------------------------
     # Pattern detectors
@@ -330,7 +514,7 @@ class WyckoffSignalDetector:
 
     def _detect_sos(
         self,
-        bars: list[OHLCVBar],
+        bars: Sequence[OHLCVBar],
         index: int,
         bar: OHLCVBar,
         tr: _TradingRange,
@@ -380,7 +564,7 @@ class WyckoffSignalDetector:
 
     def _detect_lps(
         self,
-        bars: list[OHLCVBar],
+        bars: Sequence[OHLCVBar],
         index: int,
         bar: OHLCVBar,
         tr: _TradingRange,
@@ -425,7 +609,7 @@ class WyckoffSignalDetector:
 
     def _detect_utad(
         self,
-        bars: list[OHLCVBar],
+        bars: Sequence[OHLCVBar],
         index: int,
         bar: OHLCVBar,
         tr: _TradingRange,
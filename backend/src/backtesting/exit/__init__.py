@@ -46,6 +46,9 @@ Concrete Strategies:
 Registry:
 - ExitStrategyRegistry: Runtime strategy selection
 
+Indicators:
+- ExitIndicatorState: Per-campaign incremental ATR, swing and volume state
+
 Usage:
 ------
 >>> from src.backtesting.exit import (
@@ -67,6 +70,7 @@ from src.backtesting.exit.consolidation_detector import (
     ConsolidationDetector,
     ConsolidationZone,
 )
+from src.backtesting.exit.indicator_state import ExitIndicatorState
 from src.backtesting.exit.target_exit import TargetExitStrategy
 from src.backtesting.exit.time_based import TimeBasedExitStrategy
 from src.backtesting.exit.trailing_stop import TrailingStopStrategy
@@ -84,6 +88,8 @@ __all__ = [
     "ConsolidationDetector",
     "ConsolidationConfig",
     "ConsolidationZone",
+    # Indicators
+    "ExitIndicatorState",
     # Registry
     "ExitStrategyRegistry",
 ]
@@ -0,0 +1,256 @@
+"""
+Exit Indicator State - Incremental indicators for exit evaluation
+
+Purpose:
+--------
+Keeps the indicators consumed by the Wyckoff exit checks up to date in O(1)
+per bar, so evaluating many concurrent campaigns does not rescan
+``recent_bars`` for every check on every bar.
+
+Maintained per campaign:
+- True range and rolling ATR (simple mean, as used by the exit checks)
+- Rolling mean of recent lows (uptrend break)
+- Confirmed swing highs (2 bars each side, lower high detection)
+- Rolling max high and bounded bar history (failed rallies)
+- Rolling average volume (volume baselines)
+
+Rolling sums are kept as Decimals, so every value equals the result of the
+equivalent list computation over the same bars.
+
+Classes:
+--------
+- ExitIndicatorState: Per-campaign incremental indicator state
+"""
+
+from collections import deque
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from src.models.ohlcv import OHLCVBar
+
+# Bars on each side a swing high must exceed
+_SWING_STRENGTH = 2
+
+
+class _RollingSum:
+    """Exact running sum over the last ``size`` values."""
+
+    __slots__ = ("size", "total", "_values")
+
+    def __init__(self, size: int, zero):
+        self.size = size
+        self.total = zero
+        self._values: deque = deque()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def push(self, value) -> None:
+        self._values.append(value)
+        self.total += value
+        if len(self._values) > self.size:
+            self.total -= self._values.popleft()
+
+
+class ExitIndicatorState:
+    """
+    Incremental indicator state for one campaign's exit evaluation.
+
+    Feed every bar once with update() (or sync() with a recent-bars list);
+    bars at or before the last seen timestamp are ignored, so re-feeding the
+    current bar is harmless. All properties are O(1).
+
+    Parameters:
+    -----------
+    atr_period : int
+        Window for the rolling ATR (default: 14)
+    trend_lookback : int
+        Window for the rolling mean of lows (default: 10)
+    volume_lookback : int
+        Window for the rolling average volume (default: 20)
+    history : int
+        Bars kept for windowed scans and the rolling max high (default: 20)
+
+    Example:
+    --------
+    >>> state = ExitIndicatorState()
+    >>> for bar in bars:
+    ...     state.update(bar)
+    >>> state.atr, state.avg_volume
+    """
+
+    def __init__(
+        self,
+        atr_period: int = 14,
+        trend_lookback: int = 10,
+        volume_lookback: int = 20,
+        history: int = 20,
+    ):
+        self.atr_period = atr_period
+        self.trend_lookback = trend_lookback
+        self.volume_lookback = volume_lookback
+        self.history = history
+
+        self.bar_count = 0
+        self.last_timestamp: Optional[datetime] = None
+        self._prev_close: Optional[Decimal] = None
+
+        self._bars: deque["OHLCVBar"] = deque(maxlen=history)
+        self._true_ranges = _RollingSum(atr_period, Decimal("0"))
+        self._true_range_count = 0
+        self._lows = _RollingSum(trend_lookback, Decimal("0"))
+        self._volumes = _RollingSum(volume_lookback, 0)
+
+        # (bar_index, high) pairs with decreasing highs for the rolling max
+        self._max_highs: deque[tuple[int, Decimal]] = deque()
+        # Last 2 * _SWING_STRENGTH + 1 highs for swing confirmation
+        self._swing_window: deque[Decimal] = deque(maxlen=2 * _SWING_STRENGTH + 1)
+        # Confirmed swing highs as (bar_index, high)
+        self._swing_highs: deque[tuple[int, Decimal]] = deque()
+
+    def update(self, bar: "OHLCVBar") -> bool:
+        """
+        Advance all indicators by one bar.
+
+        Parameters:
+        -----------
+        bar : OHLCVBar
+            Next bar in chronological order
+
+        Returns:
+        --------
+        bool
+            True if the bar was applied, False if it was already seen
+        """
+        if self.last_timestamp is not None and bar.timestamp <= self.last_timestamp:
+            return False
+
+        index = self.bar_count
+        self.bar_count += 1
+        self.last_timestamp = bar.timestamp
+        self._bars.append(bar)
+
+        # True range / ATR
+        if self._prev_close is not None:
+            true_range = max(
+                bar.high - bar.low,
+                abs(bar.high - self._prev_close),
+                abs(bar.low - self._prev_close),
+            )
+            self._true_ranges.push(true_range)
+            self._true_range_count += 1
+        self._prev_close = bar.close
+
+        self._lows.push(bar.low)
+        self._volumes.push(bar.volume)
+
+        # Rolling max high (monotonic deque)
+        while self._max_highs and self._max_highs[-1][1] <= bar.high:
+            self._max_highs.pop()
+        self._max_highs.append((index, bar.high))
+        if self._max_highs[0][0] <= index - self.history:
+            self._max_highs.popleft()
+
+        # Swing highs are confirmed _SWING_STRENGTH bars after they print
+        self._swing_window.append(bar.high)
+        if len(self._swing_window) == self._swing_window.maxlen:
+            center = self._swing_window[_SWING_STRENGTH]
+            if all(
+                center > high
+                for offset, high in enumerate(self._swing_window)
+                if offset != _SWING_STRENGTH
+            ):
+                self._swing_highs.append((index - _SWING_STRENGTH, center))
+        while self._swing_highs and self._swing_highs[0][0] < index + 1 - self.history:
+            self._swing_highs.popleft()
+
+        return True
+
+    def sync(self, recent_bars: Sequence["OHLCVBar"]) -> int:
+        """
+        Apply the bars from recent_bars that have not been seen yet.
+
+        Parameters:
+        -----------
+        recent_bars : Sequence[OHLCVBar]
+            Chronological bars ending at the current bar
+
+        Returns:
+        --------
+        int
+            Number of bars applied
+        """
+        # Walk back from the end to the first unseen bar (usually just one)
+        first_new = len(recent_bars)
+        while first_new > 0 and (
+            self.last_timestamp is None
+            or recent_bars[first_new - 1].timestamp > self.last_timestamp
+        ):
+            first_new -= 1
+        for index in range(first_new, len(recent_bars)):
+            self.update(recent_bars[index])
+        return len(recent_bars) - first_new
+
+    @property
+    def true_range_sum(self) -> Decimal:
+        """Sum of the last atr_period true ranges (fewer early in the series)."""
+        return self._true_ranges.total
+
+    @property
+    def true_range_count(self) -> int:
+        """Number of true ranges computed so far (bar_count - 1)."""
+        return self._true_range_count
+
+    @property
+    def atr(self) -> Optional[Decimal]:
+        """Mean of the last atr_period true ranges; None until atr_period + 1 bars."""
+        if self._true_range_count < self.atr_period:
+            return None
+        return self._true_ranges.total / Decimal(str(self.atr_period))
+
+    @property
+    def avg_low(self) -> Optional[Decimal]:
+        """Mean of the last trend_lookback lows; None until that many bars."""
+        if len(self._lows) < self.trend_lookback:
+            return None
+        return self._lows.total / Decimal(str(self.trend_lookback))
+
+    @property
+    def avg_volume(self) -> Optional[Decimal]:
+        """Mean of the last volume_lookback volumes; None until that many bars."""
+        if len(self._volumes) < self.volume_lookback:
+            return None
+        return self._volumes.total / Decimal(str(self.volume_lookback))
+
+    @property
+    def max_high(self) -> Optional[Decimal]:
+        """Highest high over the last ``history`` bars."""
+        return self._max_highs[0][1] if self._max_highs else None
+
+    @property
+    def recent_bars(self) -> deque["OHLCVBar"]:
+        """The last ``history`` bars (read-only view)."""
+        return self._bars
+
+    def swing_highs(self, lookback: int) -> list[Decimal]:
+        """
+        Confirmed swing highs inside the last lookback + 4 bars.
+
+        Matches scanning ``recent_bars[-lookback - 4:]`` for bars higher than
+        the 2 bars on each side.
+
+        Parameters:
+        -----------
+        lookback : int
+            Bars checked by the caller (must be <= history - 2)
+
+        Returns:
+        --------
+        list[Decimal]
+            Swing high prices, oldest first
+        """
+        first_index = self.bar_count - lookback - _SWING_STRENGTH
+        return [high for index, high in self._swing_highs if index >= first_index]
@@ -13,6 +13,7 @@ Enhanced Wyckoff exit logic with:
 - Excessive phase duration detection (FR6.6.2 - Story 13.6.3)
 - Unified exit integration with priority ordering (Story 13.6.5)
 - Campaign state management facade (Story 18.11.3)
+- Incremental per-campaign exit indicators (ExitIndicatorState)
 
 Migration Guide:
 ----------------
@@ -66,6 +67,7 @@ from src.backtesting.exit import (
     ConsolidationConfig,
     ConsolidationDetector,
     ConsolidationZone,
+    ExitIndicatorState,
     ExitSignal,
     ExitStrategyRegistry,
 )
@@ -93,6 +95,7 @@ def detect_ice_expansion(
     current_bar: OHLCVBar,
     recent_bars: list[OHLCVBar],
     lookback: int = 5,
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> Optional[Decimal]:
     """
     Detect if Ice level (resistance) has expanded during campaign.
@@ -108,6 +111,7 @@ def detect_ice_expansion(
         current_bar: Current bar being analyzed
         recent_bars: Recent bars for volume calculation
         lookback: Number of bars to check for consolidation (default: 5)
+        indicators: Optional incremental state supplying the 20-bar average volume
 
     Returns:
         New Ice level if expansion confirmed, None otherwise
@@ -164,8 +168,14 @@ def detect_ice_expansion(
 
     if respect_count >= 3:
         # Check volume quality - need at least 20 bars for average
-        if len(recent_bars) >= 20:
+        if indicators is not None and indicators.volume_lookback == 20:
+            avg_volume = indicators.avg_volume
+        elif len(recent_bars) >= 20:
             avg_volume = sum(b.volume for b in recent_bars[-20:]) / Decimal("20")
+        else:
+            avg_volume = None
+
+        if avg_volume is not None:
             if current_bar.volume >= avg_volume:
                 logger.info(
                     "ice_expansion_detected",
@@ -709,6 +719,7 @@ def check_volatility_spike(
     recent_bars: list[OHLCVBar],
     atr_period: int = 14,
     spike_threshold: Decimal = Decimal("2.5"),
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> tuple[bool, Optional[str]]:
     """
     Detect extreme volatility spike indicating market regime change.
@@ -725,6 +736,8 @@ def check_volatility_spike(
         recent_bars: Recent bars for ATR calculation
         atr_period: ATR calculation period (default: 14)
         spike_threshold: Multiplier for regime change (default: 2.5x)
+        indicators: Optional incremental state; replaces the true range scan
+            over recent_bars when its atr_period matches
 
     Returns:
         tuple: (should_exit: bool, exit_reason: str or None)
@@ -734,27 +747,35 @@ def check_volatility_spike(
         >>> if spike:
         ...     print(f"Exit: {reason}")
     """
-    if len(recent_bars) < atr_period or not campaign.entry_atr:
+    use_indicators = indicators is not None and indicators.atr_period == atr_period
+    bar_count = indicators.bar_count if use_indicators else len(recent_bars)
+    if bar_count < atr_period or not campaign.entry_atr:
         return (False, None)
 
     # Calculate current ATR
-    true_ranges = []
-    for i in range(1, len(recent_bars)):
-        high = recent_bars[i].high
-        low = recent_bars[i].low
-        prev_close = recent_bars[i - 1].close
-
-        true_range = max(
-            high - low,
-            abs(high - prev_close),
-            abs(low - prev_close),
-        )
-        true_ranges.append(true_range)
+    if use_indicators:
+        if indicators.true_range_count == 0:
+            return (False, None)
+        true_range_sum = indicators.true_range_sum
+    else:
+        true_ranges = []
+        for i in range(1, len(recent_bars)):
+            high = recent_bars[i].high
+            low = recent_bars[i].low
+            prev_close = recent_bars[i - 1].close
+
+            true_range = max(
+                high - low,
+                abs(high - prev_close),
+                abs(low - prev_close),
+            )
+            true_ranges.append(true_range)
 
-    if not true_ranges:
-        return (False, None)
+        if not true_ranges:
+            return (False, None)
+        true_range_sum = sum(true_ranges[-atr_period:])
 
-    current_atr = sum(true_ranges[-atr_period:]) / Decimal(str(atr_period))
+    current_atr = true_range_sum / Decimal(str(atr_period))
 
     # Update max ATR seen
     if campaign.max_atr_seen is None or current_atr > campaign.max_atr_seen:
@@ -792,6 +813,10 @@ def calculate_atr(bars: list[OHLCVBar], period: int = 14) -> Optional[Decimal]:
     Returns:
         ATR value or None if insufficient bars
 
+    Note:
+        Recomputes every true range. For per-bar evaluation keep an
+        ExitIndicatorState and read its ``atr`` (same value, O(1) per bar).
+
     Example:
         >>> atr = calculate_atr(bars, period=14)
         >>> print(f"Current ATR: {atr}")
@@ -827,6 +852,7 @@ def detect_uptrend_break(
     campaign: Campaign,
     bar: OHLCVBar,
     recent_bars: list[OHLCVBar],
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> tuple[bool, Optional[str]]:
     """
     Detect break of uptrend line connecting lows during Phase D/E.
@@ -838,6 +864,7 @@ def detect_uptrend_break(
         campaign: Active campaign
         bar: Current bar
         recent_bars: Historical bars
+        indicators: Optional incremental state supplying the 10-bar mean low
 
     Returns:
         tuple: (break_detected: bool, exit_reason: str or None)
@@ -845,12 +872,17 @@ def detect_uptrend_break(
     if campaign.current_phase != WyckoffPhase.E:
         return (False, None)
 
-    if len(recent_bars) < 10:
-        return (False, None)
-
     # Calculate average of recent lows
-    recent_lows = [b.low for b in recent_bars[-10:]]
-    avg_recent_low = sum(recent_lows) / Decimal(str(len(recent_lows)))
+    if indicators is not None and indicators.trend_lookback == 10:
+        avg_recent_low = indicators.avg_low
+        if avg_recent_low is None:
+            return (False, None)
+    else:
+        if len(recent_bars) < 10:
+            return (False, None)
+
+        recent_lows = [b.low for b in recent_bars[-10:]]
+        avg_recent_low = sum(recent_lows) / Decimal(str(len(recent_lows)))
 
     # Break if close is significantly below average
     if bar.close < avg_recent_low * Decimal("0.995"):  # 0.5% below
@@ -869,6 +901,7 @@ def detect_lower_high(
     campaign: Campaign,
     recent_bars: list[OHLCVBar],
     lookback: int = 10,
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> tuple[bool, Optional[str]]:
     """
     Detect lower high formation indicating distribution.
@@ -877,6 +910,7 @@ def detect_lower_high(
         campaign: Active campaign
         recent_bars: Recent bars for swing high detection
         lookback: Number of bars to check (default: 10)
+        indicators: Optional incremental state supplying confirmed swing highs
 
     Returns:
         tuple: (lower_high_detected: bool, exit_reason: str or None)
@@ -884,22 +918,27 @@ def detect_lower_high(
     if campaign.current_phase != WyckoffPhase.E:
         return (False, None)
 
-    if len(recent_bars) < lookback + 4:
+    use_indicators = indicators is not None and lookback + 2 <= indicators.history
+    bar_count = indicators.bar_count if use_indicators else len(recent_bars)
+    if bar_count < lookback + 4:
         return (False, None)
 
     # Find swing highs (bars higher than 2 bars on each side)
-    swing_highs = []
-    check_bars = recent_bars[-lookback - 4 :]
-
-    for i in range(2, len(check_bars) - 2):
-        bar_check = check_bars[i]
-        if (
-            bar_check.high > check_bars[i - 1].high
-            and bar_check.high > check_bars[i - 2].high
-            and bar_check.high > check_bars[i + 1].high
-            and bar_check.high > check_bars[i + 2].high
-        ):
-            swing_highs.append(bar_check.high)
+    if use_indicators:
+        swing_highs = indicators.swing_highs(lookback)
+    else:
+        swing_highs = []
+        check_bars = recent_bars[-lookback - 4 :]
+
+        for i in range(2, len(check_bars) - 2):
+            bar_check = check_bars[i]
+            if (
+                bar_check.high > check_bars[i - 1].high
+                and bar_check.high > check_bars[i - 2].high
+                and bar_check.high > check_bars[i + 1].high
+                and bar_check.high > check_bars[i + 2].high
+            ):
+                swing_highs.append(bar_check.high)
 
     if len(swing_highs) < 2:
         return (False, None)
@@ -925,6 +964,7 @@ def detect_failed_rallies(
     recent_bars: list[OHLCVBar],
     resistance_level: Optional[Decimal] = None,
     lookback: int = 20,
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> tuple[bool, Optional[str]]:
     """
     Detect multiple failed attempts to break resistance.
@@ -934,6 +974,8 @@ def detect_failed_rallies(
         recent_bars: Recent bars to analyze
         resistance_level: Resistance to test (optional)
         lookback: Number of bars to check (default: 20)
+        indicators: Optional incremental state supplying the bar window and
+            rolling max high when its history equals lookback
 
     Returns:
         tuple: (failed_rallies_detected: bool, exit_reason: str or None)
@@ -941,21 +983,27 @@ def detect_failed_rallies(
     if campaign.current_phase != WyckoffPhase.E:
         return (False, None)
 
-    if len(recent_bars) < lookback:
+    use_indicators = indicators is not None and indicators.history == lookback
+    bar_count = indicators.bar_count if use_indicators else len(recent_bars)
+    if bar_count < lookback:
         return (False, None)
 
+    window = indicators.recent_bars if use_indicators else recent_bars[-lookback:]
+
     # Determine resistance level
     if not resistance_level:
         if campaign.jump_level:
             resistance_level = campaign.jump_level * Decimal("0.95")
         elif campaign.resistance_level:
             resistance_level = campaign.resistance_level
+        elif use_indicators:
+            resistance_level = indicators.max_high
         else:
-            resistance_level = max(b.high for b in recent_bars[-lookback:])
+            resistance_level = max(b.high for b in window)
 
     # Find failed rally attempts
     rally_attempts = []
-    for bar in recent_bars[-lookback:]:
+    for bar in window:
         if bar.high >= resistance_level * Decimal("0.995") and bar.close < resistance_level:
             rally_attempts.append(bar)
 
@@ -1461,6 +1509,7 @@ def _check_volatility_spike_wrapper(
     bar: OHLCVBar,
     campaign: Campaign,
     recent_bars: list[OHLCVBar],
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> tuple[bool, Optional[str], Optional[dict[str, Any]]]:
     """
     Check Priority 2: Volatility spike (regime change).
@@ -1469,11 +1518,12 @@ def _check_volatility_spike_wrapper(
         bar: Current bar
         campaign: Active campaign
         recent_bars: Historical bars for ATR calculation
+        indicators: Optional incremental indicator state
 
     Returns:
         tuple: (should_exit, exit_reason, metadata)
     """
-    spike, reason = check_volatility_spike(bar, campaign, recent_bars)
+    spike, reason = check_volatility_spike(bar, campaign, recent_bars, indicators=indicators)
 
     if spike and reason:
         details = {
@@ -1605,6 +1655,7 @@ def _check_uptrend_break_wrapper(
     bar: OHLCVBar,
     campaign: Campaign,
     recent_bars: list[OHLCVBar],
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> tuple[bool, Optional[str], Optional[dict[str, Any]]]:
     """
     Check Priority 6: Uptrend break (structure failed).
@@ -1613,11 +1664,12 @@ def _check_uptrend_break_wrapper(
         bar: Current bar
         campaign: Active campaign
         recent_bars: Historical bars
+        indicators: Optional incremental indicator state
 
     Returns:
         tuple: (should_exit, exit_reason, metadata)
     """
-    break_detected, reason = detect_uptrend_break(campaign, bar, recent_bars)
+    break_detected, reason = detect_uptrend_break(campaign, bar, recent_bars, indicators=indicators)
 
     if break_detected and reason:
         details = {
@@ -1634,6 +1686,7 @@ def _check_lower_high_wrapper(
     campaign: Campaign,
     recent_bars: list[OHLCVBar],
     bar: OHLCVBar,
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> tuple[bool, Optional[str], Optional[dict[str, Any]]]:
     """
     Check Priority 7: Lower high (distribution pattern).
@@ -1642,11 +1695,14 @@ def _check_lower_high_wrapper(
         campaign: Active campaign
         recent_bars: Historical bars
         bar: Current bar for metadata
+        indicators: Optional incremental indicator state
 
     Returns:
         tuple: (should_exit, exit_reason, metadata)
     """
-    lower_high_detected, reason = detect_lower_high(campaign, recent_bars, lookback=10)
+    lower_high_detected, reason = detect_lower_high(
+        campaign, recent_bars, lookback=10, indicators=indicators
+    )
 
     if lower_high_detected and reason:
         details = {
@@ -1662,6 +1718,7 @@ def _check_failed_rallies_wrapper(
     campaign: Campaign,
     recent_bars: list[OHLCVBar],
     bar: OHLCVBar,
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> tuple[bool, Optional[str], Optional[dict[str, Any]]]:
     """
     Check Priority 8: Failed rallies (supply absorption).
@@ -1670,11 +1727,14 @@ def _check_failed_rallies_wrapper(
         campaign: Active campaign
         recent_bars: Historical bars
         bar: Current bar for metadata
+        indicators: Optional incremental indicator state
 
     Returns:
         tuple: (should_exit, exit_reason, metadata)
     """
-    failed, reason = detect_failed_rallies(campaign, recent_bars, lookback=20)
+    failed, reason = detect_failed_rallies(
+        campaign, recent_bars, lookback=20, indicators=indicators
+    )
 
     if failed and reason:
         details = {
@@ -1861,6 +1921,7 @@ def wyckoff_exit_logic_unified(
     session_profile: Optional[SessionVolumeProfile] = None,
     current_prices: Optional[dict[str, Decimal]] = None,
     time_limit_bars: int = 500,
+    indicators: Optional[ExitIndicatorState] = None,
 ) -> tuple[bool, Optional[str], Optional[dict[str, Any]]]:
     """
     Unified Wyckoff + Risk exit logic with all conditions.
@@ -1890,6 +1951,10 @@ def wyckoff_exit_logic_unified(
         session_profile: Optional session volume profile for intraday
         current_prices: Optional dict of symbol -> current price for portfolio
         time_limit_bars: Maximum bars before time-based exit (default: 500)
+        indicators: Optional per-campaign ExitIndicatorState, already updated
+            with the current bar. When given, the volatility spike, uptrend
+            break, lower high and failed rally checks read its incremental
+            values instead of rescanning recent_bars.
 
     Returns:
         tuple: (should_exit, exit_reason, exit_metadata)
@@ -1913,7 +1978,9 @@ def wyckoff_exit_logic_unified(
         return (should_exit, reason, metadata)
 
     # Priority 2: VOLATILITY_SPIKE - Market regime changed
-    should_exit, reason, metadata = _check_volatility_spike_wrapper(bar, campaign, recent_bars)
+    should_exit, reason, metadata = _check_volatility_spike_wrapper(
+        bar, campaign, recent_bars, indicators
+    )
     if should_exit:
         return (should_exit, reason, metadata)
 
@@ -1935,17 +2002,23 @@ def wyckoff_exit_logic_unified(
         return (should_exit, reason, metadata)
 
     # Priority 6: UPTREND_BREAK - Structure failed
-    should_exit, reason, metadata = _check_uptrend_break_wrapper(bar, campaign, recent_bars)
+    should_exit, reason, metadata = _check_uptrend_break_wrapper(
+        bar, campaign, recent_bars, indicators
+    )
     if should_exit:
         return (should_exit, reason, metadata)
 
     # Priority 7: LOWER_HIGH - Distribution pattern
-    should_exit, reason, metadata = _check_lower_high_wrapper(campaign, recent_bars, bar)
+    should_exit, reason, metadata = _check_lower_high_wrapper(
+        campaign, recent_bars, bar, indicators
+    )
     if should_exit:
         return (should_exit, reason, metadata)
 
     # Priority 8: FAILED_RALLIES - Supply absorption
-    should_exit, reason, metadata = _check_failed_rallies_wrapper(campaign, recent_bars, bar)
+    should_exit, reason, metadata = _check_failed_rallies_wrapper(
+        campaign, recent_bars, bar, indicators
+    )
     if should_exit:
         return (should_exit, reason, metadata)
 
@@ -2009,6 +2082,7 @@ class ExitLogicRefinements:
     - _state_manager: Centralized campaign state management
     - _strategy_registry: Access to exit strategy implementations
     - _consolidation_detector: Consolidation zone detection
+    - _indicator_states: Incremental exit indicators keyed by str(campaign_id)
 
     Example:
     --------
@@ -2041,6 +2115,7 @@ class ExitLogicRefinements:
         # Store class reference - ExitStrategyRegistry uses class methods (singleton pattern)
         self._strategy_registry = ExitStrategyRegistry
         self._consolidation_detector = ConsolidationDetector()
+        self._indicator_states: dict[str, ExitIndicatorState] = {}
 
     async def evaluate_exit(
         self,
@@ -2057,7 +2132,10 @@ class ExitLogicRefinements:
         Evaluate all exit conditions using unified exit logic.
 
         Delegates to wyckoff_exit_logic_unified for comprehensive exit
-        evaluation with all Wyckoff-specific refinements.
+        evaluation with all Wyckoff-specific refinements. The campaign's
+        ExitIndicatorState is advanced with the unseen tail of recent_bars
+        (normally just the current bar), so repeated evaluation costs O(1)
+        per bar instead of rescanning the history for every check.
 
         Parameters:
         -----------
@@ -2096,6 +2174,14 @@ class ExitLogicRefinements:
         >>> if should_exit:
         ...     logger.info(f"Exit triggered: {reason}", **metadata)
         """
+        # Keyed by str so process_exit's UUID campaign_id finds the same entry
+        state_key = str(campaign.campaign_id)
+        indicators = self._indicator_states.get(state_key)
+        if indicators is None:
+            indicators = ExitIndicatorState()
+            self._indicator_states[state_key] = indicators
+        indicators.sync(recent_bars)
+
         return wyckoff_exit_logic_unified(
             bar=bar,
             campaign=campaign,
@@ -2105,6 +2191,7 @@ class ExitLogicRefinements:
             portfolio=portfolio,
             current_prices=current_prices,
             time_limit_bars=time_limit_bars,
+            indicators=indicators,
         )
 
     async def update_position_state(
@@ -2156,7 +2243,8 @@ class ExitLogicRefinements:
         Process exit signal and close position.
 
         Delegates to CampaignStateManager for position closure with
-        exit signal data (price, reason, timestamp).
+        exit signal data (price, reason, timestamp), and drops the
+        campaign's incremental exit indicators.
 
         Parameters:
         -----------
@@ -2185,6 +2273,7 @@ class ExitLogicRefinements:
         ...     exit_signal=exit_signal
         ... )
         """
+        self._indicator_states.pop(str(campaign_id), None)
         return await self._state_manager.handle_exit(
             campaign_id=campaign_id,
             position_id=position_id,
@@ -33,12 +33,13 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from statistics import mean, median
+from itertools import count
 from typing import Any, Optional, TypeAlias, Union
 from uuid import uuid4
 
 import structlog
 
+from src.backtesting.completed_campaign_store import CompletedCampaignStore
 from src.backtesting.event_publisher import EventPublisher
 
 # Story 22.6: Extracted ValidationCache
@@ -218,11 +219,13 @@ class BatchResult:
     rejected_patterns: list[tuple[WyckoffPattern, str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Campaign:
     """
     Micro-campaign tracking detected Wyckoff patterns.
 
+    Slotted: attributes outside the fields below cannot be set.
+
     Attributes:
         campaign_id: Unique campaign identifier
         start_time: First pattern timestamp
@@ -338,6 +341,10 @@ class Campaign:
     points_gained: Optional[Decimal] = None  # Exit price - entry price
     duration_bars: int = 0  # Campaign duration in bars
 
+    # Position entry (set by exit logic callers; read by the time-limit exit check)
+    entry_bar_index: Optional[int] = None  # Bar index of position entry
+    entry_price: Optional[Decimal] = None  # Position entry fill price
+
     # Story 15.4: Pattern Validation Caching
     _validation_cache: dict[str, dict[str, Any]] = field(
         default_factory=dict, repr=False, compare=False
@@ -650,6 +657,21 @@ class IntradayCampaignDetector:
         # Story 16.6b: Campaigns indexed by timeframe for quick lookups
         self._campaigns_by_timeframe: dict[str, set[str]] = defaultdict(set)
 
+        # Open (FORMING/ACTIVE) campaigns in creation order, with their correlation
+        # counts, so grouping and limit checks never scan completed history
+        self._campaign_sequence = count()
+        self._creation_order: dict[str, int] = {}
+        self._open_campaigns: dict[str, Campaign] = {}
+        self._open_correlation_keys: dict[
+            str, tuple[Optional[str], Optional[str], Optional[AssetCategory]]
+        ] = {}
+        self._open_by_correlation_group: Counter[Optional[str]] = Counter()
+        self._open_by_sector: Counter[Optional[str]] = Counter()
+        self._open_by_category: Counter[Optional[AssetCategory]] = Counter()
+
+        # Outcomes of COMPLETED campaigns, archived column-wise for statistics
+        self._completed_store = CompletedCampaignStore()
+
         # Story 22.6: Extracted validation cache (replaces embedded cache in Campaign)
         self._validation_cache: ValidationCache[bool] = validation_cache or ValidationCache(
             ttl_seconds=300, max_entries=VALIDATION_CACHE_MAX_ENTRIES
@@ -717,6 +739,8 @@ class IntradayCampaignDetector:
             - _campaigns_by_state: O(1) state queries
             - _active_time_windows: Hot-path optimization for recent active campaigns
             - _campaigns_by_timeframe: O(1) timeframe queries (Story 16.6b)
+            - _open_campaigns: FORMING/ACTIVE campaigns and correlation counts
+            - _completed_store: outcome row (if COMPLETED)
 
         Args:
             campaign: Campaign to add to indexes
@@ -728,6 +752,8 @@ class IntradayCampaignDetector:
         """
         # ID index
         self._campaigns_by_id[campaign.campaign_id] = campaign
+        if campaign.campaign_id not in self._creation_order:
+            self._creation_order[campaign.campaign_id] = next(self._campaign_sequence)
 
         # State index
         self._campaigns_by_state[campaign.state].add(campaign.campaign_id)
@@ -739,6 +765,8 @@ class IntradayCampaignDetector:
         # Story 16.6b: Timeframe index
         self._campaigns_by_timeframe[campaign.timeframe].add(campaign.campaign_id)
 
+        self._track_lifecycle(campaign)
+
     def _update_indexes(self, campaign: Campaign, old_state: CampaignState) -> None:
         """
         Update indexes when campaign state changes (Story 15.3).
@@ -763,6 +791,8 @@ class IntradayCampaignDetector:
         else:
             self._active_time_windows.pop(campaign.campaign_id, None)
 
+        self._track_lifecycle(campaign)
+
     def _remove_from_indexes(self, campaign_id: str) -> None:
         """
         Remove campaign from all indexes (Story 15.3).
@@ -789,8 +819,12 @@ class IntradayCampaignDetector:
         # Story 16.6b: Remove from timeframe index
         self._campaigns_by_timeframe[campaign.timeframe].discard(campaign_id)
 
+        self._untrack_open(campaign_id)
+        self._completed_store.discard(campaign_id)
+
         # Remove from ID index
         del self._campaigns_by_id[campaign_id]
+        self._creation_order.pop(campaign_id, None)
 
     def _rebuild_indexes(self) -> None:
         """
@@ -806,14 +840,23 @@ class IntradayCampaignDetector:
         self._campaigns_by_state.clear()
         self._active_time_windows.clear()
         self._campaigns_by_timeframe.clear()  # Story 16.6b
+        self._creation_order.clear()
+        self._open_campaigns.clear()
+        self._open_correlation_keys.clear()
+        self._open_by_correlation_group.clear()
+        self._open_by_sector.clear()
+        self._open_by_category.clear()
+        self._completed_store.clear()
 
         # Rebuild from ID index
         for campaign in self._campaigns_by_id.values():
+            self._creation_order[campaign.campaign_id] = next(self._campaign_sequence)
             self._campaigns_by_state[campaign.state].add(campaign.campaign_id)
             if campaign.state == CampaignState.ACTIVE:
                 self._active_time_windows[campaign.campaign_id] = True
             # Story 16.6b: Rebuild timeframe index
             self._campaigns_by_timeframe[campaign.timeframe].add(campaign.campaign_id)
+            self._track_lifecycle(campaign)
 
         self.logger.debug(
             "Indexes rebuilt",
@@ -822,6 +865,81 @@ class IntradayCampaignDetector:
             timeframes=list(self._campaigns_by_timeframe.keys()),
         )
 
+    def _track_lifecycle(self, campaign: Campaign) -> None:
+        """
+        Sync the open-campaign set and the completed archive with campaign.state.
+
+        Open (FORMING/ACTIVE) campaigns are kept in creation order together with
+        their correlation counts; COMPLETED campaigns are archived as one row of
+        outcome columns. Safe to call repeatedly for the same campaign.
+
+        Args:
+            campaign: Campaign whose state was set or changed
+        """
+        campaign_id = campaign.campaign_id
+
+        if campaign.state in (CampaignState.FORMING, CampaignState.ACTIVE):
+            if campaign_id not in self._open_campaigns:
+                self._track_open(campaign)
+        else:
+            self._untrack_open(campaign_id)
+
+        if campaign.state == CampaignState.COMPLETED:
+            self._archive_completed(campaign)
+        else:
+            self._completed_store.discard(campaign_id)
+
+    def _track_open(self, campaign: Campaign) -> None:
+        """Add campaign to the open set, keeping creation order."""
+        campaign_id = campaign.campaign_id
+        last_open_id = next(reversed(self._open_campaigns), None)
+        self._open_campaigns[campaign_id] = campaign
+
+        # A reopened campaign (e.g. DORMANT -> ACTIVE) goes back to its creation slot
+        order = self._creation_order
+        if last_open_id is not None and order.get(last_open_id, 0) > order.get(campaign_id, 0):
+            self._open_campaigns = dict(
+                sorted(self._open_campaigns.items(), key=lambda item: order.get(item[0], 0))
+            )
+
+        keys = (campaign.correlation_group, campaign.sector, campaign.asset_category)
+        self._open_correlation_keys[campaign_id] = keys
+        self._open_by_correlation_group[keys[0]] += 1
+        self._open_by_sector[keys[1]] += 1
+        self._open_by_category[keys[2]] += 1
+
+    def _untrack_open(self, campaign_id: str) -> None:
+        """Remove campaign from the open set and its correlation counts."""
+        if self._open_campaigns.pop(campaign_id, None) is None:
+            return
+        group, sector, category = self._open_correlation_keys.pop(campaign_id)
+        for counter, key in (
+            (self._open_by_correlation_group, group),
+            (self._open_by_sector, sector),
+            (self._open_by_category, category),
+        ):
+            counter[key] -= 1
+            if counter[key] <= 0:
+                del counter[key]
+
+    def _archive_completed(self, campaign: Campaign) -> None:
+        """
+        Archive a COMPLETED campaign's outcome for statistics.
+
+        Args:
+            campaign: Completed campaign (performance metrics calculated)
+        """
+        patterns = campaign.patterns
+        self._completed_store.add(
+            campaign.campaign_id,
+            r_multiple=campaign.r_multiple,
+            duration_bars=campaign.duration_bars,
+            exit_reason=campaign.exit_reason.value,
+            sequence=self._pattern_sequence_key(patterns),
+            entry_phase=self._pattern_phase_label(patterns[0]) if patterns else "UNKNOWN",
+            exit_phase=self._pattern_phase_label(patterns[-1]) if patterns else "UNKNOWN",
+        )
+
     # ==================================================================================
     # End Story 15.3 Index Maintenance
     # ==================================================================================
@@ -1527,13 +1645,8 @@ class IntradayCampaignDetector:
             2. Pattern within campaign_window_hours from start
             3. Pattern within max_pattern_gap_hours from last pattern
         """
-        # Story 15.3: Use state index for O(1) state check while preserving insertion order
-        # Iterate over campaigns in insertion order (Python 3.7+ dict maintains order)
-        # but use state index for fast state filtering
-        valid_states = {CampaignState.FORMING, CampaignState.ACTIVE}
-        for campaign in self._campaigns_by_id.values():
-            if campaign.state not in valid_states:
-                continue
+        # Only open campaigns are scanned, in creation order
+        for campaign in self._open_campaigns.values():
             if self._pattern_matches_campaign(pattern, campaign):
                 return campaign
 
@@ -1578,15 +1691,13 @@ class IntradayCampaignDetector:
         Return campaigns in FORMING or ACTIVE state (Story 15.3).
 
         Task 4: Get active campaigns retrieval method.
-        Story 15.3: Uses state index for fast filtering while preserving insertion order.
+        Reads the open-campaign set, so cost does not grow with completed history.
 
         Returns:
             List of campaigns in FORMING or ACTIVE state (in insertion order)
         """
-        # Story 15.3: Use state index for O(1) state check while preserving insertion order
-        # Iterate over campaigns in insertion order and filter by state
         valid_states = {CampaignState.FORMING, CampaignState.ACTIVE}
-        return [c for c in self._campaigns_by_id.values() if c.state in valid_states]
+        return [c for c in self._open_campaigns.values() if c.state in valid_states]
 
     def get_correlation_summary(self) -> dict[str, Any]:
         """
@@ -1613,30 +1724,19 @@ class IntradayCampaignDetector:
             >>> print(summary["correlation_groups"])
             {"USD_MAJOR": 2, "EQUITY_TECH": 1, "INDEX_US": 2}
         """
-        active_campaigns = self.get_active_campaigns()
-
-        # Initialize counters
-        correlation_groups: dict[str, int] = {}
-        sectors: dict[str, int] = {}
-        categories: dict[str, int] = {}
-
-        for campaign in active_campaigns:
-            # Group by correlation group
-            group = campaign.correlation_group
-            if group:
-                correlation_groups[group] = correlation_groups.get(group, 0) + 1
-
-            # Group by sector (equities only)
-            if campaign.sector:
-                sectors[campaign.sector] = sectors.get(campaign.sector, 0) + 1
-
-            # Group by category
-            if campaign.asset_category:
-                cat = campaign.asset_category.value
-                categories[cat] = categories.get(cat, 0) + 1
+        # Counts are maintained incrementally for open campaigns
+        correlation_groups: dict[str, int] = {
+            group: n for group, n in self._open_by_correlation_group.items() if group
+        }
+        sectors: dict[str, int] = {
+            sector: n for sector, n in self._open_by_sector.items() if sector
+        }
+        categories: dict[str, int] = {
+            category.value: n for category, n in self._open_by_category.items() if category
+        }
 
         # Calculate category concentration percentages
-        total = len(active_campaigns)
+        total = len(self._open_campaigns)
         category_pct: dict[str, float] = {}
         if total > 0:
             category_pct = {
@@ -1781,8 +1881,6 @@ class IntradayCampaignDetector:
         # Update state
         old_state = campaign.state  # Story 15.3: Track for index update
         campaign.state = CampaignState.COMPLETED
-        # Story 15.3: Update indexes on state change
-        self._update_indexes(campaign, old_state)
         campaign.exit_price = exit_price
         campaign.exit_timestamp = exit_timestamp or datetime.now(UTC)
         campaign.exit_reason = exit_reason
@@ -1790,6 +1888,10 @@ class IntradayCampaignDetector:
         # Calculate metrics
         campaign.calculate_performance_metrics(exit_price)
 
+        # Story 15.3: Update indexes on state change (after metrics, so the
+        # completed archive records the outcome)
+        self._update_indexes(campaign, old_state)
+
         # Log
         self.logger.info(
             "Campaign completed",
@@ -1977,10 +2079,10 @@ class IntradayCampaignDetector:
             >>> stats["performance"]["avg_r_multiple"]
             2.5
         """
-        all_campaigns = list(self._campaigns_by_id.values())
-        completed = [c for c in all_campaigns if c.state == CampaignState.COMPLETED]
-        failed = [c for c in all_campaigns if c.state == CampaignState.FAILED]
-        total = len(all_campaigns)
+        # Story 15.3 indexes give the counts; outcomes come from the completed archive
+        total = len(self._campaigns_by_id)
+        completed_count = len(self._campaigns_by_state[CampaignState.COMPLETED])
+        failed_count = len(self._campaigns_by_state[CampaignState.FAILED])
 
         # Handle edge case: no campaigns
         if total == 0:
@@ -1989,41 +2091,22 @@ class IntradayCampaignDetector:
         # Overview metrics
         overview = {
             "total_campaigns": total,
-            "completed": len(completed),
-            "failed": len(failed),
+            "completed": completed_count,
+            "failed": failed_count,
             "active": len(self.get_active_campaigns()),
-            "success_rate_pct": (len(completed) / total * 100) if total > 0 else 0.0,
+            "success_rate_pct": (completed_count / total * 100) if total > 0 else 0.0,
         }
 
-        # Performance metrics
-        r_multiples = [c.r_multiple for c in completed if c.r_multiple is not None]
-        winning_campaigns = [c for c in completed if c.r_multiple and c.r_multiple > 0]
-
-        performance = {
-            "win_rate_pct": (len(winning_campaigns) / len(completed) * 100) if completed else 0.0,
-            "avg_r_multiple": float(mean(r_multiples)) if r_multiples else 0.0,
-            "median_r_multiple": float(median(r_multiples)) if r_multiples else 0.0,
-            "best_r_multiple": float(max(r_multiples)) if r_multiples else 0.0,
-            "worst_r_multiple": float(min(r_multiples)) if r_multiples else 0.0,
-            "total_r": float(sum(r_multiples)) if r_multiples else 0.0,
-            "avg_duration_bars": mean([c.duration_bars for c in completed]) if completed else 0,
-            "profitable_campaigns": len(winning_campaigns),
-            "losing_campaigns": len([c for c in completed if c.r_multiple and c.r_multiple <= 0]),
-        }
-
-        # Exit reason breakdown
-        exit_reasons = self._calculate_exit_reason_stats(completed)
-
-        # Pattern sequence analysis
-        pattern_stats = self._calculate_pattern_sequence_stats(completed)
-
-        # Phase analysis
-        phase_stats = self._calculate_phase_stats(completed)
+        store = self._completed_store
+        performance = store.performance_stats()
+        exit_reasons = store.exit_reason_stats()
+        pattern_stats = store.pattern_sequence_stats()
+        phase_stats = store.phase_stats()
 
         self.logger.info(
             "Campaign statistics generated",
             total_campaigns=total,
-            completed=len(completed),
+            completed=completed_count,
             win_rate=performance["win_rate_pct"],
             avg_r=performance["avg_r_multiple"],
         )
@@ -2111,164 +2194,42 @@ class IntradayCampaignDetector:
             "generated_at": datetime.now(UTC).isoformat(),
         }
 
-    def _calculate_exit_reason_stats(self, completed: list[Campaign]) -> dict[str, Any]:
-        """
-        Calculate statistics by exit reason (Story 15.2).
-
-        Args:
-            completed: List of completed campaigns
-
-        Returns:
-            Dictionary with stats per exit reason:
-            {
-                "TARGET_HIT": {"count": 20, "win_rate_pct": 100.0, "avg_r_multiple": 3.0},
-                "STOP_OUT": {"count": 10, "win_rate_pct": 0.0, "avg_r_multiple": -1.0}
-            }
-
-        Example:
-            >>> stats = detector._calculate_exit_reason_stats(completed_campaigns)
-            >>> stats["TARGET_HIT"]["win_rate_pct"]
-            100.0
+    @staticmethod
+    def _pattern_sequence_key(patterns: list[WyckoffPattern]) -> str:
         """
-        stats_by_reason: dict[str, dict[str, Any]] = defaultdict(
-            lambda: {"count": 0, "r_multiples": [], "winning": 0}
-        )
+        Classify a campaign's pattern sequence for statistics (Story 15.2).
 
-        for campaign in completed:
-            reason = campaign.exit_reason.value
-            stats_by_reason[reason]["count"] += 1
-
-            if campaign.r_multiple is not None:
-                stats_by_reason[reason]["r_multiples"].append(float(campaign.r_multiple))
-                if campaign.r_multiple > 0:
-                    stats_by_reason[reason]["winning"] += 1
-
-        # Calculate aggregates
-        result = {}
-        for reason, data in stats_by_reason.items():
-            result[reason] = {
-                "count": data["count"],
-                "win_rate_pct": (data["winning"] / data["count"] * 100)
-                if data["count"] > 0
-                else 0.0,
-                "avg_r_multiple": mean(data["r_multiples"]) if data["r_multiples"] else 0.0,
-            }
-
-        return result
-
-    def _calculate_pattern_sequence_stats(self, completed: list[Campaign]) -> dict[str, Any]:
-        """
-        Analyze performance by pattern sequence (Story 15.2).
-
-        Sequences analyzed:
+        Sequences:
         - Spring → SOS
         - Spring → AR → SOS
         - Spring → AR → SOS → LPS
         - Other (patterns not matching above sequences)
 
         Args:
-            completed: List of completed campaigns
+            patterns: Campaign patterns
 
         Returns:
-            Dictionary with stats per sequence:
-            {
-                "Spring→SOS": {"count": 20, "win_rate_pct": 75.0, "avg_r_multiple": 2.0},
-                "Spring→AR→SOS": {"count": 15, "win_rate_pct": 80.0, "avg_r_multiple": 2.5}
-            }
-
-        Example:
-            >>> stats = detector._calculate_pattern_sequence_stats(completed_campaigns)
-            >>> stats["Spring→AR→SOS→LPS"]["avg_r_multiple"]
-            3.0
-        """
-        sequences: dict[str, dict[str, Any]] = {
-            "Spring→SOS": {"campaigns": [], "r_multiples": []},
-            "Spring→AR→SOS": {"campaigns": [], "r_multiples": []},
-            "Spring→AR→SOS→LPS": {"campaigns": [], "r_multiples": []},
-            "Other": {"campaigns": [], "r_multiples": []},
-        }
-
-        for campaign in completed:
-            pattern_types = [type(p).__name__ for p in campaign.patterns]
-
-            # Classify sequence
-            has_spring = "Spring" in pattern_types
-            has_ar = "AutomaticRally" in pattern_types or "ARPattern" in pattern_types
-            has_sos = "SOSBreakout" in pattern_types
-            has_lps = "LPS" in pattern_types or "LPSPattern" in pattern_types
-
-            if has_spring and has_ar and has_sos and has_lps:
-                seq_key = "Spring→AR→SOS→LPS"
-            elif has_spring and has_ar and has_sos:
-                seq_key = "Spring→AR→SOS"
-            elif has_spring and has_sos:
-                seq_key = "Spring→SOS"
-            else:
-                seq_key = "Other"
-
-            sequences[seq_key]["campaigns"].append(campaign)
-            if campaign.r_multiple is not None:
-                sequences[seq_key]["r_multiples"].append(float(campaign.r_multiple))
-
-        # Calculate stats
-        result = {}
-        for seq_name, data in sequences.items():
-            count = len(data["campaigns"])
-            if count == 0:
-                continue
-
-            winning = len([c for c in data["campaigns"] if c.r_multiple and c.r_multiple > 0])
-
-            result[seq_name] = {
-                "count": count,
-                "win_rate_pct": (winning / count * 100) if count > 0 else 0.0,
-                "avg_r_multiple": mean(data["r_multiples"]) if data["r_multiples"] else 0.0,
-                "best_r_multiple": max(data["r_multiples"]) if data["r_multiples"] else 0.0,
-            }
-
-        return result
-
-    def _calculate_phase_stats(self, completed: list[Campaign]) -> dict[str, Any]:
+            Sequence key (one of PATTERN_SEQUENCES)
         """
-        Calculate statistics by entry/exit phase (Story 15.2).
+        pattern_types = {type(p).__name__ for p in patterns}
 
-        Args:
-            completed: List of completed campaigns
+        has_spring = "Spring" in pattern_types
+        has_ar = "AutomaticRally" in pattern_types or "ARPattern" in pattern_types
+        has_sos = "SOSBreakout" in pattern_types
+        has_lps = "LPS" in pattern_types or "LPSPattern" in pattern_types
 
-        Returns:
-            Dictionary with phase distribution:
-            {
-                "entry_phase_distribution": {"C": 30, "D": 20},
-                "exit_phase_distribution": {"D": 25, "E": 25}
-            }
-
-        Example:
-            >>> stats = detector._calculate_phase_stats(completed_campaigns)
-            >>> stats["entry_phase_distribution"]["C"]
-            30
-        """
-        # Entry phase distribution
-        entry_phases = [
-            c.patterns[0].phase.value
-            if c.patterns and hasattr(c.patterns[0], "phase")
-            else "UNKNOWN"
-            for c in completed
-        ]
-        entry_phase_counts = Counter(entry_phases)
-
-        # Exit phase distribution
-        exit_phases = [
-            c.patterns[-1].phase.value
-            if c.patterns and hasattr(c.patterns[-1], "phase")
-            else "UNKNOWN"
-            for c in completed
-        ]
-        exit_phase_counts = Counter(exit_phases)
+        if has_spring and has_ar and has_sos and has_lps:
+            return "Spring→AR→SOS→LPS"
+        if has_spring and has_ar and has_sos:
+            return "Spring→AR→SOS"
+        if has_spring and has_sos:
+            return "Spring→SOS"
+        return "Other"
 
-        return {
-            "entry_phase_distribution": dict(entry_phase_counts),
-            "exit_phase_distribution": dict(exit_phase_counts),
-        }
+    @staticmethod
+    def _pattern_phase_label(pattern: WyckoffPattern) -> str:
+        """Phase value of a pattern for phase distributions (Story 15.2)."""
+        return pattern.phase.value if hasattr(pattern, "phase") else "UNKNOWN"
 
     def _determine_phase(self, patterns: list[WyckoffPattern]) -> Optional[WyckoffPhase]:
         """
@@ -2838,13 +2799,11 @@ class IntradayCampaignDetector:
             2. Max 3 campaigns per sector - equities only (configurable)
             3. Max 50% of portfolio in single asset category (configurable)
         """
-        active_campaigns = self.get_active_campaigns()
-
         # Get correlation group for the new asset
         correlation_group = CorrelationMapper.get_correlation_group(asset_symbol, asset_category)
 
-        # Check 1: Correlation group limit
-        group_count = sum(1 for c in active_campaigns if c.correlation_group == correlation_group)
+        # Check 1: Correlation group limit (open-campaign counts are kept incrementally)
+        group_count = self._open_by_correlation_group[correlation_group]
         if group_count >= self.max_campaigns_per_correlation_group:
             self.logger.warning(
                 "Correlation group limit exceeded",
@@ -2865,7 +2824,7 @@ class IntradayCampaignDetector:
 
         # Check 2: Sector limit (equities only)
         if sector and asset_category == AssetCategory.EQUITY:
-            sector_count = sum(1 for c in active_campaigns if c.sector == sector)
+            sector_count = self._open_by_sector[sector]
             if sector_count >= self.max_campaigns_per_sector:
                 self.logger.warning(
                     "Sector limit exceeded",
@@ -2885,9 +2844,9 @@ class IntradayCampaignDetector:
                 )
 
         # Check 3: Category concentration limit
-        total_active = len(active_campaigns)
+        total_active = len(self._open_campaigns)
         if total_active > 0:
-            category_count = sum(1 for c in active_campaigns if c.asset_category == asset_category)
+            category_count = self._open_by_category[asset_category]
             # Calculate concentration including the new campaign
             new_category_count = category_count + 1
             new_total = total_active + 1
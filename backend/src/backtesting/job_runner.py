@@ -0,0 +1,613 @@
+"""
+Backtest Job Runner.
+
+Runs CPU-heavy backtest jobs (full backtests, previews, regression tests,
+walk-forward tests) in a bounded pool of worker processes so they never block
+the API event loop. Provides per-job-type concurrency limits with queueing,
+cancellation, and progress forwarding to async callbacks (which the API routes
+use to update run tracking and broadcast WebSocket progress messages).
+
+Everything is local: a spawn-based ProcessPoolExecutor plus a
+multiprocessing manager for the progress queue and cancellation flags. No
+Redis or Celery is required.
+
+Job functions:
+    A job function is a module-level (picklable) callable that receives its
+    positional arguments plus a ``progress`` keyword (ProgressReporter). It
+    may be sync or async; async functions run in the worker's own event loop.
+    Calling ``progress.report(...)`` forwards keyword arguments to the job's
+    ``on_progress`` callback in the API process and raises JobCancelledError
+    once the job has been cancelled, so long loops stop at their next report.
+
+Example:
+    >>> runner = get_backtest_job_runner()
+    >>> result = await runner.run(
+    ...     "backtest",
+    ...     execute_backtest,
+    ...     config,
+    ...     bars,
+    ...     job_id=run_id,
+    ...     on_progress=progress_callback,
+    ... )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import multiprocessing
+import queue
+import threading
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID, uuid4
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Default per-type limits (overridden by Settings.backtest_job_concurrency)
+DEFAULT_JOB_CONCURRENCY: dict[str, int] = {
+    "backtest": 2,
+    "preview": 2,
+    "regression": 1,
+    "walk_forward": 1,
+}
+
+# Finished jobs kept for status queries before the oldest are dropped
+MAX_FINISHED_JOBS = 1000
+
+ProgressCallback = Callable[..., Awaitable[None]]
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a backtest job."""
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+class JobCancelledError(Exception):
+    """Raised when a job is cancelled while queued or running."""
+
+    def __init__(self, job_id: UUID | str) -> None:
+        super().__init__(f"Job {job_id} was cancelled")
+        self.job_id = job_id
+
+    def __reduce__(self) -> tuple[type, tuple[UUID | str]]:
+        return (self.__class__, (self.job_id,))
+
+
+class ProgressReporter:
+    """
+    Worker-side handle for reporting progress and observing cancellation.
+
+    Picklable: holds the job ID plus the shared progress queue and
+    cancellation-flag mapping (manager proxies when running in processes).
+    """
+
+    def __init__(self, job_id: UUID, progress_queue: Any, cancel_flags: Any) -> None:
+        self.job_id = job_id
+        self._queue = progress_queue
+        self._cancel_flags = cancel_flags
+
+    @property
+    def cancelled(self) -> bool:
+        """True once the job has been cancelled."""
+        return bool(self._cancel_flags.get(self.job_id, False))
+
+    def check_cancelled(self) -> None:
+        """
+        Raise if the job has been cancelled.
+
+        Raises:
+            JobCancelledError: If the job was cancelled
+        """
+        if self.cancelled:
+            raise JobCancelledError(self.job_id)
+
+    def report(self, **payload: Any) -> None:
+        """
+        Forward progress to the job's on_progress callback.
+
+        Args:
+            **payload: Keyword arguments passed to on_progress
+
+        Raises:
+            JobCancelledError: If the job was cancelled
+        """
+        self.check_cancelled()
+        self._queue.put((self.job_id, payload))
+
+    def bar_progress_callback(self) -> Callable[[int, int], None]:
+        """
+        Build a per-bar progress hook for UnifiedBacktestEngine.run().
+
+        Reports (bars_analyzed, total_bars, percent_complete) only when the
+        whole-number percentage changes, so a long run sends at most ~100
+        messages and checks for cancellation at each of them.
+
+        Returns:
+            Callable taking (bars_processed, total_bars)
+        """
+        last_percent = -1
+
+        def _callback(bars_processed: int, total_bars: int) -> None:
+            nonlocal last_percent
+            percent = bars_processed * 100 // total_bars if total_bars else 100
+            if percent != last_percent:
+                last_percent = percent
+                self.report(
+                    bars_analyzed=bars_processed,
+                    total_bars=total_bars,
+                    percent_complete=percent,
+                )
+
+        return _callback
+
+    def step_progress_callback(self) -> Callable[[int, int], None]:
+        """
+        Build a progress hook for jobs made of a few coarse steps.
+
+        Used for regression tests (one step per symbol) and walk-forward
+        tests (one step per window). Every call reports (steps_completed,
+        total_steps, percent_complete) and checks for cancellation.
+
+        Returns:
+            Callable taking (steps_completed, total_steps)
+        """
+
+        def _callback(steps_completed: int, total_steps: int) -> None:
+            self.report(
+                steps_completed=steps_completed,
+                total_steps=total_steps,
+                percent_complete=steps_completed * 100 // total_steps if total_steps else 100,
+            )
+
+        return _callback
+
+
+@dataclass
+class BacktestJob:
+    """
+    Tracking record for one job.
+
+    Attributes:
+        job_id: Job identifier (the run/test ID of the originating request)
+        job_type: Concurrency class ("backtest", "preview", ...)
+        status: Current lifecycle state
+        created_at: Submission time
+        started_at: Time the job was dispatched to a worker
+        finished_at: Time the job completed, failed or was cancelled
+        progress: Latest progress payload reported by the worker
+        error: Error message if the job failed
+    """
+
+    job_id: UUID
+    job_type: str
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    progress: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    on_progress: ProgressCallback | None = field(default=None, repr=False)
+    task: asyncio.Task | None = field(default=None, repr=False)  # type: ignore[type-arg]
+
+    @property
+    def is_finished(self) -> bool:
+        """True for COMPLETED, FAILED and CANCELLED jobs."""
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for API responses."""
+        return {
+            "job_id": str(self.job_id),
+            "job_type": self.job_type,
+            "status": self.status.value,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "progress": self.progress,
+            "error": self.error,
+        }
+
+
+def _execute_job(fn: Callable[..., Any], args: tuple[Any, ...], reporter: ProgressReporter) -> Any:
+    """
+    Worker entry point: run a job function, driving it if it is async.
+
+    Args:
+        fn: Job function
+        args: Positional arguments for fn
+        reporter: Progress reporter passed as the ``progress`` keyword
+
+    Returns:
+        The job function's result
+    """
+    reporter.check_cancelled()
+    result = fn(*args, progress=reporter)
+    if inspect.isawaitable(result):
+        result = asyncio.run(result)  # type: ignore[arg-type]
+    return result
+
+
+class BacktestJobRunner:
+    """
+    Bounded worker pool with per-job-type queues.
+
+    Each job type has its own concurrency limit; jobs beyond the limit wait in
+    FIFO order. The process pool is started lazily on the first job and kept
+    warm until shutdown().
+
+    Cancellation:
+        - Queued jobs are removed from the queue immediately
+        - Running jobs stop at their next progress report; the awaiting caller
+          gets JobCancelledError right away and the job's slot is released when
+          the worker actually returns
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        concurrency: Mapping[str, int] | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Initialize runner.
+
+        Args:
+            max_workers: Worker processes in the pool
+            concurrency: Per-job-type concurrency limits (merged over defaults)
+            executor: Optional executor to use instead of a process pool
+                (e.g. a ThreadPoolExecutor in tests)
+        """
+        self._max_workers = max_workers
+        self._limits = {**DEFAULT_JOB_CONCURRENCY, **(concurrency or {})}
+        self._executor = executor
+        self._owns_executor = executor is None
+
+        self._jobs: dict[UUID, BacktestJob] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._callback_tasks: set[asyncio.Task] = set()  # type: ignore[type-arg]
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._start_lock = asyncio.Lock()
+        self._manager: Any = None
+        self._progress_queue: Any = None
+        self._cancel_flags: Any = None
+        self._reader: threading.Thread | None = None
+
+        logger.info(
+            "backtest_job_runner_initialized",
+            max_workers=max_workers,
+            concurrency=self._limits,
+        )
+
+    @property
+    def concurrency_limits(self) -> dict[str, int]:
+        """Per-job-type concurrency limits."""
+        return dict(self._limits)
+
+    # Lifecycle
+
+    async def _ensure_started(self) -> None:
+        """Start the worker pool and progress reader on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not None and self._loop is not loop:
+            # Runner reused from a new event loop (e.g. app restart in tests):
+            # asyncio primitives are loop-bound, so recreate them
+            self._loop = loop
+            self._semaphores.clear()
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if self._progress_queue is not None:
+                return
+            self._loop = asyncio.get_running_loop()
+            # Spawning the manager process blocks, so keep it off the event loop
+            await asyncio.to_thread(self._start)
+
+    def _start(self) -> None:
+        """Create the pool (if not injected), shared state and reader thread."""
+        if self._executor is None:
+            ctx = multiprocessing.get_context("spawn")
+            self._manager = ctx.Manager()
+            self._progress_queue = self._manager.Queue()
+            self._cancel_flags = self._manager.dict()
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers, mp_context=ctx)
+        else:
+            self._progress_queue = queue.Queue()
+            self._cancel_flags = {}
+
+        self._reader = threading.Thread(
+            target=self._read_progress, name="backtest-job-progress", daemon=True
+        )
+        self._reader.start()
+        logger.info("backtest_job_runner_started", max_workers=self._max_workers)
+
+    async def shutdown(self) -> None:
+        """Cancel outstanding jobs and stop the worker pool."""
+        for job in list(self._jobs.values()):
+            if not job.is_finished:
+                self.cancel(job.job_id)
+
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        if self._reader is not None:
+            self._progress_queue.put(None)
+            await asyncio.to_thread(self._reader.join, 5)
+            self._reader = None
+
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+        self._progress_queue = None
+        self._cancel_flags = None
+        self._loop = None
+        logger.info("backtest_job_runner_stopped")
+
+    # Submission
+
+    def _semaphore(self, job_type: str) -> asyncio.Semaphore:
+        """Get (or create) the semaphore bounding a job type."""
+        if job_type not in self._limits:
+            raise ValueError(
+                f"Unknown job type '{job_type}'; expected one of {sorted(self._limits)}"
+            )
+        if job_type not in self._semaphores:
+            self._semaphores[job_type] = asyncio.Semaphore(self._limits[job_type])
+        return self._semaphores[job_type]
+
+    async def run(
+        self,
+        job_type: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        job_id: UUID | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> Any:
+        """
+        Run a job in the worker pool and wait for its result.
+
+        Intended to be awaited from a background task (asyncio.create_task)
+        so the request handler can return immediately.
+
+        Args:
+            job_type: Concurrency class ("backtest", "preview", "regression",
+                "walk_forward")
+            fn: Module-level job function (see module docstring)
+            *args: Picklable positional arguments for fn
+            job_id: Optional job ID (defaults to a new UUID)
+            on_progress: Optional async callback receiving the keyword
+                arguments of each progress.report() call
+
+        Returns:
+            The job function's result
+
+        Raises:
+            ValueError: If job_type is unknown
+            JobCancelledError: If the job was cancelled
+            Exception: Any exception raised by the job function
+        """
+        semaphore = self._semaphore(job_type)
+        await self._ensure_started()
+        self._prune()
+
+        job = BacktestJob(job_id=job_id or uuid4(), job_type=job_type, on_progress=on_progress)
+        job.task = asyncio.current_task()
+        self._jobs[job.job_id] = job
+
+        logger.info("backtest_job_queued", job_id=str(job.job_id), job_type=job_type)
+
+        acquired = False
+        handed_off = False
+        try:
+            await semaphore.acquire()
+            acquired = True
+
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(UTC)
+            logger.info("backtest_job_started", job_id=str(job.job_id), job_type=job_type)
+
+            reporter = ProgressReporter(job.job_id, self._progress_queue, self._cancel_flags)
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, _execute_job, fn, args, reporter)
+
+            # The worker keeps its slot until it actually returns, even if the
+            # awaiting caller is cancelled first.
+            future.add_done_callback(lambda f: self._on_worker_done(f, job, semaphore))
+            handed_off = True
+
+            result = await asyncio.shield(future)
+
+            job.status = JobStatus.COMPLETED
+            job.finished_at = datetime.now(UTC)
+            logger.info("backtest_job_completed", job_id=str(job.job_id), job_type=job_type)
+            return result
+
+        except asyncio.CancelledError:
+            if job.status is not JobStatus.CANCELLED:
+                raise
+            task = asyncio.current_task()
+            if task is not None:
+                task.uncancel()
+            raise JobCancelledError(job.job_id) from None
+
+        except JobCancelledError:
+            self._mark_cancelled(job)
+            raise
+
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            job.finished_at = datetime.now(UTC)
+            logger.error(
+                "backtest_job_failed",
+                job_id=str(job.job_id),
+                job_type=job_type,
+                error=str(e),
+            )
+            raise
+
+        finally:
+            job.task = None
+            if acquired and not handed_off:
+                semaphore.release()
+
+    def _on_worker_done(
+        self,
+        future: asyncio.Future,
+        job: BacktestJob,
+        semaphore: asyncio.Semaphore,  # type: ignore[type-arg]
+    ) -> None:
+        """Release the job's slot and clear its cancellation flag."""
+        semaphore.release()
+        if not future.cancelled():
+            future.exception()  # Mark retrieved for jobs whose caller went away
+        if self._cancel_flags is not None:
+            self._cancel_flags.pop(job.job_id, None)
+
+    def cancel(self, job_id: UUID) -> bool:
+        """
+        Cancel a queued or running job.
+
+        Args:
+            job_id: Job to cancel
+
+        Returns:
+            True if the job was cancelled, False if unknown or already finished
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.is_finished:
+            return False
+
+        if job.status is JobStatus.RUNNING and self._cancel_flags is not None:
+            self._cancel_flags[job_id] = True
+
+        self._mark_cancelled(job)
+        if job.task is not None:
+            job.task.cancel()
+        return True
+
+    def _mark_cancelled(self, job: BacktestJob) -> None:
+        """Record cancellation on the job."""
+        if job.status is JobStatus.CANCELLED:
+            return
+        job.status = JobStatus.CANCELLED
+        job.finished_at = datetime.now(UTC)
+        logger.info("backtest_job_cancelled", job_id=str(job.job_id), job_type=job.job_type)
+
+    # Queries
+
+    def get_job(self, job_id: UUID) -> BacktestJob | None:
+        """Get a job by ID."""
+        return self._jobs.get(job_id)
+
+    def list_jobs(self, job_type: str | None = None) -> list[BacktestJob]:
+        """List tracked jobs, newest first, optionally filtered by type."""
+        jobs = [j for j in self._jobs.values() if job_type is None or j.job_type == job_type]
+        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get queued/running counts and the limit for each job type.
+
+        Returns:
+            Mapping of job type to {"queued", "running", "limit"}
+        """
+        stats = {t: {"queued": 0, "running": 0, "limit": n} for t, n in self._limits.items()}
+        for job in self._jobs.values():
+            if job.status is JobStatus.QUEUED:
+                stats[job.job_type]["queued"] += 1
+            elif job.status is JobStatus.RUNNING:
+                stats[job.job_type]["running"] += 1
+        return stats
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond MAX_FINISHED_JOBS."""
+        finished = [j for j in self._jobs.values() if j.is_finished]
+        if len(finished) <= MAX_FINISHED_JOBS:
+            return
+        finished.sort(key=lambda j: j.finished_at or j.created_at)
+        for job in finished[: len(finished) - MAX_FINISHED_JOBS]:
+            del self._jobs[job.job_id]
+
+    # Progress forwarding
+
+    def _read_progress(self) -> None:
+        """Reader thread: move worker progress onto the event loop."""
+        progress_queue = self._progress_queue
+        while True:
+            try:
+                item = progress_queue.get()
+            except (EOFError, OSError):
+                return
+            if item is None:
+                return
+            loop = self._loop
+            if loop is None:
+                return
+            try:
+                loop.call_soon_threadsafe(self._dispatch_progress, *item)
+            except RuntimeError:
+                continue  # Event loop closed; progress for it is dropped
+
+    def _dispatch_progress(self, job_id: UUID, payload: dict[str, Any]) -> None:
+        """Record progress and invoke the job's callback (on the event loop)."""
+        job = self._jobs.get(job_id)
+        if job is None or job.is_finished:
+            return
+        job.progress = payload
+        if job.on_progress is None:
+            return
+
+        task = asyncio.ensure_future(job.on_progress(**payload))
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._on_callback_done)
+
+    def _on_callback_done(self, task: asyncio.Task) -> None:  # type: ignore[type-arg]
+        """Log progress callback failures without affecting the job."""
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()):
+            logger.warning("backtest_job_progress_callback_failed", error=str(exc))
+
+
+# Singleton runner used by the API routes
+_runner: BacktestJobRunner | None = None
+
+
+def get_backtest_job_runner() -> BacktestJobRunner:
+    """
+    Get the application-wide job runner (created from Settings on first call).
+
+    Returns:
+        BacktestJobRunner singleton
+    """
+    global _runner
+    if _runner is None:
+        from src.config import settings
+
+        _runner = BacktestJobRunner(
+            max_workers=settings.backtest_job_workers,
+            concurrency=settings.backtest_job_concurrency,
+        )
+    return _runner
+
+
+async def shutdown_backtest_job_runner() -> None:
+    """Shut down the singleton runner, if it was created."""
+    global _runner
+    if _runner is not None:
+        await _runner.shutdown()
+        _runner = None
@@ -12,6 +12,7 @@ Modules:
     trade_statistics: Trade-level statistics (win rate, profit factor, expectancy)
     equity_analyzer: Equity curve analysis (monthly returns, validation)
     facade: Unified MetricsFacade composing all calculators
+    vectorized: NumPy equity-curve metrics for long curves (MetricsFacade semantics)
 
 Example:
     from src.backtesting.metrics_core import (
@@ -66,6 +67,12 @@ from src.backtesting.metrics_core.trade_statistics import (
     TradeStatistics,
     TradeStatisticsCalculator,
 )
+from src.backtesting.metrics_core.vectorized import (
+    FACADE_TOLERANCE,
+    EquityCurveMetrics,
+    VectorizedMetricsCalculator,
+    equity_arrays,
+)
 
 __all__ = [
     # Facade (recommended entry point)
@@ -76,6 +83,11 @@ __all__ = [
     "ReturnCalculator",
     "TradeStatisticsCalculator",
     "EquityAnalyzer",
+    # Vectorized path
+    "VectorizedMetricsCalculator",
+    "EquityCurveMetrics",
+    "equity_arrays",
+    "FACADE_TOLERANCE",
     # Data models
     "DrawdownPeriod",
     "EquityPoint",
@@ -11,6 +11,10 @@ This facade composes:
     - TradeStatisticsCalculator (Story 18.7.3)
     - EquityAnalyzer (Story 18.7.3)
 
+Equity-curve metrics are computed by VectorizedMetricsCalculator by default
+(within FACADE_TOLERANCE of the Decimal calculators); pass vectorized=False
+for the Decimal path.
+
 Author: Story 18.7.3
 """
 
@@ -24,6 +28,11 @@ from src.backtesting.metrics_core.equity_analyzer import EquityAnalyzer
 from src.backtesting.metrics_core.return_calculator import ReturnCalculator
 from src.backtesting.metrics_core.risk_calculator import RiskCalculator
 from src.backtesting.metrics_core.trade_statistics import TradeStatisticsCalculator
+from src.backtesting.metrics_core.vectorized import (
+    EquityCurveMetrics,
+    VectorizedMetricsCalculator,
+    equity_arrays,
+)
 from src.models.backtest import (
     BacktestMetrics,
     BacktestTrade,
@@ -50,13 +59,17 @@ class MetricsFacade:
         )
     """
 
-    def __init__(self, risk_free_rate: Decimal = Decimal("0.02")):
+    def __init__(self, risk_free_rate: Decimal = Decimal("0.02"), vectorized: bool = True):
         """Initialize metrics facade with sub-calculators.
 
         Args:
             risk_free_rate: Annual risk-free rate for Sharpe calculation
+            vectorized: Compute equity-curve metrics with VectorizedMetricsCalculator
+                instead of the Decimal calculators
         """
         self.risk_free_rate = risk_free_rate
+        self.vectorized = vectorized
+        self._vectorized = VectorizedMetricsCalculator(risk_free_rate=risk_free_rate)
         self._drawdown = DrawdownCalculator()
         self._risk = RiskCalculator(risk_free_rate=risk_free_rate)
         self._returns = ReturnCalculator()
@@ -81,6 +94,9 @@ class MetricsFacade:
         Returns:
             BacktestMetrics with all performance statistics
         """
+        if self.vectorized:
+            return self._vectorized.calculate_metrics(equity_curve, trades, initial_capital)
+
         # Handle empty equity curve case
         if not equity_curve:
             return self._calculate_metrics_without_equity(trades)
@@ -197,6 +213,10 @@ class MetricsFacade:
             for point in equity_curve
         ]
 
+    def _equity_metrics(self, equity_curve: list[EquityCurvePoint]) -> EquityCurveMetrics:
+        """Equity-curve metrics from the vectorized calculator."""
+        return self._vectorized.calculate_equity_metrics(*equity_arrays(equity_curve))
+
     def _get_max_drawdown_duration(self, equity_points: list[EquityPoint]) -> int:
         """Get duration of max drawdown period.
 
@@ -244,6 +264,9 @@ class MetricsFacade:
         if len(equity_curve) < 2:
             return Decimal("0")
 
+        if self.vectorized:
+            return self._equity_metrics(equity_curve).sharpe_ratio
+
         equity_points = self._convert_equity_curve(equity_curve)
         returns = self._risk.calculate_returns_from_equity(equity_points)
         return self._risk.calculate_sharpe_ratio(returns).value if returns else Decimal("0")
@@ -260,6 +283,9 @@ class MetricsFacade:
         if len(equity_curve) < 2:
             return Decimal("0")
 
+        if self.vectorized:
+            return self._equity_metrics(equity_curve).sortino_ratio
+
         equity_points = self._convert_equity_curve(equity_curve)
         returns = self._risk.calculate_returns_from_equity(equity_points)
         return self._risk.calculate_sortino_ratio(returns).value if returns else Decimal("0")
@@ -276,6 +302,10 @@ class MetricsFacade:
         if not equity_curve:
             return Decimal("0"), 0
 
+        if self.vectorized:
+            metrics = self._equity_metrics(equity_curve)
+            return metrics.max_drawdown, metrics.max_drawdown_duration_days
+
         equity_points = self._convert_equity_curve(equity_curve)
         result = self._drawdown.calculate_max_drawdown(equity_points)
 
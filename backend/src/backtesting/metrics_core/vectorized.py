@@ -0,0 +1,342 @@
+"""
+Vectorized equity-curve metrics (NumPy).
+
+Computes the equity-curve metrics of MetricsFacade - total return, CAGR,
+Sharpe, Sortino, max drawdown and its duration, drawdown periods and
+monthly returns - from float64 arrays in one pass, converting only the
+final values to Decimal. Intended for long (intraday, multi-year) curves
+where walking EquityPoint lists with Decimal arithmetic dominates run time;
+MetricsFacade and UnifiedBacktestEngine compute their equity-curve metrics
+through it.
+
+Results agree with the Decimal path of MetricsFacade / DrawdownCalculator / RiskCalculator /
+ReturnCalculator to within FACADE_TOLERANCE (one unit in the last place
+the Decimal calculators quantize to); drawdown periods and monthly returns
+cover the same dates.
+
+Author: Metrics performance (vectorized path for CF-005 calculators)
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, tzinfo
+from decimal import Decimal
+from typing import Optional, Union
+
+import numpy as np
+
+from src.backtesting.metrics_core.base import DrawdownPeriod, EquityPoint
+from src.backtesting.metrics_core.return_calculator import DAYS_PER_YEAR, MonthlyReturn
+from src.backtesting.metrics_core.trade_statistics import TradeStatisticsCalculator
+from src.models.backtest import BacktestMetrics, BacktestTrade, EquityCurvePoint
+
+# Maximum absolute difference from the Decimal calculators, per metric
+FACADE_TOLERANCE: dict[str, Decimal] = {
+    "total_return_pct": Decimal("0.0001"),
+    "cagr": Decimal("0.000001"),
+    "sharpe_ratio": Decimal("0.0001"),
+    "sortino_ratio": Decimal("0.0001"),
+    "max_drawdown": Decimal("0.000001"),
+}
+
+_MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_US_PER_DAY = 86_400_000_000
+
+
+@dataclass
+class EquityCurveMetrics:
+    """Equity-curve metrics computed by VectorizedMetricsCalculator.
+
+    Attributes:
+        total_return_pct: Total return percentage
+        cagr: Compound annual growth rate (0.15 = 15%)
+        sharpe_ratio: Annualized Sharpe ratio
+        sortino_ratio: Annualized Sortino ratio
+        max_drawdown: Max drawdown as decimal fraction (0-1 scale)
+        max_drawdown_duration_days: Peak-to-trough days of the largest drawdown period
+        drawdown_periods: Drawdown periods in chronological order
+        monthly_returns: Returns per calendar month with at least two points
+    """
+
+    total_return_pct: Decimal = Decimal("0")
+    cagr: Decimal = Decimal("0")
+    sharpe_ratio: Decimal = Decimal("0")
+    sortino_ratio: Decimal = Decimal("0")
+    max_drawdown: Decimal = Decimal("0")
+    max_drawdown_duration_days: int = 0
+    drawdown_periods: list[DrawdownPeriod] = field(default_factory=list)
+    monthly_returns: list[MonthlyReturn] = field(default_factory=list)
+
+
+def equity_arrays(
+    equity_curve: Sequence[Union[EquityPoint, EquityCurvePoint]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert an equity curve to (timestamps, values) arrays.
+
+    Args:
+        equity_curve: EquityPoint or EquityCurvePoint sequence ordered by timestamp
+
+    Returns:
+        (datetime64[us] UTC timestamps, float64 portfolio values)
+    """
+    n = len(equity_curve)
+    timestamps = np.empty(n, dtype="datetime64[us]")
+    values = np.empty(n, dtype=np.float64)
+    for i, point in enumerate(equity_curve):
+        ts = point.timestamp
+        if ts.tzinfo is not None:
+            ts = ts.astimezone(UTC).replace(tzinfo=None)
+        timestamps[i] = ts
+        values[i] = float(point.value if isinstance(point, EquityPoint) else point.portfolio_value)
+    return timestamps, values
+
+
+class VectorizedMetricsCalculator:
+    """NumPy-backed equity-curve metrics with MetricsFacade semantics.
+
+    Example:
+        calculator = VectorizedMetricsCalculator()
+        timestamps, values = equity_arrays(result.equity_curve)
+        metrics = calculator.calculate_equity_metrics(timestamps, values)
+
+        # Drop-in for MetricsFacade.calculate_metrics
+        summary = calculator.calculate_metrics(equity_curve, trades, initial_capital)
+    """
+
+    def __init__(
+        self,
+        risk_free_rate: Decimal = Decimal("0.02"),
+        periods_per_year: int = 252,
+        tz: Optional[tzinfo] = UTC,
+    ):
+        """Initialize calculator.
+
+        Args:
+            risk_free_rate: Annual risk-free rate for Sharpe calculation
+            periods_per_year: Annualization factor for Sharpe/Sortino (252 = daily,
+                as used by RiskCalculator)
+            tz: Time zone attached to datetimes in drawdown periods (None = naive UTC)
+        """
+        self.risk_free_rate = risk_free_rate
+        self.periods_per_year = periods_per_year
+        self.tz = tz
+        self._trades = TradeStatisticsCalculator()
+
+    def calculate_metrics(
+        self,
+        equity_curve: list[EquityCurvePoint],
+        trades: list[BacktestTrade],
+        initial_capital: Decimal,
+    ) -> BacktestMetrics:
+        """Calculate BacktestMetrics like MetricsFacade.calculate_metrics.
+
+        Args:
+            equity_curve: List of equity curve points
+            trades: List of completed trades
+            initial_capital: Starting capital (unused, as in MetricsFacade)
+
+        Returns:
+            BacktestMetrics with all performance statistics
+        """
+        equity = self.calculate_equity_metrics(*equity_arrays(equity_curve))
+
+        if trades:
+            trade_stats = self._trades.calculate_statistics(trades)
+            total_trades = trade_stats.total_trades
+            winning_trades = trade_stats.winning_trades
+            losing_trades = trade_stats.losing_trades
+            win_rate = trade_stats.win_rate
+            average_r_multiple = trade_stats.avg_r_multiple or Decimal("0")
+            profit_factor = trade_stats.profit_factor
+        else:
+            total_trades = winning_trades = losing_trades = 0
+            win_rate = average_r_multiple = profit_factor = Decimal("0")
+
+        return BacktestMetrics(
+            total_trades=total_trades,
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            win_rate=win_rate,
+            total_return_pct=equity.total_return_pct,
+            max_drawdown=equity.max_drawdown,
+            max_drawdown_duration_days=equity.max_drawdown_duration_days,
+            sharpe_ratio=equity.sharpe_ratio,
+            cagr=equity.cagr,
+            average_r_multiple=average_r_multiple,
+            profit_factor=profit_factor,
+        )
+
+    def calculate_equity_metrics(
+        self, timestamps: np.ndarray, values: np.ndarray
+    ) -> EquityCurveMetrics:
+        """Calculate all equity-curve metrics from arrays.
+
+        Args:
+            timestamps: datetime64 UTC timestamps in ascending order
+            values: Portfolio values (float64)
+
+        Returns:
+            EquityCurveMetrics
+        """
+        n = len(values)
+        if n < 2:
+            return EquityCurveMetrics()
+
+        timestamps = np.asarray(timestamps, dtype="datetime64[us]")
+        values = np.asarray(values, dtype=np.float64)
+        initial, final = values[0], values[-1]
+
+        metrics = EquityCurveMetrics()
+
+        # Returns
+        if initial > 0:
+            metrics.total_return_pct = self._to_decimal((final - initial) / initial * 100, "0.0001")
+        days = int((timestamps[-1] - timestamps[0]).astype(np.int64) // _US_PER_DAY)
+        if initial > 0 and final > 0 and days > 0:
+            years = days / float(DAYS_PER_YEAR)
+            metrics.cagr = self._to_decimal((final / initial) ** (1 / years) - 1, "0.000001")
+
+        # Period returns (pairs with a positive previous value)
+        previous = values[:-1]
+        valid = previous > 0
+        returns = (values[1:][valid] - previous[valid]) / previous[valid]
+        metrics.sharpe_ratio, metrics.sortino_ratio = self._risk_ratios(returns)
+
+        # Drawdowns
+        running_peak = np.maximum.accumulate(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdowns = np.where(running_peak > 0, (running_peak - values) / running_peak, 0.0)
+        metrics.drawdown_periods = self._drawdown_periods(timestamps, values, running_peak)
+        max_drawdown = self._to_decimal(drawdowns.max(), "0.000001")
+        if max_drawdown > 0:
+            metrics.max_drawdown = max_drawdown
+            largest = max(metrics.drawdown_periods, key=lambda p: p.drawdown_pct)
+            metrics.max_drawdown_duration_days = largest.duration_days
+
+        metrics.monthly_returns = self._monthly_returns(timestamps, values)
+        return metrics
+
+    # ------------------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------------------
+
+    def _risk_ratios(self, returns: np.ndarray) -> tuple[Decimal, Decimal]:
+        """Annualized (Sharpe, Sortino) with RiskCalculator conventions."""
+        count = len(returns)
+        if count < 2:
+            return Decimal("0"), Decimal("0")
+
+        annualization = np.sqrt(self.periods_per_year)
+        mean_return = returns.mean()
+
+        sharpe = Decimal("0")
+        variance = returns.var(ddof=1)
+        if variance > 0:
+            period_rf = float(self.risk_free_rate) / self.periods_per_year
+            sharpe = self._to_decimal(
+                (mean_return - period_rf) / np.sqrt(variance) * annualization, "0.0001"
+            )
+
+        # Downside deviation over all periods (target return 0)
+        downside = np.minimum(returns, 0.0)
+        downside_variance = float(np.dot(downside, downside)) / count
+        if downside_variance > 0:
+            sortino = self._to_decimal(
+                mean_return / np.sqrt(downside_variance) * annualization, "0.0001"
+            )
+        else:
+            sortino = Decimal("999.9999")
+        return sharpe, sortino
+
+    def _drawdown_periods(
+        self, timestamps: np.ndarray, values: np.ndarray, running_peak: np.ndarray
+    ) -> list[DrawdownPeriod]:
+        """Drawdown periods with DrawdownCalculator.find_drawdown_periods semantics.
+
+        A period is a maximal run of points below the running peak; its peak
+        is the point before the run, its trough the first minimum in the run
+        and its recovery the point after the run (None if still open).
+        """
+        below = values < running_peak
+        edges = np.diff(np.concatenate(([0], below.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)  # exclusive
+        if starts.size == 0:
+            return []
+
+        # First minimum of each run
+        lengths = ends - starts
+        run_ids = np.repeat(np.arange(starts.size), lengths)
+        run_values = values[below]
+        run_offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        run_mins = np.minimum.reduceat(run_values, run_offsets)
+        at_min = np.flatnonzero(run_values == run_mins[run_ids])
+        _, first = np.unique(run_ids[at_min], return_index=True)
+        troughs = np.flatnonzero(below)[at_min[first]]
+
+        peaks = starts - 1
+        peak_values = values[peaks]
+        trough_values = values[troughs]
+        drawdown_pcts = (peak_values - trough_values) / peak_values
+
+        periods = []
+        n = len(values)
+        for peak, trough, end, peak_value, trough_value, drawdown_pct in zip(
+            peaks.tolist(),
+            troughs.tolist(),
+            ends.tolist(),
+            peak_values.tolist(),
+            trough_values.tolist(),
+            drawdown_pcts.tolist(),
+            strict=True,
+        ):
+            peak_date = self._datetime(timestamps[peak])
+            trough_date = self._datetime(timestamps[trough])
+            recovery_date = self._datetime(timestamps[end]) if end < n else None
+            periods.append(
+                DrawdownPeriod(
+                    peak_date=peak_date,
+                    trough_date=trough_date,
+                    recovery_date=recovery_date,
+                    peak_value=Decimal(str(peak_value)),
+                    trough_value=Decimal(str(trough_value)),
+                    drawdown_pct=self._to_decimal(drawdown_pct, "0.000001"),
+                    duration_days=(trough_date - peak_date).days,
+                    recovery_days=(recovery_date - trough_date).days if recovery_date else None,
+                )
+            )
+        return periods
+
+    def _monthly_returns(self, timestamps: np.ndarray, values: np.ndarray) -> list[MonthlyReturn]:
+        """Returns per calendar month (first to last point of the month)."""
+        months = timestamps.astype("datetime64[M]").astype(np.int64)
+        starts = np.flatnonzero(np.concatenate(([True], months[1:] != months[:-1])))
+        ends = np.append(starts[1:], len(values)) - 1
+
+        monthly_returns = []
+        for start, end in zip(starts.tolist(), ends.tolist(), strict=True):
+            if end == start:
+                continue
+            start_value, end_value = values[start], values[end]
+            return_pct = (end_value - start_value) / start_value * 100 if start_value > 0 else 0.0
+            year, month = divmod(int(months[start]), 12)
+            year += 1970
+            monthly_returns.append(
+                MonthlyReturn(
+                    year=year,
+                    month=month + 1,
+                    month_label=f"{_MONTH_NAMES[month]} {year}",
+                    return_pct=self._to_decimal(return_pct, "0.0001"),
+                    start_value=Decimal(str(float(start_value))),
+                    end_value=Decimal(str(float(end_value))),
+                )
+            )
+        return monthly_returns
+
+    def _datetime(self, timestamp: np.datetime64) -> datetime:
+        value: datetime = timestamp.astype(datetime)
+        return value.replace(tzinfo=self.tz) if self.tz is not None else value
+
+    @staticmethod
+    def _to_decimal(value: float, quantum: str) -> Decimal:
+        return Decimal(str(float(value))).quantize(Decimal(quantum))
@@ -0,0 +1,529 @@
+"""
+Parameter Sweep - Grid search over detector and engine parameters
+
+Purpose:
+--------
+Ranks combinations of WyckoffSignalDetector parameters and EngineConfig
+settings on one symbol's bar history without paying a full backtest per
+combination from scratch.
+
+Shared work:
+------------
+- Detector features (trading ranges, volume ratios, phase history) are
+  computed once per (min_range_bars, volume_lookback)
+- Signals are detected once per detector parameter set; they do not depend
+  on the engine configuration, so engine variants replay the stored signals
+- Engine variants run in a process pool (spawn); the bars and signals are
+  handed to each worker once through the pool initializer
+
+Pruning:
+--------
+Every variant first runs on a warm-up prefix of the bars. Only the top
+``keep_fraction`` by objective plus any variant not dominated on
+(objective, max drawdown) is run on the full history; the rest are
+reported with their warm-up metrics and marked as pruned.
+
+Classes:
+--------
+- SweepVariant: One detector/engine parameter combination
+- SweepRow: Ranked result for a variant
+- ParameterSweepResult: Ranked results table
+- ParameterSweep: Sweep runner
+
+Author: Backtest parameter optimization
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import math
+import multiprocessing
+import os
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Optional
+
+import structlog
+
+from src.backtesting.bar_sequence import BarView
+from src.backtesting.engine.backtest_engine import UnifiedBacktestEngine
+from src.backtesting.engine.cost_model import ZeroCostModel
+from src.backtesting.engine.interfaces import EngineConfig
+from src.backtesting.engine.validated_detector import ValidatedSignalDetector
+from src.backtesting.engine.wyckoff_detector import DetectorFeatures, WyckoffSignalDetector
+from src.backtesting.position_manager import PositionManager
+from src.backtesting.risk_integration import BacktestRiskManager
+from src.models.backtest import BacktestMetrics
+from src.models.ohlcv import OHLCVBar
+from src.models.signal import TradeSignal
+
+logger = structlog.get_logger()
+
+# WyckoffSignalDetector constructor parameters that can be swept
+DETECTOR_PARAMETERS = ("min_range_bars", "volume_lookback", "cooldown_bars", "max_penetration_pct")
+
+# BacktestMetrics fields usable as objective (higher is better)
+OBJECTIVES = (
+    "sharpe_ratio",
+    "total_return_pct",
+    "cagr",
+    "profit_factor",
+    "average_r_multiple",
+    "win_rate",
+    "total_pnl",
+)
+
+# Warm-up runs use at least this many bars (see walk_forward_engine.MIN_BARS_PER_WINDOW)
+MIN_WARMUP_BARS = 60
+
+# Per-worker bars and signals, installed once by the pool initializer so
+# variant tasks only carry (signal group, engine config, bar count)
+_worker_bars: list[OHLCVBar] = []
+_worker_signals: Mapping[int, Mapping[int, TradeSignal]] = {}
+
+
+@dataclass(frozen=True)
+class SweepVariant:
+    """
+    One parameter combination of a sweep.
+
+    Attributes:
+        variant_id: Position in grid order
+        detector_params: WyckoffSignalDetector keyword arguments
+        engine_config: Engine configuration
+    """
+
+    variant_id: int
+    detector_params: Mapping[str, Any]
+    engine_config: EngineConfig
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """Swept parameter values (detector and engine) keyed by name."""
+        return {**self.detector_params, **dataclasses.asdict(self.engine_config)}
+
+
+@dataclass
+class SweepRow:
+    """
+    Ranked result for one variant.
+
+    Attributes:
+        rank: 1-based rank (full runs first, then pruned variants)
+        variant: Parameter combination
+        metrics: Summary metrics (warm-up metrics when pruned)
+        objective: Objective value taken from metrics
+        pruned: True if the variant was only run on the warm-up prefix
+    """
+
+    rank: int
+    variant: SweepVariant
+    metrics: BacktestMetrics
+    objective: float
+    pruned: bool
+
+
+@dataclass
+class ParameterSweepResult:
+    """
+    Ranked results table of a parameter sweep.
+
+    Attributes:
+        objective: Metric the variants are ranked by
+        rows: Results ordered by rank
+        detection_runs: Signal detection passes (one per detector parameter set)
+        warmup_runs: Backtests run on the warm-up prefix
+        full_runs: Backtests run on the full history
+        execution_time_seconds: Wall-clock duration of the sweep
+    """
+
+    objective: str
+    rows: list[SweepRow] = field(default_factory=list)
+    detection_runs: int = 0
+    warmup_runs: int = 0
+    full_runs: int = 0
+    execution_time_seconds: float = 0.0
+
+    @property
+    def best(self) -> Optional[SweepRow]:
+        """Top-ranked variant, or None for an empty sweep."""
+        return self.rows[0] if self.rows else None
+
+    def to_rows(self, swept_only: bool = True) -> list[dict[str, Any]]:
+        """
+        Flatten the table for display or export.
+
+        Args:
+            swept_only: Only include parameters that vary across the sweep
+
+        Returns:
+            One dict per variant: rank, parameters, headline metrics, pruned flag
+        """
+        params = [row.variant.params for row in self.rows]
+        names = list(params[0]) if params else []
+        if swept_only:
+            names = [name for name in names if len({repr(p[name]) for p in params}) > 1]
+
+        table = []
+        for row, row_params in zip(self.rows, params, strict=True):
+            metrics = row.metrics
+            table.append(
+                {
+                    "rank": row.rank,
+                    **{name: row_params[name] for name in names},
+                    self.objective: row.objective,
+                    "total_return_pct": float(metrics.total_return_pct),
+                    "max_drawdown": float(metrics.max_drawdown),
+                    "sharpe_ratio": float(metrics.sharpe_ratio),
+                    "win_rate": float(metrics.win_rate),
+                    "total_trades": metrics.total_trades,
+                    "pruned": row.pruned,
+                }
+            )
+        return table
+
+
+class _ReplayDetector:
+    """SignalDetector returning signals recorded by an earlier detection pass."""
+
+    def __init__(self, signals: Mapping[int, TradeSignal]) -> None:
+        self._signals = signals
+
+    def detect(self, bars: Sequence[OHLCVBar], index: int) -> Optional[TradeSignal]:
+        return self._signals.get(index)
+
+
+def _run_variant(
+    bars: list[OHLCVBar],
+    signals: Mapping[int, TradeSignal],
+    config: EngineConfig,
+    bar_count: int,
+) -> BacktestMetrics:
+    """Run UnifiedBacktestEngine over the first ``bar_count`` bars with replayed signals.
+
+    Shared by the sequential path and the process-pool workers so both
+    produce identical results. Components match the walk-forward windows.
+    """
+    engine = UnifiedBacktestEngine(
+        signal_detector=_ReplayDetector(signals),
+        cost_model=ZeroCostModel(),
+        position_manager=PositionManager(config.initial_capital),
+        config=config,
+        risk_manager=BacktestRiskManager(initial_capital=config.initial_capital),
+    )
+    return engine.run(bars[:bar_count]).summary
+
+
+def _init_sweep_worker(
+    bars: list[OHLCVBar], signals: Mapping[int, Mapping[int, TradeSignal]]
+) -> None:
+    """Process pool initializer: keep bars and detected signals for all variant tasks."""
+    global _worker_bars, _worker_signals
+    _worker_bars = bars
+    _worker_signals = signals
+
+
+def _run_variant_task(group: int, config: EngineConfig, bar_count: int) -> BacktestMetrics:
+    """Worker task: run one variant over the first ``bar_count`` bars."""
+    return _run_variant(_worker_bars, _worker_signals[group], config, bar_count)
+
+
+class ParameterSweep:
+    """
+    Grid search over WyckoffSignalDetector and EngineConfig parameters.
+
+    Example:
+        sweep = ParameterSweep(
+            detector_grid={"min_range_bars": [20, 30, 40], "cooldown_bars": [5, 10]},
+            engine_grid={"max_open_positions": [1, 3, 5], "enable_trailing_stop": [False, True]},
+            objective="sharpe_ratio",
+            parallel=True,
+        )
+        result = sweep.run(bars)
+        for row in result.to_rows()[:10]:
+            print(row)
+    """
+
+    def __init__(
+        self,
+        detector_grid: Optional[Mapping[str, Sequence[Any]]] = None,
+        engine_grid: Optional[Mapping[str, Sequence[Any]]] = None,
+        base_config: Optional[EngineConfig] = None,
+        objective: str = "sharpe_ratio",
+        warmup_fraction: float = 0.3,
+        keep_fraction: float = 0.2,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize sweep.
+
+        Args:
+            detector_grid: Values per WyckoffSignalDetector parameter (DETECTOR_PARAMETERS)
+            engine_grid: Values per EngineConfig field
+            base_config: Engine configuration the engine grid is applied to
+            objective: BacktestMetrics field to maximize (one of OBJECTIVES)
+            warmup_fraction: Share of bars used for the pruning run (>= 1 disables pruning)
+            keep_fraction: Share of variants kept by objective after warm-up
+            parallel: Run engine variants in a process pool
+            max_workers: Pool size (default: CPU count)
+
+        Raises:
+            ValueError: If a grid names an unknown parameter or a setting is out of range
+        """
+        self.detector_grid = {name: list(values) for name, values in (detector_grid or {}).items()}
+        self.engine_grid = {name: list(values) for name, values in (engine_grid or {}).items()}
+        self.base_config = base_config or EngineConfig()
+        self.objective = objective
+        self.warmup_fraction = warmup_fraction
+        self.keep_fraction = keep_fraction
+        self.parallel = parallel
+        self.max_workers = max_workers
+
+        unknown = set(self.detector_grid) - set(DETECTOR_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown detector parameters: {sorted(unknown)}")
+        engine_fields = {f.name for f in dataclasses.fields(EngineConfig)}
+        unknown = set(self.engine_grid) - engine_fields
+        if unknown:
+            raise ValueError(f"Unknown engine parameters: {sorted(unknown)}")
+        if objective not in OBJECTIVES:
+            raise ValueError(f"objective must be one of {OBJECTIVES}, got {objective!r}")
+        if warmup_fraction <= 0:
+            raise ValueError(f"warmup_fraction must be positive, got {warmup_fraction}")
+        if not 0 < keep_fraction <= 1:
+            raise ValueError(f"keep_fraction must be in (0, 1], got {keep_fraction}")
+
+    def variants(self) -> list[SweepVariant]:
+        """
+        Expand the grids into variants (detector parameters vary slowest).
+
+        Returns:
+            One SweepVariant per combination
+
+        Raises:
+            ValueError: If a combination is not a valid EngineConfig
+        """
+        detector_names = list(self.detector_grid)
+        engine_names = list(self.engine_grid)
+        engine_configs = [
+            dataclasses.replace(self.base_config, **dict(zip(engine_names, values, strict=True)))
+            for values in itertools.product(*self.engine_grid.values())
+        ]
+
+        variants = []
+        for detector_values in itertools.product(*self.detector_grid.values()):
+            detector_params = dict(zip(detector_names, detector_values, strict=True))
+            for config in engine_configs:
+                variants.append(SweepVariant(len(variants), detector_params, config))
+        return variants
+
+    def run(self, bars: list[OHLCVBar]) -> ParameterSweepResult:
+        """
+        Run the sweep over one symbol's bars.
+
+        Args:
+            bars: Bar history for one symbol (chronological order)
+
+        Returns:
+            ParameterSweepResult ranked by objective
+        """
+        start_time = time.time()
+        variants = self.variants()
+        result = ParameterSweepResult(objective=self.objective)
+        if not variants or not bars:
+            return result
+
+        groups, signals = self._detect_signals(bars, variants)
+        result.detection_runs = len(signals)
+
+        keep = max(1, math.ceil(len(variants) * self.keep_fraction))
+        warmup_bars = max(min(len(bars), MIN_WARMUP_BARS), int(len(bars) * self.warmup_fraction))
+        prune = self.warmup_fraction < 1 and keep < len(variants) and warmup_bars < len(bars)
+
+        logger.info(
+            "parameter_sweep_started",
+            variants=len(variants),
+            detection_runs=result.detection_runs,
+            bar_count=len(bars),
+            warmup_bars=warmup_bars if prune else None,
+            parallel=self.parallel,
+        )
+
+        runner = _VariantRunner(bars, signals, self.parallel, self.max_workers)
+        with runner:
+            survivors = variants
+            warmup_metrics: dict[int, BacktestMetrics] = {}
+            if prune:
+                warmup_metrics = dict(
+                    zip(
+                        (v.variant_id for v in variants),
+                        runner.run([(groups[v.variant_id], v, warmup_bars) for v in variants]),
+                        strict=True,
+                    )
+                )
+                result.warmup_runs = len(variants)
+                survivors = self._select_survivors(variants, warmup_metrics, keep)
+
+            full_metrics = runner.run([(groups[v.variant_id], v, len(bars)) for v in survivors])
+            result.full_runs = len(survivors)
+
+        survivor_ids = {v.variant_id for v in survivors}
+        full_rows = [
+            self._row(variant, metrics, pruned=False)
+            for variant, metrics in zip(survivors, full_metrics, strict=True)
+        ]
+        pruned_rows = [
+            self._row(variant, warmup_metrics[variant.variant_id], pruned=True)
+            for variant in variants
+            if variant.variant_id not in survivor_ids
+        ]
+        result.rows = sorted(full_rows, key=self._rank_key) + sorted(
+            pruned_rows, key=self._rank_key
+        )
+        for rank, row in enumerate(result.rows, start=1):
+            row.rank = rank
+
+        result.execution_time_seconds = time.time() - start_time
+        logger.info(
+            "parameter_sweep_completed",
+            variants=len(variants),
+            full_runs=result.full_runs,
+            best_variant=result.rows[0].variant.variant_id,
+            best_objective=result.rows[0].objective,
+            execution_time_seconds=round(result.execution_time_seconds, 2),
+        )
+        return result
+
+    # ------------------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------------------
+
+    def _detect_signals(
+        self, bars: list[OHLCVBar], variants: list[SweepVariant]
+    ) -> tuple[dict[int, int], dict[int, dict[int, TradeSignal]]]:
+        """
+        Run signal detection once per detector parameter set.
+
+        Returns:
+            (signal group per variant ID, signals by bar index per group)
+        """
+        features: dict[tuple[int, int], DetectorFeatures] = {}
+        group_ids: dict[tuple[tuple[str, Any], ...], int] = {}
+        groups: dict[int, int] = {}
+        signals: dict[int, dict[int, TradeSignal]] = {}
+
+        for variant in variants:
+            key = tuple(sorted(variant.detector_params.items()))
+            group = group_ids.get(key)
+            if group is None:
+                group = group_ids[key] = len(group_ids)
+                params = dict(variant.detector_params)
+                feature_key = (params.get("min_range_bars", 30), params.get("volume_lookback", 20))
+                if feature_key not in features:
+                    features[feature_key] = WyckoffSignalDetector(
+                        min_range_bars=feature_key[0], volume_lookback=feature_key[1]
+                    ).compute_features(bars)
+
+                detector = ValidatedSignalDetector(
+                    WyckoffSignalDetector(**params, features=features[feature_key])
+                )
+                detected: dict[int, TradeSignal] = {}
+                for index in range(len(bars)):
+                    signal = detector.detect(BarView(bars, 0, index + 1), index)
+                    if signal is not None:
+                        detected[index] = signal
+                signals[group] = detected
+            groups[variant.variant_id] = group
+
+        return groups, signals
+
+    def _select_survivors(
+        self,
+        variants: list[SweepVariant],
+        warmup_metrics: Mapping[int, BacktestMetrics],
+        keep: int,
+    ) -> list[SweepVariant]:
+        """Top ``keep`` variants by objective plus the (objective, drawdown) Pareto front."""
+        scored = sorted(
+            (
+                -float(getattr(warmup_metrics[v.variant_id], self.objective)),
+                float(warmup_metrics[v.variant_id].max_drawdown),
+                v.variant_id,
+            )
+            for v in variants
+        )
+        selected = {variant_id for _, _, variant_id in scored[:keep]}
+
+        # Sorted by objective, a variant is non-dominated if its drawdown is
+        # below every better-scoring variant's
+        best_drawdown = math.inf
+        for _, drawdown, variant_id in scored:
+            if drawdown < best_drawdown:
+                selected.add(variant_id)
+                best_drawdown = drawdown
+
+        return [v for v in variants if v.variant_id in selected]
+
+    def _row(self, variant: SweepVariant, metrics: BacktestMetrics, pruned: bool) -> SweepRow:
+        objective = float(getattr(metrics, self.objective))
+        return SweepRow(0, variant, metrics, objective, pruned)
+
+    @staticmethod
+    def _rank_key(row: SweepRow) -> tuple[float, Decimal, int]:
+        return -row.objective, row.metrics.max_drawdown, row.variant.variant_id
+
+
+class _VariantRunner:
+    """Runs engine variants sequentially or in one process pool kept for the sweep."""
+
+    def __init__(
+        self,
+        bars: list[OHLCVBar],
+        signals: Mapping[int, Mapping[int, TradeSignal]],
+        parallel: bool,
+        max_workers: Optional[int],
+    ) -> None:
+        self._bars = bars
+        self._signals = signals
+        self._parallel = parallel
+        self._max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> _VariantRunner:
+        if self._parallel:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers or os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_sweep_worker,
+                initargs=(self._bars, self._signals),
+            )
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def run(self, tasks: list[tuple[int, SweepVariant, int]]) -> list[BacktestMetrics]:
+        """
+        Run (signal group, variant, bar count) tasks.
+
+        Returns:
+            Summary metrics in task order
+        """
+        if self._pool is None:
+            return [
+                _run_variant(self._bars, self._signals[group], variant.engine_config, bar_count)
+                for group, variant, bar_count in tasks
+            ]
+
+        futures = [
+            self._pool.submit(_run_variant_task, group, variant.engine_config, bar_count)
+            for group, variant, bar_count in tasks
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,393 @@
+"""
+Portfolio Backtest - Many symbols against one account
+
+Purpose:
+--------
+Backtests a portfolio of symbols that share one cash balance, one position
+book and one set of risk limits, so signals on different symbols compete for
+the same portfolio heat instead of each symbol being backtested alone.
+
+Timeline:
+---------
+The per-symbol bar streams are merged by timestamp with a heap-based k-way
+merge (heapq.merge), so the merge costs O(N log k) for N bars over k symbols
+and never sorts the combined history. All bars sharing a timestamp form one
+step of the simulation:
+
+1. Pending orders fill at the open of their own symbol's bar
+2. Stop-loss / take-profit exits are checked per symbol
+3. Portfolio value is marked with every symbol's latest close
+4. Signals are handled in symbol order against the shared risk manager
+5. One equity curve point is recorded
+
+Signal detection:
+-----------------
+Detection only depends on a symbol's own bars, never on the portfolio, so
+each symbol is detected independently (in a spawn process pool when
+parallel) before the timeline is replayed. The merge is the only
+synchronization point between symbols.
+
+Risk limits:
+------------
+Entries are sized and validated by one BacktestRiskManager whose heat limit
+comes from PortfolioRiskState. Heat of orders that are still pending counts
+towards the limit, so several symbols signalling on the same bar cannot
+overshoot it together.
+
+Classes:
+--------
+- PortfolioBacktestResult: Combined equity curve, trades and metrics
+- PortfolioBacktest: Portfolio backtest runner
+
+Author: Multi-symbol portfolio backtesting
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from operator import itemgetter
+from typing import Any, Optional
+from uuid import UUID
+
+import structlog
+
+from src.backtesting.bar_sequence import BarView
+from src.backtesting.engine.backtest_engine import UnifiedBacktestEngine
+from src.backtesting.engine.cost_model import ZeroCostModel
+from src.backtesting.engine.interfaces import EngineConfig
+from src.backtesting.engine.validated_detector import ValidatedSignalDetector
+from src.backtesting.engine.wyckoff_detector import WyckoffSignalDetector
+from src.backtesting.portfolio_risk import PortfolioRiskState
+from src.backtesting.position_manager import PositionManager
+from src.backtesting.risk_integration import BacktestRiskManager
+from src.models.backtest import BacktestMetrics, BacktestTrade, EquityCurvePoint
+from src.models.ohlcv import OHLCVBar
+from src.models.signal import TradeSignal
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class PortfolioBacktestResult:
+    """
+    Result of a portfolio backtest.
+
+    Attributes:
+        symbols: Symbols in the portfolio (sorted)
+        equity_curve: One point per timestamp of the merged timeline
+        trades: Closed trades across all symbols
+        summary: Portfolio-level performance metrics
+        signals_by_symbol: Detected signal count per symbol
+        risk_report: BacktestRiskManager report (rejections, heat utilization)
+        execution_time_seconds: Wall-clock duration of the backtest
+    """
+
+    symbols: list[str]
+    equity_curve: list[EquityCurvePoint]
+    trades: list[BacktestTrade]
+    summary: BacktestMetrics
+    signals_by_symbol: dict[str, int] = field(default_factory=dict)
+    risk_report: dict[str, Any] = field(default_factory=dict)
+    execution_time_seconds: float = 0.0
+
+    def trades_by_symbol(self) -> dict[str, list[BacktestTrade]]:
+        """Closed trades grouped by symbol (symbols without trades omitted)."""
+        grouped: dict[str, list[BacktestTrade]] = {}
+        for trade in self.trades:
+            grouped.setdefault(trade.symbol, []).append(trade)
+        return grouped
+
+
+def _detect_symbol(
+    bars: list[OHLCVBar], detector_params: Mapping[str, Any]
+) -> dict[int, TradeSignal]:
+    """Run signal detection over one symbol's bars.
+
+    Shared by the sequential path and the process-pool workers so both
+    produce identical signals. Detector setup matches the parameter sweep.
+
+    Returns:
+        Signals keyed by bar index
+    """
+    params = dict(detector_params)
+    features = WyckoffSignalDetector(
+        min_range_bars=params.get("min_range_bars", 30),
+        volume_lookback=params.get("volume_lookback", 20),
+    ).compute_features(bars)
+    detector = ValidatedSignalDetector(WyckoffSignalDetector(**params, features=features))
+
+    signals: dict[int, TradeSignal] = {}
+    for index in range(len(bars)):
+        signal = detector.detect(BarView(bars, 0, index + 1), index)
+        if signal is not None:
+            signals[index] = signal
+    return signals
+
+
+def _symbol_stream(symbol: str, bars: list[OHLCVBar]) -> Iterator[tuple[datetime, str, int]]:
+    """(timestamp, symbol, bar index) entries of one symbol, in bar order."""
+    for index, bar in enumerate(bars):
+        yield bar.timestamp, symbol, index
+
+
+class _PortfolioEngine(UnifiedBacktestEngine):
+    """UnifiedBacktestEngine stepped one timestamp (many symbols) at a time."""
+
+    def __init__(self, *args: Any, max_heat_pct: Decimal, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._max_heat_pct = max_heat_pct
+        # Heat reserved by orders waiting for their fill, keyed by order_id
+        self._pending_heat: dict[UUID, Decimal] = {}
+
+    def process_step(self, step: list[tuple[OHLCVBar, Optional[TradeSignal]]]) -> Decimal:
+        """
+        Process all bars sharing one timestamp.
+
+        Args:
+            step: (bar, detected signal) pairs in symbol order
+
+        Returns:
+            Portfolio value recorded for the timestamp
+        """
+        for bar, _ in step:
+            self._fill_pending_orders(bar)
+            self._check_position_exits(bar)
+
+        portfolio_value = self._positions.cash
+        for bar, _ in step:
+            portfolio_value = self._positions.calculate_portfolio_value(bar)
+
+        for bar, signal in step:
+            if signal is not None:
+                self._handle_signal(signal, bar, portfolio_value)
+
+        self._record_equity_point(step[-1][0], portfolio_value)
+        return portfolio_value
+
+    def finish(self) -> tuple[list[BacktestTrade], list[EquityCurvePoint], BacktestMetrics]:
+        """
+        Reject orders that never got a next bar for their symbol and summarize.
+
+        Returns:
+            (closed trades, equity curve, portfolio metrics)
+        """
+        for order in self._pending_orders:
+            order.status = "REJECTED"
+            self._pending_order_stops.pop(order.order_id, None)
+        self._pending_orders.clear()
+        self._pending_heat.clear()
+
+        trades = self._positions.closed_trades
+        return trades, self._equity_curve, self._calculate_metrics(trades)
+
+    def portfolio_heat(self) -> Decimal:
+        """Heat of open positions plus heat reserved by pending orders."""
+        heat = sum(self._pending_heat.values(), Decimal("0"))
+        if self._risk_manager is not None:
+            heat += self._risk_manager.get_portfolio_heat()
+        return heat
+
+    def _fill_pending_orders(self, bar: OHLCVBar) -> None:
+        """Fill only the pending orders of ``bar.symbol``, at that bar's open."""
+        if not any(order.symbol == bar.symbol for order in self._pending_orders):
+            return
+
+        waiting = [order for order in self._pending_orders if order.symbol != bar.symbol]
+        filling = [order for order in self._pending_orders if order.symbol == bar.symbol]
+        self._pending_orders = list(filling)
+        super()._fill_pending_orders(bar)
+        self._pending_orders = waiting
+
+        # Filled orders are now registered with the risk manager (or skipped)
+        for order in filling:
+            self._pending_heat.pop(order.order_id, None)
+
+    def _handle_signal(self, signal: TradeSignal, bar: OHLCVBar, portfolio_value: Decimal) -> None:
+        """Open an order if position slots and portfolio heat allow it."""
+        # Symbols with a pending order take a position slot as well
+        held = self._positions.positions.keys() | {order.symbol for order in self._pending_orders}
+        if len(held) >= self._config.max_open_positions:
+            return
+
+        order = self._create_order(signal, bar, portfolio_value)
+        if order is None:
+            return
+
+        stop_info = self._pending_order_stops.get(order.order_id)
+        if stop_info is not None and self._risk_manager is not None:
+            capital = self._risk_manager.current_capital
+            risk_pct = order.quantity * abs(bar.close - stop_info[0]) / capital * Decimal("100")
+            if self.portfolio_heat() + risk_pct > self._max_heat_pct:
+                self._pending_order_stops.pop(order.order_id, None)
+                self._risk_manager.violations.portfolio_heat_rejections += 1
+                logger.info(
+                    "portfolio_heat_rejection",
+                    symbol=bar.symbol,
+                    heat_pct=float(self.portfolio_heat()),
+                    order_risk_pct=float(risk_pct),
+                )
+                return
+            self._pending_heat[order.order_id] = risk_pct
+
+        self._execute_order(order, bar)
+
+
+class PortfolioBacktest:
+    """
+    Backtest many symbols against one shared account and risk budget.
+
+    Example:
+        backtest = PortfolioBacktest(
+            config=EngineConfig(initial_capital=Decimal("1000000"), max_open_positions=20),
+            detector_params={"min_range_bars": 30},
+            parallel=True,
+        )
+        result = backtest.run({"AAPL": aapl_bars, "MSFT": msft_bars, ...})
+        print(result.summary.sharpe_ratio, result.risk_report["rejection_reasons"])
+    """
+
+    def __init__(
+        self,
+        config: Optional[EngineConfig] = None,
+        detector_params: Optional[Mapping[str, Any]] = None,
+        risk_state: Optional[PortfolioRiskState] = None,
+        parallel: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the portfolio backtest.
+
+        Args:
+            config: Engine configuration (default: EngineConfig())
+            detector_params: WyckoffSignalDetector keyword arguments
+            risk_state: Portfolio risk state providing the heat limit; its
+                total_heat_pct is kept current during the run
+                (default: PortfolioRiskState())
+            parallel: Detect symbols in a process pool
+            max_workers: Process pool size when parallel (default: CPU count)
+        """
+        self.config = config or EngineConfig()
+        self.detector_params = dict(detector_params or {})
+        self.risk_state = risk_state or PortfolioRiskState()
+        self.parallel = parallel
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        market_data: Mapping[str, list[OHLCVBar]],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> PortfolioBacktestResult:
+        """
+        Run the portfolio backtest.
+
+        Args:
+            market_data: Chronological bars keyed by symbol
+            progress_callback: Optional callback invoked after each timestamp
+                with (bars_processed, total_bars)
+
+        Returns:
+            PortfolioBacktestResult for the whole portfolio
+        """
+        start_time = time.time()
+        symbols = sorted(symbol for symbol, bars in market_data.items() if bars)
+        signals = self.detect_signals({symbol: market_data[symbol] for symbol in symbols})
+
+        config = self.config
+        risk_manager = BacktestRiskManager(
+            initial_capital=config.initial_capital,
+            max_portfolio_heat_pct=self.risk_state.max_heat_pct,
+        )
+        # Signals are detected up front and handed to each step; the
+        # engine's own detector is never consulted
+        engine = _PortfolioEngine(
+            signal_detector=ValidatedSignalDetector(WyckoffSignalDetector(**self.detector_params)),
+            cost_model=ZeroCostModel(),
+            position_manager=PositionManager(config.initial_capital),
+            config=config,
+            risk_manager=risk_manager,
+            max_heat_pct=self.risk_state.max_heat_pct,
+        )
+
+        timeline = heapq.merge(*(_symbol_stream(symbol, market_data[symbol]) for symbol in symbols))
+        total_bars = sum(len(market_data[symbol]) for symbol in symbols)
+        processed = 0
+
+        for _, entries in itertools.groupby(timeline, key=itemgetter(0)):
+            step = [
+                (market_data[symbol][index], signals[symbol].get(index))
+                for _, symbol, index in entries
+            ]
+            engine.process_step(step)
+            self.risk_state.total_heat_pct = engine.portfolio_heat()
+
+            processed += len(step)
+            if progress_callback is not None:
+                progress_callback(processed, total_bars)
+
+        trades, equity_curve, summary = engine.finish()
+        self.risk_state.total_heat_pct = engine.portfolio_heat()
+
+        execution_time = time.time() - start_time
+        logger.info(
+            "portfolio_backtest_complete",
+            symbols=len(symbols),
+            bars=total_bars,
+            trades=len(trades),
+            execution_time_seconds=round(execution_time, 2),
+        )
+
+        return PortfolioBacktestResult(
+            symbols=symbols,
+            equity_curve=equity_curve,
+            trades=trades,
+            summary=summary,
+            signals_by_symbol={symbol: len(signals[symbol]) for symbol in symbols},
+            risk_report=risk_manager.get_risk_report(),
+            execution_time_seconds=execution_time,
+        )
+
+    def detect_signals(
+        self, market_data: Mapping[str, list[OHLCVBar]]
+    ) -> dict[str, dict[int, TradeSignal]]:
+        """
+        Detect signals for every symbol.
+
+        Each task carries one symbol's bars, so every bar is pickled to the
+        pool exactly once. Results are merged by symbol regardless of
+        completion order.
+
+        Args:
+            market_data: Chronological bars keyed by symbol
+
+        Returns:
+            Signals by bar index, keyed by symbol
+        """
+        if not self.parallel or len(market_data) < 2:
+            return {
+                symbol: _detect_symbol(bars, self.detector_params)
+                for symbol, bars in market_data.items()
+            }
+
+        max_workers = min(self.max_workers or os.cpu_count() or 1, len(market_data))
+        logger.info(
+            "portfolio_detection_parallel",
+            symbols=len(market_data),
+            max_workers=max_workers,
+        )
+
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as pool:
+            futures = {
+                symbol: pool.submit(_detect_symbol, bars, self.detector_params)
+                for symbol, bars in market_data.items()
+            }
+            return {symbol: future.result() for symbol, future in futures.items()}
@@ -9,6 +9,7 @@ Author: Story 12.7 Tasks 2-3
 
 import subprocess
 import time
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Optional
 from uuid import UUID
@@ -57,12 +58,19 @@ class RegressionTestEngine:
         self.test_repository = test_repository
         self.baseline_repository = baseline_repository
 
-    async def run_regression_test(self, config: RegressionTestConfig) -> RegressionTestResult:
+    async def run_regression_test(
+        self,
+        config: RegressionTestConfig,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> RegressionTestResult:
         """
         Run regression test across all configured symbols.
 
         Args:
             config: Regression test configuration
+            progress_callback: Optional hook called with (symbols_completed,
+                total_symbols) before each symbol and once all are done.
+                Exceptions it raises (e.g. job cancellation) stop the test.
 
         Returns:
             RegressionTestResult with aggregated metrics and baseline comparison
@@ -90,6 +98,9 @@ class RegressionTestEngine:
         # Run backtests for each symbol
         per_symbol_results: dict[str, BacktestResult] = {}
         for i, symbol in enumerate(config.symbols, 1):
+            if progress_callback is not None:
+                progress_callback(i - 1, len(config.symbols))
+
             logger.info(
                 "symbol_backtest_started",
                 test_id=str(test_id),
@@ -118,6 +129,9 @@ class RegressionTestEngine:
                 )
                 # Continue with remaining symbols
 
+        if progress_callback is not None:
+            progress_callback(len(config.symbols), len(config.symbols))
+
         # Aggregate metrics across all symbols
         aggregate_metrics = self._aggregate_metrics(per_symbol_results)
 
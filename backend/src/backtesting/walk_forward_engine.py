@@ -7,11 +7,14 @@ detect overfitting by rolling training and validation windows.
 Author: Story 12.4 Task 2
 """
 
+import multiprocessing
+import os
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import UTC, date, datetime
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import numpy as np
 import structlog
@@ -42,6 +45,100 @@ logger = structlog.get_logger()
 # plus enough bars for signal generation. 60 bars ~ 3 months daily data.
 MIN_BARS_PER_WINDOW = 60
 
+# Per-worker market data, installed once by the pool initializer so window
+# tasks only carry (symbol, start_date, end_date, config)
+_worker_market_data: Mapping[str, list[OHLCVBar]] = {}
+
+
+def _slice_bars(bars: list[OHLCVBar], start_date: date, end_date: date) -> list[OHLCVBar]:
+    """Return bars whose date falls within [start_date, end_date]."""
+    return [bar for bar in bars if start_date <= bar.timestamp.date() <= end_date]
+
+
+def _run_window_backtest(
+    symbol: str,
+    bars: list[OHLCVBar],
+    start_date: date,
+    end_date: date,
+    base_config: BacktestConfig,
+) -> BacktestResult:
+    """Slice bars for a window and run UnifiedBacktestEngine with Wyckoff detection.
+
+    Shared by the sequential path and the process-pool workers so both
+    produce identical results.
+
+    Args:
+        symbol: Trading symbol
+        bars: Full bar history for the symbol
+        start_date: Window start date
+        end_date: Window end date
+        base_config: Base backtest configuration
+
+    Returns:
+        BacktestResult for the window
+
+    Raises:
+        ValueError: If window has insufficient bars (< MIN_BARS_PER_WINDOW)
+    """
+    window_bars = _slice_bars(bars, start_date, end_date)
+
+    if len(window_bars) < MIN_BARS_PER_WINDOW:
+        logger.warning(
+            "insufficient_bars_for_window",
+            component="walk_forward_engine",
+            symbol=symbol,
+            start_date=str(start_date),
+            end_date=str(end_date),
+            bar_count=len(window_bars),
+            min_required=MIN_BARS_PER_WINDOW,
+        )
+        raise ValueError(
+            f"Insufficient bars for window {start_date} to {end_date}: "
+            f"got {len(window_bars)}, need >= {MIN_BARS_PER_WINDOW}"
+        )
+
+    # Build UnifiedBacktestEngine components with Wyckoff detection
+    detector = WyckoffSignalDetector()
+    validated_detector = ValidatedSignalDetector(detector)
+    cost_model = ZeroCostModel()
+    position_manager = PositionManager(base_config.initial_capital)
+    engine_config = EngineConfig(
+        initial_capital=base_config.initial_capital,
+        timeframe=base_config.timeframe,  # Story 13.5 C-2 Fix: Pass timeframe for Sharpe calculation
+    )
+    risk_manager = BacktestRiskManager(initial_capital=base_config.initial_capital)
+
+    engine = UnifiedBacktestEngine(
+        signal_detector=validated_detector,
+        cost_model=cost_model,
+        position_manager=position_manager,
+        config=engine_config,
+        risk_manager=risk_manager,
+    )
+
+    return engine.run(window_bars)
+
+
+def _init_window_worker(market_data: Mapping[str, list[OHLCVBar]]) -> None:
+    """Process pool initializer: keep the bar history for all window tasks."""
+    global _worker_market_data
+    _worker_market_data = market_data
+
+
+def _run_window_task(
+    symbol: str, start_date: date, end_date: date, base_config: BacktestConfig
+) -> tuple[BacktestResult, float]:
+    """Worker task: run one train or validate backtest.
+
+    Returns:
+        (BacktestResult, execution seconds)
+    """
+    task_start = time.time()
+    result = _run_window_backtest(
+        symbol, _worker_market_data.get(symbol, []), start_date, end_date, base_config
+    )
+    return result, time.time() - task_start
+
 
 class WalkForwardEngine:
     """Walk-forward testing engine.
@@ -73,7 +170,9 @@ class WalkForwardEngine:
         self,
         backtest_engine: object | None = None,
         strategy_func: Callable[[OHLCVBar, dict], str | None] | None = None,
-        market_data: list[OHLCVBar] | None = None,
+        market_data: list[OHLCVBar] | Mapping[str, list[OHLCVBar]] | None = None,
+        parallel: bool = False,
+        max_workers: int | None = None,
     ):
         """Initialize walk-forward engine.
 
@@ -81,12 +180,21 @@ class WalkForwardEngine:
             backtest_engine: Legacy parameter (unused, kept for compat).
             strategy_func: Legacy parameter (unused, kept for compat).
             market_data: Pre-fetched OHLCV bars covering the full date range.
-                When provided, bars are sliced per window and run through
-                UnifiedBacktestEngine with Wyckoff detection.
+                Either a single bar list (tested against symbols[0]) or a
+                mapping of symbol -> bars (every requested symbol present in
+                the mapping is tested). When provided, bars are sliced per
+                window and run through UnifiedBacktestEngine with Wyckoff
+                detection.
                 When None, the engine falls back to mock/placeholder results
                 and emits a WARNING. Placeholder results are flagged with
                 is_placeholder=True so callers can distinguish them from
                 real backtest output.
+            parallel: Run (symbol, window, train/validate) backtests in a
+                process pool. Requires market_data; each worker receives the
+                bar history once at startup, not per task. Results are merged
+                in the same order as the sequential path.
+            max_workers: Process pool size when parallel (default: CPU count,
+                capped at the number of tasks)
 
         Bug C-2 note (verified 2026-02):
             All API callers (walk_forward.py, walk_forward_suite.py) now fetch
@@ -96,9 +204,16 @@ class WalkForwardEngine:
         self.backtest_engine = backtest_engine
         self.strategy_func = strategy_func
         self.market_data = market_data
+        self.parallel = parallel
+        self.max_workers = max_workers
         self.logger = logger.bind(component="walk_forward_engine")
 
-    def walk_forward_test(self, symbols: list[str], config: WalkForwardConfig) -> WalkForwardResult:
+    def walk_forward_test(
+        self,
+        symbols: list[str],
+        config: WalkForwardConfig,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> WalkForwardResult:
         """Execute walk-forward test on symbols.
 
         AC1,2: Generate rolling windows and run train/validate backtests
@@ -110,6 +225,9 @@ class WalkForwardEngine:
         Args:
             symbols: List of symbols to test
             config: Walk-forward configuration
+            progress_callback: Optional hook called with (windows_completed,
+                total_windows) as windows finish. Exceptions it raises (e.g.
+                job cancellation) stop the test; queued windows are dropped.
 
         Returns:
             WalkForwardResult with all windows, statistics, and metrics
@@ -146,104 +264,28 @@ class WalkForwardEngine:
             num_windows=len(window_periods),
         )
 
-        # Run backtests for each window
+        symbols_to_test = self._resolve_symbols(symbols)
+
+        # Run backtests for each (symbol, window)
+        if self.parallel and self.market_data is not None:
+            window_runs = self._run_windows_parallel(
+                symbols_to_test, window_periods, config, walk_forward_id, progress_callback
+            )
+        else:
+            window_runs = self._run_windows_sequential(
+                symbols_to_test, window_periods, config, walk_forward_id, progress_callback
+            )
+
         windows: list[ValidationWindow] = []
         window_execution_times: list[float] = []
         placeholder_windows: list[int] = []
 
-        for window_num, (train_start, train_end, validate_start, validate_end) in enumerate(
-            window_periods, start=1
-        ):
-            window_start_time = time.time()
-
-            try:
-                # Run training backtest
-                train_result = self._run_backtest_for_window(
-                    symbols[0],  # Single symbol for now
-                    train_start,
-                    train_end,
-                    config.backtest_config,
-                )
-
-                # Run validation backtest
-                validate_result = self._run_backtest_for_window(
-                    symbols[0],
-                    validate_start,
-                    validate_end,
-                    config.backtest_config,
-                )
-
-                # Track windows that used placeholder results
-                if train_result.is_placeholder or validate_result.is_placeholder:
-                    placeholder_windows.append(window_num)
-
-                # Calculate performance ratio and degradation
-                performance_ratio = self._calculate_performance_ratio(
-                    train_result.summary,
-                    validate_result.summary,
-                    config.primary_metric,
-                )
-
-                degradation_detected = self._detect_degradation(
-                    performance_ratio, config.degradation_threshold
-                )
-
-                # Determine if this window used placeholder results
-                window_is_placeholder = (
-                    train_result.is_placeholder or validate_result.is_placeholder
-                )
-
-                # Create validation window
-                window = ValidationWindow(
-                    window_number=window_num,
-                    train_start_date=train_start,
-                    train_end_date=train_end,
-                    validate_start_date=validate_start,
-                    validate_end_date=validate_end,
-                    train_metrics=train_result.summary,
-                    validate_metrics=validate_result.summary,
-                    train_backtest_id=train_result.backtest_run_id,
-                    validate_backtest_id=validate_result.backtest_run_id,
-                    performance_ratio=performance_ratio,
-                    degradation_detected=degradation_detected,
-                    is_placeholder=window_is_placeholder,
-                )
-
-                windows.append(window)
-
-                window_execution_time = time.time() - window_start_time
-                window_execution_times.append(window_execution_time)
-
-                self.logger.info(
-                    "walk_forward_window_completed",
-                    walk_forward_id=str(walk_forward_id),
-                    window_number=window_num,
-                    symbol=symbols[0],
-                    train_win_rate=float(train_result.summary.win_rate),
-                    validate_win_rate=float(validate_result.summary.win_rate),
-                    performance_ratio=float(performance_ratio),
-                    degradation_detected=degradation_detected,
-                    execution_time_seconds=window_execution_time,
-                )
-
-                if degradation_detected:
-                    self.logger.warning(
-                        "degradation_detected",
-                        walk_forward_id=str(walk_forward_id),
-                        window_number=window_num,
-                        performance_ratio=float(performance_ratio),
-                        threshold=float(config.degradation_threshold),
-                    )
-
-            except Exception as e:
-                self.logger.error(
-                    "window_backtest_failed",
-                    walk_forward_id=str(walk_forward_id),
-                    window_number=window_num,
-                    error=str(e),
-                )
-                # Continue with next window on failure
-                continue
+        for window, execution_time in window_runs:
+            windows.append(window)
+            window_execution_times.append(execution_time)
+            # Track windows that used placeholder results
+            if window.is_placeholder:
+                placeholder_windows.append(window.window_number)
 
         # Calculate summary statistics
         summary_stats = self._calculate_summary_statistics(windows)
@@ -296,6 +338,313 @@ class WalkForwardEngine:
 
         return result
 
+    def _resolve_symbols(self, symbols: list[str]) -> list[str]:
+        """Determine which symbols to test.
+
+        With per-symbol market data every requested symbol that has data is
+        tested; a single bar list (or no data) covers symbols[0] only.
+
+        Args:
+            symbols: Requested symbols
+
+        Returns:
+            Symbols to run windows for
+        """
+        if not isinstance(self.market_data, Mapping):
+            return symbols[:1]
+
+        missing = [symbol for symbol in symbols if symbol not in self.market_data]
+        if missing:
+            self.logger.warning("walk_forward_symbols_without_data", symbols=missing)
+        return [symbol for symbol in symbols if symbol in self.market_data]
+
+    def _window_number(self, symbol_index: int, window_index: int, num_periods: int) -> int:
+        """Sequential window number across symbols (1-based, symbol-major)."""
+        return symbol_index * num_periods + window_index + 1
+
+    def _run_windows_sequential(
+        self,
+        symbols: list[str],
+        window_periods: list[tuple[date, date, date, date]],
+        config: WalkForwardConfig,
+        walk_forward_id: UUID,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list[tuple[ValidationWindow, float]]:
+        """Run train/validate backtests for every (symbol, window) in order.
+
+        Args:
+            symbols: Symbols to test
+            window_periods: (train_start, train_end, validate_start, validate_end)
+            config: Walk-forward configuration
+            walk_forward_id: ID for log correlation
+            progress_callback: Called with (windows_completed, total_windows)
+                before each window and after the last one
+
+        Returns:
+            (ValidationWindow, execution seconds) for each successful window
+        """
+        window_runs: list[tuple[ValidationWindow, float]] = []
+        total_windows = len(symbols) * len(window_periods)
+
+        for symbol_index, symbol in enumerate(symbols):
+            for window_index, period in enumerate(window_periods):
+                window_num = self._window_number(symbol_index, window_index, len(window_periods))
+                if progress_callback is not None:
+                    progress_callback(window_num - 1, total_windows)
+                train_start, train_end, validate_start, validate_end = period
+                window_start_time = time.time()
+
+                try:
+                    # Run training backtest
+                    train_result = self._run_backtest_for_window(
+                        symbol,
+                        train_start,
+                        train_end,
+                        config.backtest_config,
+                    )
+
+                    # Run validation backtest
+                    validate_result = self._run_backtest_for_window(
+                        symbol,
+                        validate_start,
+                        validate_end,
+                        config.backtest_config,
+                    )
+
+                    window = self._build_window(
+                        window_num,
+                        symbol if len(symbols) > 1 else None,
+                        period,
+                        train_result,
+                        validate_result,
+                        config,
+                    )
+
+                except Exception as e:
+                    self.logger.error(
+                        "window_backtest_failed",
+                        walk_forward_id=str(walk_forward_id),
+                        window_number=window_num,
+                        symbol=symbol,
+                        error=str(e),
+                    )
+                    # Continue with next window on failure
+                    continue
+
+                execution_time = time.time() - window_start_time
+                self._log_window(walk_forward_id, symbol, window, execution_time, config)
+                window_runs.append((window, execution_time))
+
+        if progress_callback is not None:
+            progress_callback(total_windows, total_windows)
+
+        return window_runs
+
+    def _run_windows_parallel(
+        self,
+        symbols: list[str],
+        window_periods: list[tuple[date, date, date, date]],
+        config: WalkForwardConfig,
+        walk_forward_id: UUID,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list[tuple[ValidationWindow, float]]:
+        """Run every (symbol, window, train/validate) backtest in a process pool.
+
+        The bar history is handed to each worker once through the pool
+        initializer; tasks only carry the symbol and date range. Results are
+        merged in (symbol, window) order, so the output matches the
+        sequential path apart from generated IDs and timings.
+
+        Args:
+            symbols: Symbols to test
+            window_periods: (train_start, train_end, validate_start, validate_end)
+            config: Walk-forward configuration
+            walk_forward_id: ID for log correlation
+            progress_callback: Called with (windows_completed, total_windows)
+                as window results are merged; if it raises, pending tasks
+                are cancelled and the pool is not waited on
+
+        Returns:
+            (ValidationWindow, execution seconds) for each successful window
+        """
+        if isinstance(self.market_data, Mapping):
+            market_data = {symbol: list(self.market_data[symbol]) for symbol in symbols}
+        else:
+            market_data = {symbol: list(self.market_data or []) for symbol in symbols}
+
+        num_tasks = 2 * len(symbols) * len(window_periods)
+        if num_tasks == 0:
+            return []
+        max_workers = min(self.max_workers or os.cpu_count() or 1, num_tasks)
+
+        self.logger.info(
+            "walk_forward_parallel_started",
+            walk_forward_id=str(walk_forward_id),
+            symbols=symbols,
+            num_tasks=num_tasks,
+            max_workers=max_workers,
+        )
+
+        ctx = multiprocessing.get_context("spawn")
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=ctx,
+            initializer=_init_window_worker,
+            initargs=(market_data,),
+        )
+        try:
+            futures: list[tuple[str, int, Future, Future]] = []
+            for symbol in symbols:
+                for window_index, period in enumerate(window_periods):
+                    train_start, train_end, validate_start, validate_end = period
+                    futures.append(
+                        (
+                            symbol,
+                            window_index,
+                            pool.submit(
+                                _run_window_task,
+                                symbol,
+                                train_start,
+                                train_end,
+                                config.backtest_config,
+                            ),
+                            pool.submit(
+                                _run_window_task,
+                                symbol,
+                                validate_start,
+                                validate_end,
+                                config.backtest_config,
+                            ),
+                        )
+                    )
+
+            window_runs: list[tuple[ValidationWindow, float]] = []
+            for windows_completed, window_futures in enumerate(futures):
+                symbol, window_index, train_future, validate_future = window_futures
+                if progress_callback is not None:
+                    progress_callback(windows_completed, len(futures))
+
+                symbol_index = symbols.index(symbol)
+                window_num = self._window_number(symbol_index, window_index, len(window_periods))
+
+                try:
+                    train_result, train_time = train_future.result()
+                    validate_result, validate_time = validate_future.result()
+
+                    window = self._build_window(
+                        window_num,
+                        symbol if len(symbols) > 1 else None,
+                        window_periods[window_index],
+                        train_result,
+                        validate_result,
+                        config,
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        "window_backtest_failed",
+                        walk_forward_id=str(walk_forward_id),
+                        window_number=window_num,
+                        symbol=symbol,
+                        error=str(e),
+                    )
+                    continue
+
+                execution_time = train_time + validate_time
+                self._log_window(walk_forward_id, symbol, window, execution_time, config)
+                window_runs.append((window, execution_time))
+
+            if progress_callback is not None:
+                progress_callback(len(futures), len(futures))
+        except BaseException:
+            # Stop promptly (e.g. cancellation): drop queued tasks, don't wait
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+
+        return window_runs
+
+    def _build_window(
+        self,
+        window_num: int,
+        symbol: str | None,
+        period: tuple[date, date, date, date],
+        train_result: BacktestResult,
+        validate_result: BacktestResult,
+        config: WalkForwardConfig,
+    ) -> ValidationWindow:
+        """Build a ValidationWindow from its train and validate results.
+
+        Args:
+            window_num: Sequential window number
+            symbol: Symbol for multi-symbol runs (None for single-symbol)
+            period: (train_start, train_end, validate_start, validate_end)
+            train_result: Training backtest result
+            validate_result: Validation backtest result
+            config: Walk-forward configuration
+
+        Returns:
+            ValidationWindow with performance ratio and degradation flag
+        """
+        train_start, train_end, validate_start, validate_end = period
+
+        # Calculate performance ratio and degradation
+        performance_ratio = self._calculate_performance_ratio(
+            train_result.summary,
+            validate_result.summary,
+            config.primary_metric,
+        )
+
+        degradation_detected = self._detect_degradation(
+            performance_ratio, config.degradation_threshold
+        )
+
+        return ValidationWindow(
+            window_number=window_num,
+            symbol=symbol,
+            train_start_date=train_start,
+            train_end_date=train_end,
+            validate_start_date=validate_start,
+            validate_end_date=validate_end,
+            train_metrics=train_result.summary,
+            validate_metrics=validate_result.summary,
+            train_backtest_id=train_result.backtest_run_id,
+            validate_backtest_id=validate_result.backtest_run_id,
+            performance_ratio=performance_ratio,
+            degradation_detected=degradation_detected,
+            # Determine if this window used placeholder results
+            is_placeholder=train_result.is_placeholder or validate_result.is_placeholder,
+        )
+
+    def _log_window(
+        self,
+        walk_forward_id: UUID,
+        symbol: str,
+        window: ValidationWindow,
+        execution_time: float,
+        config: WalkForwardConfig,
+    ) -> None:
+        """Log a completed window (and degradation warning, if any)."""
+        self.logger.info(
+            "walk_forward_window_completed",
+            walk_forward_id=str(walk_forward_id),
+            window_number=window.window_number,
+            symbol=symbol,
+            train_win_rate=float(window.train_metrics.win_rate),
+            validate_win_rate=float(window.validate_metrics.win_rate),
+            performance_ratio=float(window.performance_ratio),
+            degradation_detected=window.degradation_detected,
+            execution_time_seconds=execution_time,
+        )
+
+        if window.degradation_detected:
+            self.logger.warning(
+                "degradation_detected",
+                walk_forward_id=str(walk_forward_id),
+                window_number=window.window_number,
+                performance_ratio=float(window.performance_ratio),
+                threshold=float(config.degradation_threshold),
+            )
+
     def _validate_config(self, config: WalkForwardConfig) -> None:
         """Validate walk-forward configuration.
 
@@ -422,51 +771,25 @@ class WalkForwardEngine:
         Returns:
             BacktestResult with real Wyckoff-based metrics from the engine
         """
-        # Slice bars for this window period
-        window_bars = self._slice_bars_for_period(start_date, end_date)
-
-        if len(window_bars) < MIN_BARS_PER_WINDOW:
-            self.logger.warning(
-                "insufficient_bars_for_window",
-                symbol=symbol,
-                start_date=str(start_date),
-                end_date=str(end_date),
-                bar_count=len(window_bars),
-                min_required=MIN_BARS_PER_WINDOW,
-            )
-            raise ValueError(
-                f"Insufficient bars for window {start_date} to {end_date}: "
-                f"got {len(window_bars)}, need >= {MIN_BARS_PER_WINDOW}"
-            )
-
-        # Build UnifiedBacktestEngine components with Wyckoff detection
-        detector = WyckoffSignalDetector()
-        validated_detector = ValidatedSignalDetector(detector)
-        cost_model = ZeroCostModel()
-        position_manager = PositionManager(base_config.initial_capital)
-        engine_config = EngineConfig(
-            initial_capital=base_config.initial_capital,
-            timeframe=base_config.timeframe,  # Story 13.5 C-2 Fix: Pass timeframe for Sharpe calculation
-        )
-        risk_manager = BacktestRiskManager(initial_capital=base_config.initial_capital)
-
-        engine = UnifiedBacktestEngine(
-            signal_detector=validated_detector,
-            cost_model=cost_model,
-            position_manager=position_manager,
-            config=engine_config,
-            risk_manager=risk_manager,
+        return _run_window_backtest(
+            symbol, self._bars_for_symbol(symbol), start_date, end_date, base_config
         )
 
-        result = engine.run(window_bars)
-        return result
+    def _bars_for_symbol(self, symbol: str) -> list[OHLCVBar]:
+        """Get the pre-fetched bar history for a symbol."""
+        if isinstance(self.market_data, Mapping):
+            return self.market_data.get(symbol, [])
+        return self.market_data or []
 
-    def _slice_bars_for_period(self, start_date: date, end_date: date) -> list[OHLCVBar]:
+    def _slice_bars_for_period(
+        self, start_date: date, end_date: date, symbol: str | None = None
+    ) -> list[OHLCVBar]:
         """Slice pre-fetched market data for a specific date range.
 
         Args:
             start_date: Period start date (inclusive)
             end_date: Period end date (inclusive)
+            symbol: Symbol to slice when market_data is per-symbol
 
         Returns:
             List of OHLCVBar within the date range
@@ -474,7 +797,12 @@ class WalkForwardEngine:
         if not self.market_data:
             return []
 
-        return [bar for bar in self.market_data if start_date <= bar.timestamp.date() <= end_date]
+        if isinstance(self.market_data, Mapping):
+            if symbol is None:
+                return []
+            return _slice_bars(self._bars_for_symbol(symbol), start_date, end_date)
+
+        return _slice_bars(self.market_data, start_date, end_date)
 
     @staticmethod
     def _create_placeholder_result(
@@ -737,7 +1065,10 @@ class WalkForwardEngine:
         Returns:
             WalkForwardChartData for charting
         """
-        window_labels = [f"Window {w.window_number}" for w in windows]
+        window_labels = [
+            f"{w.symbol} Window {w.window_number}" if w.symbol else f"Window {w.window_number}"
+            for w in windows
+        ]
         train_win_rates = [w.train_metrics.win_rate for w in windows]
         validate_win_rates = [w.validate_metrics.win_rate for w in windows]
         train_avg_r = [w.train_metrics.average_r_multiple for w in windows]
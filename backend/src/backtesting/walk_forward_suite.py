@@ -14,8 +14,10 @@ from __future__ import annotations
 
 import json
 import time
+from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 import structlog
@@ -30,6 +32,9 @@ from src.backtesting.walk_forward_config import (
 from src.backtesting.walk_forward_engine import WalkForwardEngine
 from src.models.backtest import WalkForwardConfig
 
+if TYPE_CHECKING:
+    from src.backtesting.bar_store import ParquetBarStore
+
 logger = structlog.get_logger(__name__)
 
 # Default baselines directory for walk-forward suite
@@ -59,15 +64,22 @@ class WalkForwardSuite:
     and compares against stored baselines to detect regressions.
     """
 
-    def __init__(self, config: WalkForwardSuiteConfig | None = None):
+    def __init__(
+        self,
+        config: WalkForwardSuiteConfig | None = None,
+        bar_store: ParquetBarStore | None = None,
+    ):
         """Initialize the suite.
 
         Args:
             config: Suite configuration. If None, uses default config.
+            bar_store: Optional local bar store. Symbols without market data
+                passed to run() are loaded from it.
         """
         from src.backtesting.walk_forward_config import get_default_suite_config
 
         self.config = config or get_default_suite_config()
+        self.bar_store = bar_store
         self.logger = logger.bind(component="walk_forward_suite")
 
     def run(self, market_data_by_symbol: dict[str, list] | None = None) -> WalkForwardSuiteResult:
@@ -151,6 +163,28 @@ class WalkForwardSuite:
 
         return result
 
+    def _load_stored_bars(self, symbol_config: SymbolSuiteConfig) -> list | None:
+        """Load a symbol's bars for the configured period from the bar store.
+
+        Args:
+            symbol_config: Configuration for this symbol
+
+        Returns:
+            Chronological OHLCVBar list, or None if the store has no bars
+        """
+        bars = self.bar_store.read_bars(
+            symbol_config.symbol,
+            symbol_config.timeframe,
+            datetime.combine(symbol_config.start_date, datetime.min.time(), tzinfo=UTC),
+            datetime.combine(symbol_config.end_date, datetime.max.time(), tzinfo=UTC),
+        )
+        self.logger.info(
+            "walk_forward_bars_loaded_from_store",
+            symbol=symbol_config.symbol,
+            bar_count=len(bars),
+        )
+        return bars or None
+
     def _run_symbol(
         self,
         symbol_config: SymbolSuiteConfig,
@@ -173,6 +207,8 @@ class WalkForwardSuite:
             market_data = None
             if market_data_by_symbol and symbol in market_data_by_symbol:
                 market_data = market_data_by_symbol[symbol]
+            elif self.bar_store is not None:
+                market_data = self._load_stored_bars(symbol_config)
 
             # Build WalkForwardConfig for the existing engine
             backtest_config = self.config.to_backtest_config(symbol_config)
@@ -0,0 +1,155 @@
+"""
+In-memory cache for serialized chart payloads.
+
+Holds the JSON body of /api/v1/charts/data responses keyed by
+symbol/timeframe/range, so repeated opens, pans and zooms over the same
+window skip both the database and response serialization. Entries expire
+after a short TTL (pattern detections are not tracked) and are dropped
+immediately when new bars are ingested for their symbol/timeframe.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class ChartCacheKey(NamedTuple):
+    """Request parameters that determine a chart payload."""
+
+    symbol: str
+    timeframe: str  # Database timeframe (e.g. "1d")
+    start_date: str | None
+    end_date: str | None
+    limit: int
+    max_points: int | None
+
+
+class ChartDataCache:
+    """
+    Thread-safe LRU cache of serialized chart payloads with TTL.
+
+    Example:
+        ```python
+        cache = get_chart_cache()
+        payload = cache.get(key)
+        if payload is None:
+            payload = build_payload()
+            cache.set(key, payload)
+
+        # On ingestion of new AAPL daily bars
+        cache.invalidate_symbol("AAPL", "1d")
+        ```
+    """
+
+    DEFAULT_TTL = 60  # seconds
+    MAX_ENTRIES = 500
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL, max_entries: int = MAX_ENTRIES):
+        """
+        Initialize empty cache.
+
+        Args:
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Entries kept before least recently used are evicted
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[ChartCacheKey, tuple[bytes, float]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: ChartCacheKey) -> bytes | None:
+        """
+        Get payload if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Serialized payload, or None on miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            payload, expires_at = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: ChartCacheKey, payload: bytes) -> None:
+        """
+        Store payload, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            payload: Serialized payload
+        """
+        with self._lock:
+            self._entries[key] = (payload, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_symbol(self, symbol: str, timeframe: str | None = None) -> int:
+        """
+        Drop all payloads for a symbol (optionally one timeframe).
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Database timeframe, or None for every timeframe
+
+        Returns:
+            Number of entries removed
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if key.symbol == symbol and (timeframe is None or key.timeframe == timeframe)
+            ]
+            for key in keys:
+                del self._entries[key]
+
+        if keys:
+            logger.debug(
+                "chart_cache_invalidated",
+                symbol=symbol,
+                timeframe=timeframe,
+                entries_removed=len(keys),
+            )
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache_instance: ChartDataCache | None = None
+
+
+def get_chart_cache() -> ChartDataCache:
+    """
+    Get the process-wide chart payload cache.
+
+    Returns:
+        Global ChartDataCache instance
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = ChartDataCache()
+    return _cache_instance
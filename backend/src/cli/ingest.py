@@ -65,7 +65,13 @@ def cli():
     type=click.Choice(["stock", "forex", "index", "crypto"]),
     help="Asset class for provider-specific symbol formatting (default: stock)",
 )
-def ingest(symbol, start, end, timeframe, provider, asset_class):
+@click.option(
+    "--bulk",
+    is_flag=True,
+    default=False,
+    help="Use chunked COPY ingestion for large backfills (PostgreSQL)",
+)
+def ingest(symbol, start, end, timeframe, provider, asset_class, bulk):
     """
     Ingest historical OHLCV data for backtesting.
 
@@ -74,11 +80,14 @@ def ingest(symbol, start, end, timeframe, provider, asset_class):
 
     Multiple symbols:
         wyckoff ingest -s AAPL -s MSFT -s TSLA --start 2020-01-01 --end 2024-12-31
+
+    Minute-data backfill:
+        wyckoff ingest -s AAPL --start 2015-01-01 --end 2024-12-31 --timeframe 1m --bulk
     """
-    asyncio.run(ingest_async(symbol, start, end, timeframe, provider, asset_class))
+    asyncio.run(ingest_async(symbol, start, end, timeframe, provider, asset_class, bulk))
 
 
-async def ingest_async(symbols, start, end, timeframe, provider, asset_class):
+async def ingest_async(symbols, start, end, timeframe, provider, asset_class, bulk=False):
     """
     Async implementation of ingest command.
 
@@ -89,6 +98,7 @@ async def ingest_async(symbols, start, end, timeframe, provider, asset_class):
         timeframe: Bar timeframe
         provider: Provider name (or None for default)
         asset_class: Asset class for symbol formatting (or None for default)
+        bulk: Use the bulk COPY ingestion path
     """
     # Generate correlation ID for this ingestion run
     correlation_id = str(uuid.uuid4())
@@ -108,6 +118,7 @@ async def ingest_async(symbols, start, end, timeframe, provider, asset_class):
         end_date=str(end_date),
         timeframe=timeframe,
         provider=provider_name,
+        bulk=bulk,
         message=f"Starting ingestion for {len(symbols)} symbols using {provider_name}",
     )
 
@@ -168,6 +179,7 @@ async def ingest_async(symbols, start, end, timeframe, provider, asset_class):
                     end_date=end_date,
                     timeframe=timeframe,
                     asset_class=asset_class,
+                    bulk=bulk,
                 )
 
                 # Update statistics
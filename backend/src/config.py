@@ -226,6 +226,22 @@ class Settings(BaseSettings):
         description="Number of bars to fetch per batch",
     )
 
+    # Backtest Job Runner Configuration
+    backtest_job_workers: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Worker processes for backtest, preview, regression and walk-forward jobs",
+    )
+    backtest_job_concurrency: dict[str, int] = Field(
+        default={"backtest": 2, "preview": 2, "regression": 1, "walk_forward": 1},
+        description="Maximum concurrently running jobs per job type (extra jobs queue)",
+    )
+    bar_store_path: str | None = Field(
+        default=None,
+        description="Directory of the local Parquet bar store used by backtests (disabled if unset)",
+    )
+
     # Application Settings
     backend_port: int = Field(
         default=8000,
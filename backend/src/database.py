@@ -13,6 +13,7 @@ Connection Pool Configuration (AC: 9):
 
 import logging
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from sqlalchemy import event
@@ -23,6 +24,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 from src.config import settings
 
@@ -123,6 +125,35 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def isolated_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Database session on a private, unpooled engine that is disposed on exit.
+
+    For code running on its own event loop, such as backtest job workers
+    (one asyncio.run() per job): the module-level engine's pooled
+    connections belong to the loop that opened them and must not be
+    reused from another loop.
+
+    Yields:
+        AsyncSession: Database session
+    """
+    private_engine = create_async_engine(
+        str(settings.database_url), echo=settings.db_echo, poolclass=NullPool
+    )
+    try:
+        async with async_sessionmaker(
+            private_engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )() as session:
+            yield session
+    finally:
+        await private_engine.dispose()
+
+
 async def init_db() -> None:
     """
     Initialize database schema.
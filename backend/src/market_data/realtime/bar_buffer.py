@@ -135,3 +135,23 @@ class BarBuffer:
         """Total number of symbols with buffered data."""
         with self._lock:
             return len(self._buffers)
+
+
+# Latest live bars per symbol, fed by MarketDataCoordinator
+_live_bar_buffer: BarBuffer | None = None
+
+
+def get_live_bar_buffer() -> BarBuffer:
+    """
+    Get the process-wide buffer of live bars from the market data feed.
+
+    Holds the most recent bar per symbol, so consumers such as paper
+    trading mark-to-market can quote without touching the database.
+
+    Returns:
+        BarBuffer singleton
+    """
+    global _live_bar_buffer
+    if _live_bar_buffer is None:
+        _live_bar_buffer = BarBuffer(max_bars=1)
+    return _live_bar_buffer
@@ -0,0 +1,219 @@
+"""
+Incremental rolling volume/spread ratio engine for live ingestion.
+
+Keeps the trailing 20-bar window of volumes and spreads per symbol/timeframe
+in memory so each live bar's volume_ratio and spread_ratio can be computed
+without a database round trip. Windows are hydrated from the database once
+and then updated in O(1) per bar using ring buffers with running sums.
+
+Parity:
+    - Decimal averages (running sums) are exactly what MarketDataCoordinator
+      previously computed from get_latest_bars(count=20)
+    - volume_ratio()/spread_ratio() return the same floats as
+      volume_analyzer.calculate_volume_ratio()/calculate_spread_ratio()
+      for the bar following the window
+
+Example:
+    >>> engine = RollingRatioEngine()
+    >>> engine.hydrate("AAPL", "1m", recent_bars)
+    >>> window = engine.get("AAPL", "1m")
+    >>> window.volume_ratio(2500)
+    2.5
+    >>> engine.update(new_bar)
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+from decimal import Decimal
+
+import numpy as np
+
+from src.models.ohlcv import OHLCVBar
+
+RATIO_WINDOW_BARS = 20
+
+
+class RollingRatioWindow:
+    """
+    Fixed-size trailing window of bar volumes and spreads.
+
+    push() evicts the oldest bar once the window is full and keeps exact
+    running sums (int volume, Decimal spread), so averages never drift.
+
+    Attributes:
+        size: Maximum number of bars in the window
+    """
+
+    __slots__ = ("size", "_volumes", "_spreads", "_float_spreads", "_volume_sum", "_spread_sum")
+
+    def __init__(self, size: int = RATIO_WINDOW_BARS) -> None:
+        """
+        Initialize an empty window.
+
+        Args:
+            size: Number of trailing bars to keep (default 20)
+
+        Raises:
+            ValueError: If size < 1
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.size = size
+        self._volumes: deque[int] = deque()
+        self._spreads: deque[Decimal] = deque()
+        self._float_spreads: deque[float] = deque()
+        self._volume_sum = 0
+        self._spread_sum = Decimal("0")
+
+    def __len__(self) -> int:
+        return len(self._volumes)
+
+    @property
+    def is_full(self) -> bool:
+        """True once the window holds `size` bars."""
+        return len(self._volumes) == self.size
+
+    @property
+    def volume_sum(self) -> int:
+        """Sum of volumes in the window."""
+        return self._volume_sum
+
+    @property
+    def spread_sum(self) -> Decimal:
+        """Sum of spreads in the window."""
+        return self._spread_sum
+
+    def push(self, bar: OHLCVBar) -> None:
+        """
+        Append a bar, evicting the oldest if the window is full.
+
+        Args:
+            bar: Next bar in chronological order
+        """
+        if len(self._volumes) == self.size:
+            self._volume_sum -= self._volumes.popleft()
+            self._spread_sum -= self._spreads.popleft()
+            self._float_spreads.popleft()
+
+        spread = Decimal(str(bar.spread))
+        self._volumes.append(bar.volume)
+        self._spreads.append(spread)
+        self._float_spreads.append(float(bar.high - bar.low))
+        self._volume_sum += bar.volume
+        self._spread_sum += spread
+
+    def volume_ratio(self, current_volume: int) -> float | None:
+        """
+        Volume ratio of the next bar, as calculate_volume_ratio computes it.
+
+        Args:
+            current_volume: Volume of the bar following the window
+
+        Returns:
+            current_volume / window average, or None if the window is not
+            full or the average volume is zero
+        """
+        if not self.is_full:
+            return None
+        # Integer sums are exact in float64, so this equals np.mean()
+        avg_volume = float(self._volume_sum) / self.size
+        if avg_volume == 0:
+            return None
+        return float(current_volume) / avg_volume
+
+    def spread_ratio(self, current_spread: float) -> float | None:
+        """
+        Spread ratio of the next bar, as calculate_spread_ratio computes it.
+
+        Args:
+            current_spread: high - low of the bar following the window
+
+        Returns:
+            current_spread / window average, None if the window is not full,
+            or 0.0 if either the current or average spread is zero
+        """
+        if not self.is_full:
+            return None
+        if current_spread == 0:
+            return 0.0
+        # Float sums are order-dependent: average the (fixed-size) window with
+        # np.mean in chronological order to stay bit-identical to the batch path
+        avg_spread = np.mean(np.fromiter(self._float_spreads, dtype=np.float64, count=self.size))
+        if avg_spread == 0:
+            return 0.0
+        return float(current_spread / avg_spread)
+
+
+class RollingRatioEngine:
+    """
+    Rolling ratio windows keyed by symbol/timeframe.
+
+    Windows must be hydrated (from the database or any chronological bar
+    source) before they are updated; update() ignores bars for keys that
+    were never hydrated so a partial window is never mistaken for history.
+    """
+
+    def __init__(self, window_size: int = RATIO_WINDOW_BARS) -> None:
+        """
+        Initialize engine.
+
+        Args:
+            window_size: Trailing bars per window (default 20)
+        """
+        self._window_size = window_size
+        self._windows: dict[tuple[str, str], RollingRatioWindow] = {}
+
+    @property
+    def window_size(self) -> int:
+        """Trailing bars per window."""
+        return self._window_size
+
+    def is_hydrated(self, symbol: str, timeframe: str) -> bool:
+        """Check whether a window exists for symbol/timeframe."""
+        return (symbol, timeframe) in self._windows
+
+    def get(self, symbol: str, timeframe: str) -> RollingRatioWindow | None:
+        """Get the window for symbol/timeframe, or None if not hydrated."""
+        return self._windows.get((symbol, timeframe))
+
+    def hydrate(self, symbol: str, timeframe: str, bars: Sequence[OHLCVBar]) -> RollingRatioWindow:
+        """
+        (Re)build the window for symbol/timeframe from historical bars.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+            bars: Historical bars in chronological order (only the last
+                window_size are kept)
+
+        Returns:
+            The hydrated window
+        """
+        window = RollingRatioWindow(self._window_size)
+        for bar in bars[-self._window_size :]:
+            window.push(bar)
+        self._windows[(symbol, timeframe)] = window
+        return window
+
+    def update(self, bar: OHLCVBar) -> bool:
+        """
+        Push a newly stored bar into its window.
+
+        Args:
+            bar: Bar that was just persisted
+
+        Returns:
+            True if the window was updated, False if it was never hydrated
+        """
+        window = self._windows.get((bar.symbol, bar.timeframe))
+        if window is None:
+            return False
+        window.push(bar)
+        return True
+
+    def clear(self) -> None:
+        """Drop all windows (they will be re-hydrated on next use)."""
+        self._windows.clear()
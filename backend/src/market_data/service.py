@@ -18,10 +18,13 @@ from decimal import Decimal
 
 import structlog
 
+from src.cache.chart_cache import get_chart_cache
 from src.config import Settings
 from src.database import async_session_maker
 from src.market_data.provider import MarketDataProvider
+from src.market_data.realtime.bar_buffer import get_live_bar_buffer
 from src.market_data.retry import with_retry
+from src.market_data.rolling_ratios import RATIO_WINDOW_BARS, RollingRatioEngine, RollingRatioWindow
 from src.market_data.validators import validate_bar_batch
 from src.models.ohlcv import OHLCVBar
 from src.repositories.ohlcv_repository import OHLCVRepository
@@ -77,6 +80,7 @@ class MarketDataService:
         end_date: date,
         timeframe: str = "1d",
         asset_class: str | None = None,
+        bulk: bool = False,
     ) -> IngestionResult:
         """
         Ingest historical OHLCV data for a symbol.
@@ -95,6 +99,8 @@ class MarketDataService:
             timeframe: Bar timeframe (default "1d")
             asset_class: Asset class for provider-specific symbol formatting
                 (e.g., "stock", "forex", "index", "crypto"). None defaults to stock.
+            bulk: Use the chunked COPY/ON CONFLICT ingestion path
+                (OHLCVRepository.insert_bars_bulk) for large backfills
 
         Returns:
             IngestionResult with statistics
@@ -184,13 +190,24 @@ class MarketDataService:
 
                 log.info("insert_started", message=f"Inserting {len(valid_bars)} bars")
 
-                inserted_count = await repo.insert_bars(valid_bars)
+                if bulk:
+                    bulk_result = await repo.insert_bars_bulk(valid_bars)
+                    inserted_count = bulk_result.inserted
+                    rows_per_second = round(bulk_result.rows_per_second)
+                else:
+                    inserted_count = await repo.insert_bars(valid_bars)
+                    rows_per_second = None
                 duplicates_count = len(valid_bars) - inserted_count
 
+                if inserted_count > 0:
+                    get_chart_cache().invalidate_symbol(symbol, timeframe)
+
                 log.info(
                     "insert_complete",
                     inserted=inserted_count,
                     duplicates=duplicates_count,
+                    bulk=bulk,
+                    rows_per_second=rows_per_second,
                 )
 
             # Return result
@@ -350,6 +367,9 @@ class MarketDataCoordinator:
         self._analysis_cooldowns: dict[str, datetime] = {}
         self._analysis_cooldown_secs: int = 60  # Max one analysis per symbol per minute
 
+        # In-memory trailing windows for volume/spread ratios (hydrated once from DB)
+        self._ratio_engine = RollingRatioEngine(window_size=RATIO_WINDOW_BARS)
+
         logger.info(
             "market_data_coordinator_initialized",
             provider=adapter.__class__.__name__,
@@ -374,6 +394,11 @@ class MarketDataCoordinator:
                 timeframe=self.settings.bar_timeframe,
             )
 
+            # Load ratio windows before bars start arriving
+            await self._hydrate_ratio_windows(
+                self.settings.watchlist_symbols, self.settings.bar_timeframe
+            )
+
             # Register bar callback
             self.adapter.on_bar_received(self._on_bar_received)
 
@@ -446,9 +471,68 @@ class MarketDataCoordinator:
         Args:
             bar: Validated OHLCVBar from real-time feed
         """
+        # Latest live bar serves quotes (paper trading mark-to-market)
+        get_live_bar_buffer().add_bar(bar)
+
         # Create async task to insert bar
         asyncio.create_task(self._insert_bar(bar))
 
+    async def _hydrate_ratio_windows(self, symbols: list[str], timeframe: str) -> None:
+        """
+        Load the trailing ratio window for each symbol from the database.
+
+        Failures are logged and left for lazy hydration on the symbol's first
+        live bar, so a slow or unavailable database never blocks startup.
+
+        Args:
+            symbols: Symbols to hydrate
+            timeframe: Bar timeframe
+        """
+        for symbol in symbols:
+            try:
+                await self._get_ratio_window(symbol, timeframe)
+            except Exception as e:
+                logger.warning(
+                    "ratio_window_hydration_failed",
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    error=str(e),
+                )
+
+    async def _get_ratio_window(self, symbol: str, timeframe: str) -> RollingRatioWindow:
+        """
+        Get the trailing ratio window, hydrating it from the database once.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+
+        Returns:
+            RollingRatioWindow holding up to the last 20 stored bars
+        """
+        window = self._ratio_engine.get(symbol, timeframe)
+        if window is not None:
+            return window
+
+        async with async_session_maker() as session:
+            repo = OHLCVRepository(session)
+            recent_bars = await repo.get_latest_bars(
+                symbol, timeframe, count=self._ratio_engine.window_size
+            )
+
+        # Another bar for this symbol may have hydrated the window meanwhile
+        window = self._ratio_engine.get(symbol, timeframe)
+        if window is not None:
+            return window
+
+        logger.debug(
+            "ratio_window_hydrated",
+            symbol=symbol,
+            timeframe=timeframe,
+            bars_loaded=len(recent_bars),
+        )
+        return self._ratio_engine.hydrate(symbol, timeframe, recent_bars)
+
     async def _compute_ratios(
         self,
         symbol: str,
@@ -459,10 +543,11 @@ class MarketDataCoordinator:
         """
         Compute volume_ratio and spread_ratio from trailing 20-bar average.
 
-        Fetches the most recent 20 bars from the database and calculates the
-        ratio of current volume/spread to the average. This ensures Spring
-        (< 0.7x volume) and SOS (> 1.5x volume) detectors work correctly on
-        live data.
+        Uses the in-memory trailing window of the most recent 20 stored bars
+        (hydrated from the database on first use, then updated as bars are
+        inserted) and calculates the ratio of current volume/spread to the
+        average. This ensures Spring (< 0.7x volume) and SOS (> 1.5x volume)
+        detectors work correctly on live data.
 
         Args:
             symbol: Stock symbol
@@ -480,12 +565,11 @@ class MarketDataCoordinator:
             This method matches the lookback window used by the pattern engine's
             volume_analyzer.calculate_volume_ratio() function (20 bars).
         """
-        async with async_session_maker() as session:
-            repo = OHLCVRepository(session)
-            recent_bars = await repo.get_latest_bars(symbol, timeframe, count=20)
+        window = await self._get_ratio_window(symbol, timeframe)
+        bars_used = len(window)
 
         # Handle edge case: no historical data
-        if len(recent_bars) == 0:
+        if bars_used == 0:
             logger.debug(
                 "no_history_for_ratio_computation",
                 symbol=symbol,
@@ -494,22 +578,18 @@ class MarketDataCoordinator:
             return (Decimal("1.0"), Decimal("1.0"), True)
 
         # Handle insufficient history (< 20 bars)
-        low_history_flag = len(recent_bars) < 20
+        low_history_flag = not window.is_full
         if low_history_flag:
             logger.debug(
                 "insufficient_history_for_ratio_computation",
                 symbol=symbol,
                 timeframe=timeframe,
-                bars_available=len(recent_bars),
+                bars_available=bars_used,
             )
 
-        # Compute averages from available bars
-        # Explicit Decimal conversion on both volume and spread for type safety
-        volumes = [Decimal(str(bar.volume)) for bar in recent_bars]
-        spreads = [Decimal(str(bar.spread)) for bar in recent_bars]
-
-        avg_volume = sum(volumes) / Decimal(len(volumes))
-        avg_spread = sum(spreads) / Decimal(len(spreads))
+        # Compute averages from the window's exact running sums
+        avg_volume = Decimal(window.volume_sum) / Decimal(bars_used)
+        avg_spread = window.spread_sum / Decimal(bars_used)
 
         # Handle division by zero for volume ratio
         if avg_volume == Decimal("0"):
@@ -539,7 +619,7 @@ class MarketDataCoordinator:
             timeframe=timeframe,
             volume_ratio=float(volume_ratio),
             spread_ratio=float(spread_ratio),
-            bars_used=len(recent_bars),
+            bars_used=bars_used,
             low_history_flag=low_history_flag,
         )
 
@@ -587,6 +667,12 @@ class MarketDataCoordinator:
                     self._insertion_successes += 1
                     self._consecutive_failures = 0
 
+                    # Charts showing this series must pick up the new bar
+                    get_chart_cache().invalidate_symbol(bar.symbol, bar.timeframe)
+
+                    # Advance the trailing ratio window (O(1), no DB read)
+                    self._ratio_engine.update(bar)
+
                     logger.info(
                         "realtime_bar_inserted",
                         symbol=bar.symbol,
@@ -34,6 +34,7 @@ class ValidationWindow(BaseModel):
     Attributes:
         window_id: Unique identifier for this validation window
         window_number: Sequential window number (1, 2, 3...)
+        symbol: Symbol tested in this window (multi-symbol runs only)
         train_start_date: Start of training period
         train_end_date: End of training period
         validate_start_date: Start of validation period
@@ -49,6 +50,9 @@ class ValidationWindow(BaseModel):
 
     window_id: UUID = Field(default_factory=uuid4, description="Unique window ID")
     window_number: int = Field(ge=1, description="Sequential window number")
+    symbol: str | None = Field(
+        default=None, description="Symbol tested in this window (multi-symbol runs only)"
+    )
     train_start_date: date = Field(description="Training period start")
     train_end_date: date = Field(description="Training period end")
     validate_start_date: date = Field(description="Validation period start")
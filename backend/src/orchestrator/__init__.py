@@ -32,6 +32,7 @@ from src.orchestrator.events import (
     Event,
     PatternDetectedEvent,
     PhaseDetectedEvent,
+    PositionChangedEvent,
     RangeDetectedEvent,
     VolumeAnalyzedEvent,
 )
@@ -76,6 +77,7 @@ __all__ = [
     "RangeDetectedEvent",
     "PhaseDetectedEvent",
     "PatternDetectedEvent",
+    "PositionChangedEvent",
     # Services
     "ForexSessionService",
     "PortfolioMonitor",
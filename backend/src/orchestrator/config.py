@@ -66,6 +66,27 @@ class OrchestratorConfig(BaseSettings):
         default=True,
         description="Enable caching of intermediate results (ranges, phases, volume)",
     )
+    executor_mode: Literal["asyncio", "process"] = Field(
+        default="asyncio",
+        description=(
+            "Where CPU-bound stages (volume, range, phase, pattern) run: 'asyncio' runs "
+            "them on the event loop, 'process' dispatches them to a warm process pool"
+        ),
+    )
+    process_pool_workers: int | None = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description="Process pool size when executor_mode='process' (default: CPU count)",
+    )
+
+    incremental_range_detection: bool = Field(
+        default=True,
+        description=(
+            "Keep per-symbol range detection state and update it as the analysis window "
+            "slides, instead of re-detecting ranges over the whole window on every bar"
+        ),
+    )
 
     # Error handling
     max_detector_retries: int = Field(
@@ -88,6 +88,7 @@ class OrchestratorContainer:
         import_path: str,
         class_name: str,
         critical: bool,
+        init_kwargs: dict[str, Any] | None = None,
     ) -> Any | None:
         """
         Load a detector using the centralized DetectorLoader.
@@ -97,6 +98,7 @@ class OrchestratorContainer:
             import_path: Module path to import
             class_name: Class to instantiate
             critical: If True, raises on failure; if False, returns None
+            init_kwargs: Keyword arguments for the detector constructor
 
         Returns:
             Detector instance, or None for non-critical failures
@@ -118,9 +120,9 @@ class OrchestratorContainer:
 
         try:
             if critical:
-                instance = self._loader.load(name, import_path, class_name)
+                instance = self._loader.load(name, import_path, class_name, init_kwargs)
             else:
-                instance = self._loader.load_optional(name, import_path, class_name)
+                instance = self._loader.load_optional(name, import_path, class_name, init_kwargs)
 
             if instance is not None:
                 self._detectors[name] = instance
@@ -179,6 +181,9 @@ class OrchestratorContainer:
         """
         Get TradingRangeDetector instance (Story 3.2).
 
+        Incremental mode follows config.incremental_range_detection, so
+        repeated analysis of a symbol's sliding window reuses earlier work.
+
         Returns:
             TradingRangeDetector for range clustering and detection.
 
@@ -190,6 +195,7 @@ class OrchestratorContainer:
             "src.pattern_engine.trading_range_detector",
             "TradingRangeDetector",
             critical=True,
+            init_kwargs={"incremental": self._config.incremental_range_detection},
         )
 
     @property
@@ -91,6 +91,7 @@ class DetectorLoader:
         name: str,
         import_path: str,
         class_name: str | None = None,
+        init_kwargs: dict[str, Any] | None = None,
     ) -> Any:
         """
         Load a detector with consistent error handling.
@@ -99,6 +100,7 @@ class DetectorLoader:
             name: Friendly name for logging/errors
             import_path: Module path to import (e.g., 'src.pattern_engine.volume_analyzer')
             class_name: Class to get from module (defaults to name if not provided)
+            init_kwargs: Keyword arguments for the detector constructor
 
         Returns:
             Initialized detector instance
@@ -118,7 +120,7 @@ class DetectorLoader:
         try:
             module = importlib.import_module(import_path)
             detector_class = getattr(module, class_name)
-            instance = detector_class()
+            instance = detector_class(**(init_kwargs or {}))
 
             logger.debug("detector_loaded", detector=name)
             return instance
@@ -158,6 +160,7 @@ class DetectorLoader:
         name: str,
         import_path: str,
         class_name: str | None = None,
+        init_kwargs: dict[str, Any] | None = None,
     ) -> Any | None:
         """
         Load a detector, returning None on failure (for optional detectors).
@@ -168,11 +171,12 @@ class DetectorLoader:
             name: Friendly name for logging/errors
             import_path: Module path to import
             class_name: Class to get from module (defaults to name if not provided)
+            init_kwargs: Keyword arguments for the detector constructor
 
         Returns:
             Initialized detector instance, or None if loading failed
         """
         try:
-            return self.load(name, import_path, class_name)
+            return self.load(name, import_path, class_name, init_kwargs)
         except DetectorLoadError:
             return None
@@ -218,3 +218,21 @@ class DetectorFailedEvent(Event):
     error_message: str = Field(..., description="Error description")
     stack_trace: str | None = Field(None, description="Stack trace for debugging")
     retry_count: int = Field(default=0, ge=0, description="Retry attempts")
+
+
+class PositionChangedEvent(Event):
+    """
+    Emitted when a fill opens or closes a position.
+
+    Consumers holding portfolio state (equity, heat, open positions) drop it
+    on this event so the next validation reads current values.
+
+    Attributes:
+        position_id: Position that changed
+        change: OPENED or CLOSED
+    """
+
+    event_type: Literal["position_changed"] = "position_changed"
+    timeframe: str = Field(default="", description="Unused: positions span timeframes")
+    position_id: UUID = Field(..., description="Position identifier")
+    change: Literal["OPENED", "CLOSED"] = Field(..., description="Position change")
@@ -11,8 +11,9 @@ import asyncio
 import time
 import traceback
 from collections import defaultdict
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
 import structlog
@@ -38,6 +39,9 @@ from src.orchestrator.events import (
 )
 from src.orchestrator.pipeline_stage import StageResult
 
+if TYPE_CHECKING:
+    from src.orchestrator.process_executor import ProcessPoolStageExecutor
+
 logger = structlog.get_logger(__name__)
 
 
@@ -117,6 +121,23 @@ class TradeSignal:
         self.campaign_id = campaign_id
 
 
+@dataclass
+class AnalysisStages:
+    """
+    Results of the CPU-bound pipeline stages 2-5 for one symbol.
+
+    A stage's result is None if the pipeline stopped before reaching it.
+    patterns is empty unless every stage ran and Stage 5 found patterns.
+    Instances are picklable so process-pool workers can return them.
+    """
+
+    volume: StageResult | None = None
+    range: StageResult | None = None
+    phase: StageResult | None = None
+    pattern: StageResult | None = None
+    patterns: list["Pattern"] = field(default_factory=list)
+
+
 class CircuitBreaker:
     """
     Circuit breaker for detector failure protection.
@@ -231,6 +252,15 @@ class MasterOrchestrator:
         self._semaphore = asyncio.Semaphore(self._config.max_concurrent_symbols)
         self._lock = asyncio.Lock()
 
+        # Optional process pool for stages 2-5 (created lazily on first use)
+        self._process_executor: ProcessPoolStageExecutor | None = None
+        if self._config.executor_mode == "process":
+            from src.orchestrator import process_executor
+
+            self._process_executor = process_executor.ProcessPoolStageExecutor(
+                self._config, self._event_bus, self._cache
+            )
+
         # Metrics
         self._analysis_count = 0
         self._signal_count = 0
@@ -243,6 +273,7 @@ class MasterOrchestrator:
                 "max_concurrent": self._config.max_concurrent_symbols,
                 "cache_enabled": self._config.enable_caching,
                 "parallel_enabled": self._config.enable_parallel_processing,
+                "executor_mode": self._config.executor_mode,
             },
         )
 
@@ -283,10 +314,10 @@ class MasterOrchestrator:
 
             async with async_session_maker() as session:
                 repo = OHLCVRepository(session=session)
-                bars = await repo.get_latest_bars(
+                bars = await repo.get_bars_lean(
                     symbol=symbol,
                     timeframe=timeframe,
-                    count=self._config.default_lookback_bars,
+                    limit=self._config.default_lookback_bars,
                 )
 
             if not bars:
@@ -1232,6 +1263,110 @@ class MasterOrchestrator:
 
     # Main Analysis Method
 
+    # Stages 2-5: CPU-bound analysis
+
+    async def _run_analysis_stages(
+        self,
+        bars: list[OHLCVBar],
+        symbol: str,
+        timeframe: str,
+        correlation_id: UUID,
+    ) -> AnalysisStages:
+        """
+        Run the CPU-bound stages 2-5 (volume, range, phase, pattern).
+
+        Stops at the first stage that fails or produces no output, logging
+        why, exactly as analyze_symbol does. Shared by the in-loop path and
+        the process-pool workers (see src/orchestrator/process_executor.py).
+
+        Args:
+            bars: Chronological OHLCV bars from Stage 1
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+            correlation_id: Request correlation ID
+
+        Returns:
+            AnalysisStages with the result of every stage that ran
+        """
+        analysis = AnalysisStages()
+
+        # Stage 2: Volume Analysis
+        volume_result = await self._analyze_volume(bars, symbol, timeframe, correlation_id)
+        if not volume_result.success:
+            logger.warning(
+                "pipeline_stopped_at_volume",
+                symbol=symbol,
+                error=volume_result.error,
+                correlation_id=str(correlation_id),
+            )
+            return analysis
+        volume_analysis = volume_result.output
+        analysis.volume = volume_result
+
+        # Stage 3: Trading Range Detection
+        range_result = await self._detect_trading_ranges(
+            bars, volume_analysis, symbol, timeframe, correlation_id
+        )
+        if not range_result.success:
+            logger.warning(
+                "pipeline_stopped_at_range",
+                symbol=symbol,
+                error=range_result.error,
+                correlation_id=str(correlation_id),
+            )
+            return analysis
+        analysis.range = range_result
+        trading_ranges = range_result.output or []
+
+        if not trading_ranges:
+            logger.info(
+                "no_trading_ranges_detected",
+                symbol=symbol,
+                correlation_id=str(correlation_id),
+            )
+            return analysis
+
+        # Stage 4: Phase Detection
+        phase_result = await self._detect_phases(
+            bars, trading_ranges, volume_analysis, symbol, timeframe, correlation_id
+        )
+        if not phase_result.success:
+            logger.warning(
+                "pipeline_stopped_at_phase",
+                symbol=symbol,
+                error=phase_result.error,
+                correlation_id=str(correlation_id),
+            )
+            return analysis
+        analysis.phase = phase_result
+        phases = phase_result.output or []
+
+        if not phases:
+            logger.info(
+                "no_phases_detected",
+                symbol=symbol,
+                correlation_id=str(correlation_id),
+            )
+            return analysis
+
+        # Stage 5: Pattern Detection
+        pattern_result = await self._detect_patterns(
+            bars, trading_ranges, phases, volume_analysis, symbol, timeframe, correlation_id
+        )
+        analysis.pattern = pattern_result
+        patterns = pattern_result.output or []
+
+        if not patterns:
+            logger.info(
+                "no_patterns_detected",
+                symbol=symbol,
+                correlation_id=str(correlation_id),
+            )
+            return analysis
+
+        analysis.patterns = patterns
+        return analysis
+
     async def analyze_symbol(self, symbol: str, timeframe: str) -> list[TradeSignal]:
         """
         Analyze a symbol and generate trade signals.
@@ -1284,75 +1419,18 @@ class MasterOrchestrator:
                 return []
             bars = data_result.output
 
-            # Stage 2: Volume Analysis
-            volume_result = await self._analyze_volume(bars, symbol, timeframe, correlation_id)
-            if not volume_result.success:
-                logger.warning(
-                    "pipeline_stopped_at_volume",
-                    symbol=symbol,
-                    error=volume_result.error,
-                    correlation_id=str(correlation_id),
-                )
-                return []
-            volume_analysis = volume_result.output
-
-            # Stage 3: Trading Range Detection
-            range_result = await self._detect_trading_ranges(
-                bars, volume_analysis, symbol, timeframe, correlation_id
-            )
-            if not range_result.success:
-                logger.warning(
-                    "pipeline_stopped_at_range",
-                    symbol=symbol,
-                    error=range_result.error,
-                    correlation_id=str(correlation_id),
-                )
-                return []
-            trading_ranges = range_result.output or []
-
-            if not trading_ranges:
-                logger.info(
-                    "no_trading_ranges_detected",
-                    symbol=symbol,
-                    correlation_id=str(correlation_id),
-                )
-                return []
-
-            # Stage 4: Phase Detection
-            phase_result = await self._detect_phases(
-                bars, trading_ranges, volume_analysis, symbol, timeframe, correlation_id
-            )
-            if not phase_result.success:
-                logger.warning(
-                    "pipeline_stopped_at_phase",
-                    symbol=symbol,
-                    error=phase_result.error,
-                    correlation_id=str(correlation_id),
-                )
-                return []
-            phases = phase_result.output or []
-
-            if not phases:
-                logger.info(
-                    "no_phases_detected",
-                    symbol=symbol,
-                    correlation_id=str(correlation_id),
-                )
-                return []
-
-            # Stage 5: Pattern Detection
-            pattern_result = await self._detect_patterns(
-                bars, trading_ranges, phases, volume_analysis, symbol, timeframe, correlation_id
-            )
-            patterns = pattern_result.output or []
-
-            if not patterns:
-                logger.info(
-                    "no_patterns_detected",
-                    symbol=symbol,
-                    correlation_id=str(correlation_id),
-                )
+            # Stages 2-5: CPU-bound analysis (on the loop or in the process pool)
+            if self._process_executor is not None:
+                analysis = await self._process_executor.run(bars, symbol, timeframe, correlation_id)
+            else:
+                analysis = await self._run_analysis_stages(bars, symbol, timeframe, correlation_id)
+            if not analysis.patterns:
                 return []
+            volume_result = analysis.volume
+            range_result = analysis.range
+            phase_result = analysis.phase
+            pattern_result = analysis.pattern
+            patterns = analysis.patterns
 
             # Stage 6: Risk Validation
             risk_result = await self._validate_risk(patterns, symbol, correlation_id)
@@ -1431,6 +1509,11 @@ class MasterOrchestrator:
         Uses asyncio.gather with semaphore to limit concurrent analyses.
         Each symbol is analyzed independently with error isolation.
 
+        With executor_mode="process", stages 2-5 for each symbol run in a
+        warm process pool so symbols are analyzed in parallel across cores;
+        bar fetching, event publishing, risk validation, signal generation
+        and campaign persistence stay on the event loop.
+
         Args:
             symbols: List of stock symbols
             timeframe: Bar timeframe for all symbols
@@ -1499,6 +1582,15 @@ class MasterOrchestrator:
 
         return output
 
+    def shutdown(self) -> None:
+        """
+        Release the process pool, if one was started.
+
+        Safe to call more than once. Only needed with executor_mode="process".
+        """
+        if self._process_executor is not None:
+            self._process_executor.shutdown()
+
     # Health and Metrics
 
     def get_health(self) -> dict[str, Any]:
@@ -0,0 +1,388 @@
+"""
+Process-Pool Executor for CPU-Bound Orchestrator Stages.
+
+Runs MasterOrchestrator stages 2-5 (volume, range, phase, pattern) in a pool
+of warm worker processes so multi-symbol analysis scales across cores instead
+of serializing on the event loop. Enabled with executor_mode="process".
+
+Division of work:
+    - Event loop (main process): bar fetching, cache lookups/writes, event
+      publishing, risk validation, signal generation, campaign persistence
+    - Workers: pure computation on a compact BarPayload (Decimals travel as
+      strings, so bars are rebuilt exactly)
+
+Each worker builds one MasterOrchestrator (with its own detector container)
+in the pool initializer and reuses it for every task, so detectors are loaded
+once per process rather than once per symbol. Events a worker publishes are
+recorded and re-published on the main event bus in order.
+
+Note: circuit breaker state is tracked per worker process.
+
+Example:
+    >>> config = OrchestratorConfig(executor_mode="process", process_pool_workers=4)
+    >>> orchestrator = MasterOrchestrator(config=config)
+    >>> results = await orchestrator.analyze_symbols(["AAPL", "MSFT", "SPY"], "1d")
+    >>> orchestrator.shutdown()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import structlog
+
+from src.models.ohlcv import OHLCVBar
+from src.orchestrator.cache import OrchestratorCache
+from src.orchestrator.config import OrchestratorConfig
+from src.orchestrator.event_bus import EventBus
+from src.orchestrator.events import Event
+from src.pattern_engine.ohlcv_frame import datetime_to_epoch_ns, epoch_ns_to_datetime
+
+if TYPE_CHECKING:
+    from src.orchestrator.master_orchestrator import AnalysisStages, MasterOrchestrator
+
+logger = structlog.get_logger(__name__)
+
+# Cache key prefixes for the intermediate results produced by stages 2-4
+_CACHED_STAGE_PREFIXES = ("volume_analysis", "trading_ranges", "phases")
+
+# Executors with a running pool, stopped together by shutdown_process_pools()
+_live_executors: weakref.WeakSet[ProcessPoolStageExecutor] = weakref.WeakSet()
+
+
+class RecordingEventBus(EventBus):
+    """
+    EventBus that records published events instead of dispatching them.
+
+    Used inside worker processes; the main process re-publishes the recorded
+    events on the real bus where subscribers live.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: list[Event] = []
+
+    async def publish(self, event: Event) -> None:
+        """Record an event for later re-publishing."""
+        self._event_count += 1
+        self.events.append(event)
+
+    def drain(self) -> list[Event]:
+        """Return and clear all recorded events."""
+        events, self.events = self.events, []
+        return events
+
+
+@dataclass
+class WorkerResult:
+    """
+    Output of one worker task.
+
+    Attributes:
+        analysis: Stage 2-5 results
+        events: Events published by the stages, in order
+        cache_updates: Cache entries computed by the worker (key -> value)
+    """
+
+    analysis: AnalysisStages
+    events: list[Event] = field(default_factory=list)
+    cache_updates: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class BarPayload:
+    """
+    Bars for one symbol in a compact, lossless form for worker processes.
+
+    Each row is (epoch ns, open, high, low, close, volume, spread,
+    spread_ratio, volume_ratio, low_history_flag) with Decimals as strings,
+    so the worker rebuilds exactly the bars the parent fetched.
+
+    Attributes:
+        symbol: Ticker symbol shared by all rows
+        timeframe: Bar timeframe shared by all rows
+        rows: One tuple per bar, chronological
+    """
+
+    symbol: str
+    timeframe: str
+    rows: tuple[tuple[Any, ...], ...]
+
+    @classmethod
+    def from_bars(cls, bars: list[OHLCVBar]) -> BarPayload:
+        """Encode non-empty chronological bars for one symbol/timeframe."""
+        first = bars[0]
+        return cls(
+            symbol=first.symbol,
+            timeframe=first.timeframe,
+            rows=tuple(
+                (
+                    datetime_to_epoch_ns(bar.timestamp),
+                    str(bar.open),
+                    str(bar.high),
+                    str(bar.low),
+                    str(bar.close),
+                    bar.volume,
+                    str(bar.spread),
+                    str(bar.spread_ratio),
+                    str(bar.volume_ratio),
+                    bar.low_history_flag,
+                )
+                for bar in bars
+            ),
+        )
+
+    def to_bars(self) -> list[OHLCVBar]:
+        """Rebuild the bars (values were validated in the parent)."""
+        return [
+            OHLCVBar.model_construct(
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+                timestamp=epoch_ns_to_datetime(timestamp),
+                open=Decimal(open_),
+                high=Decimal(high),
+                low=Decimal(low),
+                close=Decimal(close),
+                volume=volume,
+                spread=Decimal(spread),
+                spread_ratio=Decimal(spread_ratio),
+                volume_ratio=Decimal(volume_ratio),
+                low_history_flag=low_history_flag,
+            )
+            for (
+                timestamp,
+                open_,
+                high,
+                low,
+                close,
+                volume,
+                spread,
+                spread_ratio,
+                volume_ratio,
+                low_history_flag,
+            ) in self.rows
+        ]
+
+
+# Worker-process state (set by _init_worker, reused across tasks)
+_worker_orchestrator: MasterOrchestrator | None = None
+_worker_event_bus: RecordingEventBus | None = None
+_worker_cache: OrchestratorCache | None = None
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _init_worker(config_data: dict[str, Any]) -> None:
+    """
+    Pool initializer: build the worker's long-lived orchestrator.
+
+    Args:
+        config_data: Serialized OrchestratorConfig of the parent orchestrator
+    """
+    global _worker_orchestrator, _worker_event_bus, _worker_cache, _worker_loop
+
+    from src.orchestrator.container import OrchestratorContainer
+    from src.orchestrator.master_orchestrator import MasterOrchestrator
+
+    config = OrchestratorConfig(**{**config_data, "executor_mode": "asyncio"})
+    _worker_event_bus = RecordingEventBus()
+    _worker_cache = OrchestratorCache(config)
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_orchestrator = MasterOrchestrator(
+        config=config,
+        container=OrchestratorContainer(config),
+        event_bus=_worker_event_bus,
+        cache=_worker_cache,
+    )
+
+
+def _run_stages_in_worker(
+    payload: BarPayload,
+    correlation_id: UUID,
+    cached: dict[str, Any],
+) -> WorkerResult:
+    """
+    Worker task: run stages 2-5 for one symbol.
+
+    Args:
+        payload: Bars for the symbol
+        correlation_id: Correlation ID of the parent analysis
+        cached: Parent cache entries for this symbol, keyed by cache key
+
+    Returns:
+        WorkerResult with stage results, recorded events and new cache entries
+    """
+    if _worker_orchestrator is None or _worker_loop is None:
+        raise RuntimeError("Process pool worker was not initialized")
+    assert _worker_event_bus is not None and _worker_cache is not None
+
+    _worker_cache.clear()
+    for key, value in cached.items():
+        _worker_cache.set(key, value)
+    _worker_event_bus.drain()
+
+    analysis = _worker_loop.run_until_complete(
+        _worker_orchestrator._run_analysis_stages(
+            payload.to_bars(), payload.symbol, payload.timeframe, correlation_id
+        )
+    )
+
+    cache_updates: dict[str, Any] = {}
+    for prefix in _CACHED_STAGE_PREFIXES:
+        key = f"{prefix}_{payload.symbol}_{payload.timeframe}"
+        if key not in cached:
+            value = _worker_cache.get(key)
+            if value is not None:
+                cache_updates[key] = value
+
+    return WorkerResult(
+        analysis=analysis,
+        events=_worker_event_bus.drain(),
+        cache_updates=cache_updates,
+    )
+
+
+class ProcessPoolStageExecutor:
+    """
+    Dispatches orchestrator stages 2-5 to a warm process pool.
+
+    The pool is created on first use and reused until shutdown(). Workers use
+    the "spawn" start method so they never inherit the parent's event loop,
+    database connections or thread state.
+
+    Example:
+        >>> executor = ProcessPoolStageExecutor(config, event_bus, cache)
+        >>> analysis = await executor.run(bars, "AAPL", "1d", correlation_id)
+        >>> executor.shutdown()
+    """
+
+    def __init__(
+        self,
+        config: OrchestratorConfig,
+        event_bus: EventBus,
+        cache: OrchestratorCache,
+    ) -> None:
+        """
+        Initialize executor (the pool itself is started lazily).
+
+        Args:
+            config: Orchestrator configuration (sent to workers)
+            event_bus: Main-process event bus for re-publishing worker events
+            cache: Main-process cache for intermediate results
+        """
+        self._config = config
+        self._event_bus = event_bus
+        self._cache = cache
+        self._max_workers = config.process_pool_workers or os.cpu_count() or 1
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def max_workers(self) -> int:
+        """Number of worker processes in the pool."""
+        return self._max_workers
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool, starting it on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._config.model_dump(),),
+            )
+            _live_executors.add(self)
+            logger.info("orchestrator_process_pool_started", workers=self._max_workers)
+        return self._pool
+
+    def _cached_entries(self, symbol: str, timeframe: str) -> dict[str, Any]:
+        """Collect cached stage 2-4 results for a symbol to seed the worker."""
+        if not self._config.enable_caching:
+            return {}
+        entries: dict[str, Any] = {}
+        for prefix in _CACHED_STAGE_PREFIXES:
+            key = f"{prefix}_{symbol}_{timeframe}"
+            value = self._cache.get(key)
+            if value:
+                entries[key] = value
+        return entries
+
+    async def run(
+        self,
+        bars: list[OHLCVBar],
+        symbol: str,
+        timeframe: str,
+        correlation_id: UUID,
+    ) -> AnalysisStages:
+        """
+        Run stages 2-5 for one symbol in the process pool.
+
+        Args:
+            bars: Chronological OHLCV bars from Stage 1
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+            correlation_id: Request correlation ID
+
+        Returns:
+            AnalysisStages produced by the worker
+
+        Raises:
+            BrokenProcessPool: If a worker died; the pool is restarted on the
+                next call
+        """
+        payload = BarPayload.from_bars(bars)
+        cached = self._cached_entries(symbol, timeframe)
+        loop = asyncio.get_running_loop()
+
+        try:
+            result: WorkerResult = await loop.run_in_executor(
+                self._get_pool(), _run_stages_in_worker, payload, correlation_id, cached
+            )
+        except BrokenProcessPool:
+            logger.error(
+                "orchestrator_process_pool_broken",
+                symbol=symbol,
+                correlation_id=str(correlation_id),
+            )
+            # Workers are gone; don't block the event loop waiting on them
+            self.shutdown(wait=False)
+            raise
+
+        for key, value in result.cache_updates.items():
+            self._cache.set(key, value)
+        for event in result.events:
+            await self._event_bus.publish(event)
+
+        return result.analysis
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes. Safe to call more than once.
+
+        Args:
+            wait: Block until the workers have exited
+        """
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            _live_executors.discard(self)
+            pool.shutdown(wait=wait, cancel_futures=True)
+            logger.info("orchestrator_process_pool_stopped")
+
+
+def shutdown_process_pools() -> None:
+    """
+    Stop the pools of every executor that started one.
+
+    Called from the application shutdown handler so worker processes do not
+    outlive the server, whoever created the orchestrator.
+    """
+    for executor in list(_live_executors):
+        executor.shutdown()
@@ -11,8 +11,10 @@ from typing import Generic, TypeVar
 
 import structlog
 
+from src.models.ohlcv import OHLCVBar
 from src.orchestrator.pipeline.context import PipelineContext
 from src.orchestrator.pipeline.result import PipelineResult
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
 
 logger = structlog.get_logger(__name__)
 
@@ -48,6 +50,9 @@ class PipelineStage(ABC, Generic[TInput, TOutput]):
         ...         return volume_analysis_result
     """
 
+    # Context key for the shared columnar bar store (built once per pipeline run)
+    OHLCV_FRAME_CONTEXT_KEY = "ohlcv_frame"
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -142,3 +147,23 @@ class PipelineStage(ABC, Generic[TInput, TOutput]):
                 execution_time_ms=execution_time_ms,
                 exception=e,
             )
+
+    def _get_ohlcv_frame(self, bars: list[OHLCVBar], context: PipelineContext) -> OHLCVFrame:
+        """
+        Get the shared OHLCVFrame for this pipeline run, building it on first use.
+
+        The frame is stored in context so downstream stages reuse the same
+        columnar arrays instead of re-extracting Decimal fields from bars.
+
+        Args:
+            bars: Non-empty input bars for the pipeline run
+            context: Pipeline context
+
+        Returns:
+            OHLCVFrame over the input bars
+        """
+        frame: OHLCVFrame | None = context.get(self.OHLCV_FRAME_CONTEXT_KEY)
+        if frame is None or frame.bars is not bars:
+            frame = OHLCVFrame.from_bars(bars)
+            context.set(self.OHLCV_FRAME_CONTEXT_KEY, frame)
+        return frame
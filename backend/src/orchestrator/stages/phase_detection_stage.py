@@ -9,7 +9,6 @@ Story 23.1: Migrate to PhaseClassifier (real phase detection implementation)
 
 from datetime import UTC, datetime
 
-import pandas as pd
 import structlog
 
 from src.models.ohlcv import OHLCVBar
@@ -40,6 +39,9 @@ class PhaseDetectionStage(PipelineStage[list[OHLCVBar], PhaseInfo | None]):
     Context Keys Required:
         - "trading_ranges": list[TradingRange] (from RangeDetectionStage)
 
+    Context Keys Used (optional):
+        - "ohlcv_frame": OHLCVFrame (reused if set by an earlier stage)
+
     Context Keys Set:
         - "phase_info": PhaseInfo | None (for downstream stages)
         - "current_trading_range": TradingRange | None (most recent active range)
@@ -127,8 +129,8 @@ class PhaseDetectionStage(PipelineStage[list[OHLCVBar], PhaseInfo | None]):
             context.set(self.CONTEXT_KEY, None)
             return None
 
-        df = self._bars_to_dataframe(bars)
-        result = self._classifier.classify(df)
+        frame = self._get_ohlcv_frame(bars, context)
+        result = self._classifier.classify(frame)
         phase_info = self._phase_result_to_info(result, current_range, bars)
 
         context.set(self.CONTEXT_KEY, phase_info)
@@ -145,30 +147,6 @@ class PhaseDetectionStage(PipelineStage[list[OHLCVBar], PhaseInfo | None]):
 
         return phase_info
 
-    def _bars_to_dataframe(self, bars: list[OHLCVBar]) -> pd.DataFrame:
-        """
-        Convert list of OHLCVBar to DataFrame for PhaseClassifier.
-
-        Args:
-            bars: List of OHLCV bars
-
-        Returns:
-            DataFrame with columns [timestamp, open, high, low, close, volume]
-        """
-        return pd.DataFrame(
-            [
-                {
-                    "timestamp": bar.timestamp,
-                    "open": float(bar.open),
-                    "high": float(bar.high),
-                    "low": float(bar.low),
-                    "close": float(bar.close),
-                    "volume": float(bar.volume),
-                }
-                for bar in bars
-            ]
-        )
-
     def _phase_result_to_info(
         self,
         result: PhaseResult,
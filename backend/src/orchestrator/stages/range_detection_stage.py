@@ -31,6 +31,9 @@ class RangeDetectionStage(PipelineStage[list[OHLCVBar], list[TradingRange]]):
     Context Keys Required:
         - "volume_analysis": list[VolumeAnalysis] (from VolumeAnalysisStage)
 
+    Context Keys Used (optional):
+        - "ohlcv_frame": OHLCVFrame (reused if set by an earlier stage)
+
     Context Keys Set:
         - "trading_ranges": list[TradingRange] (for downstream stages)
 
@@ -103,7 +106,8 @@ class RangeDetectionStage(PipelineStage[list[OHLCVBar], list[TradingRange]]):
             correlation_id=str(context.correlation_id),
         )
 
-        trading_ranges = self._detector.detect_ranges(bars, volume_analysis)
+        frame = self._get_ohlcv_frame(bars, context)
+        trading_ranges = self._detector.detect_ranges(frame, volume_analysis)
 
         context.set(self.CONTEXT_KEY, trading_ranges)
 
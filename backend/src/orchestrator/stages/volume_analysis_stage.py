@@ -32,6 +32,7 @@ class VolumeAnalysisStage(PipelineStage[list[OHLCVBar], list[VolumeAnalysis]]):
 
     Context Keys Set:
         - "volume_analysis": list[VolumeAnalysis] (for downstream stages)
+        - "ohlcv_frame": OHLCVFrame (columnar bars shared with downstream stages)
 
     Example:
         >>> analyzer = VolumeAnalyzer(lookback_period=20)
@@ -92,7 +93,8 @@ class VolumeAnalysisStage(PipelineStage[list[OHLCVBar], list[VolumeAnalysis]]):
             correlation_id=str(context.correlation_id),
         )
 
-        volume_analysis = self._analyzer.analyze(bars)
+        frame = self._get_ohlcv_frame(bars, context)
+        volume_analysis = self._analyzer.analyze(frame)
 
         context.set(self.CONTEXT_KEY, volume_analysis)
 
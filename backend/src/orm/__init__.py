@@ -3,8 +3,12 @@ ORM Models for BMAD Wyckoff System (Story 10.3.1).
 
 This module exports Pattern, Signal, and SectorMappingORM models.
 OHLCVBar model is in src/repositories/models.py (OHLCVBarModel).
+
+Importing this package also registers the signal statistics rollup table
+and the Signal mapper events that maintain it.
 """
 
 from src.orm.models import Pattern, SectorMappingORM, Signal
+from src.orm.signal_statistics import SignalStatisticsRollupORM
 
-__all__ = ["Pattern", "SectorMappingORM", "Signal"]
+__all__ = ["Pattern", "SectorMappingORM", "Signal", "SignalStatisticsRollupORM"]
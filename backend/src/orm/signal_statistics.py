@@ -0,0 +1,289 @@
+"""
+SQLAlchemy ORM Model for Signal Statistics Rollups.
+
+Pre-aggregated signal counts and outcome sums per
+day x signal type x symbol x lifecycle state x rejection reason, so the
+statistics dashboard reads a few rollup rows instead of scanning signals.
+
+Rollups are maintained incrementally by mapper events on Signal: every ORM
+insert, update or delete of a signal applies the difference between its old
+and new contribution in the same transaction. Core UPDATE/DELETE statements
+against the signals table bypass these events; use ORM writes (or
+SignalStatisticsService.rebuild_rollups) for signals.
+"""
+
+from collections.abc import Mapping
+from datetime import UTC, date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+import structlog
+from sqlalchemy import BigInteger, Date, Index, Integer, String, event, inspect
+from sqlalchemy.dialects.postgresql import NUMERIC, TIMESTAMP
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+from src.orm.models import Signal
+
+logger = structlog.get_logger(__name__)
+
+# Signal columns that feed the rollups
+ROLLUP_SOURCE_FIELDS = (
+    "created_at",
+    "signal_type",
+    "symbol",
+    "lifecycle_state",
+    "confidence_score",
+    "validation_results",
+    "trade_outcome",
+)
+
+ROLLUP_KEY_COLUMNS = (
+    "day",
+    "signal_type",
+    "symbol",
+    "lifecycle_state",
+    "rejection_stage",
+    "rejection_reason",
+)
+
+ROLLUP_MEASURE_COLUMNS = (
+    "signal_count",
+    "confidence_sum",
+    "winning_count",
+    "r_multiple_sum",
+    "r_multiple_count",
+    "pnl_sum",
+)
+
+_REJECTION_REASON_LENGTH = 255
+
+# Rows per upsert statement (13 bind parameters each)
+_UPSERT_BATCH_SIZE = 1000
+
+_UPSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+# Values for columns filled by server defaults, which are not loaded on the
+# instance when the after_insert event fires
+_SERVER_DEFAULTS = {"signal_type": "LONG", "lifecycle_state": "generated"}
+
+
+class SignalStatisticsRollupORM(Base):
+    """
+    Daily signal statistics rollup.
+
+    Table: signal_statistics_rollups
+    Primary Key: (day, signal_type, symbol, lifecycle_state,
+                  rejection_stage, rejection_reason)
+
+    rejection_stage/rejection_reason are empty strings except for rejected
+    signals that carry validation results. Outcome measures (winning_count,
+    r_multiple_*, pnl_sum) are summed from trade_outcome for every state;
+    statistics read them for lifecycle_state == "closed".
+    """
+
+    __tablename__ = "signal_statistics_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    signal_type: Mapped[str] = mapped_column(String(10), primary_key=True)
+    symbol: Mapped[str] = mapped_column(String(20), primary_key=True)
+    lifecycle_state: Mapped[str] = mapped_column(String(20), primary_key=True)
+    rejection_stage: Mapped[str] = mapped_column(String(50), primary_key=True, default="")
+    rejection_reason: Mapped[str] = mapped_column(
+        String(_REJECTION_REASON_LENGTH), primary_key=True, default=""
+    )
+
+    signal_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    confidence_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    winning_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    r_multiple_sum: Mapped[Decimal] = mapped_column(NUMERIC(24, 8), nullable=False, default=0)
+    r_multiple_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pnl_sum: Mapped[Decimal] = mapped_column(NUMERIC(24, 8), nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+    )
+
+    __table_args__ = (Index("idx_signal_statistics_rollups_symbol_day", "symbol", "day"),)
+
+
+def _outcome_value(trade_outcome: Any, key: str) -> Decimal | None:
+    """Numeric trade_outcome field (stored as string or number), or None."""
+    if not isinstance(trade_outcome, Mapping):
+        return None
+    value = trade_outcome.get(key)
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return None
+
+
+def signal_rollup_row(values: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Rollup key and measures contributed by one signal.
+
+    Args:
+        values: Signal column values for ROLLUP_SOURCE_FIELDS
+
+    Returns:
+        Dict with ROLLUP_KEY_COLUMNS and ROLLUP_MEASURE_COLUMNS
+    """
+    created_at = values["created_at"]
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=UTC)
+
+    lifecycle_state = values["lifecycle_state"] or "generated"
+    validation_results = values["validation_results"]
+    rejection_stage = rejection_reason = ""
+    if lifecycle_state == "rejected" and isinstance(validation_results, Mapping):
+        rejection_stage = str(validation_results.get("rejection_stage") or "Unknown")
+        rejection_reason = str(validation_results.get("rejection_reason") or "Unknown")
+
+    trade_outcome = values["trade_outcome"]
+    pnl = _outcome_value(trade_outcome, "pnl_dollars")
+    r_multiple = _outcome_value(trade_outcome, "r_multiple")
+
+    return {
+        "day": created_at.astimezone(UTC).date(),
+        "signal_type": values["signal_type"],
+        "symbol": values["symbol"],
+        "lifecycle_state": lifecycle_state,
+        "rejection_stage": rejection_stage[:50],
+        "rejection_reason": rejection_reason[:_REJECTION_REASON_LENGTH],
+        "signal_count": 1,
+        "confidence_sum": values["confidence_score"] or 0,
+        "winning_count": 1 if pnl is not None and pnl > 0 else 0,
+        "r_multiple_sum": r_multiple if r_multiple is not None else Decimal("0"),
+        "r_multiple_count": 1 if r_multiple is not None else 0,
+        "pnl_sum": pnl if pnl is not None else Decimal("0"),
+    }
+
+
+def merge_rollup_rows(
+    rows: list[tuple[int, dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """
+    Combine signed rollup rows by key, dropping rows that cancel out.
+
+    Args:
+        rows: (sign, row) pairs with sign +1 (add) or -1 (remove)
+
+    Returns:
+        One row per key with summed measures
+    """
+    merged: dict[tuple, dict[str, Any]] = {}
+    for sign, row in rows:
+        key = tuple(row[column] for column in ROLLUP_KEY_COLUMNS)
+        target = merged.get(key)
+        if target is None:
+            target = merged[key] = {column: row[column] for column in ROLLUP_KEY_COLUMNS}
+            for column in ROLLUP_MEASURE_COLUMNS:
+                target[column] = 0
+        for column in ROLLUP_MEASURE_COLUMNS:
+            target[column] += sign * row[column]
+    return [row for row in merged.values() if any(row[column] for column in ROLLUP_MEASURE_COLUMNS)]
+
+
+def upsert_rollup_deltas(connection: Connection, rows: list[dict[str, Any]]) -> None:
+    """
+    Add measure deltas to the rollup rows (inserting missing keys).
+
+    Args:
+        connection: Connection of the transaction that changed the signals
+        rows: Rows from merge_rollup_rows
+    """
+    if not rows:
+        return
+    insert = _UPSERTS.get(connection.dialect.name)
+    if insert is None:
+        logger.warning("signal_rollups_unsupported_dialect", dialect=connection.dialect.name)
+        return
+
+    table = SignalStatisticsRollupORM.__table__
+    now = datetime.now(UTC)
+    for offset in range(0, len(rows), _UPSERT_BATCH_SIZE):
+        batch = rows[offset : offset + _UPSERT_BATCH_SIZE]
+        stmt = insert(table).values([{**row, "updated_at": now} for row in batch])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(ROLLUP_KEY_COLUMNS),
+            set_={
+                **{
+                    column: table.c[column] + stmt.excluded[column]
+                    for column in ROLLUP_MEASURE_COLUMNS
+                },
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        connection.execute(stmt)
+
+
+def _inserted_values(target: Signal) -> dict[str, Any]:
+    """Values of a just-inserted signal (never triggers a lazy load mid-flush)."""
+    loaded = inspect(target).dict
+    values = {field: loaded.get(field) for field in ROLLUP_SOURCE_FIELDS}
+    for field, default in _SERVER_DEFAULTS.items():
+        values[field] = values[field] or default
+    if values["created_at"] is None:
+        values["created_at"] = datetime.now(UTC)
+    return values
+
+
+def _current_values(target: Signal) -> dict[str, Any]:
+    return {field: getattr(target, field) for field in ROLLUP_SOURCE_FIELDS}
+
+
+def _previous_values(target: Signal) -> dict[str, Any]:
+    """Values the signal had before this flush (from attribute history)."""
+    state = inspect(target)
+    values = _current_values(target)
+    for field in ROLLUP_SOURCE_FIELDS:
+        deleted = state.attrs[field].history.deleted
+        if deleted:
+            values[field] = deleted[0]
+    return values
+
+
+def _track_previous_value(target, value, oldvalue, initiator) -> None:
+    """No-op; registered for its active_history side effect."""
+
+
+# Load the old value when a rollup source attribute is assigned while
+# expired, so after_update can always see what the signal contributed before
+for _field in ROLLUP_SOURCE_FIELDS:
+    event.listen(getattr(Signal, _field), "set", _track_previous_value, active_history=True)
+
+
+@event.listens_for(Signal, "after_insert")
+def _rollup_signal_insert(mapper, connection: Connection, target: Signal) -> None:
+    upsert_rollup_deltas(
+        connection, merge_rollup_rows([(1, signal_rollup_row(_inserted_values(target)))])
+    )
+
+
+@event.listens_for(Signal, "after_update")
+def _rollup_signal_update(mapper, connection: Connection, target: Signal) -> None:
+    state = inspect(target)
+    if not any(state.attrs[field].history.has_changes() for field in ROLLUP_SOURCE_FIELDS):
+        return
+    upsert_rollup_deltas(
+        connection,
+        merge_rollup_rows(
+            [
+                (-1, signal_rollup_row(_previous_values(target))),
+                (1, signal_rollup_row(_current_values(target))),
+            ]
+        ),
+    )
+
+
+@event.listens_for(Signal, "before_delete")
+def _rollup_signal_delete(mapper, connection: Connection, target: Signal) -> None:
+    # before_delete so unloaded attributes can still be read from the row
+    upsert_rollup_deltas(
+        connection, merge_rollup_rows([(-1, signal_rollup_row(_previous_values(target)))])
+    )
@@ -258,6 +258,22 @@ class BarWindowManager:
 
         return list(self._windows[symbol].bars)
 
+    def get_latest_bar(self, symbol: str) -> OHLCVBar | None:
+        """
+        Retrieve the most recent bar for a symbol without copying the window.
+
+        Args:
+            symbol: Symbol to query
+
+        Returns:
+            Most recent bar, or None if the symbol is not tracked or empty
+        """
+        window = self._windows.get(symbol)
+        if window is None or not window.bars:
+            return None
+
+        return window.bars[-1]
+
     def get_state(self, symbol: str) -> WindowState:
         """
         Get current state of symbol's window.
@@ -0,0 +1,261 @@
+"""
+Columnar OHLCV bar container.
+
+This module provides OHLCVFrame, a struct-of-arrays representation of a bar
+sequence for a single symbol/timeframe. Pattern-engine stages (volume analysis,
+pivot detection, range detection, phase classification) accept it directly so
+Decimal-to-float conversion and per-bar attribute access happen once per fetch
+instead of once per stage.
+
+Layout:
+    - open/high/low/close/volume: float64 arrays
+    - timestamp: int64 epoch nanoseconds (UTC)
+    - symbol/timeframe: header shared by every row
+    - bars: optional reference to the source OHLCVBar list, used by stages
+      that must return Pydantic objects (e.g. Pivot, VolumeAnalysis)
+
+Example:
+    >>> from src.pattern_engine.ohlcv_frame import OHLCVFrame
+    >>> frame = OHLCVFrame.from_bars(bars)
+    >>> volume_analysis = VolumeAnalyzer().analyze(frame)
+    >>> pivots = detect_pivots(frame, lookback=5)
+    >>> ranges = TradingRangeDetector().detect_ranges(frame, volume_analysis)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from src.models.ohlcv import OHLCVBar
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_epoch_ns(value: datetime) -> int:
+    """
+    Convert a datetime to integer epoch nanoseconds without float rounding.
+
+    Naive datetimes are treated as UTC, matching OHLCVBar's validator.
+
+    Args:
+        value: Datetime to convert
+
+    Returns:
+        Nanoseconds since 1970-01-01T00:00:00Z
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return ((value - _EPOCH) // _ONE_MICROSECOND) * 1000
+
+
+def epoch_ns_to_datetime(value: int) -> datetime:
+    """
+    Convert integer epoch nanoseconds back to a UTC datetime.
+
+    Args:
+        value: Nanoseconds since the epoch
+
+    Returns:
+        Timezone-aware UTC datetime (microsecond precision)
+    """
+    return _EPOCH + timedelta(microseconds=int(value) // 1000)
+
+
+@dataclass(frozen=True, slots=True)
+class OHLCVFrame:
+    """
+    Struct-of-arrays OHLCV container for one symbol/timeframe.
+
+    Build once per fetch with from_bars() and hand the same instance to every
+    pattern-engine stage. Arrays are treated as read-only; slice() returns
+    NumPy views, so sub-frames share storage with the parent.
+
+    Attributes:
+        symbol: Ticker symbol shared by all rows
+        timeframe: Bar timeframe shared by all rows
+        timestamp: int64 epoch nanoseconds (UTC), chronological
+        open: float64 open prices
+        high: float64 high prices
+        low: float64 low prices
+        close: float64 close prices
+        volume: float64 volumes
+        bars: Source OHLCVBar list, if the frame was built from bars
+    """
+
+    symbol: str
+    timeframe: str
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    bars: Sequence[OHLCVBar] | None = None
+
+    def __post_init__(self) -> None:
+        """Validate that all columns have the same length."""
+        n = len(self.timestamp)
+        for name in ("open", "high", "low", "close", "volume"):
+            if len(getattr(self, name)) != n:
+                raise ValueError(
+                    f"Column '{name}' has length {len(getattr(self, name))}, expected {n}"
+                )
+        if self.bars is not None and len(self.bars) != n:
+            raise ValueError(f"Source bars length {len(self.bars)} does not match frame length {n}")
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[OHLCVBar]) -> OHLCVFrame:
+        """
+        Build a frame from OHLCVBar objects in a single pass.
+
+        Args:
+            bars: Non-empty chronological bars for one symbol/timeframe
+
+        Returns:
+            OHLCVFrame referencing the source bars
+
+        Raises:
+            ValueError: If bars is empty
+        """
+        if not bars:
+            raise ValueError("Cannot build OHLCVFrame from empty bar list")
+
+        n = len(bars)
+        timestamp = np.empty(n, dtype=np.int64)
+        opens = np.empty(n, dtype=np.float64)
+        highs = np.empty(n, dtype=np.float64)
+        lows = np.empty(n, dtype=np.float64)
+        closes = np.empty(n, dtype=np.float64)
+        volumes = np.empty(n, dtype=np.float64)
+
+        for i, bar in enumerate(bars):
+            timestamp[i] = datetime_to_epoch_ns(bar.timestamp)
+            opens[i] = float(bar.open)
+            highs[i] = float(bar.high)
+            lows[i] = float(bar.low)
+            closes[i] = float(bar.close)
+            volumes[i] = bar.volume
+
+        first = bars[0]
+        return cls(
+            symbol=first.symbol,
+            timeframe=first.timeframe,
+            timestamp=timestamp,
+            open=opens,
+            high=highs,
+            low=lows,
+            close=closes,
+            volume=volumes,
+            bars=bars,
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @property
+    def spread(self) -> np.ndarray:
+        """High - low for every bar (float64)."""
+        return self.high - self.low
+
+    def timestamp_at(self, index: int) -> datetime:
+        """
+        Get the timestamp of a single row as a UTC datetime.
+
+        Args:
+            index: Row index
+
+        Returns:
+            UTC datetime for the row
+        """
+        if self.bars is not None:
+            return self.bars[index].timestamp
+        return epoch_ns_to_datetime(int(self.timestamp[index]))
+
+    def bar(self, index: int) -> OHLCVBar:
+        """
+        Get the OHLCVBar for a row.
+
+        Returns the source bar when available; otherwise constructs one from
+        the columns without re-running validation.
+
+        Args:
+            index: Row index
+
+        Returns:
+            OHLCVBar for the row
+        """
+        if self.bars is not None:
+            return self.bars[index]
+
+        high = Decimal(repr(float(self.high[index])))
+        low = Decimal(repr(float(self.low[index])))
+        return OHLCVBar.model_construct(
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            timestamp=epoch_ns_to_datetime(int(self.timestamp[index])),
+            open=Decimal(repr(float(self.open[index]))),
+            high=high,
+            low=low,
+            close=Decimal(repr(float(self.close[index]))),
+            volume=int(self.volume[index]),
+            spread=high - low,
+        )
+
+    def to_bars(self) -> list[OHLCVBar]:
+        """
+        Get the frame's rows as a list of OHLCVBar objects.
+
+        Returns:
+            Source bars when available, otherwise constructed bars
+        """
+        if self.bars is not None:
+            return list(self.bars)
+        return [self.bar(i) for i in range(len(self))]
+
+    def slice(self, start: int, stop: int) -> OHLCVFrame:
+        """
+        Get a sub-frame for rows [start, stop) sharing storage with this frame.
+
+        Args:
+            start: First row (inclusive)
+            stop: Last row (exclusive)
+
+        Returns:
+            OHLCVFrame whose arrays are NumPy views of this frame's arrays
+        """
+        return OHLCVFrame(
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            timestamp=self.timestamp[start:stop],
+            open=self.open[start:stop],
+            high=self.high[start:stop],
+            low=self.low[start:stop],
+            close=self.close[start:stop],
+            volume=self.volume[start:stop],
+            bars=self.bars[start:stop] if self.bars is not None else None,
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convert to the DataFrame layout used by PhaseClassifier.
+
+        Returns:
+            DataFrame with columns [timestamp, open, high, low, close, volume]
+        """
+        return pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(self.timestamp, unit="ns", utc=True),
+                "open": self.open,
+                "high": self.high,
+                "low": self.low,
+                "close": self.close,
+                "volume": self.volume,
+            }
+        )
@@ -16,6 +16,7 @@ import pandas as pd
 import structlog
 
 from src.models.phase_classification import PhaseClassification, PhaseEvents
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
 
 from ._converters import (
     PHASE_TYPE_TO_WYCKOFF,
@@ -104,7 +105,7 @@ class PhaseClassifier:
 
     def classify(
         self,
-        ohlcv: pd.DataFrame,
+        ohlcv: pd.DataFrame | OHLCVFrame,
         events: Optional[list[PhaseEvent]] = None,
     ) -> PhaseResult:
         """
@@ -114,7 +115,8 @@ class PhaseClassifier:
         phase of the Wyckoff cycle the market is currently in.
 
         Args:
-            ohlcv: DataFrame with columns [timestamp, open, high, low, close, volume]
+            ohlcv: DataFrame with columns [timestamp, open, high, low, close, volume],
+                or an OHLCVFrame (accepted as-is; no DataFrame is built for it)
             events: Optional list of pre-detected events
 
         Returns:
@@ -23,16 +23,23 @@ Example:
 
 from __future__ import annotations
 
+from collections import deque
+
 import numpy as np
 import structlog
 
 from src.models.ohlcv import OHLCVBar
 from src.models.pivot import Pivot, PivotType
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
 
 logger = structlog.get_logger(__name__)
 
+# Default retention for StreamingPivotDetector: at most one HIGH and one LOW
+# per bar over the 200-bar detection window
+STREAMING_MAX_PIVOTS = 400
+
 
-def detect_pivots(bars: list[OHLCVBar], lookback: int = 5) -> list[Pivot]:
+def detect_pivots(bars: list[OHLCVBar] | OHLCVFrame, lookback: int = 5) -> list[Pivot]:
     """
     Detect swing highs and swing lows (pivot points) in price action.
 
@@ -43,8 +50,10 @@ def detect_pivots(bars: list[OHLCVBar], lookback: int = 5) -> list[Pivot]:
 
     Algorithm:
         1. Validate inputs (bars not empty, sufficient data, valid lookback)
-        2. Extract highs and lows into NumPy arrays for vectorized operations
-        3. For each candidate bar from index lookback to len(bars)-lookback-1:
+        2. Extract highs and lows into NumPy arrays (taken directly from an
+           OHLCVFrame when one is passed)
+        3. Compute rolling max/min of every `lookback`-bar window in one pass,
+           then for each candidate bar from index lookback to len(bars)-lookback-1:
            - Check if bar.high > all highs in [i-lookback:i] and [i+1:i+lookback+1]
            - Check if bar.low < all lows in [i-lookback:i] and [i+1:i+lookback+1]
            - Create Pivot object if conditions met
@@ -58,10 +67,12 @@ def detect_pivots(bars: list[OHLCVBar], lookback: int = 5) -> list[Pivot]:
 
     Performance:
         Optimized with NumPy vectorization to process 1000 bars in <50ms.
-        Uses pre-extracted arrays and efficient array slicing.
+        Window extrema are computed with sliding_window_view, so candidate
+        selection is a single vectorized comparison.
 
     Args:
-        bars: Sequence of OHLCV bars to analyze (must have ≥ 2*lookback+1 bars)
+        bars: Sequence of OHLCV bars or an OHLCVFrame to analyze
+              (must have ≥ 2*lookback+1 bars)
         lookback: Number of bars on each side to compare (default 5, range 1-100)
                   Higher values find fewer, stronger pivots
 
@@ -89,7 +100,7 @@ def detect_pivots(bars: list[OHLCVBar], lookback: int = 5) -> list[Pivot]:
     start_time = time.perf_counter()
 
     # Input validation
-    if not bars:
+    if bars is None or len(bars) == 0:
         logger.warning("empty_bars_list", message="Cannot detect pivots on empty bar list")
         return []
 
@@ -108,56 +119,75 @@ def detect_pivots(bars: list[OHLCVBar], lookback: int = 5) -> list[Pivot]:
         )
         return []
 
-    # Extract symbol for logging
-    symbol = bars[0].symbol if bars else "UNKNOWN"
+    if isinstance(bars, OHLCVFrame):
+        frame = bars
+        symbol = frame.symbol
+        first_timestamp = frame.timestamp_at(0)
+        last_timestamp = frame.timestamp_at(len(frame) - 1)
+        # Columns are already float64 - no Decimal conversion needed
+        highs = frame.high
+        lows = frame.low
+        get_bar = frame.bar
+    else:
+        symbol = bars[0].symbol
+        first_timestamp = bars[0].timestamp
+        last_timestamp = bars[-1].timestamp
+        # Pre-extract highs and lows into NumPy arrays for vectorized operations
+        # Convert Decimal to float for NumPy performance
+        highs = np.array([float(bar.high) for bar in bars])
+        lows = np.array([float(bar.low) for bar in bars])
+        get_bar = bars.__getitem__
 
     logger.info(
         "pivot_detection_start",
         symbol=symbol,
         bar_count=len(bars),
         lookback=lookback,
-        first_timestamp=bars[0].timestamp.isoformat(),
-        last_timestamp=bars[-1].timestamp.isoformat(),
+        first_timestamp=first_timestamp.isoformat(),
+        last_timestamp=last_timestamp.isoformat(),
     )
 
-    # Pre-extract highs and lows into NumPy arrays for vectorized operations
-    # Convert Decimal to float for NumPy performance
-    highs = np.array([float(bar.high) for bar in bars])
-    lows = np.array([float(bar.low) for bar in bars])
+    n = len(highs)
 
-    pivots: list[Pivot] = []
+    # Rolling extrema of every `lookback`-bar window: window_max[j] = max(highs[j:j+lookback])
+    window_max = np.lib.stride_tricks.sliding_window_view(highs, lookback).max(axis=1)
+    window_min = np.lib.stride_tricks.sliding_window_view(lows, lookback).min(axis=1)
 
-    # Loop through candidate bars (skip first and last lookback bars)
-    for i in range(lookback, len(bars) - lookback):
-        current_high = highs[i]
-        current_low = lows[i]
+    # Candidate bars skip the first and last lookback bars.
+    # Window before i starts at i-lookback; window after i starts at i+1.
+    candidates = np.arange(lookback, n - lookback)
+    is_high = (highs[candidates] > window_max[candidates - lookback]) & (
+        highs[candidates] > window_max[candidates + 1]
+    )
+    is_low = (lows[candidates] < window_min[candidates - lookback]) & (
+        lows[candidates] < window_min[candidates + 1]
+    )
 
-        # Extract comparison windows
-        highs_before = highs[i - lookback : i]
-        highs_after = highs[i + 1 : i + lookback + 1]
-        lows_before = lows[i - lookback : i]
-        lows_after = lows[i + 1 : i + lookback + 1]
+    pivots: list[Pivot] = []
+
+    for i in candidates[is_high | is_low].tolist():
+        bar = get_bar(i)
 
         # Check for pivot high
-        if current_high > np.max(highs_before) and current_high > np.max(highs_after):
+        if is_high[i - lookback]:
             pivot = Pivot(
-                bar=bars[i],
-                price=bars[i].high,  # Use original Decimal, not float
+                bar=bar,
+                price=bar.high,  # Use original Decimal, not float
                 type=PivotType.HIGH,
                 strength=lookback,
-                timestamp=bars[i].timestamp,
+                timestamp=bar.timestamp,
                 index=i,
             )
             pivots.append(pivot)
 
         # Check for pivot low
-        if current_low < np.min(lows_before) and current_low < np.min(lows_after):
+        if is_low[i - lookback]:
             pivot = Pivot(
-                bar=bars[i],
-                price=bars[i].low,  # Use original Decimal, not float
+                bar=bar,
+                price=bar.low,  # Use original Decimal, not float
                 type=PivotType.LOW,
                 strength=lookback,
-                timestamp=bars[i].timestamp,
+                timestamp=bar.timestamp,
                 index=i,
             )
             pivots.append(pivot)
@@ -304,7 +334,7 @@ class PivotDetector:
 
     def detect_pivots(
         self,
-        bars: list[OHLCVBar],
+        bars: list[OHLCVBar] | OHLCVFrame,
     ) -> tuple[list[Pivot], list[Pivot]]:
         """
         Detect pivot highs and pivot lows in OHLCV bars.
@@ -313,7 +343,7 @@ class PivotDetector:
         and separates the results into highs and lows.
 
         Args:
-            bars: List of OHLCV bars to scan for pivots
+            bars: List of OHLCV bars (or an OHLCVFrame) to scan for pivots
 
         Returns:
             Tuple of (pivot_highs, pivot_lows)
@@ -334,3 +364,166 @@ class PivotDetector:
         pivot_lows = get_pivot_lows(all_pivots)
 
         return pivot_highs, pivot_lows
+
+
+class StreamingPivotDetector:
+    """
+    Incremental pivot detector fed one bar at a time.
+
+    Produces the same pivots as detect_pivots() over the bars seen so far,
+    but confirms each candidate as soon as its ``lookback`` right-hand bars
+    have arrived instead of rescanning the whole window on every bar.
+
+    Algorithm:
+        Two monotonic deques hold (index, value, tied) candidates for the
+        trailing 2*lookback+1 bars - strictly decreasing highs and strictly
+        increasing lows. When bar t arrives, the center bar c = t - lookback
+        is a pivot high iff it is the front of the highs deque (no greater
+        or equal high on its right) and no equal high within lookback bars
+        on its left displaced it when it was pushed (``tied``). Lows are
+        symmetric. Each bar is pushed and popped at most once per deque.
+
+    Performance:
+        O(1) amortized deque work per bar plus at most two Pivot objects,
+        O(lookback + max_pivots) memory - independent of the stream length.
+
+    Attributes:
+        lookback: Number of bars on each side compared (1-100)
+        bars_seen: Bars consumed since construction or reset(); pivot
+            indices are positions in this stream
+
+    Example:
+        >>> detector = StreamingPivotDetector(lookback=5)
+        >>> for bar in live_bars:
+        ...     for pivot in detector.update(bar):
+        ...         print(pivot.type, pivot.price, pivot.index)
+    """
+
+    def __init__(self, lookback: int = 5, max_pivots: int | None = STREAMING_MAX_PIVOTS) -> None:
+        """
+        Initialize an empty streaming detector.
+
+        Args:
+            lookback: Number of bars on each side to compare (1-100)
+            max_pivots: Keep only the most recent confirmed pivots (default
+                covers a 200-bar window; None = unbounded, for callers that
+                prune_before() themselves)
+
+        Raises:
+            ValueError: If lookback < 1 or lookback > 100
+        """
+        if lookback < 1:
+            raise ValueError(f"lookback must be >= 1, got {lookback}")
+        if lookback > 100:
+            raise ValueError(f"lookback must be <= 100, got {lookback}")
+
+        self.lookback = lookback
+        self._max_pivots = max_pivots
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all state and restart the bar index at 0."""
+        self.bars_seen = 0
+        self._bars: deque[OHLCVBar] = deque(maxlen=2 * self.lookback + 1)
+        self._highs: deque[tuple[int, float, bool]] = deque()
+        self._lows: deque[tuple[int, float, bool]] = deque()
+        self._pivots: deque[Pivot] = deque(maxlen=self._max_pivots)
+
+    @property
+    def pivots(self) -> list[Pivot]:
+        """Confirmed pivots in chronological order (HIGH before LOW per bar)."""
+        return list(self._pivots)
+
+    def update(self, bar: OHLCVBar) -> list[Pivot]:
+        """
+        Consume the next bar and return pivots it confirms.
+
+        Only the bar ``lookback`` positions back can be confirmed by a new
+        bar, so at most one HIGH and one LOW are returned.
+
+        Args:
+            bar: Next bar in chronological order
+
+        Returns:
+            Newly confirmed pivots (empty while unconfirmed)
+        """
+        lookback = self.lookback
+        index = self.bars_seen
+        high = float(bar.high)
+        low = float(bar.low)
+
+        # A popped equal value within lookback bars on the left rules the new
+        # bar out as a strict pivot, which the deque alone cannot remember
+        highs = self._highs
+        tied = False
+        while highs and highs[-1][1] <= high:
+            prior_index, prior_high, _ = highs.pop()
+            if prior_high == high and prior_index >= index - lookback:
+                tied = True
+        highs.append((index, high, tied))
+
+        lows = self._lows
+        tied = False
+        while lows and lows[-1][1] >= low:
+            prior_index, prior_low, _ = lows.pop()
+            if prior_low == low and prior_index >= index - lookback:
+                tied = True
+        lows.append((index, low, tied))
+
+        self._bars.append(bar)
+        self.bars_seen += 1
+
+        center = index - lookback
+        if center < lookback:
+            return []
+
+        # Expire candidates that fell out of [center - lookback, index]
+        oldest = center - lookback
+        while highs[0][0] < oldest:
+            highs.popleft()
+        while lows[0][0] < oldest:
+            lows.popleft()
+
+        confirmed: list[Pivot] = []
+        # Buffer is full (2*lookback+1 bars) here, so the center sits at lookback
+        center_bar = self._bars[lookback]
+
+        front_index, _, front_tied = highs[0]
+        if front_index == center and not front_tied:
+            confirmed.append(
+                Pivot(
+                    bar=center_bar,
+                    price=center_bar.high,
+                    type=PivotType.HIGH,
+                    strength=lookback,
+                    timestamp=center_bar.timestamp,
+                    index=center,
+                )
+            )
+
+        front_index, _, front_tied = lows[0]
+        if front_index == center and not front_tied:
+            confirmed.append(
+                Pivot(
+                    bar=center_bar,
+                    price=center_bar.low,
+                    type=PivotType.LOW,
+                    strength=lookback,
+                    timestamp=center_bar.timestamp,
+                    index=center,
+                )
+            )
+
+        self._pivots.extend(confirmed)
+        return confirmed
+
+    def prune_before(self, index: int) -> None:
+        """
+        Drop retained pivots whose index is below ``index``.
+
+        Args:
+            index: First stream index to keep
+        """
+        pivots = self._pivots
+        while pivots and pivots[0].index < index:
+            pivots.popleft()
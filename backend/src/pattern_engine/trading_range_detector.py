@@ -46,12 +46,16 @@ Example:
 from __future__ import annotations
 
 import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
+import numpy as np
 import structlog
 
 from src.models.ohlcv import OHLCVBar
+from src.models.pivot import Pivot
 from src.models.trading_range import RangeStatus, TradingRange
 from src.models.volume_analysis import VolumeAnalysis
 from src.models.zone import ZoneStrength, ZoneType
@@ -60,13 +64,92 @@ from src.pattern_engine.level_calculator import (
     calculate_ice_level,
     calculate_jump_level,
 )
-from src.pattern_engine.pivot_detector import detect_pivots, get_pivot_highs, get_pivot_lows
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
+from src.pattern_engine.pivot_detector import (
+    StreamingPivotDetector,
+    detect_pivots,
+    get_pivot_highs,
+    get_pivot_lows,
+)
 from src.pattern_engine.range_cluster import cluster_pivots, form_trading_range
 from src.pattern_engine.range_quality import calculate_range_quality
 from src.pattern_engine.zone_mapper import map_supply_demand_zones
 
 logger = structlog.get_logger(__name__)
 
+# Support and resistance cluster pivot indices identifying one candidate range
+_RangeKey = tuple[tuple[int, ...], tuple[int, ...]]
+
+# Candidate outcome: (window base index it was built at, built range), or None
+# when the pair was rejected
+_RangeMemo = dict[_RangeKey, tuple[int, TradingRange] | None]
+
+# Volume/spread ratios need 20 prior bars, so analysis of the first bars of a
+# window depends on where the window starts
+_VOLUME_WARMUP_BARS = 20
+
+
+@dataclass
+class _IncrementalRangeState:
+    """
+    Per symbol/timeframe state for incremental range detection.
+
+    Indices in ``range_memo`` keys and ``broken_range`` are stream indices
+    (position since the state was created); ``base`` is the stream index of
+    ``bars[0]``, so window index = stream index - base.
+
+    Attributes:
+        pivot_detector: Streaming pivots over ``bars`` (confirmed as bars arrive)
+        bars: Bars of the current window (evicted from the head as it slides)
+        base: Stream index of bars[0]
+        ranges: Result of the last detection, indexed relative to ``ranges_base``
+        ranges_base: Value of ``base`` when ``ranges`` were built
+        range_memo: Candidate range outcomes keyed by cluster pivot stream indices
+        broken_range: Stream (start_index, end_index) of the last range a bar
+            closed outside of, so one breakout triggers only one rebuild
+        needs_build: True until the pipeline has run over the current state
+    """
+
+    pivot_detector: StreamingPivotDetector
+    bars: list[OHLCVBar] = field(default_factory=list)
+    base: int = 0
+    ranges: list[TradingRange] = field(default_factory=list)
+    ranges_base: int = 0
+    range_memo: _RangeMemo = field(default_factory=dict)
+    broken_range: tuple[int, int] | None = None
+    needs_build: bool = True
+
+
+def _bar_timestamp(bar: OHLCVBar) -> datetime:
+    """Sort key for bisecting bars by timestamp."""
+    return bar.timestamp
+
+
+def _reindex_range(trading_range: TradingRange, shift: int) -> TradingRange:
+    """
+    Copy a range, moving its bar indices ``shift`` bars towards the window head.
+
+    Zone formation indices are relative to the range start and stay as-is.
+
+    Args:
+        trading_range: Range to copy (left unchanged)
+        shift: Bars evicted from the window head since the range was built
+
+    Returns:
+        TradingRange: Deep copy indexed against the current window
+    """
+    shifted = trading_range.model_copy(deep=True)
+    if shift:
+        shifted.start_index -= shift
+        shifted.end_index -= shift
+        for pivot in (*shifted.support_cluster.pivots, *shifted.resistance_cluster.pivots):
+            pivot.index -= shift
+        for level in (shifted.creek, shifted.ice):
+            if level is not None:
+                for touch in level.touch_details:
+                    touch.index -= shift
+    return shifted
+
 
 class TradingRangeDetector:
     """
@@ -80,6 +163,29 @@ class TradingRangeDetector:
         pivot_tolerance_pct: Clustering tolerance 2% (default Decimal("0.02"))
         min_quality_threshold: Minimum quality score 70 (default 70)
         cache_enabled: Enable range caching (default True)
+        incremental: Keep per-symbol state and update it on appended bars
+            (default False)
+
+    Incremental Mode:
+        Realtime callers pass the same window again with new bars appended
+        and, once it is full, the oldest bars dropped. The exact-match cache
+        misses on every new bar, so with ``incremental=True`` the detector
+        instead keeps, per symbol and timeframe, the current window, a
+        streaming pivot detector and the outcome of every candidate
+        support/resistance pair. The new window is matched to the cached
+        one on their overlapping bars: evicted head bars (and the pivots and
+        candidates that used them) are dropped, appended bars are pushed
+        through the streaming pivots. If nothing changed the previous ranges
+        are returned, otherwise only pairs whose clusters changed are
+        re-scored, re-levelled and re-zoned. Results equal a full
+        detect_ranges() over the same bars, and each call returns its own
+        copies of the ranges.
+
+        The state is rebuilt from scratch when the window does not overlap
+        the cached one (first call, gap, rewritten history) and when a bar
+        closes above Ice or below Creek of the most recent range
+        (breakout/invalidation). volume_analysis entries past the first 20
+        bars of the window are assumed unchanged between calls.
 
     Example:
         >>> detector = TradingRangeDetector(
@@ -98,6 +204,7 @@ class TradingRangeDetector:
         pivot_tolerance_pct: Decimal = Decimal("0.02"),
         min_quality_threshold: int = 70,
         cache_enabled: bool = True,
+        incremental: bool = False,
     ):
         """
         Initialize TradingRangeDetector with configuration.
@@ -107,27 +214,34 @@ class TradingRangeDetector:
             pivot_tolerance_pct: Price clustering tolerance (default 0.02 = 2%)
             min_quality_threshold: Minimum quality score (0-100, default 70)
             cache_enabled: Enable result caching (default True)
+            incremental: Update per-symbol state on appended bars instead of
+                re-running the full pipeline (default False)
         """
         self.lookback = lookback
         self.pivot_tolerance_pct = pivot_tolerance_pct
         self.min_quality_threshold = min_quality_threshold
         self.cache_enabled = cache_enabled
+        self.incremental = incremental
 
         # Cache storage
         self._range_cache: dict[str, list[TradingRange]] = {}
         self._cache_hits = 0
         self._cache_misses = 0
 
+        # Incremental state keyed by "{symbol}:{timeframe}"
+        self._incremental_state: dict[str, _IncrementalRangeState] = {}
+
         logger.info(
             "trading_range_detector_initialized",
             lookback=lookback,
             pivot_tolerance_pct=str(pivot_tolerance_pct),
             min_quality_threshold=min_quality_threshold,
             cache_enabled=cache_enabled,
+            incremental=incremental,
         )
 
     def detect_ranges(
-        self, bars: list[OHLCVBar], volume_analysis: list[VolumeAnalysis]
+        self, bars: list[OHLCVBar] | OHLCVFrame, volume_analysis: list[VolumeAnalysis]
     ) -> list[TradingRange]:
         """
         Detect trading ranges with complete levels and zones.
@@ -148,7 +262,8 @@ class TradingRangeDetector:
             9. Cache results
 
         Args:
-            bars: OHLCV bars to analyze (500-1000 typical, minimum 20)
+            bars: OHLCV bars to analyze (500-1000 typical, minimum 20), or an
+                  OHLCVFrame (pivot detection and ordering checks use its columns)
             volume_analysis: Volume analysis results from Epic 2 (same length as bars)
 
         Returns:
@@ -172,7 +287,7 @@ class TradingRangeDetector:
         start_time = time.perf_counter()
 
         # Input validation
-        if not bars:
+        if bars is None or len(bars) == 0:
             logger.warning("empty_bars_list", message="Cannot detect ranges on empty bar list")
             return []
 
@@ -194,15 +309,32 @@ class TradingRangeDetector:
             )
             raise ValueError("Bars and volume_analysis must have same length")
 
+        if self.incremental:
+            return self._detect_ranges_incremental(bars, volume_analysis, start_time)
+
         # Validate sequential timestamps
-        for i in range(1, len(bars)):
-            if bars[i].timestamp <= bars[i - 1].timestamp:
+        frame: OHLCVFrame | None = None
+        if isinstance(bars, OHLCVFrame):
+            frame = bars
+            non_sequential = np.flatnonzero(np.diff(frame.timestamp) <= 0)
+            if len(non_sequential) > 0:
                 logger.error(
                     "non_sequential_bars",
-                    index=i,
+                    index=int(non_sequential[0]) + 1,
                     message="Bars must be in chronological order",
                 )
                 raise ValueError("Bars must have sequential timestamps")
+            # Downstream stages (clustering, levels, zones) operate on bar objects
+            bars = frame.to_bars()
+        else:
+            for i in range(1, len(bars)):
+                if bars[i].timestamp <= bars[i - 1].timestamp:
+                    logger.error(
+                        "non_sequential_bars",
+                        index=i,
+                        message="Bars must be in chronological order",
+                    )
+                    raise ValueError("Bars must have sequential timestamps")
 
         symbol = bars[0].symbol
         timeframe = bars[0].timeframe
@@ -232,7 +364,7 @@ class TradingRangeDetector:
 
         # Step 1: Pivot Detection (~50ms)
         pivot_start = time.perf_counter()
-        pivots = detect_pivots(bars, lookback=self.lookback)
+        pivots = detect_pivots(frame if frame is not None else bars, lookback=self.lookback)
         pivot_duration = (time.perf_counter() - pivot_start) * 1000
 
         if len(pivots) < 4:
@@ -255,12 +387,305 @@ class TradingRangeDetector:
             duration_ms=f"{pivot_duration:.2f}",
         )
 
+        non_overlapping_ranges, stage_durations = self._build_ranges(
+            bars, volume_analysis, pivot_highs, pivot_lows
+        )
+
+        # Cache results
+        if self.cache_enabled:
+            self._range_cache[cache_key] = non_overlapping_ranges
+            logger.info(
+                "ranges_cached",
+                cache_key=cache_key,
+                range_count=len(non_overlapping_ranges),
+            )
+
+        self._log_detection_summary(
+            symbol,
+            timeframe,
+            non_overlapping_ranges,
+            start_time,
+            {"pivot_detection_ms": pivot_duration, **stage_durations},
+        )
+
+        return non_overlapping_ranges
+
+    def _detect_ranges_incremental(
+        self,
+        bars: list[OHLCVBar] | OHLCVFrame,
+        volume_analysis: list[VolumeAnalysis],
+        start_time: float,
+    ) -> list[TradingRange]:
+        """
+        Detect ranges by updating per-symbol state with the changed bars.
+
+        Args:
+            bars: Bar window (the previously analyzed window, minus evicted
+                head bars, plus appended bars)
+            volume_analysis: Volume analysis matching bars
+            start_time: perf_counter() value at detection start
+
+        Returns:
+            List[TradingRange]: Ranges equal to a full detection over bars
+
+        Raises:
+            ValueError: If bars are not sequential
+        """
+        if isinstance(bars, OHLCVFrame):
+            symbol, timeframe = bars.symbol, bars.timeframe
+            get_bar = bars.bar
+        else:
+            symbol, timeframe = bars[0].symbol, bars[0].timeframe
+            get_bar = bars.__getitem__
+
+        state_key = f"{symbol}:{timeframe}"
+        state = self._incremental_state.get(state_key)
+
+        # Match the new window to the cached one on their overlapping bars
+        evicted = overlap = 0
+        continues = False
+        if state is not None and state.bars:
+            first_timestamp = get_bar(0).timestamp
+            evicted = bisect_left(state.bars, first_timestamp, key=_bar_timestamp)
+            overlap = len(state.bars) - evicted
+            continues = (
+                0 < overlap <= len(bars)
+                and state.bars[evicted].timestamp == first_timestamp
+                and get_bar(overlap - 1).timestamp == state.bars[-1].timestamp
+            )
+
+        if continues and evicted == 0 and overlap == len(bars) and not state.needs_build:
+            self._cache_hits += 1
+            return self._copy_ranges(state)
+
+        self._cache_misses += 1
+
+        # Only appended bars need converting and ordering checks
+        first_new = overlap if continues else 0
+        new_bars = [get_bar(i) for i in range(first_new, len(bars))]
+        previous = state.bars[-1] if continues else None
+        for offset, bar in enumerate(new_bars):
+            if previous is not None and bar.timestamp <= previous.timestamp:
+                logger.error(
+                    "non_sequential_bars",
+                    index=first_new + offset,
+                    message="Bars must be in chronological order",
+                )
+                raise ValueError("Bars must have sequential timestamps")
+            previous = bar
+
+        changed = False
+        if not continues:
+            logger.info(
+                "incremental_range_state_rebuild",
+                symbol=symbol,
+                timeframe=timeframe,
+                reason="new_series" if state is None else "discontinuous_series",
+                bar_count=len(bars),
+            )
+            state = _IncrementalRangeState(
+                # Pivots are pruned to the window in _evict_head_bars
+                pivot_detector=StreamingPivotDetector(lookback=self.lookback, max_pivots=None)
+            )
+            self._incremental_state[state_key] = state
+        elif evicted:
+            changed = self._evict_head_bars(state, evicted)
+
+        # Step 1: Streaming pivots - only the appended bars are processed
+        pivot_start = time.perf_counter()
+        new_pivot_count = 0
+        for bar in new_bars:
+            new_pivot_count += len(state.pivot_detector.update(bar))
+        state.bars.extend(new_bars)
+        pivot_duration = (time.perf_counter() - pivot_start) * 1000
+
+        broken_range = self._find_breakout(
+            state.ranges, new_bars, state.broken_range, index_offset=state.ranges_base
+        )
+        if broken_range is not None:
+            logger.info(
+                "range_breakout_rebuild",
+                symbol=symbol,
+                timeframe=timeframe,
+                range_start_index=broken_range[0] - state.base,
+                range_end_index=broken_range[1] - state.base,
+            )
+            state.broken_range = broken_range
+            state.range_memo.clear()
+            state.needs_build = True
+
+        if not state.needs_build and not changed and new_pivot_count == 0:
+            logger.debug(
+                "incremental_ranges_unchanged",
+                symbol=symbol,
+                timeframe=timeframe,
+                appended_bars=len(new_bars),
+                evicted_bars=evicted,
+            )
+            return self._copy_ranges(state)
+
+        # Streaming pivots carry stream indices; the pipeline indexes the window
+        base = state.base
+        pivots = [
+            pivot.model_copy(update={"index": pivot.index - base}) if base else pivot
+            for pivot in state.pivot_detector.pivots
+        ]
+        stage_durations: dict[str, float] = {}
+        if len(pivots) < 4:
+            logger.warning(
+                "insufficient_pivots",
+                pivot_count=len(pivots),
+                required=4,
+                message="Need at least 4 pivots (2 highs, 2 lows) for range detection",
+            )
+            ranges: list[TradingRange] = []
+        else:
+            ranges, stage_durations = self._build_ranges(
+                state.bars,
+                volume_analysis,
+                get_pivot_highs(pivots),
+                get_pivot_lows(pivots),
+                state.range_memo,
+                index_offset=base,
+            )
+
+        state.ranges = ranges
+        state.ranges_base = base
+        state.needs_build = False
+
+        self._log_detection_summary(
+            symbol,
+            timeframe,
+            ranges,
+            start_time,
+            {"pivot_detection_ms": pivot_duration, **stage_durations},
+            incremental=True,
+            appended_bars=len(new_bars),
+            evicted_bars=evicted,
+            new_pivots=new_pivot_count,
+        )
+
+        return self._copy_ranges(state)
+
+    def _evict_head_bars(self, state: _IncrementalRangeState, count: int) -> bool:
+        """
+        Drop bars that slid out of the window, with the state that used them.
+
+        Pivots within ``lookback`` bars of the new head are dropped (a full
+        run cannot confirm them), as are candidates that start inside the
+        volume warm-up of the new window, whose volume analysis now differs.
+
+        Args:
+            state: Incremental state to trim
+            count: Number of bars evicted from the head
+
+        Returns:
+            bool: True if any pivot or candidate outcome was dropped
+        """
+        del state.bars[:count]
+        state.base += count
+
+        pivot_count = len(state.pivot_detector.pivots)
+        state.pivot_detector.prune_before(state.base + self.lookback)
+        pruned = len(state.pivot_detector.pivots) < pivot_count
+
+        warm_start = state.base + _VOLUME_WARMUP_BARS
+        stale_keys = [key for key in state.range_memo if min(*key[0], *key[1]) < warm_start]
+        for key in stale_keys:
+            del state.range_memo[key]
+
+        return pruned or bool(stale_keys)
+
+    @staticmethod
+    def _copy_ranges(state: _IncrementalRangeState) -> list[TradingRange]:
+        """
+        Copy the state's ranges, indexed against the current window.
+
+        Args:
+            state: Incremental state holding the last detection
+
+        Returns:
+            List[TradingRange]: Copies the caller may mutate freely
+        """
+        shift = state.base - state.ranges_base
+        return [_reindex_range(trading_range, shift) for trading_range in state.ranges]
+
+    @staticmethod
+    def _find_breakout(
+        ranges: list[TradingRange],
+        new_bars: list[OHLCVBar],
+        broken_range: tuple[int, int] | None,
+        index_offset: int = 0,
+    ) -> tuple[int, int] | None:
+        """
+        Check whether appended bars broke out of the most recent range.
+
+        A close above Ice (breakout) or below Creek (breakdown/invalidation)
+        ends the range's current structure. Each range triggers at most once.
+
+        Args:
+            ranges: Ranges from the previous detection
+            new_bars: Appended bars
+            broken_range: Range that already triggered a rebuild
+            index_offset: Added to range indices to form the returned key
+
+        Returns:
+            (start_index, end_index) of the broken range, or None
+        """
+        current = get_most_recent_range(ranges)
+        if current is None or current.creek is None or current.ice is None:
+            return None
+
+        range_key = (current.start_index + index_offset, current.end_index + index_offset)
+        if range_key == broken_range:
+            return None
+
+        for bar in new_bars:
+            if bar.close > current.ice.price or bar.close < current.creek.price:
+                return range_key
+        return None
+
+    def _build_ranges(
+        self,
+        bars: list[OHLCVBar],
+        volume_analysis: list[VolumeAnalysis],
+        pivot_highs: list[Pivot],
+        pivot_lows: list[Pivot],
+        range_memo: _RangeMemo | None = None,
+        index_offset: int = 0,
+    ) -> tuple[list[TradingRange], dict[str, float]]:
+        """
+        Run clustering through status assignment for a set of pivots.
+
+        Each support/resistance cluster pair is keyed by its pivot stream
+        indices (window index + ``index_offset``). Pairs already present in
+        ``range_memo`` reuse the stored outcome (a fully built range, or
+        None if it was rejected) instead of re-running formation, quality
+        scoring, levels and zones - those stages only read bars inside the
+        range, so the outcome of an unchanged pair cannot change. Reused
+        ranges are re-indexed if the window slid since they were built, and
+        the returned ranges are copies, so the memo is never mutated through
+        them. Stale keys are pruned on return.
+
+        Args:
+            bars: OHLCV bars being analyzed
+            volume_analysis: Volume analysis matching bars
+            pivot_highs: Pivot highs (resistance candidates)
+            pivot_lows: Pivot lows (support candidates)
+            range_memo: Pair outcomes from earlier runs (updated in place;
+                None for a one-off full build)
+            index_offset: Stream index of bars[0]
+
+        Returns:
+            Tuple of (non-overlapping ranges, stage durations in ms)
+        """
         # Step 2: Clustering & Formation (~30ms)
         cluster_start = time.perf_counter()
         resistance_clusters = cluster_pivots(pivot_highs, tolerance_pct=self.pivot_tolerance_pct)
         support_clusters = cluster_pivots(pivot_lows, tolerance_pct=self.pivot_tolerance_pct)
 
-        candidate_ranges = []
+        range_keys: list[_RangeKey] = []
+        candidates: list[tuple[_RangeKey, TradingRange]] = []
         for support_cluster in support_clusters:
             for resistance_cluster in resistance_clusters:
                 # Basic validation: resistance > support, min 3% width, min 10 bars
@@ -271,18 +696,27 @@ class TradingRangeDetector:
 
                     if range_width_pct >= Decimal("0.03"):
                         # Calculate duration from pivot indices
-                        support_indices = [p.index for p in support_cluster.pivots]
-                        resistance_indices = [p.index for p in resistance_cluster.pivots]
+                        support_indices = tuple(p.index for p in support_cluster.pivots)
+                        resistance_indices = tuple(p.index for p in resistance_cluster.pivots)
                         min_index = min(min(support_indices), min(resistance_indices))
                         max_index = max(max(support_indices), max(resistance_indices))
                         duration = max_index - min_index + 1
 
                         if duration >= 10:
+                            range_key = (
+                                tuple(i + index_offset for i in support_indices),
+                                tuple(i + index_offset for i in resistance_indices),
+                            )
+                            range_keys.append(range_key)
+                            if range_memo is not None:
+                                if range_key in range_memo:
+                                    continue
+                                range_memo[range_key] = None
                             try:
                                 trading_range = form_trading_range(
                                     support_cluster, resistance_cluster, bars
                                 )
-                                candidate_ranges.append(trading_range)
+                                candidates.append((range_key, trading_range))
                             except Exception as e:
                                 logger.warning(
                                     "range_formation_failed",
@@ -297,7 +731,8 @@ class TradingRangeDetector:
             "clustering_complete",
             resistance_clusters=len(resistance_clusters),
             support_clusters=len(support_clusters),
-            candidate_ranges=len(candidate_ranges),
+            candidate_ranges=len(candidates),
+            reused_ranges=len(range_keys) - len(candidates),
             duration_ms=f"{cluster_duration:.2f}",
         )
 
@@ -306,13 +741,13 @@ class TradingRangeDetector:
         quality_ranges = []
         rejected_count = 0
 
-        for candidate_range in candidate_ranges:
+        for range_key, candidate_range in candidates:
             try:
                 quality_score = calculate_range_quality(candidate_range, bars, volume_analysis)
                 candidate_range.quality_score = quality_score
 
                 if quality_score >= self.min_quality_threshold:
-                    quality_ranges.append(candidate_range)
+                    quality_ranges.append((range_key, candidate_range))
                 else:
                     rejected_count += 1
             except Exception as e:
@@ -337,7 +772,7 @@ class TradingRangeDetector:
         level_start = time.perf_counter()
         ranges_with_levels = []
 
-        for trading_range in quality_ranges:
+        for range_key, trading_range in quality_ranges:
             try:
                 # Calculate levels
                 creek = calculate_creek_level(trading_range, bars, volume_analysis)
@@ -388,6 +823,8 @@ class TradingRangeDetector:
                 trading_range.midpoint = calculated_midpoint
 
                 ranges_with_levels.append(trading_range)
+                if range_memo is not None:
+                    range_memo[range_key] = (index_offset, trading_range)
 
                 logger.debug(
                     "levels_calculated",
@@ -450,16 +887,35 @@ class TradingRangeDetector:
             duration_ms=f"{zone_duration:.2f}",
         )
 
+        # Reassemble in candidate order from copies of the memoized ranges,
+        # which overlap resolution and status assignment below mutate
+        built_ranges = ranges_with_levels
+        if range_memo is not None:
+            seen_keys = set(range_keys)
+            for stale_key in [key for key in range_memo if key not in seen_keys]:
+                del range_memo[stale_key]
+
+            built_ranges = []
+            for range_key in range_keys:
+                outcome = range_memo[range_key]
+                if outcome is None:
+                    continue
+                built_offset, trading_range = outcome
+                if built_offset != index_offset:
+                    trading_range = _reindex_range(trading_range, index_offset - built_offset)
+                    range_memo[range_key] = (index_offset, trading_range)
+                built_ranges.append(trading_range.model_copy(deep=True))
+
         # Step 6: Overlap Resolution (~10ms)
         overlap_start = time.perf_counter()
-        non_overlapping_ranges = self._resolve_overlapping_ranges(ranges_with_levels)
+        non_overlapping_ranges = self._resolve_overlapping_ranges(built_ranges)
         overlap_duration = (time.perf_counter() - overlap_start) * 1000
 
         logger.info(
             "overlap_resolution_complete",
-            input_ranges=len(ranges_with_levels),
+            input_ranges=len(built_ranges),
             output_ranges=len(non_overlapping_ranges),
-            archived_ranges=len(ranges_with_levels) - len(non_overlapping_ranges),
+            archived_ranges=len(built_ranges) - len(non_overlapping_ranges),
             duration_ms=f"{overlap_duration:.2f}",
         )
 
@@ -486,47 +942,55 @@ class TradingRangeDetector:
             duration_ms=f"{status_duration:.2f}",
         )
 
-        # Cache results
-        if self.cache_enabled:
-            self._range_cache[cache_key] = non_overlapping_ranges
-            logger.info(
-                "ranges_cached",
-                cache_key=cache_key,
-                range_count=len(non_overlapping_ranges),
-            )
+        return non_overlapping_ranges, {
+            "clustering_ms": cluster_duration,
+            "quality_scoring_ms": quality_duration,
+            "level_calculation_ms": level_duration,
+            "zone_mapping_ms": zone_duration,
+            "overlap_resolution_ms": overlap_duration,
+            "status_assignment_ms": status_duration,
+        }
 
-        # Final summary
+    def _log_detection_summary(
+        self,
+        symbol: str,
+        timeframe: str,
+        ranges: list[TradingRange],
+        start_time: float,
+        stage_durations: dict[str, float],
+        **extra: object,
+    ) -> None:
+        """
+        Log the final range detection summary with per-stage timings.
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Bar timeframe
+            ranges: Detected ranges
+            start_time: perf_counter() value at detection start
+            stage_durations: Stage name → duration in ms
+            **extra: Additional fields for the log event
+        """
         total_duration = (time.perf_counter() - start_time) * 1000
-        active_ranges = [r for r in non_overlapping_ranges if r.is_active]
-        forming_ranges = [r for r in non_overlapping_ranges if r.status == RangeStatus.FORMING]
-        avg_quality = (
-            sum(r.quality_score for r in non_overlapping_ranges) / len(non_overlapping_ranges)
-            if non_overlapping_ranges
-            else 0
-        )
+        active_ranges = [r for r in ranges if r.is_active]
+        forming_ranges = [r for r in ranges if r.status == RangeStatus.FORMING]
+        avg_quality = sum(r.quality_score for r in ranges) / len(ranges) if ranges else 0
 
         logger.info(
             "range_detection_complete",
             symbol=symbol,
             timeframe=timeframe,
-            total_ranges=len(non_overlapping_ranges),
+            total_ranges=len(ranges),
             active_ranges=len(active_ranges),
             forming_ranges=len(forming_ranges),
             avg_quality=f"{avg_quality:.1f}",
             total_duration_ms=f"{total_duration:.2f}",
             performance_breakdown={
-                "pivot_detection_ms": f"{pivot_duration:.2f}",
-                "clustering_ms": f"{cluster_duration:.2f}",
-                "quality_scoring_ms": f"{quality_duration:.2f}",
-                "level_calculation_ms": f"{level_duration:.2f}",
-                "zone_mapping_ms": f"{zone_duration:.2f}",
-                "overlap_resolution_ms": f"{overlap_duration:.2f}",
-                "status_assignment_ms": f"{status_duration:.2f}",
+                name: f"{duration:.2f}" for name, duration in stage_durations.items()
             },
+            **extra,
         )
 
-        return non_overlapping_ranges
-
     def _create_cache_key(self, bars: list[OHLCVBar]) -> str:
         """
         Create cache key from bar sequence.
@@ -640,13 +1104,14 @@ class TradingRangeDetector:
 
     def clear_cache(self) -> None:
         """
-        Clear all cached ranges.
+        Clear all cached ranges and incremental state.
 
         Example:
             >>> detector.clear_cache()
             >>> # All cached results removed
         """
         self._range_cache.clear()
+        self._incremental_state.clear()
         logger.info(
             "cache_cleared",
             cache_hits=self._cache_hits,
@@ -657,7 +1122,7 @@ class TradingRangeDetector:
 
     def invalidate_symbol(self, symbol: str) -> None:
         """
-        Clear cached ranges for specific symbol.
+        Clear cached ranges and incremental state for specific symbol.
 
         Args:
             symbol: Ticker symbol to invalidate
@@ -669,6 +1134,8 @@ class TradingRangeDetector:
         keys_to_remove = [key for key in self._range_cache.keys() if key.startswith(f"{symbol}:")]
         for key in keys_to_remove:
             del self._range_cache[key]
+        for key in [key for key in self._incremental_state if key.startswith(f"{symbol}:")]:
+            del self._incremental_state[key]
 
         logger.info(
             "symbol_cache_invalidated",
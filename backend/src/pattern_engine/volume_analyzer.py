@@ -13,10 +13,28 @@ import structlog
 from src.models.effort_result import EffortResult
 from src.models.ohlcv import OHLCVBar
 from src.models.volume_analysis import VolumeAnalysis
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
 
 logger = structlog.get_logger(__name__)
 
 
+def _symbol_of(bars: list[OHLCVBar] | OHLCVFrame) -> str:
+    """Get the symbol for logging from bars or a frame."""
+    return bars.symbol if isinstance(bars, OHLCVFrame) else bars[0].symbol
+
+
+def _timeframe_of(bars: list[OHLCVBar] | OHLCVFrame) -> str:
+    """Get the timeframe for logging from bars or a frame."""
+    return bars.timeframe if isinstance(bars, OHLCVFrame) else bars[0].timeframe
+
+
+def _timestamp_iso(bars: list[OHLCVBar] | OHLCVFrame, index: int) -> str:
+    """Get the ISO timestamp of a bar for logging from bars or a frame."""
+    if isinstance(bars, OHLCVFrame):
+        return bars.timestamp_at(index).isoformat()
+    return bars[index].timestamp.isoformat()
+
+
 def calculate_volume_ratio(bars: list[OHLCVBar], index: int) -> float | None:
     """
     Calculate volume ratio: current bar volume / 20-bar average volume.
@@ -96,7 +114,7 @@ def calculate_volume_ratio(bars: list[OHLCVBar], index: int) -> float | None:
     return volume_ratio
 
 
-def calculate_volume_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
+def calculate_volume_ratios_batch(bars: list[OHLCVBar] | OHLCVFrame) -> list[float | None]:
     """
     Calculate volume ratios for all bars in a sequence using vectorized operations.
 
@@ -107,7 +125,8 @@ def calculate_volume_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
     Performance: Processes 10,000 bars in <100ms using NumPy convolution.
 
     Args:
-        bars: List of OHLCVBar objects in chronological order
+        bars: List of OHLCVBar objects in chronological order, or an
+              OHLCVFrame (volume column is used directly, no extraction)
 
     Returns:
         List of volume ratios (float or None) for each bar.
@@ -120,7 +139,7 @@ def calculate_volume_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
         >>> ratios[24]  # Last bar's ratio
         2.0
     """
-    if not bars or len(bars) == 0:
+    if bars is None or len(bars) == 0:
         return []
 
     # Log debug info for batch processing (for first 25 bars or when explicitly enabled)
@@ -128,12 +147,15 @@ def calculate_volume_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
         logger.debug(
             "batch_volume_calculation_starting",
             num_bars=len(bars),
-            symbol=bars[0].symbol if bars else None,
-            timeframe=bars[0].timeframe if bars else None,
+            symbol=_symbol_of(bars),
+            timeframe=_timeframe_of(bars),
         )
 
     # Extract all volumes into NumPy array (single pass, vectorized)
-    volumes = np.array([bar.volume for bar in bars], dtype=np.float64)
+    if isinstance(bars, OHLCVFrame):
+        volumes = bars.volume
+    else:
+        volumes = np.array([bar.volume for bar in bars], dtype=np.float64)
 
     # Initialize result array with None for first 20 bars
     results: list[float | None] = [None] * len(bars)
@@ -167,10 +189,10 @@ def calculate_volume_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
                 if abnormal_count <= 3:
                     logger.warning(
                         "abnormal_volume_spike_in_batch",
-                        symbol=bars[i].symbol,
+                        symbol=_symbol_of(bars),
                         index=i,
                         volume_ratio=round(ratio, 4),
-                        timestamp=bars[i].timestamp.isoformat(),
+                        timestamp=_timestamp_iso(bars, i),
                     )
 
     # Log batch completion summary
@@ -273,7 +295,7 @@ def calculate_spread_ratio(bars: list[OHLCVBar], index: int) -> float | None:
     return spread_ratio
 
 
-def calculate_spread_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
+def calculate_spread_ratios_batch(bars: list[OHLCVBar] | OHLCVFrame) -> list[float | None]:
     """
     Calculate spread ratios for all bars in a sequence using vectorized operations.
 
@@ -284,7 +306,8 @@ def calculate_spread_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
     Performance: Processes 10,000 bars in <100ms using NumPy convolution.
 
     Args:
-        bars: List of OHLCVBar objects in chronological order
+        bars: List of OHLCVBar objects in chronological order, or an
+              OHLCVFrame (high/low columns are used directly)
 
     Returns:
         List of spread ratios (float or None) for each bar.
@@ -298,7 +321,7 @@ def calculate_spread_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
         >>> ratios[24]  # Last bar's ratio
         2.0
     """
-    if not bars or len(bars) == 0:
+    if bars is None or len(bars) == 0:
         return []
 
     # Log debug info for batch processing
@@ -306,13 +329,17 @@ def calculate_spread_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
         logger.debug(
             "batch_spread_calculation_starting",
             num_bars=len(bars),
-            symbol=bars[0].symbol if bars else None,
-            timeframe=bars[0].timeframe if bars else None,
+            symbol=_symbol_of(bars),
+            timeframe=_timeframe_of(bars),
         )
 
     # Extract all highs and lows into NumPy arrays (single pass, vectorized)
-    highs = np.array([float(bar.high) for bar in bars], dtype=np.float64)
-    lows = np.array([float(bar.low) for bar in bars], dtype=np.float64)
+    if isinstance(bars, OHLCVFrame):
+        highs = bars.high
+        lows = bars.low
+    else:
+        highs = np.array([float(bar.high) for bar in bars], dtype=np.float64)
+        lows = np.array([float(bar.low) for bar in bars], dtype=np.float64)
 
     # Calculate spreads vectorized: spreads = highs - lows
     spreads = np.subtract(highs, lows)
@@ -358,10 +385,10 @@ def calculate_spread_ratios_batch(bars: list[OHLCVBar]) -> list[float | None]:
                 if abnormal_count <= 3:
                     logger.warning(
                         "abnormal_spread_in_batch",
-                        symbol=bars[i].symbol,
+                        symbol=_symbol_of(bars),
                         index=i,
                         spread_ratio=round(ratio, 4),
-                        timestamp=bars[i].timestamp.isoformat(),
+                        timestamp=_timestamp_iso(bars, i),
                     )
 
     # Log batch completion summary
@@ -463,7 +490,7 @@ def calculate_close_position(bar: OHLCVBar) -> float:
     return close_position
 
 
-def calculate_close_positions_batch(bars: list[OHLCVBar]) -> list[float]:
+def calculate_close_positions_batch(bars: list[OHLCVBar] | OHLCVFrame) -> list[float]:
     """
     Calculate close positions for all bars in a sequence using vectorized operations.
 
@@ -474,7 +501,8 @@ def calculate_close_positions_batch(bars: list[OHLCVBar]) -> list[float]:
     Performance: Processes 10,000 bars in <5ms using NumPy vectorization.
 
     Args:
-        bars: List of OHLCVBar objects in chronological order
+        bars: List of OHLCVBar objects in chronological order, or an
+              OHLCVFrame (high/low/close columns are used directly)
 
     Returns:
         List of close positions (float) for each bar, all in range [0.0, 1.0].
@@ -489,7 +517,7 @@ def calculate_close_positions_batch(bars: list[OHLCVBar]) -> list[float]:
         >>> positions
         [0.5, 1.0]
     """
-    if not bars or len(bars) == 0:
+    if bars is None or len(bars) == 0:
         return []
 
     # Log debug info for batch processing
@@ -497,14 +525,19 @@ def calculate_close_positions_batch(bars: list[OHLCVBar]) -> list[float]:
         logger.debug(
             "batch_close_position_calculation_starting",
             num_bars=len(bars),
-            symbol=bars[0].symbol if bars else None,
-            timeframe=bars[0].timeframe if bars else None,
+            symbol=_symbol_of(bars),
+            timeframe=_timeframe_of(bars),
         )
 
     # Extract all highs, lows, and closes into NumPy arrays (vectorized)
-    highs = np.array([float(bar.high) for bar in bars], dtype=np.float64)
-    lows = np.array([float(bar.low) for bar in bars], dtype=np.float64)
-    closes = np.array([float(bar.close) for bar in bars], dtype=np.float64)
+    if isinstance(bars, OHLCVFrame):
+        highs = bars.high
+        lows = bars.low
+        closes = bars.close
+    else:
+        highs = np.array([float(bar.high) for bar in bars], dtype=np.float64)
+        lows = np.array([float(bar.low) for bar in bars], dtype=np.float64)
+        closes = np.array([float(bar.close) for bar in bars], dtype=np.float64)
 
     # Calculate spreads vectorized: spreads = highs - lows
     spreads = np.subtract(highs, lows)
@@ -739,7 +772,7 @@ class VolumeAnalyzer:
         """
         pass
 
-    def analyze(self, bars: list[OHLCVBar]) -> list[VolumeAnalysis]:
+    def analyze(self, bars: list[OHLCVBar] | OHLCVFrame) -> list[VolumeAnalysis]:
         """
         Analyze a sequence of OHLCV bars and produce complete volume analysis.
 
@@ -757,7 +790,8 @@ class VolumeAnalyzer:
         8. Log statistics and completion
 
         Args:
-            bars: List of OHLCV bars to analyze, in chronological order.
+            bars: List of OHLCV bars to analyze, in chronological order, or an
+                  OHLCVFrame built once per fetch (skips per-stage extraction).
                   Must contain at least 1 bar. Typically 252 bars (1 year daily)
                   or more for backtesting.
 
@@ -796,7 +830,7 @@ class VolumeAnalyzer:
             Decimal('1.2345')
         """
         # Validate input
-        if not bars or len(bars) == 0:
+        if bars is None or len(bars) == 0:
             logger.warning("empty_bars_list", message="Cannot analyze empty bar list")
             raise ValueError("Cannot analyze empty bar list")
 
@@ -806,11 +840,11 @@ class VolumeAnalyzer:
         # Log analysis start
         logger.info(
             "analysis_start",
-            symbol=bars[0].symbol,
-            timeframe=bars[0].timeframe,
+            symbol=_symbol_of(bars),
+            timeframe=_timeframe_of(bars),
             bar_count=len(bars),
-            start_timestamp=bars[0].timestamp.isoformat(),
-            end_timestamp=bars[-1].timestamp.isoformat(),
+            start_timestamp=_timestamp_iso(bars, 0),
+            end_timestamp=_timestamp_iso(bars, len(bars) - 1),
         )
 
         # ============================================================
@@ -828,8 +862,9 @@ class VolumeAnalyzer:
 
         # Step 4: Build VolumeAnalysis objects with effort_result classification
         results: list[VolumeAnalysis] = []
+        source_bars = bars.to_bars() if isinstance(bars, OHLCVFrame) else bars
 
-        for i, bar in enumerate(bars):
+        for i, bar in enumerate(source_bars):
             # Get calculated values for this bar
             volume_ratio_raw = volume_ratios[i]
             spread_ratio_raw = spread_ratios[i]
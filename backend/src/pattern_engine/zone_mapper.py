@@ -14,16 +14,21 @@ Key Functions:
     - calculate_zone_proximity: Determine if zone is near Creek or Ice
     - calculate_significance_score: 0-100 score based on strength + proximity + quality
     - check_zone_invalidation: Detect when zone is broken
+    - count_zone_touches_batch: Touch counts for many zones in one NumPy pass
+    - find_zone_invalidations: First invalidating bar for many zones in one pass
 
 Performance:
     - Single zone mapping (one range): <20ms
     - Batch zone mapping (10 ranges): <200ms
+    - Batch touch counting (hundreds of zones, 5k bars): a few ms
 """
 
+from collections.abc import Sequence
 from datetime import datetime
 from decimal import Decimal
 from uuid import uuid4
 
+import numpy as np
 import structlog
 
 from src.models.creek_level import CreekLevel
@@ -44,6 +49,9 @@ NARROW_SPREAD_THRESHOLD = Decimal("0.8")  # AC 2: Narrow spread requirement
 PROXIMITY_THRESHOLD_PCT = Decimal("0.02")  # AC 7: 2% proximity for significance
 INVALIDATION_VOLUME_THRESHOLD = Decimal("1.5")  # High volume for zone breaks
 
+# Upper bound on zone x bar cells evaluated per broadcast (bounds peak memory)
+_MAX_BROADCAST_CELLS = 4_000_000
+
 
 def detect_demand_zones(bars: list[OHLCVBar], volume_analysis: list[VolumeAnalysis]) -> list[Zone]:
     """
@@ -333,6 +341,113 @@ def count_zone_touches(
     return touch_count, last_touch_timestamp
 
 
+def _zone_start_indices(zones: Sequence[Zone], start_indices: Sequence[int] | None) -> np.ndarray:
+    """Per-zone first bar to evaluate (defaults to the bar after formation)."""
+    if start_indices is None:
+        return np.fromiter(
+            (zone.formation_bar_index + 1 for zone in zones), dtype=np.int64, count=len(zones)
+        )
+    if len(start_indices) != len(zones):
+        raise ValueError(
+            f"start_indices count {len(start_indices)} does not match zone count {len(zones)}"
+        )
+    return np.asarray(start_indices, dtype=np.int64)
+
+
+def _decimal_column(values: Sequence[Decimal]) -> np.ndarray:
+    """Convert Decimals to a float64 array (correctly rounded, order-preserving)."""
+    return np.fromiter((float(v) for v in values), dtype=np.float64, count=len(values))
+
+
+def _zone_chunk_size(bar_count: int) -> int:
+    """Zones per broadcast so each one stays under _MAX_BROADCAST_CELLS."""
+    return max(1, _MAX_BROADCAST_CELLS // max(bar_count, 1))
+
+
+def count_zone_touches_batch(
+    zones: Sequence[Zone],
+    bars: Sequence[OHLCVBar],
+    start_indices: Sequence[int] | None = None,
+) -> list[tuple[int, datetime | None]]:
+    """
+    Count touches for many zones at once.
+
+    Equivalent to calling count_zone_touches() for every zone, but evaluates
+    all zones against high/low arrays in one NumPy broadcast (chunked by
+    zone to bound memory) instead of a Python loop per zone and bar.
+
+    Float64 comparisons are exact except when a bar price and a zone bound
+    round to the same float; those cells are re-checked with Decimals, so
+    results are identical to the scalar implementation.
+
+    Args:
+        zones: Zones to check for touches
+        bars: List of OHLCV bars in chronological order
+        start_indices: Per-zone index to start counting from
+            (default: formation_bar_index + 1 for each zone)
+
+    Returns:
+        List[Tuple[int, Optional[datetime]]]: (touch_count, last_touch_timestamp)
+            per zone, in the same order as zones
+
+    Raises:
+        ValueError: If start_indices length doesn't match zones
+
+    Example:
+        >>> results = count_zone_touches_batch(all_zones, range_bars)
+        >>> for zone, (touch_count, last_touch) in zip(all_zones, results):
+        ...     zone.touch_count = touch_count
+    """
+    if not zones:
+        return []
+
+    starts = _zone_start_indices(zones, start_indices)
+    if not bars:
+        return [(0, None)] * len(zones)
+
+    bar_count = len(bars)
+    highs = _decimal_column([bar.high for bar in bars])
+    lows = _decimal_column([bar.low for bar in bars])
+    zone_highs = _decimal_column([zone.price_range.high for zone in zones])
+    zone_lows = _decimal_column([zone.price_range.low for zone in zones])
+    bar_indices = np.arange(bar_count)
+
+    results: list[tuple[int, datetime | None]] = []
+    chunk_size = _zone_chunk_size(bar_count)
+    for chunk_start in range(0, len(zones), chunk_size):
+        chunk = slice(chunk_start, chunk_start + chunk_size)
+        chunk_highs = zone_highs[chunk, None]
+        chunk_lows = zone_lows[chunk, None]
+        in_window = bar_indices >= starts[chunk, None]
+
+        # Overlap: bar.low <= zone.high AND bar.high >= zone.low
+        touched = (lows <= chunk_highs) & (highs >= chunk_lows) & in_window
+
+        # Float ties may hide a Decimal difference - resolve them exactly
+        ties = np.argwhere(((lows == chunk_highs) | (highs == chunk_lows)) & in_window)
+        for row, col in ties:
+            zone = zones[chunk_start + row]
+            bar = bars[col]
+            touched[row, col] = (
+                bar.low <= zone.price_range.high and bar.high >= zone.price_range.low
+            )
+
+        touch_counts = touched.sum(axis=1)
+        last_touch_indices = bar_count - 1 - np.argmax(touched[:, ::-1], axis=1)
+        for touch_count, last_index in zip(touch_counts, last_touch_indices, strict=True):
+            last_touch = bars[last_index].timestamp if touch_count else None
+            results.append((int(touch_count), last_touch))
+
+    logger.debug(
+        "zone_touches_counted",
+        zone_count=len(zones),
+        bar_count=bar_count,
+        total_touches=sum(count for count, _ in results),
+    )
+
+    return results
+
+
 def classify_zone_strength(touch_count: int) -> ZoneStrength:
     """
     Classify zone strength based on number of touches.
@@ -490,6 +605,17 @@ def calculate_significance_score(zone: Zone) -> int:
     return final_score
 
 
+def _breaks_zone(zone: Zone, bar: OHLCVBar) -> bool:
+    """Exact (Decimal) invalidation test for one zone and bar."""
+    if bar.volume_ratio < INVALIDATION_VOLUME_THRESHOLD:
+        return False
+    if zone.zone_type == ZoneType.DEMAND:
+        return bar.close < zone.price_range.low
+    if zone.zone_type == ZoneType.SUPPLY:
+        return bar.close > zone.price_range.high
+    return False
+
+
 def check_zone_invalidation(zone: Zone, bars: list[OHLCVBar], current_index: int) -> bool:
     """
     Check if zone has been invalidated (broken).
@@ -516,34 +642,123 @@ def check_zone_invalidation(zone: Zone, bars: list[OHLCVBar], current_index: int
         return False
 
     bar = bars[current_index]
+    if not _breaks_zone(zone, bar):
+        return False
 
     # Demand zone invalidation: close below zone low with high volume
     if zone.zone_type == ZoneType.DEMAND:
-        if bar.close < zone.price_range.low and bar.volume_ratio >= INVALIDATION_VOLUME_THRESHOLD:
-            logger.info(
-                "demand_zone_invalidated",
-                zone_id=str(zone.id),
-                bar_index=current_index,
-                bar_close=str(bar.close),
-                zone_low=str(zone.price_range.low),
-                volume_ratio=str(bar.volume_ratio),
-            )
-            return True
-
+        logger.info(
+            "demand_zone_invalidated",
+            zone_id=str(zone.id),
+            bar_index=current_index,
+            bar_close=str(bar.close),
+            zone_low=str(zone.price_range.low),
+            volume_ratio=str(bar.volume_ratio),
+        )
     # Supply zone invalidation: close above zone high with high volume
-    if zone.zone_type == ZoneType.SUPPLY:
-        if bar.close > zone.price_range.high and bar.volume_ratio >= INVALIDATION_VOLUME_THRESHOLD:
-            logger.info(
-                "supply_zone_invalidated",
-                zone_id=str(zone.id),
-                bar_index=current_index,
-                bar_close=str(bar.close),
-                zone_high=str(zone.price_range.high),
-                volume_ratio=str(bar.volume_ratio),
-            )
-            return True
+    else:
+        logger.info(
+            "supply_zone_invalidated",
+            zone_id=str(zone.id),
+            bar_index=current_index,
+            bar_close=str(bar.close),
+            zone_high=str(zone.price_range.high),
+            volume_ratio=str(bar.volume_ratio),
+        )
+    return True
 
-    return False
+
+def find_zone_invalidations(
+    zones: Sequence[Zone],
+    bars: Sequence[OHLCVBar],
+    start_indices: Sequence[int] | None = None,
+) -> list[int | None]:
+    """
+    Find the first bar that invalidates each zone.
+
+    Equivalent to scanning check_zone_invalidation() over every bar from
+    each zone's start index, but evaluates all zones against close and
+    volume-ratio arrays in one NumPy broadcast. Float ties against a zone
+    bound or the volume threshold are re-checked with Decimals, so results
+    match the scalar check exactly.
+
+    Args:
+        zones: Zones to check for invalidation
+        bars: List of OHLCV bars in chronological order
+        start_indices: Per-zone first bar index to check
+            (default: formation_bar_index + 1 for each zone)
+
+    Returns:
+        List[Optional[int]]: Index of the first invalidating bar per zone,
+            or None if the zone was never broken
+
+    Raises:
+        ValueError: If start_indices length doesn't match zones
+
+    Example:
+        >>> for zone, broken_at in zip(zones, find_zone_invalidations(zones, bars)):
+        ...     if broken_at is not None:
+        ...         zone.is_active = False
+        ...         zone.invalidation_timestamp = bars[broken_at].timestamp
+    """
+    if not zones:
+        return []
+
+    starts = _zone_start_indices(zones, start_indices)
+    if not bars:
+        return [None] * len(zones)
+
+    bar_count = len(bars)
+    closes = _decimal_column([bar.close for bar in bars])
+    volume_ratios = _decimal_column([bar.volume_ratio for bar in bars])
+    threshold = float(INVALIDATION_VOLUME_THRESHOLD)
+    high_volume = volume_ratios >= threshold
+    volume_ties = volume_ratios == threshold
+
+    is_demand = np.fromiter(
+        (zone.zone_type == ZoneType.DEMAND for zone in zones), dtype=bool, count=len(zones)
+    )
+    is_supply = np.fromiter(
+        (zone.zone_type == ZoneType.SUPPLY for zone in zones), dtype=bool, count=len(zones)
+    )
+    # Demand zones break below their low, supply zones above their high
+    bounds = np.where(
+        is_demand,
+        _decimal_column([zone.price_range.low for zone in zones]),
+        _decimal_column([zone.price_range.high for zone in zones]),
+    )
+    bar_indices = np.arange(bar_count)
+
+    results: list[int | None] = []
+    chunk_size = _zone_chunk_size(bar_count)
+    for chunk_start in range(0, len(zones), chunk_size):
+        chunk = slice(chunk_start, chunk_start + chunk_size)
+        chunk_bounds = bounds[chunk, None]
+        in_window = bar_indices >= starts[chunk, None]
+
+        broken = (
+            (is_demand[chunk, None] & (closes < chunk_bounds))
+            | (is_supply[chunk, None] & (closes > chunk_bounds))
+        ) & high_volume
+        broken &= in_window
+
+        # Float ties may hide a Decimal difference - resolve them exactly
+        ties = np.argwhere(((closes == chunk_bounds) | volume_ties) & in_window)
+        for row, col in ties:
+            broken[row, col] = _breaks_zone(zones[chunk_start + row], bars[col])
+
+        first_indices = np.argmax(broken, axis=1)
+        for row, first_index in enumerate(first_indices):
+            results.append(int(first_index) if broken[row, first_index] else None)
+
+    logger.debug(
+        "zone_invalidations_checked",
+        zone_count=len(zones),
+        bar_count=bar_count,
+        invalidated_zones=sum(index is not None for index in results),
+    )
+
+    return results
 
 
 def map_supply_demand_zones(
@@ -655,11 +870,11 @@ def map_supply_demand_zones(
         total_zones=len(all_zones),
     )
 
-    # Process each zone: count touches, classify strength, calculate proximity and significance
-    for zone in all_zones:
-        # Count touches (after formation bar)
-        start_touch_index = zone.formation_bar_index + 1
-        touch_count, last_touch = count_zone_touches(zone, range_bars, start_touch_index)
+    # Count touches (after formation bar) for all zones in one pass
+    touch_results = count_zone_touches_batch(all_zones, range_bars)
+
+    # Process each zone: classify strength, calculate proximity and significance
+    for zone, (touch_count, last_touch) in zip(all_zones, touch_results, strict=True):
         zone.touch_count = touch_count
         zone.last_touch_timestamp = last_touch
 
@@ -2,9 +2,10 @@
 
 Story 11.5: Advanced Charting Integration
 Handles database queries for OHLCV bars, patterns, trading ranges, and Wyckoff data.
+Payload assembly and caching live in src/services/chart_data_service.py.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 
 import structlog
@@ -18,7 +19,6 @@ from src.models.chart import (
     PRELIMINARY_EVENT_CONFIG,
     CauseBuildingData,
     ChartBar,
-    ChartDataResponse,
     LevelLine,
     PatternMarker,
     PhaseAnnotation,
@@ -28,7 +28,8 @@ from src.models.chart import (
 )
 from src.orm.models import Pattern as PatternORM
 from src.orm.models import TradingRange as TradingRangeORM
-from src.repositories.models import OHLCVBarModel as OHLCVBarORM
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
+from src.repositories.ohlcv_repository import OHLCVRepository
 from src.repositories.wyckoff_algorithms import (
     calculate_cause_building,
     match_wyckoff_schematic,
@@ -36,6 +37,35 @@ from src.repositories.wyckoff_algorithms import (
 
 logger = structlog.get_logger(__name__)
 
+# API timeframe -> database timeframe
+TIMEFRAME_MAP = {"1D": "1d", "1W": "1w", "1M": "1M", "1H": "1H", "4H": "4H"}
+
+
+def to_db_timeframe(timeframe: str) -> str:
+    """Map an API timeframe (1D, 1W, ...) to the stored timeframe."""
+    return TIMEFRAME_MAP.get(timeframe, "1d")
+
+
+def chart_bars_from_frame(frame: OHLCVFrame) -> list[ChartBar]:
+    """Convert a bar frame to Lightweight Charts bars (Unix seconds, floats).
+
+    Values come from typed arrays, so ChartBar validation is skipped.
+    """
+    return [
+        ChartBar.model_construct(
+            time=unix_seconds, open=open_, high=high, low=low, close=close, volume=int(volume)
+        )
+        for unix_seconds, open_, high, low, close, volume in zip(
+            (frame.timestamp // 1_000_000_000).tolist(),
+            frame.open.tolist(),
+            frame.high.tolist(),
+            frame.low.tolist(),
+            frame.close.tolist(),
+            frame.volume.tolist(),
+            strict=True,
+        )
+    ]
+
 
 class ChartRepository:
     """Repository for chart data operations."""
@@ -48,168 +78,32 @@ class ChartRepository:
         """
         self.session = session
 
-    async def get_chart_data(
+    async def get_bar_frame(
         self,
         symbol: str,
         timeframe: str,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        limit: int = 500,
-    ) -> ChartDataResponse:
-        """Fetch complete chart data for symbol and timeframe.
-
-        Args:
-            symbol: Ticker symbol
-            timeframe: Bar interval (1D, 1W, 1M)
-            start_date: Optional start date filter
-            end_date: Optional end date filter
-            limit: Maximum number of bars (default 500, max 2000)
-
-        Returns:
-            ChartDataResponse with all chart data
-
-        Raises:
-            ValueError: If no data found for symbol/timeframe
-        """
-        logger.info(
-            "Fetching chart data",
-            symbol=symbol,
-            timeframe=timeframe,
-            start_date=start_date,
-            end_date=end_date,
-            limit=limit,
-        )
-
-        # Default date range: last 90 days
-        if end_date is None:
-            end_date = datetime.utcnow()
-        if start_date is None:
-            start_date = end_date - timedelta(days=90)
-
-        # Fetch OHLCV bars
-        bars = await self._get_ohlcv_bars(symbol, timeframe, start_date, end_date, limit)
-
-        if not bars:
-            raise ValueError(f"No OHLCV data found for {symbol} {timeframe}")
-
-        # Get actual date range from bars
-        actual_start = min(bar.time for bar in bars)
-        actual_end = max(bar.time for bar in bars)
-        actual_start_dt = datetime.utcfromtimestamp(actual_start)
-        actual_end_dt = datetime.utcfromtimestamp(actual_end)
-
-        # Fetch patterns for this time range
-        patterns = await self._get_pattern_markers(
-            symbol, timeframe, actual_start_dt, actual_end_dt
-        )
-
-        # Fetch trading range levels
-        level_lines, trading_ranges = await self._get_trading_range_levels(
-            symbol, timeframe, actual_start_dt, actual_end_dt
-        )
-
-        # Fetch phase annotations
-        phase_annotations = await self._get_phase_annotations(
-            symbol, timeframe, actual_start_dt, actual_end_dt
-        )
-
-        # Fetch preliminary events (PS, SC, AR, ST)
-        preliminary_events = await self._get_preliminary_events(
-            symbol, timeframe, actual_start_dt, actual_end_dt
-        )
-
-        # Get schematic matching (if available)
-        # Extract creek/ice levels from trading ranges for normalization
-        creek_level = trading_ranges[0].creek_level if trading_ranges else None
-        ice_level = trading_ranges[0].ice_level if trading_ranges else None
-
-        schematic_match = await self._get_schematic_match(
-            symbol, timeframe, actual_start_dt, actual_end_dt, creek_level, ice_level
-        )
-
-        # Get cause-building data (if available)
-        cause_building = await self._get_cause_building_data(symbol, timeframe, trading_ranges)
-
-        logger.info(
-            "Chart data fetched successfully",
-            symbol=symbol,
-            bar_count=len(bars),
-            pattern_count=len(patterns),
-            level_line_count=len(level_lines),
-        )
-
-        return ChartDataResponse(
-            symbol=symbol,
-            timeframe=timeframe,
-            bars=bars,
-            patterns=patterns,
-            level_lines=level_lines,
-            phase_annotations=phase_annotations,
-            trading_ranges=trading_ranges,
-            preliminary_events=preliminary_events,
-            schematic_match=schematic_match,
-            cause_building=cause_building,
-            bar_count=len(bars),
-            date_range={"start": actual_start_dt.isoformat(), "end": actual_end_dt.isoformat()},
-        )
-
-    async def _get_ohlcv_bars(
-        self, symbol: str, timeframe: str, start_date: datetime, end_date: datetime, limit: int
-    ) -> list[ChartBar]:
-        """Fetch OHLCV bars from database.
-
-        Converts to Lightweight Charts format:
-        - Timestamps as Unix seconds
-        - Decimal prices to float
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int],
+    ) -> OHLCVFrame:
+        """Fetch OHLCV bars as a columnar frame.
 
         Args:
             symbol: Ticker symbol
-            timeframe: Bar interval
+            timeframe: API bar interval (1D, 1W, ...)
             start_date: Start date
             end_date: End date
-            limit: Max number of bars
+            limit: Max number of (most recent) bars, or None for the whole range
 
         Returns:
-            List of ChartBar objects
+            OHLCVFrame in ascending timestamp order
         """
-        # Map API timeframe to database timeframe
-        timeframe_map = {"1D": "1d", "1W": "1w", "1M": "1M", "1H": "1H", "4H": "4H"}
-        db_timeframe = timeframe_map.get(timeframe, "1d")
-
-        query = (
-            select(OHLCVBarORM)
-            .where(
-                and_(
-                    OHLCVBarORM.symbol == symbol,
-                    OHLCVBarORM.timeframe == db_timeframe,
-                    OHLCVBarORM.timestamp >= start_date,
-                    OHLCVBarORM.timestamp <= end_date,
-                )
-            )
-            .order_by(OHLCVBarORM.timestamp.desc())
-            .limit(limit)
+        # Column rows only: no ORM instances or Pydantic validation per bar
+        return await OHLCVRepository(self.session).get_bar_frame(
+            symbol, to_db_timeframe(timeframe), start_date, end_date, limit=limit
         )
 
-        result = await self.session.execute(query)
-        orm_bars = result.scalars().all()
-
-        # Convert to ChartBar format (reverse for chronological order)
-        chart_bars = []
-        for bar in reversed(orm_bars):
-            chart_bars.append(
-                ChartBar(
-                    time=int(bar.timestamp.timestamp()),
-                    open=float(bar.open),
-                    high=float(bar.high),
-                    low=float(bar.low),
-                    close=float(bar.close),
-                    volume=int(bar.volume),
-                )
-            )
-
-        return chart_bars
-
-    async def _get_pattern_markers(
+    async def get_pattern_markers(
         self, symbol: str, timeframe: str, start_date: datetime, end_date: datetime
     ) -> list[PatternMarker]:
         """Fetch pattern markers for chart overlay.
@@ -225,9 +119,7 @@ class ChartRepository:
         Returns:
             List of PatternMarker objects
         """
-        # Map API timeframe to database timeframe
-        timeframe_map = {"1D": "1d", "1W": "1w", "1M": "1M", "1H": "1H", "4H": "4H"}
-        db_timeframe = timeframe_map.get(timeframe, "1d")
+        db_timeframe = to_db_timeframe(timeframe)
 
         query = (
             select(PatternORM)
@@ -275,7 +167,7 @@ class ChartRepository:
 
         return markers
 
-    async def _get_trading_range_levels(
+    async def get_trading_range_levels(
         self, symbol: str, timeframe: str, start_date: datetime, end_date: datetime
     ) -> tuple[list[LevelLine], list[TradingRangeLevels]]:
         """Fetch trading range level lines (Creek, Ice, Jump).
@@ -289,9 +181,7 @@ class ChartRepository:
         Returns:
             Tuple of (level_lines, trading_ranges)
         """
-        # Map API timeframe to database timeframe
-        timeframe_map = {"1D": "1d", "1W": "1w", "1M": "1M", "1H": "1H", "4H": "4H"}
-        db_timeframe = timeframe_map.get(timeframe, "1d")
+        db_timeframe = to_db_timeframe(timeframe)
 
         query = (
             select(TradingRangeORM)
@@ -375,7 +265,7 @@ class ChartRepository:
 
         return level_lines, trading_ranges
 
-    async def _get_phase_annotations(
+    async def get_phase_annotations(
         self, symbol: str, timeframe: str, start_date: datetime, end_date: datetime
     ) -> list[PhaseAnnotation]:
         """Fetch phase annotations for background shading.
@@ -391,9 +281,7 @@ class ChartRepository:
         Returns:
             List of PhaseAnnotation objects
         """
-        # Map API timeframe to database timeframe
-        timeframe_map = {"1D": "1d", "1W": "1w", "1M": "1M", "1H": "1H", "4H": "4H"}
-        db_timeframe = timeframe_map.get(timeframe, "1d")
+        db_timeframe = to_db_timeframe(timeframe)
 
         # Query patterns grouped by phase
         query = (
@@ -432,7 +320,7 @@ class ChartRepository:
 
         return annotations
 
-    async def _get_preliminary_events(
+    async def get_preliminary_events(
         self, symbol: str, timeframe: str, start_date: datetime, end_date: datetime
     ) -> list[PreliminaryEvent]:
         """Fetch preliminary Wyckoff events (PS, SC, AR, ST).
@@ -448,9 +336,7 @@ class ChartRepository:
         Returns:
             List of PreliminaryEvent objects
         """
-        # Map API timeframe to database timeframe
-        timeframe_map = {"1D": "1d", "1W": "1w", "1M": "1M", "1H": "1H", "4H": "4H"}
-        db_timeframe = timeframe_map.get(timeframe, "1d")
+        db_timeframe = to_db_timeframe(timeframe)
 
         # Query for preliminary event patterns
         # Note: Assuming these are stored as pattern_type in patterns table
@@ -492,7 +378,7 @@ class ChartRepository:
 
         return events
 
-    async def _get_schematic_match(
+    async def get_schematic_match(
         self,
         symbol: str,
         timeframe: str,
@@ -526,7 +412,7 @@ class ChartRepository:
             ice_level,
         )
 
-    async def _get_cause_building_data(
+    async def get_cause_building_data(
         self, symbol: str, timeframe: str, trading_ranges: list[TradingRangeLevels]
     ) -> Optional[CauseBuildingData]:
         """Get Point & Figure cause-building data.
@@ -5,23 +5,100 @@ This module provides database access methods for OHLCV bars,
 including bulk insert, duplicate detection, and data quality queries.
 
 Note: Uses database-agnostic patterns for compatibility with both
-PostgreSQL (production) and SQLite (testing).
+PostgreSQL (production) and SQLite (testing). The high-throughput
+insert_bars_bulk path uses COPY on PostgreSQL (psycopg/asyncpg) and
+batched INSERT ... ON CONFLICT DO NOTHING elsewhere.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import islice
+from typing import Any
 
+import numpy as np
 import structlog
-from sqlalchemy import and_, exists, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, exists, func, select, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from src.models.ohlcv import OHLCVBar
+from src.pattern_engine.ohlcv_frame import OHLCVFrame, datetime_to_epoch_ns
 from src.repositories.bar_iterator import BarIterator
 from src.repositories.models import OHLCVBarModel
 
 logger = structlog.get_logger(__name__)
 
+# Column order of COPY records and the staging table
+_BULK_COLUMNS = (
+    "id",
+    "symbol",
+    "timeframe",
+    "timestamp",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "spread",
+    "spread_ratio",
+    "volume_ratio",
+    "low_history_flag",
+    "created_at",
+)
+_CONFLICT_COLUMNS = ["symbol", "timeframe", "timestamp"]
+_STAGING_TABLE = "ohlcv_bars_staging"
+_COPY_DRIVERS = ("asyncpg", "psycopg")
+
+
+@dataclass(frozen=True)
+class BulkInsertResult:
+    """
+    Outcome of a bulk bar ingestion.
+
+    Attributes:
+        total: Bars submitted
+        inserted: Bars written
+        skipped: Bars already present (or repeated in the input)
+        chunks: Number of committed chunks
+        duration_seconds: Wall time for the whole ingestion
+        method: "copy" (PostgreSQL COPY) or "insert" (batched INSERT)
+    """
+
+    total: int
+    inserted: int
+    skipped: int
+    chunks: int
+    duration_seconds: float
+    method: str
+
+    @property
+    def rows_per_second(self) -> float:
+        """Submitted bars processed per second."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.total / self.duration_seconds
+
+
+def _chunked(bars: Iterable[OHLCVBar], size: int) -> Iterator[list[OHLCVBar]]:
+    """Yield lists of up to size bars without materializing the input."""
+    iterator = iter(bars)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalize a database timestamp to UTC (mirrors OHLCVBar.ensure_utc)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    if value.tzinfo is UTC:
+        return value
+    return value.astimezone(UTC)
+
 
 class OHLCVRepository:
     """
@@ -178,6 +255,217 @@ class OHLCVRepository:
             logger.error("insert_failed", error=str(e))
             raise
 
+    async def insert_bars_bulk(
+        self,
+        bars: Iterable[OHLCVBar],
+        chunk_size: int = 10_000,
+    ) -> BulkInsertResult:
+        """
+        High-throughput bulk insert for backfills.
+
+        Streams bars in chunks, committing after each one, and lets the
+        unique constraint on (symbol, timeframe, timestamp) discard
+        duplicates instead of querying for existing timestamps first:
+
+        - PostgreSQL (psycopg/asyncpg): COPY into a temporary staging table,
+          then INSERT ... SELECT ... ON CONFLICT DO NOTHING into ohlcv_bars
+        - Other dialects (SQLite in tests): executemany
+          INSERT ... ON CONFLICT DO NOTHING
+
+        Bars may span several symbols and timeframes. The input is consumed
+        lazily, so generators over very large histories are fine.
+
+        Args:
+            bars: OHLCVBar objects to insert (any iterable)
+            chunk_size: Bars per COPY/commit (default: 10,000)
+
+        Returns:
+            BulkInsertResult with inserted/skipped counts and throughput
+
+        Raises:
+            ValueError: If chunk_size is not positive
+
+        Example:
+            ```python
+            result = await repo.insert_bars_bulk(bar_generator(), chunk_size=20_000)
+            logger.info(
+                "backfill_complete",
+                inserted=result.inserted,
+                skipped=result.skipped,
+                rows_per_second=round(result.rows_per_second),
+            )
+            ```
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        start_time = time.perf_counter()
+        total = 0
+        inserted = 0
+        chunks = 0
+        method = "insert"
+
+        try:
+            for chunk in _chunked(bars, chunk_size):
+                connection = await self.session.connection()
+                dialect = connection.dialect
+                if dialect.name == "postgresql" and dialect.driver in _COPY_DRIVERS:
+                    method = "copy"
+                    chunk_inserted = await self._copy_chunk(connection, chunk)
+                else:
+                    method = "insert"
+                    chunk_inserted = await self._insert_chunk(dialect.name, chunk)
+
+                await self.session.commit()
+
+                total += len(chunk)
+                inserted += chunk_inserted
+                chunks += 1
+
+                logger.debug(
+                    "bulk_chunk_inserted",
+                    chunk=chunks,
+                    bars=len(chunk),
+                    inserted=chunk_inserted,
+                    method=method,
+                )
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(
+                "bulk_insert_failed",
+                error=str(e),
+                committed_chunks=chunks,
+                committed_inserted=inserted,
+            )
+            raise
+
+        result = BulkInsertResult(
+            total=total,
+            inserted=inserted,
+            skipped=total - inserted,
+            chunks=chunks,
+            duration_seconds=time.perf_counter() - start_time,
+            method=method,
+        )
+
+        logger.info(
+            "bars_bulk_inserted",
+            total_bars=result.total,
+            inserted=result.inserted,
+            duplicates_skipped=result.skipped,
+            chunks=result.chunks,
+            method=result.method,
+            rows_per_second=round(result.rows_per_second),
+        )
+
+        return result
+
+    async def _copy_chunk(self, connection: AsyncConnection, chunk: list[OHLCVBar]) -> int:
+        """
+        COPY one chunk into the staging table and merge it into ohlcv_bars.
+
+        The staging table is a per-connection temp table whose rows are
+        dropped on commit, so each chunk starts from an empty table.
+
+        Args:
+            connection: Session connection (PostgreSQL)
+            chunk: Bars to write
+
+        Returns:
+            Number of rows inserted into ohlcv_bars
+        """
+        columns = ", ".join(_BULK_COLUMNS)
+        await connection.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} "
+                f"(LIKE {OHLCVBarModel.__tablename__} INCLUDING DEFAULTS) "
+                "ON COMMIT DELETE ROWS"
+            )
+        )
+
+        records = [
+            (
+                bar.id,
+                bar.symbol,
+                bar.timeframe,
+                bar.timestamp,
+                bar.open,
+                bar.high,
+                bar.low,
+                bar.close,
+                bar.volume,
+                bar.spread,
+                bar.spread_ratio,
+                bar.volume_ratio,
+                bar.low_history_flag,
+                bar.created_at,
+            )
+            for bar in chunk
+        ]
+
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if connection.dialect.driver == "asyncpg":
+            await driver_connection.copy_records_to_table(
+                _STAGING_TABLE, records=records, columns=list(_BULK_COLUMNS)
+            )
+        else:
+            async with driver_connection.cursor() as cursor:
+                async with cursor.copy(f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN") as copy:
+                    for record in records:
+                        await copy.write_row(record)
+
+        result = await connection.execute(
+            text(
+                f"INSERT INTO {OHLCVBarModel.__tablename__} ({columns}) "
+                f"SELECT {columns} FROM {_STAGING_TABLE} "
+                f"ON CONFLICT ({', '.join(_CONFLICT_COLUMNS)}) DO NOTHING"
+            )
+        )
+        return result.rowcount
+
+    async def _insert_chunk(self, dialect_name: str, chunk: list[OHLCVBar]) -> int:
+        """
+        Insert one chunk with INSERT ... ON CONFLICT DO NOTHING.
+
+        Rows are passed as executemany parameters rather than one multi-row
+        VALUES clause, so the statement is compiled once per chunk and the
+        driver batches the rows.
+
+        Args:
+            dialect_name: "postgresql" or "sqlite"
+            chunk: Bars to write
+
+        Returns:
+            Number of rows inserted
+        """
+        insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+        stmt = insert(OHLCVBarModel.__table__).on_conflict_do_nothing(
+            index_elements=_CONFLICT_COLUMNS
+        )
+        rows: list[dict[str, Any]] = [
+            {
+                "id": str(bar.id),  # Convert UUID to string for SQLite compatibility
+                "symbol": bar.symbol,
+                "timeframe": bar.timeframe,
+                "timestamp": bar.timestamp,
+                "open": bar.open,
+                "high": bar.high,
+                "low": bar.low,
+                "close": bar.close,
+                "volume": bar.volume,
+                "spread": bar.spread,
+                "spread_ratio": bar.spread_ratio,
+                "volume_ratio": bar.volume_ratio,
+                "low_history_flag": bar.low_history_flag,
+                "created_at": bar.created_at,
+            }
+            for bar in chunk
+        ]
+        result = await self.session.execute(stmt, rows)
+        return result.rowcount
+
     async def bar_exists(
         self,
         symbol: str,
@@ -305,6 +593,151 @@ class OHLCVRepository:
         bars = [OHLCVBar.model_validate(model) for model in models]
         return list(reversed(bars))
 
+    async def get_bars_lean(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[OHLCVBar]:
+        """
+        Retrieve bars without ORM materialization or per-row validation.
+
+        Selects plain column rows and builds OHLCVBar objects with
+        model_construct. Values come straight from constrained database
+        columns, so validation would only repeat what the schema enforces;
+        timestamps are still normalized to UTC and prices rounded to 8 places
+        as the model's validator does, so lean bars equal validated ones.
+        Stored id and created_at are used, so no default factories run.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+            start_date: Start date (inclusive), or None for no lower bound
+            end_date: End date (inclusive), or None for no upper bound
+            limit: Keep only the most recent N bars in the range
+
+        Returns:
+            List of OHLCVBar objects sorted by timestamp (oldest first)
+
+        Example:
+            ```python
+            recent_bars = await repo.get_bars_lean("AAPL", "1d", limit=2000)
+            ```
+        """
+        rows = await self._fetch_lean_rows(
+            OHLCVBarModel.__table__.columns, symbol, timeframe, start_date, end_date, limit
+        )
+        return [
+            OHLCVBar.model_construct(
+                id=row.id,
+                symbol=row.symbol,
+                timeframe=row.timeframe,
+                timestamp=_as_utc(row.timestamp),
+                open=round(row.open, 8),
+                high=round(row.high, 8),
+                low=round(row.low, 8),
+                close=round(row.close, 8),
+                volume=row.volume,
+                spread=round(row.spread, 8),
+                spread_ratio=row.spread_ratio,
+                volume_ratio=row.volume_ratio,
+                low_history_flag=row.low_history_flag,
+                created_at=_as_utc(row.created_at),
+            )
+            for row in rows
+        ]
+
+    async def get_bar_frame(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int | None = None,
+    ) -> OHLCVFrame:
+        """
+        Retrieve bars as NumPy columns, without building any bar objects.
+
+        Only timestamp and OHLCV columns are selected. The returned frame has
+        no source bars; OHLCVFrame.bar() constructs them on demand.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+            start_date: Start date (inclusive), or None for no lower bound
+            end_date: End date (inclusive), or None for no upper bound
+            limit: Keep only the most recent N bars in the range
+
+        Returns:
+            OHLCVFrame in chronological order (empty if no bars match)
+
+        Example:
+            ```python
+            frame = await repo.get_bar_frame("AAPL", "1d", start, end)
+            volume_analysis = VolumeAnalyzer().analyze(frame)
+            ```
+        """
+        rows = await self._fetch_lean_rows(
+            (
+                OHLCVBarModel.timestamp,
+                OHLCVBarModel.open,
+                OHLCVBarModel.high,
+                OHLCVBarModel.low,
+                OHLCVBarModel.close,
+                OHLCVBarModel.volume,
+            ),
+            symbol,
+            timeframe,
+            start_date,
+            end_date,
+            limit,
+        )
+        timestamp = np.fromiter(
+            (datetime_to_epoch_ns(row[0]) for row in rows), dtype=np.int64, count=len(rows)
+        )
+        values = np.array([row[1:] for row in rows], dtype=np.float64).reshape(len(rows), 5)
+        opens, highs, lows, closes, volumes = np.ascontiguousarray(values.T)
+        return OHLCVFrame(
+            symbol=symbol,
+            timeframe=timeframe,
+            timestamp=timestamp,
+            open=opens,
+            high=highs,
+            low=lows,
+            close=closes,
+            volume=volumes,
+        )
+
+    async def _fetch_lean_rows(
+        self,
+        columns: Iterable[Any],
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        limit: int | None,
+    ) -> list[Any]:
+        """Select plain column rows in chronological order (shared by the lean reads)."""
+        conditions = [OHLCVBarModel.symbol == symbol, OHLCVBarModel.timeframe == timeframe]
+        if start_date is not None:
+            conditions.append(OHLCVBarModel.timestamp >= start_date)
+        if end_date is not None:
+            conditions.append(OHLCVBarModel.timestamp <= end_date)
+
+        stmt = select(*columns).where(and_(*conditions))
+        if limit is None:
+            stmt = stmt.order_by(OHLCVBarModel.timestamp)
+        else:
+            stmt = stmt.order_by(OHLCVBarModel.timestamp.desc()).limit(limit)
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        if limit is not None:
+            rows.reverse()
+        return rows
+
     async def count_bars(self, symbol: str, timeframe: str) -> int:
         """
         Count total bars for a symbol and timeframe.
@@ -180,6 +180,39 @@ class PaperPositionRepository:
 
         return self._to_model(position_db)
 
+    async def bulk_update_marks(self, positions: list[PaperPosition]) -> int:
+        """
+        Write mark-to-market fields for many positions in one UPDATE. Does NOT commit.
+
+        Sends a single executemany UPDATE keyed by primary key covering
+        current_price, unrealized_pnl and updated_at.
+
+        Args:
+            positions: PaperPosition models with updated marks
+
+        Returns:
+            Number of positions written
+        """
+        if not positions:
+            return 0
+
+        await self.session.execute(
+            update(PaperPositionDB),
+            [
+                {
+                    "id": position.id,
+                    "current_price": position.current_price,
+                    "unrealized_pnl": position.unrealized_pnl,
+                    "updated_at": position.updated_at,
+                }
+                for position in positions
+            ],
+        )
+
+        logger.debug("paper_positions_marked", count=len(positions))
+
+        return len(positions)
+
     async def delete_position(self, position_id: UUID) -> None:
         """
         Delete a paper position.
@@ -273,16 +273,8 @@ class SignalAuditRepository:
             signal_id: Signal UUID
             new_state: New lifecycle state
         """
-        from sqlalchemy import update as sql_update
-
-        stmt = (
-            sql_update(Signal)
-            .where(Signal.id == signal_id)
-            .values(lifecycle_state=new_state, updated_at=datetime.now(UTC))
-        )
-
-        await self.session.execute(stmt)
-        await self.session.commit()
+        if not await self._update_signal(signal_id, lifecycle_state=new_state):
+            return
 
         logger.info(
             "signal_lifecycle_state_updated",
@@ -300,16 +292,8 @@ class SignalAuditRepository:
             signal_id: Signal UUID
             validation_results: Validation results dictionary
         """
-        from sqlalchemy import update as sql_update
-
-        stmt = (
-            sql_update(Signal)
-            .where(Signal.id == signal_id)
-            .values(validation_results=validation_results, updated_at=datetime.now(UTC))
-        )
-
-        await self.session.execute(stmt)
-        await self.session.commit()
+        if not await self._update_signal(signal_id, validation_results=validation_results):
+            return
 
         logger.info(
             "signal_validation_results_updated",
@@ -324,22 +308,40 @@ class SignalAuditRepository:
             signal_id: Signal UUID
             trade_outcome: Trade outcome dictionary
         """
-        from sqlalchemy import update as sql_update
-
-        stmt = (
-            sql_update(Signal)
-            .where(Signal.id == signal_id)
-            .values(trade_outcome=trade_outcome, updated_at=datetime.now(UTC))
-        )
-
-        await self.session.execute(stmt)
-        await self.session.commit()
+        if not await self._update_signal(signal_id, trade_outcome=trade_outcome):
+            return
 
         logger.info(
             "signal_trade_outcome_updated",
             signal_id=str(signal_id),
         )
 
+    async def _update_signal(self, signal_id: UUID, **values) -> bool:
+        """
+        Set signal columns through the ORM and commit.
+
+        Updates go through the session (not a Core UPDATE) so the signal
+        statistics rollups are adjusted by the Signal mapper events.
+
+        Args:
+            signal_id: Signal UUID
+            **values: Column values to set
+
+        Returns:
+            False if the signal does not exist
+        """
+        signal = await self.session.get(Signal, signal_id)
+        if signal is None:
+            logger.warning("signal_not_found_for_update", signal_id=str(signal_id))
+            return False
+
+        for name, value in values.items():
+            setattr(signal, name, value)
+        signal.updated_at = datetime.now(UTC)
+
+        await self.session.commit()
+        return True
+
     def _audit_entry_to_model(self, orm_entry: SignalAuditLogORM) -> SignalAuditLogEntry:
         """
         Convert ORM audit entry to Pydantic model.
@@ -0,0 +1,255 @@
+"""
+Chart Data Service
+
+Assembles /api/v1/charts/data payloads for the charting component.
+
+- Bars are read first (they fix the visible time range); the overlay queries
+  (pattern markers, range levels, phase annotations, preliminary events,
+  then schematic match and cause-building) run concurrently, each on its own
+  pooled session
+- Wide zoom levels request max_points: the full range is loaded and reduced
+  to at most that many candles
+- Serialized payloads are cached per symbol/timeframe/range; MarketDataService
+  invalidates a symbol/timeframe when new bars are ingested
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+import numpy as np
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.cache.chart_cache import ChartCacheKey, ChartDataCache, get_chart_cache
+from src.models.chart import ChartDataResponse
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
+from src.repositories.chart_repository import (
+    ChartRepository,
+    chart_bars_from_frame,
+    to_db_timeframe,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Upper bound on bars loaded for a downsampled (max_points) request
+MAX_RANGE_BARS = 100_000
+
+ChartQuery = Callable[[ChartRepository], Awaitable[Any]]
+
+
+def downsample_ohlc(frame: OHLCVFrame, max_points: int) -> OHLCVFrame:
+    """
+    Reduce bars to at most max_points candles of consecutive bars.
+
+    Each candle takes the first bar's timestamp and open, the last bar's
+    close, the bucket's highest high and lowest low, and the summed volume,
+    so the price extremes of every bucket stay visible.
+
+    Args:
+        frame: Bars in ascending timestamp order
+        max_points: Maximum number of candles to return
+
+    Returns:
+        The frame itself if it is small enough, else the bucketed frame
+    """
+    count = len(frame)
+    if count <= max_points:
+        return frame
+
+    starts = np.linspace(0, count, max_points, endpoint=False).astype(np.int64)
+    ends = np.append(starts[1:], count) - 1
+
+    return OHLCVFrame(
+        symbol=frame.symbol,
+        timeframe=frame.timeframe,
+        timestamp=frame.timestamp[starts],
+        open=frame.open[starts],
+        high=np.maximum.reduceat(frame.high, starts),
+        low=np.minimum.reduceat(frame.low, starts),
+        close=frame.close[ends],
+        volume=np.add.reduceat(frame.volume, starts),
+    )
+
+
+class ChartDataService:
+    """Builds and caches chart payloads."""
+
+    def __init__(self, session: AsyncSession, cache: Optional[ChartDataCache] = None):
+        """Initialize service.
+
+        Args:
+            session: Request session, used for the bar query
+            cache: Payload cache (defaults to the process-wide cache)
+        """
+        self.session = session
+        self._cache = cache or get_chart_cache()
+
+        # Overlay queries get their own pooled sessions on PostgreSQL. SQLite
+        # (tests) cannot run them in parallel, so they share the request session.
+        bind = session.bind
+        self._session_factory = (
+            async_sessionmaker(bind, class_=AsyncSession, expire_on_commit=False)
+            if bind is not None and bind.dialect.name == "postgresql"
+            else None
+        )
+
+    async def get_chart_payload(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 500,
+        max_points: Optional[int] = None,
+    ) -> bytes:
+        """Get the serialized chart payload, from cache when possible.
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Bar interval (1H, 4H, 1D, 1W, 1M)
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            limit: Maximum number of bars when max_points is not given
+            max_points: Downsample the whole range to at most this many bars
+
+        Returns:
+            ChartDataResponse serialized as JSON
+
+        Raises:
+            ValueError: If no data found for symbol/timeframe
+        """
+        key = ChartCacheKey(
+            symbol=symbol.upper(),
+            timeframe=to_db_timeframe(timeframe),
+            start_date=start_date.isoformat() if start_date else None,
+            end_date=end_date.isoformat() if end_date else None,
+            limit=limit,
+            max_points=max_points,
+        )
+        payload = self._cache.get(key)
+        if payload is not None:
+            logger.debug("chart_payload_cache_hit", symbol=symbol, timeframe=timeframe)
+            return payload
+
+        chart_data = await self.get_chart_data(
+            symbol, timeframe, start_date, end_date, limit, max_points
+        )
+        payload = chart_data.model_dump_json().encode()
+        self._cache.set(key, payload)
+        return payload
+
+    async def get_chart_data(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 500,
+        max_points: Optional[int] = None,
+    ) -> ChartDataResponse:
+        """Fetch complete chart data for symbol and timeframe (uncached).
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Bar interval (1H, 4H, 1D, 1W, 1M)
+            start_date: Optional start date filter (default: 90 days before end)
+            end_date: Optional end date filter (default: now)
+            limit: Maximum number of bars when max_points is not given
+            max_points: Downsample the whole range to at most this many bars
+
+        Returns:
+            ChartDataResponse with all chart data
+
+        Raises:
+            ValueError: If no data found for symbol/timeframe
+        """
+        if end_date is None:
+            end_date = datetime.utcnow()
+        if start_date is None:
+            start_date = end_date - timedelta(days=90)
+
+        frame = await ChartRepository(self.session).get_bar_frame(
+            symbol,
+            timeframe,
+            start_date,
+            end_date,
+            limit=MAX_RANGE_BARS if max_points is not None else limit,
+        )
+        if len(frame) == 0:
+            raise ValueError(f"No OHLCV data found for {symbol} {timeframe}")
+
+        # Overlays cover the loaded bars (second resolution, as sent to the chart)
+        actual_start_dt = datetime.utcfromtimestamp(int(frame.timestamp[0]) // 1_000_000_000)
+        actual_end_dt = datetime.utcfromtimestamp(int(frame.timestamp[-1]) // 1_000_000_000)
+
+        source_bar_count = len(frame)
+        if max_points is not None:
+            frame = downsample_ohlc(frame, max_points)
+        bars = chart_bars_from_frame(frame)
+
+        (
+            patterns,
+            (level_lines, trading_ranges),
+            phase_annotations,
+            preliminary_events,
+        ) = await self._run_queries(
+            lambda repo: repo.get_pattern_markers(
+                symbol, timeframe, actual_start_dt, actual_end_dt
+            ),
+            lambda repo: repo.get_trading_range_levels(
+                symbol, timeframe, actual_start_dt, actual_end_dt
+            ),
+            lambda repo: repo.get_phase_annotations(
+                symbol, timeframe, actual_start_dt, actual_end_dt
+            ),
+            lambda repo: repo.get_preliminary_events(
+                symbol, timeframe, actual_start_dt, actual_end_dt
+            ),
+        )
+
+        # Schematic matching and cause-building depend on the trading ranges
+        creek_level = trading_ranges[0].creek_level if trading_ranges else None
+        ice_level = trading_ranges[0].ice_level if trading_ranges else None
+        schematic_match, cause_building = await self._run_queries(
+            lambda repo: repo.get_schematic_match(
+                symbol, timeframe, actual_start_dt, actual_end_dt, creek_level, ice_level
+            ),
+            lambda repo: repo.get_cause_building_data(symbol, timeframe, trading_ranges),
+        )
+
+        logger.info(
+            "Chart data fetched successfully",
+            symbol=symbol,
+            bar_count=len(bars),
+            source_bar_count=source_bar_count,
+            pattern_count=len(patterns),
+            level_line_count=len(level_lines),
+        )
+
+        return ChartDataResponse(
+            symbol=symbol,
+            timeframe=timeframe,
+            bars=bars,
+            patterns=patterns,
+            level_lines=level_lines,
+            phase_annotations=phase_annotations,
+            trading_ranges=trading_ranges,
+            preliminary_events=preliminary_events,
+            schematic_match=schematic_match,
+            cause_building=cause_building,
+            bar_count=len(bars),
+            date_range={"start": actual_start_dt.isoformat(), "end": actual_end_dt.isoformat()},
+        )
+
+    async def _run_queries(self, *queries: ChartQuery) -> list[Any]:
+        """Run repository queries, concurrently when separate sessions are available."""
+        if self._session_factory is None:
+            repository = ChartRepository(self.session)
+            return [await query(repository) for query in queries]
+        return list(await asyncio.gather(*(self._run_on_own_session(query) for query in queries)))
+
+    async def _run_on_own_session(self, query: ChartQuery) -> Any:
+        async with self._session_factory() as session:
+            return await query(ChartRepository(session))
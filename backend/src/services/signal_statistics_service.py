@@ -10,6 +10,10 @@ Caching Strategy (per Story 19.17):
 - Rejections: 30 minute TTL
 - Symbol performance: 15 minute TTL
 
+With use_rollups=True the aggregations read the daily
+signal_statistics_rollups table (maintained by Signal mapper events)
+instead of scanning signals; date filters then apply at day granularity.
+
 Author: Story 19.17
 """
 
@@ -17,7 +21,7 @@ from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 
 import structlog
-from sqlalchemy import Numeric, and_, case, cast, func, select
+from sqlalchemy import Numeric, and_, case, cast, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.cache.statistics_cache import StatisticsCache, get_statistics_cache
@@ -30,6 +34,13 @@ from src.models.signal_statistics import (
     SymbolPerformance,
 )
 from src.orm.models import Signal
+from src.orm.signal_statistics import (
+    ROLLUP_SOURCE_FIELDS,
+    SignalStatisticsRollupORM,
+    merge_rollup_rows,
+    signal_rollup_row,
+    upsert_rollup_deltas,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -52,6 +63,7 @@ class SignalStatisticsService:
         self,
         session: AsyncSession,
         cache: StatisticsCache | None = None,
+        use_rollups: bool = False,
     ):
         """
         Initialize service with database session and optional cache.
@@ -59,9 +71,12 @@ class SignalStatisticsService:
         Args:
             session: Async SQLAlchemy session
             cache: Optional cache instance (defaults to global singleton)
+            use_rollups: Aggregate from the daily rollup table instead of
+                scanning signals
         """
         self.session = session
         self._cache = cache or get_statistics_cache()
+        self.use_rollups = use_rollups
 
     async def get_statistics(
         self,
@@ -242,6 +257,9 @@ class SignalStatisticsService:
         Returns:
             SignalSummary with aggregated statistics
         """
+        if self.use_rollups:
+            return await self._get_summary_from_rollups(start_datetime, end_datetime)
+
         now = datetime.now(UTC)
         today_start = datetime.combine(now.date(), datetime.min.time(), tzinfo=UTC)
         week_start = today_start - timedelta(days=now.weekday())
@@ -362,6 +380,9 @@ class SignalStatisticsService:
         Returns:
             List of PatternWinRate sorted by win rate descending
         """
+        if self.use_rollups:
+            return await self._get_win_rate_from_rollups(start_datetime, end_datetime)
+
         base_filter = and_(
             Signal.created_at >= start_datetime,
             Signal.created_at <= end_datetime,
@@ -451,6 +472,9 @@ class SignalStatisticsService:
         Returns:
             List of RejectionCount sorted by count descending
         """
+        if self.use_rollups:
+            return await self._get_rejections_from_rollups(start_datetime, end_datetime)
+
         # Filter for rejected signals with validation results
         rejected_filter = and_(
             Signal.created_at >= start_datetime,
@@ -530,6 +554,9 @@ class SignalStatisticsService:
         Returns:
             List of SymbolPerformance sorted by total_pnl descending
         """
+        if self.use_rollups:
+            return await self._get_symbol_perf_from_rollups(start_datetime, end_datetime)
+
         base_filter = and_(
             Signal.created_at >= start_datetime,
             Signal.created_at <= end_datetime,
@@ -606,3 +633,303 @@ class SignalStatisticsService:
         )
 
         return symbol_stats
+
+    # =========================================================================
+    # Rollup-backed aggregations
+    # =========================================================================
+
+    @staticmethod
+    def _rollup_day_filter(start_datetime: datetime, end_datetime: datetime):
+        """Rollup rows for the UTC days covering the datetime range."""
+        return and_(
+            SignalStatisticsRollupORM.day >= start_datetime.astimezone(UTC).date(),
+            SignalStatisticsRollupORM.day <= end_datetime.astimezone(UTC).date(),
+        )
+
+    @staticmethod
+    def _closed_sum(column):
+        """SUM of a rollup measure over closed-signal rows."""
+        return func.sum(
+            case((SignalStatisticsRollupORM.lifecycle_state == "closed", column), else_=0)
+        )
+
+    async def _get_summary_from_rollups(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> SignalSummary:
+        """Summary statistics in a single query over the rollup rows."""
+        rollup = SignalStatisticsRollupORM
+        today = datetime.now(UTC).date()
+        week_start = today - timedelta(days=today.weekday())
+        month_start = today.replace(day=1)
+
+        def count_since(day: date):
+            return func.sum(case((rollup.day >= day, rollup.signal_count), else_=0))
+
+        stmt = select(
+            func.sum(rollup.signal_count).label("total_signals"),
+            count_since(today).label("signals_today"),
+            count_since(week_start).label("signals_this_week"),
+            count_since(month_start).label("signals_this_month"),
+            func.sum(rollup.confidence_sum).label("confidence_sum"),
+            self._closed_sum(rollup.signal_count).label("closed_count"),
+            self._closed_sum(rollup.winning_count).label("winning_count"),
+            self._closed_sum(rollup.confidence_sum).label("closed_confidence_sum"),
+            self._closed_sum(rollup.r_multiple_sum).label("r_multiple_sum"),
+            self._closed_sum(rollup.r_multiple_count).label("r_multiple_count"),
+            self._closed_sum(rollup.pnl_sum).label("total_pnl"),
+        ).where(self._rollup_day_filter(start_datetime, end_datetime))
+
+        row = (await self.session.execute(stmt)).one()
+
+        total_signals = int(row.total_signals or 0)
+        closed_count = int(row.closed_count or 0)
+        winning_count = int(row.winning_count or 0)
+        r_multiple_count = int(row.r_multiple_count or 0)
+
+        overall_win_rate = (winning_count / closed_count * 100) if closed_count > 0 else 0.0
+        # Closed-signal average, falling back to all signals (as the scan path does)
+        if closed_count > 0:
+            avg_confidence = int(row.closed_confidence_sum or 0) / closed_count
+        elif total_signals > 0:
+            avg_confidence = int(row.confidence_sum or 0) / total_signals
+        else:
+            avg_confidence = 0.0
+        avg_r_multiple = (
+            float(row.r_multiple_sum) / r_multiple_count if r_multiple_count > 0 else 0.0
+        )
+        total_pnl = Decimal(str(row.total_pnl)) if row.total_pnl else Decimal("0")
+
+        logger.debug(
+            "signal_summary_calculated",
+            total_signals=total_signals,
+            closed_count=closed_count,
+            winning_count=winning_count,
+            win_rate=overall_win_rate,
+            source="rollups",
+        )
+
+        return SignalSummary(
+            total_signals=total_signals,
+            signals_today=int(row.signals_today or 0),
+            signals_this_week=int(row.signals_this_week or 0),
+            signals_this_month=int(row.signals_this_month or 0),
+            overall_win_rate=round(overall_win_rate, 2),
+            avg_confidence=round(avg_confidence, 2),
+            avg_r_multiple=round(avg_r_multiple, 2),
+            total_pnl=total_pnl,
+        )
+
+    async def _get_win_rate_from_rollups(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> list[PatternWinRate]:
+        """Win rate per pattern type from the rollup rows."""
+        rollup = SignalStatisticsRollupORM
+        stmt = (
+            select(
+                rollup.signal_type.label("pattern_type"),
+                func.sum(rollup.signal_count).label("total_signals"),
+                func.sum(rollup.confidence_sum).label("confidence_sum"),
+                self._closed_sum(rollup.signal_count).label("closed_signals"),
+                self._closed_sum(rollup.winning_count).label("winning_signals"),
+                self._closed_sum(rollup.r_multiple_sum).label("r_multiple_sum"),
+                self._closed_sum(rollup.r_multiple_count).label("r_multiple_count"),
+            )
+            .where(self._rollup_day_filter(start_datetime, end_datetime))
+            .group_by(rollup.signal_type)
+            .having(func.sum(rollup.signal_count) > 0)
+        )
+
+        pattern_stats = []
+        for row in (await self.session.execute(stmt)).all():
+            total = int(row.total_signals)
+            closed = int(row.closed_signals or 0)
+            winning = int(row.winning_signals or 0)
+            r_count = int(row.r_multiple_count or 0)
+            win_rate = (winning / closed * 100) if closed > 0 else 0.0
+
+            pattern_stats.append(
+                PatternWinRate(
+                    pattern_type=row.pattern_type,
+                    total_signals=total,
+                    closed_signals=closed,
+                    winning_signals=winning,
+                    win_rate=round(win_rate, 2),
+                    avg_confidence=round(int(row.confidence_sum or 0) / total, 2),
+                    avg_r_multiple=round(
+                        float(row.r_multiple_sum) / r_count if r_count > 0 else 0.0, 2
+                    ),
+                )
+            )
+
+        pattern_stats.sort(key=lambda x: x.win_rate, reverse=True)
+
+        logger.debug(
+            "win_rate_by_pattern_calculated",
+            pattern_count=len(pattern_stats),
+            source="rollups",
+        )
+
+        return pattern_stats
+
+    async def _get_rejections_from_rollups(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> list[RejectionCount]:
+        """Rejection counts by stage and reason from the rollup rows."""
+        rollup = SignalStatisticsRollupORM
+        stmt = (
+            select(
+                rollup.rejection_stage,
+                rollup.rejection_reason,
+                func.sum(rollup.signal_count).label("rejection_count"),
+            )
+            .where(
+                self._rollup_day_filter(start_datetime, end_datetime),
+                rollup.lifecycle_state == "rejected",
+                rollup.rejection_stage != "",
+            )
+            .group_by(rollup.rejection_stage, rollup.rejection_reason)
+            .having(func.sum(rollup.signal_count) > 0)
+        )
+        rows = (await self.session.execute(stmt)).all()
+
+        total_rejections = sum(int(row.rejection_count) for row in rows)
+        if total_rejections == 0:
+            return []
+
+        rejection_counts = [
+            RejectionCount(
+                reason=row.rejection_reason,
+                validation_stage=row.rejection_stage,
+                count=int(row.rejection_count),
+                percentage=round(int(row.rejection_count) / total_rejections * 100, 2),
+            )
+            for row in rows
+        ]
+        rejection_counts.sort(key=lambda x: x.count, reverse=True)
+
+        logger.debug(
+            "rejection_breakdown_calculated",
+            total_rejections=total_rejections,
+            unique_reasons=len(rejection_counts),
+            source="rollups",
+        )
+
+        return rejection_counts
+
+    async def _get_symbol_perf_from_rollups(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> list[SymbolPerformance]:
+        """Per-symbol performance from the rollup rows."""
+        rollup = SignalStatisticsRollupORM
+        stmt = (
+            select(
+                rollup.symbol,
+                func.sum(rollup.signal_count).label("total_signals"),
+                self._closed_sum(rollup.signal_count).label("closed_signals"),
+                self._closed_sum(rollup.winning_count).label("winning_signals"),
+                self._closed_sum(rollup.r_multiple_sum).label("r_multiple_sum"),
+                self._closed_sum(rollup.r_multiple_count).label("r_multiple_count"),
+                self._closed_sum(rollup.pnl_sum).label("total_pnl"),
+            )
+            .where(self._rollup_day_filter(start_datetime, end_datetime))
+            .group_by(rollup.symbol)
+            .having(func.sum(rollup.signal_count) > 0)
+        )
+
+        symbol_stats = []
+        for row in (await self.session.execute(stmt)).all():
+            closed = int(row.closed_signals or 0)
+            winning = int(row.winning_signals or 0)
+            r_count = int(row.r_multiple_count or 0)
+            win_rate = (winning / closed * 100) if closed > 0 else 0.0
+
+            symbol_stats.append(
+                SymbolPerformance(
+                    symbol=row.symbol,
+                    total_signals=int(row.total_signals),
+                    win_rate=round(win_rate, 2),
+                    avg_r_multiple=round(
+                        float(row.r_multiple_sum) / r_count if r_count > 0 else 0.0, 2
+                    ),
+                    total_pnl=Decimal(str(row.total_pnl or 0)),
+                )
+            )
+
+        symbol_stats.sort(key=lambda x: x.total_pnl, reverse=True)
+
+        logger.debug(
+            "symbol_performance_calculated",
+            symbol_count=len(symbol_stats),
+            source="rollups",
+        )
+
+        return symbol_stats
+
+    async def rebuild_rollups(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> int:
+        """
+        Recompute rollup rows from the signals table.
+
+        Used for backfills and to repair rollups after signals were changed
+        with Core UPDATE/DELETE statements (which bypass the mapper events).
+
+        Args:
+            start_date: First UTC day to rebuild (defaults to all history)
+            end_date: Last UTC day to rebuild (defaults to all history)
+
+        Returns:
+            Number of signals aggregated
+        """
+        rollup = SignalStatisticsRollupORM
+        delete_stmt = delete(rollup)
+        signal_stmt = select(*(getattr(Signal, field) for field in ROLLUP_SOURCE_FIELDS))
+        if start_date is not None:
+            delete_stmt = delete_stmt.where(rollup.day >= start_date)
+            signal_stmt = signal_stmt.where(
+                Signal.created_at >= datetime.combine(start_date, datetime.min.time(), tzinfo=UTC)
+            )
+        if end_date is not None:
+            delete_stmt = delete_stmt.where(rollup.day <= end_date)
+            signal_stmt = signal_stmt.where(
+                Signal.created_at
+                < datetime.combine(end_date + timedelta(days=1), datetime.min.time(), tzinfo=UTC)
+            )
+
+        await self.session.execute(delete_stmt)
+
+        signal_count = 0
+        contributions = []
+        result = await self.session.stream(signal_stmt.execution_options(yield_per=5000))
+        async for partition in result.partitions():
+            for row in partition:
+                contributions.append((1, signal_rollup_row(row._mapping)))
+            signal_count += len(partition)
+            # Keep memory bounded by the number of distinct keys
+            contributions = [(1, merged) for merged in merge_rollup_rows(contributions)]
+
+        rows = merge_rollup_rows(contributions)
+        connection = await self.session.connection()
+        await connection.run_sync(upsert_rollup_deltas, rows)
+        await self.session.commit()
+
+        self.invalidate_cache()
+        logger.info(
+            "signal_rollups_rebuilt",
+            start_date=start_date.isoformat() if start_date else None,
+            end_date=end_date.isoformat() if end_date else None,
+            signals=signal_count,
+            rollup_rows=len(rows),
+        )
+
+        return signal_count
@@ -35,7 +35,8 @@ Author: Story 8.10
 import asyncio
 import time
 from collections import defaultdict
-from datetime import UTC, datetime
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import UTC, date, datetime
 from decimal import Decimal
 from typing import Any, Literal
 from uuid import UUID, uuid4
@@ -93,6 +94,10 @@ class BacktestMetrics(BaseModel):
     avg_latency_ms: float = Field(..., description="Average processing latency")
     p95_latency_ms: float = Field(..., description="95th percentile latency")
     p99_latency_ms: float = Field(..., description="99th percentile latency")
+    stage_latency_ms: dict[str, dict[str, float]] = Field(
+        default_factory=dict,
+        description="Per-stage latency (count, avg, p50, p95, p99) keyed by pipeline stage",
+    )
 
 
 class BacktestResult(BaseModel):
@@ -202,6 +207,171 @@ class PerformanceTracker:
         return metrics
 
 
+# ============================================================================
+# Validation Context Cache
+# ============================================================================
+
+
+class ValidationContextCache:
+    """
+    Validation context inputs shared by the patterns of a scan cycle.
+
+    Entries are stored as tasks, so patterns assembled concurrently share one
+    in-flight fetch instead of issuing duplicates.
+
+    Lifetimes:
+    - Portfolio context: until the next cycle or invalidate_portfolio() (fills)
+    - Market context: per (symbol, forex session), until the next cycle
+    - Trading range: per range ID, until the next cycle
+    - Volume analysis: per (symbol, bar timestamp, forex session), until the
+      next cycle or the symbol is invalidated by a new bar
+    """
+
+    def __init__(self) -> None:
+        self._portfolio: dict[None, asyncio.Task[Any]] = {}
+        self._market: dict[tuple[str, str | None], asyncio.Task[Any]] = {}
+        self._ranges: dict[Hashable, asyncio.Task[Any]] = {}
+        self._volume: dict[tuple[str, Any, str | None], asyncio.Task[Any]] = {}
+
+    async def portfolio_context(self, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Portfolio context for the current cycle."""
+        return await self._memoized(self._portfolio, None, fetch)
+
+    async def market_context(
+        self, symbol: str, forex_session: str | None, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Market context of a symbol (and forex session) for the current cycle."""
+        return await self._memoized(self._market, (symbol, forex_session), fetch)
+
+    async def trading_range(
+        self, trading_range_id: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Trading range by ID for the current cycle."""
+        return await self._memoized(self._ranges, trading_range_id, fetch)
+
+    async def volume_analysis(
+        self,
+        symbol: str,
+        bar_timestamp: Any,
+        forex_session: str | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Volume analysis of a symbol's bar, shared by all patterns on that bar."""
+        return await self._memoized(self._volume, (symbol, bar_timestamp, forex_session), fetch)
+
+    def begin_cycle(self) -> None:
+        """Start a new scan cycle: drop every entry."""
+        self._portfolio.clear()
+        self._market.clear()
+        self._ranges.clear()
+        self._volume.clear()
+
+    def invalidate_portfolio(self) -> None:
+        """Drop the portfolio context (call after fills change positions or heat)."""
+        self._portfolio.clear()
+
+    def invalidate_symbol(self, symbol: str) -> None:
+        """Drop market context and volume analysis of a symbol (new bar arrived)."""
+        for store in (self._market, self._volume):
+            for key in [key for key in store if key[0] == symbol]:
+                del store[key]
+
+    @staticmethod
+    async def _memoized(
+        store: dict[Any, asyncio.Task[Any]], key: Any, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        task = store.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = store[key] = asyncio.ensure_future(fetch())
+        try:
+            # Shielded: a cancelled pattern must not cancel a fetch other patterns await
+            return await asyncio.shield(task)
+        except Exception:
+            if store.get(key) is task:
+                del store[key]
+            raise
+
+
+# ============================================================================
+# Historical Replay State
+# ============================================================================
+
+
+class ReplayState:
+    """
+    Per-symbol state reused across the bars of a historical replay.
+
+    Lookups that do not depend on the bar being replayed are fetched once;
+    lookups keyed by pattern timestamp or range ID are memoized, and
+    as-of lookups (phase, market and portfolio context) are memoized per bar
+    date, so every bar only pays for detection and validation.
+
+    Attributes:
+        symbol: Ticker symbol being replayed
+        timeframe: Bar interval
+        asset_class: STOCK/FOREX/CRYPTO
+        trading_ranges: All known ranges for the symbol (filtered per bar)
+        seen_patterns: (pattern_type, bar_timestamp) of patterns already processed
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        asset_class: Literal["STOCK", "FOREX", "CRYPTO"],
+        trading_ranges: list[Any],
+    ):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.asset_class = asset_class
+        self.trading_ranges = trading_ranges
+        self.seen_patterns: set[tuple[Any, Any]] = set()
+        self.volume_analysis: dict[tuple[Any, str | None], Any] = {}
+        self.ranges_by_id: dict[UUID, Any] = {}
+        self.phase_info: dict[date, Any] = {}
+        self.market_context: dict[tuple[str | None, date], Any] = {}
+        self.portfolio_context: dict[date, Any] = {}
+
+    @staticmethod
+    def range_known_by(trading_range: Any, timestamp: datetime) -> bool:
+        """
+        Whether a stored range's state was known at ``timestamp``.
+
+        A stored range reflects every bar through its end_timestamp, so it is
+        only visible once that bar has been replayed. An open range (no end
+        timestamp) carries the levels of its last update, so it is visible
+        from updated_at; without either it is excluded, since its start says
+        nothing about when its current Creek/Ice/quality were known.
+        """
+        if trading_range is None:
+            return False
+        known_at = getattr(trading_range, "end_timestamp", None) or getattr(
+            trading_range, "updated_at", None
+        )
+        return known_at is not None and known_at <= timestamp
+
+    def ranges_as_of(self, timestamp: datetime) -> list[Any]:
+        """Trading ranges as known at ``timestamp`` (point-in-time view)."""
+        return [
+            trading_range
+            for trading_range in self.trading_ranges
+            if self.range_known_by(trading_range, timestamp)
+        ]
+
+    def is_new_pattern(self, pattern: Any) -> bool:
+        """
+        Record a pattern and report whether it was seen on an earlier bar.
+
+        Detectors see an overlapping window on consecutive bars, so the same
+        pattern is re-detected until it scrolls out of the window.
+        """
+        key = (pattern.get("pattern_type"), pattern.get("bar_timestamp") or pattern.get("id"))
+        if key in self.seen_patterns:
+            return False
+        self.seen_patterns.add(key)
+        return True
+
+
 # ============================================================================
 # MasterOrchestrator
 # ============================================================================
@@ -244,6 +414,7 @@ class MasterOrchestrator:
         rejection_repository: Any = None,  # Stub for now
         signal_priority_queue: SignalPriorityQueue | None = None,  # NEW: Story 9.3
         websocket_manager: Any = None,  # NEW: Story 10.9 - WebSocket event emissions
+        event_bus: Any = None,  # Orchestrator EventBus: position changes drop portfolio context
         performance_tracker: PerformanceTracker | None = None,
         max_concurrent_symbols: int | None = None,
         cache_ttl_seconds: int | None = None,
@@ -268,6 +439,7 @@ class MasterOrchestrator:
             signal_repository: Persist signals
             rejection_repository: Log rejections
             signal_priority_queue: Priority queue for signal ranking (Story 9.3)
+            event_bus: EventBus publishing position_changed events on fills
             performance_tracker: Track latency
             max_concurrent_symbols: Parallel processing limit (from OrchestratorConfig if None)
             cache_ttl_seconds: Cache expiration time (from OrchestratorConfig if None)
@@ -318,6 +490,8 @@ class MasterOrchestrator:
         # Caching
         self._range_cache: dict[str, tuple[Any, float]] = {}  # {symbol: (range, timestamp)}
         self._phase_cache: dict[str, tuple[Any, float]] = {}  # {symbol: (phase, timestamp)}
+        self._context_cache = ValidationContextCache()
+        self._watchlist_scans = 0  # analyze_watchlist calls in progress
 
         # System state
         self._system_halted: bool = False
@@ -325,6 +499,9 @@ class MasterOrchestrator:
 
         self.logger = structlog.get_logger(__name__)
 
+        if event_bus is not None:
+            event_bus.subscribe("position_changed", self._on_position_changed)
+
     # ========================================================================
     # Core Orchestration Methods
     # ========================================================================
@@ -351,6 +528,10 @@ class MasterOrchestrator:
         """
         correlation_id = correlation_id or str(uuid4())
 
+        # A standalone call is its own scan cycle; watchlist scans share one
+        if not self._watchlist_scans:
+            self._context_cache.begin_cycle()
+
         self.logger.info(
             "analyze_symbol_start",
             symbol=symbol,
@@ -565,27 +746,43 @@ class MasterOrchestrator:
             if asset_class == "FOREX":
                 forex_session = self._get_forex_session()
 
-            # Fetch volume analysis (REQUIRED)
+            # Independent fetches run concurrently. Portfolio/market context and
+            # trading ranges are shared per scan cycle, volume analysis per bar.
             # CRITICAL: Pass forex_session for session-aware volume baselines (Victoria requirement)
-            volume_analysis = await self._fetch_volume_analysis(symbol, pattern, forex_session)
+            cache = self._context_cache
+            trading_range_id = pattern.get("trading_range_id")
+            (
+                volume_analysis,
+                phase_info,
+                trading_range,
+                portfolio_context,
+                market_context,
+            ) = await asyncio.gather(
+                cache.volume_analysis(
+                    symbol,
+                    pattern.get("bar_timestamp"),
+                    forex_session,
+                    lambda: self._fetch_volume_analysis(symbol, pattern, forex_session),
+                ),
+                self._fetch_phase_info(symbol, timeframe),
+                cache.trading_range(
+                    trading_range_id, lambda: self._fetch_trading_range(trading_range_id)
+                ),
+                cache.portfolio_context(self._fetch_portfolio_context),
+                cache.market_context(
+                    symbol,
+                    forex_session,
+                    lambda: self._build_market_context(symbol, asset_class, forex_session),
+                ),
+            )
+
+            # Volume analysis is REQUIRED
             if not volume_analysis:
                 self.logger.error(
                     "volume_analysis_missing", symbol=symbol, pattern_id=str(pattern.get("id"))
                 )
                 return None
 
-            # Fetch phase info (optional)
-            phase_info = await self._fetch_phase_info(symbol, timeframe)
-
-            # Fetch trading range (optional)
-            trading_range = await self._fetch_trading_range(pattern.get("trading_range_id"))
-
-            # Fetch portfolio context (optional)
-            portfolio_context = await self._fetch_portfolio_context()
-
-            # Build market context (asset-class-aware)
-            market_context = await self._build_market_context(symbol, asset_class, forex_session)
-
             # Build context
             context = ValidationContext(
                 pattern=pattern,
@@ -865,8 +1062,14 @@ class MasterOrchestrator:
             async with semaphore:
                 return await self.analyze_symbol(symbol, timeframe)
 
-        tasks = [analyze_with_limit(sym) for sym in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # One scan cycle: portfolio and market context are shared by all symbols
+        self._context_cache.begin_cycle()
+        self._watchlist_scans += 1
+        try:
+            tasks = [analyze_with_limit(sym) for sym in symbols]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._watchlist_scans -= 1
 
         # Build result dict (exclude failed symbols)
         result_dict = {}
@@ -925,15 +1128,25 @@ class MasterOrchestrator:
         timeframe: str,
         start_date: datetime,
         end_date: datetime,
+        lookback_bars: int = 100,
     ) -> BacktestResult:
         """
         Analyze historical period for backtesting (AC: 4).
 
+        Bars are fetched once and replayed from memory: at each bar the
+        detectors see only the trailing ``lookback_bars`` bars up to and
+        including it, the trading ranges that had started by then, and the
+        forex session of the bar's timestamp. Per-symbol lookups are kept in
+        a ReplayState between bars, and each pattern is validated once, on
+        the first bar it is detected. Phase, market and portfolio context
+        are requested as of the bar, never the live values.
+
         Args:
             symbol: Ticker symbol
             timeframe: Bar interval
             start_date: Start of period (UTC)
             end_date: End of period (UTC)
+            lookback_bars: Bars visible to detectors (matches analyze_symbol)
 
         Returns:
             BacktestResult with signals, rejections, metrics
@@ -942,6 +1155,9 @@ class MasterOrchestrator:
         signals: list[TradeSignal] = []
         rejections: list[RejectedSignal] = []
         latencies: list[float] = []
+        patterns_detected = 0
+        tracker = PerformanceTracker()
+        correlation_id = str(uuid4())
 
         self.logger.info(
             "backtest_start",
@@ -951,23 +1167,51 @@ class MasterOrchestrator:
             end_date=end_date.isoformat(),
         )
 
-        # Fetch historical bars
+        # Fetch historical bars and bar-independent context once
         bars = await self._fetch_historical_bars(symbol, timeframe, start_date, end_date)
+        state = ReplayState(
+            symbol=symbol,
+            timeframe=timeframe,
+            asset_class=self._detect_asset_class(symbol),
+            trading_ranges=await self._get_trading_ranges(symbol) if bars else [],
+        )
 
-        # Process each bar
-        for bar in bars:
-            bar_start = time.time()
+        # Replay each bar point-in-time
+        for index, bar in enumerate(bars):
+            bar_timer = tracker.start_timer("bar")
 
-            # Analyze symbol at this point in time
-            bar_signals = await self.analyze_symbol(symbol, timeframe)
+            detect_timer = tracker.start_timer("pattern_detection")
+            window = bars[max(0, index + 1 - lookback_bars) : index + 1]
+            detected_patterns = await self._run_pattern_detection(
+                window, state.ranges_as_of(bar.timestamp), correlation_id
+            )
+            tracker.end_timer(detect_timer)
 
-            for signal in bar_signals:
-                if isinstance(signal, TradeSignal):
-                    signals.append(signal)
-                elif isinstance(signal, RejectedSignal):
-                    rejections.append(signal)
+            for pattern in detected_patterns:
+                if not state.is_new_pattern(pattern):
+                    continue
+                patterns_detected += 1
 
-            latencies.append((time.time() - bar_start) * 1000)
+                try:
+                    result = await self._replay_pattern(
+                        pattern, state, bar.timestamp, tracker, correlation_id
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        "pattern_processing_error",
+                        pattern_id=str(pattern.get("id", "unknown")),
+                        error=str(e),
+                        correlation_id=correlation_id,
+                        exc_info=True,
+                    )
+                    continue
+
+                if isinstance(result, TradeSignal):
+                    signals.append(result)
+                elif isinstance(result, RejectedSignal):
+                    rejections.append(result)
+
+            latencies.append(tracker.end_timer(bar_timer))
 
         # Calculate metrics
         rejection_by_stage: dict[str, int] = defaultdict(int)
@@ -976,7 +1220,7 @@ class MasterOrchestrator:
 
         sorted_latencies = sorted(latencies) if latencies else [0.0]
         metrics = BacktestMetrics(
-            total_patterns_detected=len(signals) + len(rejections),
+            total_patterns_detected=patterns_detected,
             total_signals_generated=len(signals),
             total_signals_rejected=len(rejections),
             rejection_by_stage=dict(rejection_by_stage),
@@ -987,6 +1231,7 @@ class MasterOrchestrator:
             p99_latency_ms=sorted_latencies[int(len(sorted_latencies) * 0.99)]
             if len(sorted_latencies) > 100
             else sorted_latencies[-1],
+            stage_latency_ms=tracker.get_metrics(),
         )
 
         processing_time = time.time() - start_time
@@ -994,6 +1239,8 @@ class MasterOrchestrator:
         self.logger.info(
             "backtest_complete",
             symbol=symbol,
+            bars_replayed=len(bars),
+            patterns_detected=patterns_detected,
             signals_generated=len(signals),
             signals_rejected=len(rejections),
             processing_time_seconds=processing_time,
@@ -1006,6 +1253,120 @@ class MasterOrchestrator:
             processing_time_seconds=processing_time,
         )
 
+    async def _replay_pattern(
+        self,
+        pattern: Any,
+        state: ReplayState,
+        as_of: datetime,
+        tracker: PerformanceTracker,
+        correlation_id: str,
+    ) -> TradeSignal | RejectedSignal | None:
+        """
+        Validate a pattern detected during a historical replay.
+
+        Same pipeline as _process_pattern, but the validation context is built
+        from the replay state as of the bar being replayed.
+
+        Args:
+            pattern: Detected pattern
+            state: Per-symbol replay state
+            as_of: Timestamp of the bar being replayed
+            tracker: Replay performance tracker (per-stage latency)
+            correlation_id: Request correlation ID
+
+        Returns:
+            TradeSignal, RejectedSignal, or None if context could not be built
+        """
+        context_timer = tracker.start_timer("build_context")
+        context = await self._build_replay_context(pattern, state, as_of)
+        tracker.end_timer(context_timer)
+        if context is None:
+            self.logger.warning(
+                "validation_context_build_failed",
+                pattern_id=str(pattern.get("id", "unknown")),
+                symbol=state.symbol,
+                correlation_id=correlation_id,
+            )
+            return None
+
+        validation_timer = tracker.start_timer("validation_chain")
+        validation_chain = await self.run_validation_chain(pattern, context, correlation_id)
+        tracker.end_timer(validation_timer)
+
+        signal_timer = tracker.start_timer("signal_generation")
+        signal = await self.generate_signal_from_pattern(pattern, validation_chain, context)
+        tracker.end_timer(signal_timer)
+
+        return signal
+
+    async def _build_replay_context(
+        self, pattern: Any, state: ReplayState, as_of: datetime
+    ) -> ValidationContext | None:
+        """
+        Build ValidationContext point-in-time from replay state.
+
+        Mirrors build_validation_context, with the forex session taken from
+        ``as_of`` instead of the wall clock, ranges, phase, market and
+        portfolio context filtered or requested as of that bar, and service
+        lookups memoized in the replay state.
+
+        Args:
+            pattern: Detected pattern
+            state: Per-symbol replay state
+            as_of: Timestamp of the bar being replayed
+
+        Returns:
+            ValidationContext, or None if volume analysis is missing
+        """
+        forex_session = None
+        if state.asset_class == "FOREX":
+            forex_session = self._get_forex_session(as_of)
+
+        volume_key = (pattern.get("bar_timestamp"), forex_session)
+        if volume_key not in state.volume_analysis:
+            state.volume_analysis[volume_key] = await self._fetch_volume_analysis(
+                state.symbol, pattern, forex_session
+            )
+        volume_analysis = state.volume_analysis[volume_key]
+        if not volume_analysis:
+            self.logger.error(
+                "volume_analysis_missing", symbol=state.symbol, pattern_id=str(pattern.get("id"))
+            )
+            return None
+
+        trading_range_id = pattern.get("trading_range_id")
+        if trading_range_id not in state.ranges_by_id:
+            state.ranges_by_id[trading_range_id] = await self._fetch_trading_range(trading_range_id)
+        trading_range = state.ranges_by_id[trading_range_id]
+        if not state.range_known_by(trading_range, as_of):
+            trading_range = None
+
+        as_of_date = as_of.date()
+        if as_of_date not in state.phase_info:
+            state.phase_info[as_of_date] = await self._fetch_phase_info(
+                state.symbol, state.timeframe, as_of=as_of
+            )
+        market_key = (forex_session, as_of_date)
+        if market_key not in state.market_context:
+            state.market_context[market_key] = await self._build_market_context(
+                state.symbol, state.asset_class, forex_session, as_of=as_of
+            )
+        if as_of_date not in state.portfolio_context:
+            state.portfolio_context[as_of_date] = await self._fetch_portfolio_context(as_of=as_of)
+
+        return ValidationContext(
+            pattern=pattern,
+            symbol=state.symbol,
+            timeframe=state.timeframe,
+            volume_analysis=volume_analysis,
+            asset_class=state.asset_class,
+            forex_session=forex_session,
+            phase_info=state.phase_info[as_of_date],
+            trading_range=trading_range,
+            portfolio_context=state.portfolio_context[as_of_date],
+            market_context=state.market_context[market_key],
+        )
+
     # ========================================================================
     # Emergency Exit Integration
     # ========================================================================
@@ -1410,8 +1771,10 @@ class MasterOrchestrator:
             )
             return None
 
-    async def _fetch_phase_info(self, symbol: str, timeframe: str) -> Any:
-        """Fetch phase classification."""
+    async def _fetch_phase_info(
+        self, symbol: str, timeframe: str, as_of: datetime | None = None
+    ) -> Any:
+        """Fetch phase classification (as of a replayed bar when ``as_of`` is set)."""
         # Stub
         return None
 
@@ -1444,9 +1807,9 @@ class MasterOrchestrator:
             )
             return None
 
-    async def _fetch_portfolio_context(self) -> Any:
+    async def _fetch_portfolio_context(self, as_of: datetime | None = None) -> Any:
         """
-        Fetch current portfolio state.
+        Fetch current portfolio state, or the state at ``as_of`` for replays.
 
         Returns PortfolioContext with:
         - total_equity
@@ -1457,6 +1820,10 @@ class MasterOrchestrator:
         - total_forex_notional (NEW: Story 8.6.1 - Rachel requirement)
         - max_forex_notional (3x equity limit)
 
+        Args:
+            as_of: Point in time for historical replays (passed to the service);
+                the live portfolio is never used for a replayed bar
+
         Returns:
             PortfolioContext or None on error
         """
@@ -1474,6 +1841,8 @@ class MasterOrchestrator:
                     "max_forex_notional": Decimal("0"),
                 }
 
+            if as_of is not None:
+                return await self.portfolio_service.get_current_context(as_of=as_of)
             portfolio = await self.portfolio_service.get_current_context()
             return portfolio
         except Exception as e:
@@ -1494,6 +1863,7 @@ class MasterOrchestrator:
         symbol: str,
         asset_class: Literal["STOCK", "FOREX", "CRYPTO"],
         forex_session: str | None = None,
+        as_of: datetime | None = None,
     ) -> Any:
         """
         Build asset-class-aware market context.
@@ -1505,6 +1875,7 @@ class MasterOrchestrator:
             symbol: Ticker symbol
             asset_class: STOCK/FOREX/CRYPTO
             forex_session: ASIAN/LONDON/NY/OVERLAP (forex only)
+            as_of: Point in time for historical replays (passed to the builder)
 
         Returns:
             MarketContext with asset-class-specific data
@@ -1520,6 +1891,13 @@ class MasterOrchestrator:
                     "market_regime": "UNKNOWN",
                 }
 
+            if as_of is not None:
+                return await self.market_context_builder.build(
+                    symbol=symbol,
+                    asset_class=asset_class,
+                    forex_session=forex_session,
+                    as_of=as_of,
+                )
             context = await self.market_context_builder.build(
                 symbol=symbol, asset_class=asset_class, forex_session=forex_session
             )
@@ -1582,10 +1960,24 @@ class MasterOrchestrator:
             )
             return []
 
+    def invalidate_portfolio_context(self) -> None:
+        """
+        Drop the cached portfolio context.
+
+        Call after fills (position opened, added to or closed) so the next
+        validation sees current equity and heat.
+        """
+        self._context_cache.invalidate_portfolio()
+
+    async def _on_position_changed(self, event: Any) -> None:
+        """EventBus handler: a fill opened or closed a position."""
+        self.invalidate_portfolio_context()
+
     def _invalidate_cache(self, symbol: str) -> None:
         """Invalidate cached data for symbol."""
         self._range_cache.pop(symbol, None)
         self._phase_cache.pop(symbol, None)
+        self._context_cache.invalidate_symbol(symbol)
 
     async def _emit_event(self, event_type: str, payload: dict) -> None:
         """Emit WebSocket event."""
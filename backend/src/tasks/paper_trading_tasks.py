@@ -4,19 +4,28 @@ Paper Trading Background Tasks (Story 12.8 Task 7)
 Background task for updating paper trading positions on every bar.
 Checks for stop/target hits and updates unrealized P&L.
 
+Each update is a batched mark-to-market: one quote per distinct symbol from
+a PriceSource (by default the live bar buffer fed by the market data feed),
+stop/target checks in Decimal across all positions, and a single bulk
+UPDATE for the positions that stay open.
+
 Author: Story 12.8
 """
 
 import asyncio
-from datetime import UTC
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Protocol
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.brokers.paper_broker_adapter import PaperBrokerAdapter
-from src.models.paper_trading import PaperTradingConfig
+from src.market_data.realtime.bar_buffer import get_live_bar_buffer
+from src.models.ohlcv import OHLCVBar
+from src.models.paper_trading import PaperPosition, PaperTradingConfig
 from src.repositories.paper_account_repository import PaperAccountRepository
 from src.repositories.paper_position_repository import PaperPositionRepository
 from src.repositories.paper_trade_repository import PaperTradeRepository
@@ -25,6 +34,139 @@ from src.trading.paper_trading_service import PaperTradingService
 logger = structlog.get_logger(__name__)
 
 
+class PriceSource(Protocol):
+    """Protocol for batched quote lookup."""
+
+    async def get_prices(self, symbols: Iterable[str]) -> dict[str, Decimal]:
+        """Get the latest price per symbol; symbols without a usable quote are omitted."""
+        ...
+
+
+class LatestBarSource(Protocol):
+    """Protocol for live bar buffers (BarBuffer, BarWindowManager, RealtimeClient)."""
+
+    def get_latest_bar(self, symbol: str) -> OHLCVBar | None:
+        """Get the most recent bar for a symbol."""
+        ...
+
+
+class BarBufferPriceSource:
+    """
+    PriceSource serving the close of the latest live bar.
+
+    Quotes come from in-memory bar buffers, so a lookup is a dictionary
+    access per symbol. Bars older than max_age are treated as unavailable.
+    """
+
+    def __init__(self, bar_source: LatestBarSource, max_age: timedelta = timedelta(minutes=5)):
+        """
+        Initialize price source.
+
+        Args:
+            bar_source: Live bar buffer to read latest bars from
+            max_age: Maximum age of the latest bar for its close to be used
+        """
+        self.bar_source = bar_source
+        self.max_age = max_age
+
+    async def get_prices(self, symbols: Iterable[str]) -> dict[str, Decimal]:
+        """Get the latest bar close per symbol, skipping missing or stale bars."""
+        cutoff = datetime.now(UTC) - self.max_age
+        prices: dict[str, Decimal] = {}
+        for symbol in symbols:
+            bar = self.bar_source.get_latest_bar(symbol)
+            if bar is not None and bar.timestamp >= cutoff:
+                prices[symbol] = bar.close
+        return prices
+
+
+class StaticPriceSource:
+    """
+    In-memory PriceSource for tests and local runs.
+
+    Records every lookup so callers can check how many quotes were requested.
+    """
+
+    def __init__(self, prices: Optional[dict[str, Decimal]] = None):
+        """
+        Initialize price source.
+
+        Args:
+            prices: Initial price per symbol
+        """
+        self.prices: dict[str, Decimal] = dict(prices or {})
+        self.lookups: list[list[str]] = []
+
+    def set_price(self, symbol: str, price: Decimal) -> None:
+        """Set the price returned for a symbol."""
+        self.prices[symbol] = price
+
+    async def get_prices(self, symbols: Iterable[str]) -> dict[str, Decimal]:
+        """Get the configured price for each known symbol."""
+        requested = list(symbols)
+        self.lookups.append(requested)
+        return {symbol: self.prices[symbol] for symbol in requested if symbol in self.prices}
+
+
+@dataclass
+class MarkToMarketResult:
+    """
+    Outcome of marking a batch of positions to market.
+
+    Attributes:
+        marked: Positions staying open, with current_price/unrealized_pnl updated
+        exits: (position, price, exit_reason) for positions whose stop or target was hit
+    """
+
+    marked: list[PaperPosition] = field(default_factory=list)
+    exits: list[tuple[PaperPosition, Decimal, str]] = field(default_factory=list)
+
+
+def mark_to_market(
+    positions: list[PaperPosition],
+    prices: dict[str, Decimal],
+    broker: PaperBrokerAdapter,
+    now: datetime,
+) -> MarkToMarketResult:
+    """
+    Mark positions to market and classify stop/target hits in one pass.
+
+    Stop and target checks go through PaperBrokerAdapter.check_stop_hit and
+    check_target_hit (stop, then TARGET_2, then TARGET_1), so prices are
+    compared as exact Decimals. Unrealized P&L stays in Decimal via the
+    broker.
+
+    Args:
+        positions: Open positions; every symbol must have a price
+        prices: Current price per symbol
+        broker: Paper broker used for P&L
+        now: Timestamp written to updated_at
+
+    Returns:
+        MarkToMarketResult with positions to update and positions to close
+    """
+    result = MarkToMarketResult()
+    if not positions:
+        return result
+
+    for position in positions:
+        current_price = prices[position.symbol]
+        if broker.check_stop_hit(position, current_price):
+            exit_reason: str | None = "STOP_LOSS"
+        else:
+            exit_reason = broker.check_target_hit(position, current_price)
+        if exit_reason:
+            result.exits.append((position, current_price, exit_reason))
+            continue
+
+        position.current_price = current_price
+        position.unrealized_pnl = broker.calculate_unrealized_pnl(position, current_price)
+        position.updated_at = now
+        result.marked.append(position)
+
+    return result
+
+
 class PaperTradingTask:
     """
     Background task for paper trading position updates.
@@ -33,14 +175,19 @@ class PaperTradingTask:
     check for stop/target hits, and auto-close positions.
     """
 
-    def __init__(self, db_session_factory):
+    def __init__(self, db_session_factory, price_source: Optional[PriceSource] = None):
         """
         Initialize paper trading task.
 
         Args:
             db_session_factory: Factory function to create database sessions
+            price_source: Quote source for mark-to-market (default: latest bars
+                from the live market data feed)
         """
         self.db_session_factory = db_session_factory
+        self.price_source: Optional[PriceSource] = price_source or BarBufferPriceSource(
+            get_live_bar_buffer()
+        )
         self.is_running = False
         self.update_interval = 60  # Update every 60 seconds (on bar close)
         logger.info("paper_trading_task_initialized", update_interval=self.update_interval)
@@ -90,8 +237,9 @@ class PaperTradingTask:
         """
         Update all open paper trading positions.
 
-        Fetches current market prices, updates unrealized P&L,
-        and checks for stop/target hits.
+        Fetches one price per distinct symbol, checks stop/target hits across
+        all positions at once, closes hit positions and writes the marks of the
+        rest in a single bulk UPDATE.
         """
         async with self.db_session_factory() as session:
             try:
@@ -113,22 +261,27 @@ class PaperTradingTask:
 
                 logger.debug("updating_paper_positions", count=len(positions))
 
-                # Update each position
-                for position in positions:
-                    try:
-                        # Fetch current market price
-                        current_price = await self._fetch_current_price(position.symbol)
+                # One quote per distinct symbol
+                prices = await self._fetch_current_prices({p.symbol for p in positions})
+                priced = [p for p in positions if p.symbol in prices]
 
-                        if current_price is None:
-                            logger.warning(
-                                "failed_to_fetch_price_skipping_position",
-                                position_id=str(position.id),
-                                symbol=position.symbol,
-                            )
-                            continue
+                if len(priced) < len(positions):
+                    logger.warning(
+                        "failed_to_fetch_price_skipping_positions",
+                        skipped=len(positions) - len(priced),
+                        symbols=sorted({p.symbol for p in positions} - prices.keys()),
+                    )
+
+                if not priced:
+                    return
+
+                result = mark_to_market(priced, prices, service.broker, datetime.now(UTC))
 
-                        # Check if stop hit
-                        if service.broker.check_stop_hit(position, current_price):
+                # Closes first: each one commits, so a failed mark write below
+                # can never hold back a stop-loss or target exit
+                for position, current_price, exit_reason in result.exits:
+                    try:
+                        if exit_reason == "STOP_LOSS":
                             logger.info(
                                 "paper_stop_hit_auto_closing",
                                 position_id=str(position.id),
@@ -136,53 +289,37 @@ class PaperTradingTask:
                                 current_price=float(current_price),
                                 stop_loss=float(position.stop_loss),
                             )
-                            await service._close_position(
-                                position, current_price, "STOP_LOSS", account
-                            )
-                            continue
-
-                        # Check if target hit
-                        target_hit = service.broker.check_target_hit(position, current_price)
-                        if target_hit:
+                        else:
                             logger.info(
                                 "paper_target_hit_auto_closing",
                                 position_id=str(position.id),
                                 symbol=position.symbol,
                                 current_price=float(current_price),
-                                target_hit=target_hit,
+                                target_hit=exit_reason,
                             )
-                            await service._close_position(
-                                position, current_price, target_hit, account
-                            )
-                            continue
-
-                        # Update unrealized P&L
-                        from datetime import datetime
-
-                        position.current_price = current_price
-                        position.unrealized_pnl = service.broker.calculate_unrealized_pnl(
-                            position, current_price
-                        )
-                        position.updated_at = datetime.now(UTC)
-                        await service.position_repo.update_position(position)
-
-                        logger.debug(
-                            "position_updated",
-                            position_id=str(position.id),
-                            symbol=position.symbol,
-                            current_price=float(current_price),
-                            unrealized_pnl=float(position.unrealized_pnl),
-                        )
+                        await service._close_position(position, current_price, exit_reason, account)
 
                     except Exception as e:
                         logger.error(
-                            "failed_to_update_position",
+                            "failed_to_close_position",
                             position_id=str(position.id),
                             symbol=position.symbol,
                             error=str(e),
                             error_type=type(e).__name__,
                         )
-                        continue
+
+                # Single bulk UPDATE for every position that stays open
+                try:
+                    await service.position_repo.bulk_update_marks(result.marked)
+                except Exception as e:
+                    # Marks are rewritten next cycle; the closes are already committed
+                    await session.rollback()
+                    logger.error(
+                        "failed_to_write_position_marks",
+                        positions=len(result.marked),
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
 
                 # Update account metrics after all position updates
                 await service._update_account_metrics(account)
@@ -191,7 +328,8 @@ class PaperTradingTask:
 
                 logger.info(
                     "paper_positions_updated_successfully",
-                    positions_updated=len(positions),
+                    positions_updated=len(result.marked),
+                    positions_closed=len(result.exits),
                     total_unrealized_pnl=float(account.total_unrealized_pnl),
                 )
 
@@ -233,50 +371,40 @@ class PaperTradingTask:
 
         return service
 
-    async def _fetch_current_price(self, symbol: str) -> Optional[Decimal]:
+    async def _fetch_current_prices(self, symbols: set[str]) -> dict[str, Decimal]:
         """
-        Fetch current market price for a symbol.
+        Fetch current market prices for a set of symbols in one lookup.
 
         Args:
-            symbol: Trading symbol
+            symbols: Distinct trading symbols
 
         Returns:
-            Current price or None if unavailable
-
-        TODO: Integrate with MarketDataService to get real-time prices
+            Price per symbol; symbols without a fresh quote are omitted
         """
-        # Placeholder implementation
-        # In production, this should fetch from MarketDataService or Alpaca adapter
-
-        logger.debug("fetching_current_price_placeholder", symbol=symbol)
+        if self.price_source is None:
+            logger.debug("no_price_source_configured", symbols=len(symbols))
+            return {}
 
-        # For now, return None to skip position updates
-        # This will be replaced with actual market data integration
-        return None
-
-        # Example integration (when MarketDataService is available):
-        # try:
-        #     from src.market_data.service import MarketDataCoordinator
-        #     coordinator = MarketDataCoordinator()
-        #     bar = await coordinator.get_latest_bar(symbol)
-        #     if bar:
-        #         return Decimal(str(bar.close))
-        #     return None
-        # except Exception as e:
-        #     logger.error("failed_to_fetch_market_price", symbol=symbol, error=str(e))
-        #     return None
+        try:
+            return await self.price_source.get_prices(symbols)
+        except Exception as e:
+            logger.error("failed_to_fetch_market_prices", symbols=len(symbols), error=str(e))
+            return {}
 
 
 # Global task instance
 _paper_trading_task: Optional[PaperTradingTask] = None
 
 
-async def start_paper_trading_task(db_session_factory) -> None:
+async def start_paper_trading_task(
+    db_session_factory, price_source: Optional[PriceSource] = None
+) -> None:
     """
     Start the global paper trading background task.
 
     Args:
         db_session_factory: Factory function to create database sessions
+        price_source: Quote source for mark-to-market (default: live bar buffer)
     """
     global _paper_trading_task
 
@@ -284,7 +412,7 @@ async def start_paper_trading_task(db_session_factory) -> None:
         logger.warning("paper_trading_task_already_started")
         return
 
-    _paper_trading_task = PaperTradingTask(db_session_factory)
+    _paper_trading_task = PaperTradingTask(db_session_factory, price_source)
     await _paper_trading_task.start()
 
 
@@ -9,7 +9,7 @@ Author: Story 12.8
 
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Literal, Optional
 
 import structlog
 
@@ -143,6 +143,8 @@ class PaperTradingService:
             new_heat=float(account.current_heat),
         )
 
+        await self._publish_position_change(saved_position, "OPENED")
+
         return saved_position
 
     async def update_positions(self) -> int:
@@ -466,6 +468,33 @@ class PaperTradingService:
         # Recalculate metrics
         await self._update_account_metrics(account)
 
+        await self._publish_position_change(position, "CLOSED")
+
+    async def _publish_position_change(
+        self, position: PaperPosition, change: Literal["OPENED", "CLOSED"]
+    ) -> None:
+        """Publish a position change so cached portfolio context is dropped."""
+        from src.orchestrator.event_bus import get_event_bus
+        from src.orchestrator.events import PositionChangedEvent
+
+        try:
+            await get_event_bus().publish(
+                PositionChangedEvent(
+                    correlation_id=position.signal_id,
+                    symbol=position.symbol,
+                    position_id=position.id,
+                    change=change,
+                )
+            )
+        except Exception as e:
+            # The fill is already persisted; a failed notification must not undo it
+            logger.warning(
+                "position_change_publish_failed",
+                position_id=str(position.id),
+                change=change,
+                error=str(e),
+            )
+
     async def _update_account_metrics(self, account: PaperAccount) -> None:
         """Recalculate and update account performance metrics."""
         # Calculate win rate
@@ -655,4 +684,7 @@ class PaperTradingService:
         # Single commit for everything
         await session.commit()
 
+        for position in positions:
+            await self._publish_position_change(position, "CLOSED")
+
         return closed_count
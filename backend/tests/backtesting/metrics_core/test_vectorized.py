@@ -0,0 +1,177 @@
+"""
+Unit tests for VectorizedMetricsCalculator.
+
+Tests:
+- Parity with MetricsFacade and the Decimal calculators (within FACADE_TOLERANCE)
+- Drawdown periods and monthly returns match DrawdownCalculator / ReturnCalculator
+- Edge cases (short curves, flat curves, open drawdown)
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.backtesting.metrics_core import (
+    FACADE_TOLERANCE,
+    DrawdownCalculator,
+    EquityPoint,
+    MetricsFacade,
+    ReturnCalculator,
+    RiskCalculator,
+    VectorizedMetricsCalculator,
+    equity_arrays,
+)
+from src.models.backtest import EquityCurvePoint
+
+
+def _equity_curve(count: int, seed: int) -> list[EquityCurvePoint]:
+    rng = random.Random(seed)
+    start = datetime(2022, 1, 3, tzinfo=UTC)
+    value = Decimal("100000")
+    curve = []
+    for i in range(count):
+        value = (value * Decimal(str(1 + rng.gauss(0.0004, 0.01)))).quantize(Decimal("0.01"))
+        curve.append(
+            EquityCurvePoint(
+                timestamp=start + timedelta(hours=8 * i),
+                equity_value=value,
+                portfolio_value=value,
+                cash=value,
+                positions_value=Decimal("0"),
+            )
+        )
+    return curve
+
+
+def _points(curve: list[EquityCurvePoint]) -> list[EquityPoint]:
+    return [EquityPoint(timestamp=p.timestamp, value=p.portfolio_value) for p in curve]
+
+
+@pytest.fixture
+def calculator():
+    return VectorizedMetricsCalculator()
+
+
+@pytest.fixture
+def curve():
+    return _equity_curve(2000, seed=17)
+
+
+def _assert_close(name: str, actual: Decimal, expected: Decimal) -> None:
+    assert abs(actual - expected) <= FACADE_TOLERANCE[name], name
+
+
+class TestFacadeParity:
+    def test_backtest_metrics_match_facade(self, calculator, curve):
+        expected = MetricsFacade(vectorized=False).calculate_metrics(curve, [], Decimal("100000"))
+        actual = calculator.calculate_metrics(curve, [], Decimal("100000"))
+
+        for name in ("total_return_pct", "cagr", "sharpe_ratio", "max_drawdown"):
+            _assert_close(name, getattr(actual, name), getattr(expected, name))
+        assert actual.max_drawdown_duration_days == expected.max_drawdown_duration_days
+
+    def test_facade_routes_through_vectorized_path(self, curve):
+        vectorized = MetricsFacade()
+        decimal = MetricsFacade(vectorized=False)
+
+        actual = vectorized.calculate_metrics(curve, [], Decimal("100000"))
+        expected = decimal.calculate_metrics(curve, [], Decimal("100000"))
+
+        for name in ("total_return_pct", "cagr", "sharpe_ratio", "max_drawdown"):
+            _assert_close(name, getattr(actual, name), getattr(expected, name))
+        _assert_close(
+            "sortino_ratio",
+            vectorized.calculate_sortino_ratio(curve),
+            decimal.calculate_sortino_ratio(curve),
+        )
+        assert (
+            vectorized.calculate_max_drawdown(curve)[1] == decimal.calculate_max_drawdown(curve)[1]
+        )
+
+    def test_engine_metrics_match_decimal_calculators(self, curve):
+        from src.backtesting.engine.backtest_engine import UnifiedBacktestEngine
+        from src.backtesting.engine.interfaces import EngineConfig
+        from src.backtesting.position_manager import PositionManager
+
+        config = EngineConfig(initial_capital=Decimal("100000"))
+        engine = UnifiedBacktestEngine(
+            signal_detector=None,
+            cost_model=None,
+            position_manager=PositionManager(initial_capital=config.initial_capital),
+            config=config,
+        )
+        engine._equity_curve = curve
+        expected = MetricsFacade(vectorized=False).calculate_metrics(curve, [], Decimal("100000"))
+
+        metrics = engine._equity_curve_metrics()
+
+        _assert_close("sharpe_ratio", metrics.sharpe_ratio, expected.sharpe_ratio)
+        _assert_close("max_drawdown", engine._calculate_max_drawdown(), expected.max_drawdown)
+
+    def test_sortino_matches_risk_calculator(self, calculator, curve):
+        risk = RiskCalculator()
+        expected = risk.calculate_sortino_ratio(risk.calculate_returns_from_equity(_points(curve)))
+
+        actual = calculator.calculate_equity_metrics(*equity_arrays(curve))
+
+        _assert_close("sortino_ratio", actual.sortino_ratio, expected.value)
+
+    def test_drawdown_periods_match(self, calculator, curve):
+        expected = DrawdownCalculator().find_drawdown_periods(_points(curve))
+
+        actual = calculator.calculate_equity_metrics(*equity_arrays(curve)).drawdown_periods
+
+        assert len(actual) == len(expected)
+        for a, e in zip(actual, expected, strict=True):
+            assert (a.peak_date, a.trough_date, a.recovery_date) == (
+                e.peak_date,
+                e.trough_date,
+                e.recovery_date,
+            )
+            assert (a.duration_days, a.recovery_days) == (e.duration_days, e.recovery_days)
+            assert a.trough_value == e.trough_value
+            _assert_close("max_drawdown", a.drawdown_pct, e.drawdown_pct)
+
+    def test_monthly_returns_match(self, calculator, curve):
+        expected = ReturnCalculator().calculate_monthly_returns(_points(curve))
+
+        actual = calculator.calculate_equity_metrics(*equity_arrays(curve)).monthly_returns
+
+        assert [(m.year, m.month, m.month_label) for m in actual] == [
+            (m.year, m.month, m.month_label) for m in expected
+        ]
+        for a, e in zip(actual, expected, strict=True):
+            _assert_close("total_return_pct", a.return_pct, e.return_pct)
+            assert a.end_value == e.end_value
+
+
+class TestEdgeCases:
+    def test_single_point(self, calculator):
+        metrics = calculator.calculate_equity_metrics(*equity_arrays(_equity_curve(1, seed=1)))
+
+        assert metrics.sharpe_ratio == Decimal("0")
+        assert metrics.drawdown_periods == []
+
+    def test_rising_curve_has_no_drawdown(self, calculator):
+        timestamps = [datetime(2024, 1, 1, tzinfo=UTC) + timedelta(days=i) for i in range(10)]
+        points = [EquityPoint(ts, Decimal(100 + i)) for i, ts in enumerate(timestamps)]
+
+        metrics = calculator.calculate_equity_metrics(*equity_arrays(points))
+
+        assert metrics.max_drawdown == Decimal("0")
+        assert metrics.max_drawdown_duration_days == 0
+        assert metrics.sortino_ratio == Decimal("999.9999")
+
+    def test_open_drawdown_has_no_recovery(self, calculator):
+        timestamps = [datetime(2024, 3, 1, tzinfo=UTC) + timedelta(days=i) for i in range(4)]
+        values = ["100", "120", "90", "95"]
+        points = [EquityPoint(ts, Decimal(v)) for ts, v in zip(timestamps, values, strict=True)]
+
+        (period,) = calculator.calculate_equity_metrics(*equity_arrays(points)).drawdown_periods
+
+        assert period.peak_value == Decimal("120.0")
+        assert period.trough_date == timestamps[2]
+        assert period.recovery_date is None
+        assert period.drawdown_pct == Decimal("0.250000")
@@ -0,0 +1,197 @@
+"""
+Unit tests for the columnar completed-campaign archive.
+
+Tests cover:
+1. CompletedCampaignStore aggregates (add, replace, discard)
+2. Detector keeps open campaigns and correlation counts off completed history
+3. Campaign statistics served from the archive
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from src.backtesting.completed_campaign_store import CompletedCampaignStore
+from src.backtesting.intraday_campaign_detector import (
+    Campaign,
+    CampaignState,
+    ExitReason,
+    IntradayCampaignDetector,
+)
+from src.models.campaign import AssetCategory
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def store():
+    store = CompletedCampaignStore()
+    store.add("win-1", Decimal("2.5"), 10, "TARGET_HIT", "Spring→SOS", "C", "D")
+    store.add("win-2", Decimal("4.0"), 20, "TARGET_HIT", "Spring→AR→SOS", "C", "E")
+    store.add("loss-1", Decimal("-1.0"), 6, "STOP_OUT", "Spring→SOS", "C", "C")
+    store.add("no-r", None, 4, "TIME_EXIT", "Other", "UNKNOWN", "UNKNOWN")
+    return store
+
+
+@pytest.fixture
+def detector():
+    return IntradayCampaignDetector(max_concurrent_campaigns=10)
+
+
+def _completed(campaign_id: str, r_multiple: Decimal, **kwargs) -> Campaign:
+    return Campaign(
+        campaign_id=campaign_id,
+        state=CampaignState.COMPLETED,
+        r_multiple=r_multiple,
+        exit_reason=ExitReason.TARGET_HIT if r_multiple > 0 else ExitReason.STOP_OUT,
+        duration_bars=10,
+        **kwargs,
+    )
+
+
+# ============================================================================
+# CompletedCampaignStore
+# ============================================================================
+
+
+class TestCompletedCampaignStore:
+    def test_performance_stats(self, store):
+        performance = store.performance_stats()
+
+        assert len(store) == 4
+        assert performance["win_rate_pct"] == 50.0
+        assert performance["avg_r_multiple"] == pytest.approx(5.5 / 3)
+        assert performance["median_r_multiple"] == 2.5
+        assert performance["best_r_multiple"] == 4.0
+        assert performance["worst_r_multiple"] == -1.0
+        assert performance["total_r"] == pytest.approx(5.5)
+        assert performance["avg_duration_bars"] == 10
+        assert performance["profitable_campaigns"] == 2
+        assert performance["losing_campaigns"] == 1
+
+    def test_group_stats(self, store):
+        exit_reasons = store.exit_reason_stats()
+        sequences = store.pattern_sequence_stats()
+        phases = store.phase_stats()
+
+        assert exit_reasons["TARGET_HIT"] == {
+            "count": 2,
+            "win_rate_pct": 100.0,
+            "avg_r_multiple": 3.25,
+        }
+        assert exit_reasons["TIME_EXIT"]["avg_r_multiple"] == 0.0
+        assert list(sequences) == ["Spring→SOS", "Spring→AR→SOS", "Other"]
+        assert sequences["Spring→SOS"]["win_rate_pct"] == 50.0
+        assert sequences["Spring→SOS"]["best_r_multiple"] == 2.5
+        assert sequences["Other"]["best_r_multiple"] == 0.0
+        assert phases["entry_phase_distribution"] == {"C": 3, "UNKNOWN": 1}
+        assert phases["exit_phase_distribution"] == {"D": 1, "E": 1, "C": 1, "UNKNOWN": 1}
+
+    def test_discard_and_replace(self, store):
+        store.discard("win-2")
+        store.add("loss-1", Decimal("1.5"), 6, "TARGET_HIT", "Spring→SOS", "C", "D")
+
+        performance = store.performance_stats()
+        assert len(store) == 3
+        assert performance["best_r_multiple"] == 2.5
+        assert performance["losing_campaigns"] == 0
+        assert "STOP_OUT" not in store.exit_reason_stats()
+        assert "Spring→AR→SOS" not in store.pattern_sequence_stats()
+        assert store.phase_stats()["exit_phase_distribution"] == {"D": 2, "UNKNOWN": 1}
+
+    def test_empty_store(self):
+        store = CompletedCampaignStore()
+
+        assert store.performance_stats()["median_r_multiple"] == 0.0
+        assert store.pattern_sequence_stats() == {}
+
+
+# ============================================================================
+# Detector integration
+# ============================================================================
+
+
+class TestDetectorArchive:
+    def test_completed_history_not_in_open_set(self, detector):
+        for i in range(50):
+            detector._add_to_indexes(_completed(f"done-{i}", Decimal("1")))
+        open_campaign = Campaign(campaign_id="open", state=CampaignState.ACTIVE)
+        detector._add_to_indexes(open_campaign)
+
+        assert list(detector._open_campaigns) == ["open"]
+        assert detector.get_active_campaigns() == [open_campaign]
+        assert len(detector._completed_store) == 50
+
+    def test_correlation_counts_follow_state(self, detector):
+        for i in range(2):
+            detector._add_to_indexes(
+                Campaign(
+                    campaign_id=f"tech-{i}",
+                    state=CampaignState.ACTIVE,
+                    asset_category=AssetCategory.EQUITY,
+                    sector="TECH",
+                    correlation_group="EQUITY_TECH",
+                )
+            )
+
+        campaign = detector.get_campaign_by_id("tech-0")
+        campaign.state = CampaignState.FAILED
+        detector._update_indexes(campaign, CampaignState.ACTIVE)
+
+        summary = detector.get_correlation_summary()
+        assert summary["total_active_campaigns"] == 1
+        assert summary["correlation_groups"] == {"EQUITY_TECH": 1}
+        assert summary["sectors"] == {"TECH": 1}
+        assert summary["asset_categories"] == {"EQUITY": 1}
+
+    def test_reopened_campaign_keeps_creation_order(self, detector):
+        campaigns = [Campaign(campaign_id=f"c{i}", state=CampaignState.ACTIVE) for i in range(3)]
+        for campaign in campaigns:
+            detector._add_to_indexes(campaign)
+
+        campaigns[0].state = CampaignState.DORMANT
+        detector._update_indexes(campaigns[0], CampaignState.ACTIVE)
+        campaigns[0].state = CampaignState.ACTIVE
+        detector._update_indexes(campaigns[0], CampaignState.DORMANT)
+
+        assert [c.campaign_id for c in detector.get_active_campaigns()] == ["c0", "c1", "c2"]
+
+    def test_statistics_from_archive(self, detector):
+        detector._add_to_indexes(_completed("win", Decimal("3")))
+        detector._add_to_indexes(_completed("loss", Decimal("-1")))
+        detector._add_to_indexes(Campaign(campaign_id="failed", state=CampaignState.FAILED))
+
+        stats = detector.get_campaign_statistics()
+
+        assert stats["overview"]["total_campaigns"] == 3
+        assert stats["overview"]["completed"] == 2
+        assert stats["overview"]["failed"] == 1
+        assert stats["performance"]["total_r"] == 2.0
+        assert stats["exit_reasons"]["STOP_OUT"]["count"] == 1
+        assert stats["patterns"] == {
+            "Other": {
+                "count": 2,
+                "win_rate_pct": 50.0,
+                "avg_r_multiple": 1.0,
+                "best_r_multiple": 3.0,
+            }
+        }
+
+    def test_remove_and_rebuild_keep_archive_consistent(self, detector):
+        detector._add_to_indexes(_completed("keep", Decimal("2")))
+        detector._add_to_indexes(_completed("drop", Decimal("-1")))
+
+        detector._remove_from_indexes("drop")
+        assert "drop" not in detector._completed_store
+
+        detector._rebuild_indexes()
+        assert len(detector._completed_store) == 1
+        assert detector.get_campaign_statistics()["performance"]["win_rate_pct"] == 100.0
+
+    def test_campaign_is_slotted(self):
+        campaign = Campaign()
+
+        with pytest.raises(AttributeError):
+            campaign.not_a_field = 1
@@ -574,6 +574,72 @@ class TestNormalFillWithinRiskLimit:
         assert not pm.has_position("TEST")
 
 
+class TestFillLimitedByCash:
+    """Verify that fills never cost more than the cash on hand."""
+
+    def _engine(self, initial_capital: Decimal) -> tuple[UnifiedBacktestEngine, PositionManager]:
+        pm = PositionManager(initial_capital=initial_capital)
+        engine = UnifiedBacktestEngine(
+            signal_detector=StubDetector(),
+            cost_model=ZeroCostModel(),
+            position_manager=pm,
+            config=EngineConfig(initial_capital=initial_capital),
+            risk_manager=BacktestRiskManager(initial_capital=initial_capital),
+        )
+        return engine, pm
+
+    def _queue_buy(self, engine: UnifiedBacktestEngine, quantity: int, stop: str) -> BacktestOrder:
+        order = BacktestOrder(
+            order_id=uuid4(),
+            symbol="TEST",
+            side="BUY",
+            order_type="MARKET",
+            quantity=quantity,
+            status="PENDING",
+            created_bar_timestamp=datetime.now(UTC),
+        )
+        engine._pending_orders.append(order)
+        engine._pending_order_stops[order.order_id] = (Decimal(stop), None)
+        return order
+
+    def test_tight_stop_reduced_to_affordable_quantity(self):
+        """A tight stop sizes past buying power; the fill is trimmed to cash."""
+        engine, pm = self._engine(Decimal("100000"))
+        # Risk = 1500 * $0.50 = 0.75%, but cost = $150,000
+        order = self._queue_buy(engine, 1500, "99.50")
+
+        engine._fill_pending_orders(_make_bar(open_=Decimal("100.00")))
+
+        assert order.status == "FILLED"
+        assert order.quantity == 1000
+        assert pm.get_position("TEST").quantity == 1000
+        assert pm.cash == Decimal("0")
+
+    def test_add_order_limited_to_remaining_cash(self):
+        """An ADD on top of an open position only uses the remaining cash."""
+        engine, pm = self._engine(Decimal("100000"))
+        self._queue_buy(engine, 600, "99.50")
+        engine._fill_pending_orders(_make_bar(open_=Decimal("100.00")))
+
+        add = self._queue_buy(engine, 600, "99.50")
+        engine._fill_pending_orders(_make_bar(open_=Decimal("100.00")))
+
+        assert add.quantity == 400
+        assert pm.get_position("TEST").quantity == 1000
+
+    def test_order_rejected_without_cash_for_one_unit(self):
+        """An order that cannot afford a single unit is rejected, not raised."""
+        engine, pm = self._engine(Decimal("100000"))
+        pm.cash = Decimal("50")
+        order = self._queue_buy(engine, 10, "99.50")
+
+        engine._fill_pending_orders(_make_bar(open_=Decimal("100.00")))
+
+        assert order.status == "REJECTED"
+        assert not pm.has_position("TEST")
+        assert order.order_id not in engine._pending_order_stops
+
+
 class TestEndToEndWithGapBuffer:
     """Integration-style test running bars through the full engine."""
 
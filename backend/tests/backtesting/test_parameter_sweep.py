@@ -0,0 +1,181 @@
+"""
+Unit tests for the backtest parameter sweep.
+
+Tests cover:
+1. Grid expansion and parameter validation
+2. Shared detection (one pass per detector parameter set)
+3. Warm-up pruning and ranking
+4. Parity of a sweep variant with a plain backtest run
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.backtesting.engine.backtest_engine import UnifiedBacktestEngine
+from src.backtesting.engine.cost_model import ZeroCostModel
+from src.backtesting.engine.interfaces import EngineConfig
+from src.backtesting.engine.validated_detector import ValidatedSignalDetector
+from src.backtesting.engine.wyckoff_detector import WyckoffSignalDetector
+from src.backtesting.parameter_sweep import ParameterSweep
+from src.backtesting.position_manager import PositionManager
+from src.backtesting.risk_integration import BacktestRiskManager
+from src.models.ohlcv import OHLCVBar
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def bars() -> list[OHLCVBar]:
+    rng = random.Random(42)
+    start = datetime(2023, 1, 2, tzinfo=UTC)
+    bars = []
+    price = 100
+    for i in range(250):
+        price = max(80, min(125, price + rng.choice((-2, -1, 0, 1, 2))))
+        low = Decimal(price) - Decimal("1.5")
+        high = Decimal(price) + Decimal("1.5")
+        bars.append(
+            OHLCVBar(
+                symbol="TEST",
+                timeframe="1d",
+                open=Decimal(price),
+                high=high,
+                low=low,
+                close=Decimal(price),
+                volume=rng.randint(200, 4000),
+                spread=high - low,
+                timestamp=start + timedelta(days=i),
+            )
+        )
+    return bars
+
+
+# ============================================================================
+# Grid expansion
+# ============================================================================
+
+
+class TestGrid:
+    def test_variants_cover_product(self):
+        sweep = ParameterSweep(
+            detector_grid={"cooldown_bars": [5, 10]},
+            engine_grid={"max_open_positions": [1, 2, 3]},
+        )
+
+        variants = sweep.variants()
+
+        assert len(variants) == 6
+        assert [v.variant_id for v in variants] == list(range(6))
+        assert variants[0].detector_params == {"cooldown_bars": 5}
+        assert [v.engine_config.max_open_positions for v in variants[:3]] == [1, 2, 3]
+
+    def test_unknown_parameter_rejected(self):
+        with pytest.raises(ValueError, match="Unknown detector parameters"):
+            ParameterSweep(detector_grid={"lookback": [1]})
+        with pytest.raises(ValueError, match="Unknown engine parameters"):
+            ParameterSweep(engine_grid={"leverage": [2]})
+        with pytest.raises(ValueError, match="objective"):
+            ParameterSweep(objective="max_drawdown")
+
+    def test_invalid_engine_value_rejected(self):
+        sweep = ParameterSweep(engine_grid={"max_open_positions": [0]})
+
+        with pytest.raises(ValueError, match="max_open_positions"):
+            sweep.variants()
+
+
+# ============================================================================
+# Sweep runs
+# ============================================================================
+
+
+class TestSweepRun:
+    def test_detection_shared_across_engine_variants(self, bars):
+        sweep = ParameterSweep(
+            detector_grid={"cooldown_bars": [5, 10]},
+            engine_grid={"max_open_positions": [1, 5], "enable_trailing_stop": [False, True]},
+            warmup_fraction=1.0,
+        )
+
+        result = sweep.run(bars)
+
+        assert result.detection_runs == 2
+        assert result.full_runs == 8
+        assert result.warmup_runs == 0
+        assert [row.rank for row in result.rows] == list(range(1, 9))
+        objectives = [row.objective for row in result.rows]
+        assert objectives == sorted(objectives, reverse=True)
+
+    def test_pruning_limits_full_runs(self, bars):
+        sweep = ParameterSweep(
+            engine_grid={
+                "max_open_positions": [1, 2, 5],
+                "enable_trailing_stop": [False, True],
+                "risk_per_trade": [Decimal("0.01"), Decimal("0.02")],
+            },
+            warmup_fraction=0.4,
+            keep_fraction=0.25,
+        )
+
+        result = sweep.run(bars)
+
+        assert result.warmup_runs == 12
+        assert 3 <= result.full_runs < 12
+        assert len(result.rows) == 12
+        pruned = [row.pruned for row in result.rows]
+        # Full-history results rank ahead of pruned ones
+        assert pruned == sorted(pruned)
+        assert pruned.count(False) == result.full_runs
+
+    def test_variant_matches_plain_backtest(self, bars):
+        config = EngineConfig(max_open_positions=2, enable_trailing_stop=True)
+        sweep = ParameterSweep(
+            detector_grid={"cooldown_bars": [7]},
+            engine_grid={"max_open_positions": [2], "enable_trailing_stop": [True]},
+        )
+
+        row = sweep.run(bars).best
+
+        engine = UnifiedBacktestEngine(
+            signal_detector=ValidatedSignalDetector(WyckoffSignalDetector(cooldown_bars=7)),
+            cost_model=ZeroCostModel(),
+            position_manager=PositionManager(config.initial_capital),
+            config=config,
+            risk_manager=BacktestRiskManager(initial_capital=config.initial_capital),
+        )
+        expected = engine.run(bars).summary
+        assert row.metrics.total_trades == expected.total_trades
+        assert row.metrics.total_return_pct == expected.total_return_pct
+        assert row.metrics.max_drawdown == expected.max_drawdown
+
+    def test_results_table_lists_swept_parameters(self, bars):
+        sweep = ParameterSweep(
+            detector_grid={"cooldown_bars": [5, 10]},
+            engine_grid={"max_open_positions": [3]},
+            warmup_fraction=1.0,
+        )
+
+        table = sweep.run(bars).to_rows()
+
+        assert len(table) == 2
+        assert set(table[0]) == {
+            "rank",
+            "cooldown_bars",
+            "sharpe_ratio",
+            "total_return_pct",
+            "max_drawdown",
+            "win_rate",
+            "total_trades",
+            "pruned",
+        }
+
+    def test_empty_bars(self):
+        result = ParameterSweep(detector_grid={"cooldown_bars": [5]}).run([])
+
+        assert result.rows == []
+        assert result.best is None
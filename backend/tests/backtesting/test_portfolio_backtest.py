@@ -0,0 +1,212 @@
+"""
+Unit tests for the multi-symbol portfolio backtest.
+
+Tests cover:
+1. Timestamp merge of symbols with different calendars
+2. Orders fill only on their own symbol's next bar
+3. Portfolio heat shared across symbols (pending orders included)
+4. Parity of a single-symbol portfolio with a plain backtest run
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.backtesting.engine.backtest_engine import UnifiedBacktestEngine
+from src.backtesting.engine.cost_model import ZeroCostModel
+from src.backtesting.engine.interfaces import EngineConfig
+from src.backtesting.engine.validated_detector import ValidatedSignalDetector
+from src.backtesting.engine.wyckoff_detector import WyckoffSignalDetector
+from src.backtesting.portfolio_backtest import PortfolioBacktest, _PortfolioEngine
+from src.backtesting.portfolio_risk import PortfolioRiskState
+from src.backtesting.position_manager import PositionManager
+from src.backtesting.risk_integration import BacktestRiskManager
+from src.models.ohlcv import OHLCVBar
+
+START = datetime(2023, 1, 2, tzinfo=UTC)
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+def _bar(symbol: str, day: int, price: Decimal, volume: int = 1000) -> OHLCVBar:
+    return OHLCVBar(
+        symbol=symbol,
+        timeframe="1d",
+        open=price,
+        high=price + Decimal("1.5"),
+        low=price - Decimal("1.5"),
+        close=price,
+        volume=volume,
+        spread=Decimal("3"),
+        timestamp=START + timedelta(days=day),
+    )
+
+
+def _random_bars(symbol: str, seed: int, days: range) -> list[OHLCVBar]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100
+    for day in days:
+        price = max(80, min(125, price + rng.choice((-2, -1, 0, 1, 2))))
+        bars.append(_bar(symbol, day, Decimal(price), rng.randint(200, 4000)))
+    return bars
+
+
+def _signal(stop_loss: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        direction="LONG",
+        stop_loss=Decimal(stop_loss),
+        target_levels=None,
+        pattern_type=None,
+        campaign_id=None,
+    )
+
+
+def _engine(max_heat_pct: Decimal = Decimal("10.0")) -> _PortfolioEngine:
+    config = EngineConfig(initial_capital=Decimal("100000"))
+    return _PortfolioEngine(
+        signal_detector=ValidatedSignalDetector(WyckoffSignalDetector()),
+        cost_model=ZeroCostModel(),
+        position_manager=PositionManager(config.initial_capital),
+        config=config,
+        risk_manager=BacktestRiskManager(
+            initial_capital=config.initial_capital, max_portfolio_heat_pct=max_heat_pct
+        ),
+        max_heat_pct=max_heat_pct,
+    )
+
+
+# ============================================================================
+# Timeline
+# ============================================================================
+
+
+class TestTimeline:
+    def test_one_equity_point_per_timestamp(self):
+        market_data = {
+            "AAA": _random_bars("AAA", 1, range(0, 40)),
+            "BBB": _random_bars("BBB", 2, range(0, 40, 2)),
+            "CCC": _random_bars("CCC", 3, range(10, 50)),
+        }
+        progress = []
+
+        result = PortfolioBacktest(parallel=False).run(
+            market_data, progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        timestamps = [point.timestamp for point in result.equity_curve]
+        assert timestamps == [START + timedelta(days=day) for day in range(50)]
+        assert result.symbols == ["AAA", "BBB", "CCC"]
+        assert progress[-1] == (100, 100)
+
+    def test_empty_symbols_ignored(self):
+        result = PortfolioBacktest(parallel=False).run(
+            {"AAA": _random_bars("AAA", 1, range(5)), "EMPTY": []}
+        )
+
+        assert result.symbols == ["AAA"]
+        assert len(result.equity_curve) == 5
+        assert result.trades == []
+
+
+# ============================================================================
+# Shared engine
+# ============================================================================
+
+
+class TestPortfolioEngine:
+    def test_order_fills_on_own_symbol_bar(self):
+        engine = _engine()
+        engine.process_step([(_bar("AAA", 0, Decimal("100")), _signal("95"))])
+        engine.process_step([(_bar("BBB", 1, Decimal("50")), None)])
+
+        assert engine._positions.positions == {}
+        assert len(engine._pending_orders) == 1
+
+        engine.process_step([(_bar("AAA", 2, Decimal("101")), None)])
+
+        position = engine._positions.positions["AAA"]
+        assert position.average_entry_price == Decimal("101")
+        assert engine._pending_orders == []
+        assert engine._pending_heat == {}
+
+    def test_pending_heat_shared_across_symbols(self):
+        engine = _engine(max_heat_pct=Decimal("3.0"))
+
+        engine.process_step(
+            [
+                (_bar("AAA", 0, Decimal("100")), _signal("95")),
+                (_bar("BBB", 0, Decimal("100")), _signal("95")),
+            ]
+        )
+
+        assert [order.symbol for order in engine._pending_orders] == ["AAA"]
+        assert engine._risk_manager.violations.portfolio_heat_rejections == 1
+        assert Decimal("0") < engine.portfolio_heat() <= Decimal("3.0")
+
+    def test_pending_orders_take_position_slots(self):
+        engine = _engine()
+        engine._config.max_open_positions = 1
+
+        engine.process_step(
+            [
+                (_bar("AAA", 0, Decimal("100")), _signal("95")),
+                (_bar("BBB", 0, Decimal("100")), _signal("95")),
+            ]
+        )
+
+        assert [order.symbol for order in engine._pending_orders] == ["AAA"]
+
+    def test_risk_state_heat_limit_applied(self):
+        risk_state = PortfolioRiskState(max_heat_pct=Decimal("4.0"))
+        backtest = PortfolioBacktest(risk_state=risk_state, parallel=False)
+
+        result = backtest.run({"AAA": _random_bars("AAA", 1, range(5))})
+
+        assert result.risk_report["portfolio_utilization"]["heat_limit_pct"] == 4.0
+        assert risk_state.total_heat_pct == Decimal("0")
+
+
+# ============================================================================
+# Parity
+# ============================================================================
+
+
+class TestParity:
+    def test_single_symbol_matches_plain_run(self):
+        bars = _random_bars("TEST", 42, range(250))
+        config = EngineConfig(initial_capital=Decimal("100000"))
+
+        result = PortfolioBacktest(config=config, parallel=False).run({"TEST": bars})
+        plain = UnifiedBacktestEngine(
+            signal_detector=ValidatedSignalDetector(WyckoffSignalDetector()),
+            cost_model=ZeroCostModel(),
+            position_manager=PositionManager(config.initial_capital),
+            config=config,
+            risk_manager=BacktestRiskManager(initial_capital=config.initial_capital),
+        ).run(bars)
+
+        assert [p.portfolio_value for p in result.equity_curve] == [
+            p.portfolio_value for p in plain.equity_curve
+        ]
+        assert len(result.trades) == len(plain.trades)
+        assert result.summary.total_return_pct == plain.summary.total_return_pct
+
+    @pytest.mark.slow
+    def test_parallel_detection_matches_sequential(self):
+        market_data = {
+            symbol: _random_bars(symbol, seed, range(150))
+            for seed, symbol in enumerate(("AAA", "BBB", "CCC"))
+        }
+
+        sequential = PortfolioBacktest(parallel=False).detect_signals(market_data)
+        parallel = PortfolioBacktest(parallel=True, max_workers=2).detect_signals(market_data)
+
+        assert {s: sorted(v) for s, v in parallel.items()} == {
+            s: sorted(v) for s, v in sequential.items()
+        }
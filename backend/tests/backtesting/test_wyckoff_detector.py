@@ -17,6 +17,8 @@ Author: Critical Backtest Fix tests
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
+import pytest
+
 from src.backtesting.engine.wyckoff_detector import WyckoffSignalDetector
 from src.models.ohlcv import OHLCVBar
 
@@ -500,3 +502,127 @@ class TestPhaseProgressionTracking:
         assert (
             phase == "C"
         ), f"Phase was {phase}; low penetration below support should yield Phase C"
+
+
+# ---------------------------------------------------------------------------
+# Streaming rolling window parity
+# ---------------------------------------------------------------------------
+
+
+def _random_walk_bars(count: int, seed: int) -> list[OHLCVBar]:
+    """Bars with many repeated (and differently-scaled equal) price levels."""
+    import random
+
+    rng = random.Random(seed)
+    bars: list[OHLCVBar] = []
+    price = 100
+    for i in range(count):
+        price = max(60, min(140, price + rng.choice((-3, -1, 0, 1, 3))))
+        low = Decimal(price) - Decimal(rng.choice(("1", "1.0", "2.00")))
+        high = Decimal(price) + Decimal(rng.choice(("1", "1.00", "2.5")))
+        bars.append(
+            OHLCVBar(
+                symbol="TEST",
+                timeframe="1d",
+                open=Decimal(price),
+                high=high,
+                low=low,
+                close=Decimal(price),
+                volume=rng.randint(500, 5000),
+                spread=high - low,
+                timestamp=_BASE_DATE + timedelta(days=i),
+            )
+        )
+    return bars
+
+
+class TestRollingWindowParity:
+    """Streaming range/volume window matches the sort-based computation."""
+
+    def test_skiplist_matches_sorted_list(self):
+        import random
+
+        from src.backtesting.engine.rolling_window import IndexedSkiplist
+
+        rng = random.Random(7)
+        skiplist = IndexedSkiplist(expected_size=64)
+        window: list[int] = []
+        for _ in range(2000):
+            value = rng.randint(0, 40)
+            skiplist.insert(value)
+            window.append(value)
+            if len(window) > 61:
+                skiplist.remove(window.pop(0))
+            expected = sorted(window)
+            assert list(skiplist) == expected
+            k = rng.randrange(len(window))
+            assert skiplist[k] == expected[k]
+
+    def test_window_matches_sorted_percentiles_and_mean(self):
+        """At every bar the streamed support/resistance/avg volume are identical."""
+        from src.backtesting.bar_sequence import BarView
+
+        bars = _random_walk_bars(400, seed=11)
+        detector = WyckoffSignalDetector()
+        span = detector._min_range_bars * 2  # noqa: SLF001
+
+        for index in range(len(bars)):
+            view = BarView(bars, 0, index + 1)
+            window = detector._sync_rolling_window(view, index)  # noqa: SLF001
+
+            expected = detector._identify_trading_range(  # noqa: SLF001
+                bars[max(0, index - span) : index + 1]
+            )
+            actual = detector._trading_range_from_window(window)  # noqa: SLF001
+            assert actual == expected
+            if expected is not None:
+                assert str(actual.support) == str(expected.support)
+                assert str(actual.resistance) == str(expected.resistance)
+            assert window.avg_volume() == detector._avg_volume(bars, index)  # noqa: SLF001
+
+    def test_streaming_detection_matches_fresh_slices(self):
+        """Signals are identical whether the window advances or is rebuilt."""
+        from src.backtesting.bar_sequence import BarView
+
+        bars = _random_walk_bars(300, seed=3)
+        streaming = WyckoffSignalDetector()
+        rebuilding = WyckoffSignalDetector()
+
+        for index in range(len(bars)):
+            a = streaming.detect(BarView(bars, 0, index + 1), index)
+            # A fresh list per call forces a rebuild every bar
+            b = rebuilding.detect(bars[: index + 1], index)
+            assert (a is None) == (b is None)
+            if a is not None:
+                assert (a.pattern_type, a.entry_price, a.stop_loss) == (
+                    b.pattern_type,
+                    b.entry_price,
+                    b.stop_loss,
+                )
+
+    def test_precomputed_features_match_streaming_detection(self):
+        """Detectors sharing precomputed features emit the same signals."""
+        from src.backtesting.bar_sequence import BarView
+
+        bars = _random_walk_bars(300, seed=5)
+        features = WyckoffSignalDetector().compute_features(bars)
+
+        for cooldown in (3, 10):
+            streaming = WyckoffSignalDetector(cooldown_bars=cooldown)
+            shared = WyckoffSignalDetector(cooldown_bars=cooldown, features=features)
+            for index in range(len(bars)):
+                a = streaming.detect(BarView(bars, 0, index + 1), index)
+                b = shared.detect(BarView(bars, 0, index + 1), index)
+                assert (a is None) == (b is None)
+                if a is not None:
+                    assert (a.pattern_type, a.phase, a.entry_price) == (
+                        b.pattern_type,
+                        b.phase,
+                        b.entry_price,
+                    )
+
+    def test_features_require_matching_parameters(self):
+        features = WyckoffSignalDetector().compute_features(_random_walk_bars(50, seed=1))
+
+        with pytest.raises(ValueError, match="min_range_bars"):
+            WyckoffSignalDetector(min_range_bars=20, features=features)
@@ -13,8 +13,23 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.ohlcv import OHLCVBar
+from src.cache.chart_cache import get_chart_cache
 from src.orm.models import Pattern, TradingRange
+from src.repositories.models import OHLCVBarModel
+
+
+@pytest.fixture
+def client(async_client: AsyncClient) -> AsyncClient:
+    """HTTP client bound to the app with the test database session."""
+    return async_client
+
+
+@pytest.fixture(autouse=True)
+def clear_chart_cache():
+    """Chart payloads are cached per process; each test has its own database."""
+    get_chart_cache().clear()
+    yield
+    get_chart_cache().clear()
 
 
 @pytest.mark.asyncio
@@ -31,7 +46,7 @@ class TestChartDataEndpoint:
         bars = []
         for i in range(10):
             timestamp = now - timedelta(days=10 - i)
-            bar = OHLCVBar(
+            bar = OHLCVBarModel(
                 id=uuid4(),
                 symbol=symbol,
                 timeframe=timeframe,
@@ -85,7 +100,7 @@ class TestChartDataEndpoint:
         pattern_timestamp = now - timedelta(days=5)
 
         # Create bar
-        bar = OHLCVBar(
+        bar = OHLCVBarModel(
             id=uuid4(),
             symbol=symbol,
             timeframe=timeframe,
@@ -250,7 +265,7 @@ class TestChartDataEndpoint:
 
         for i in range(100):
             timestamp = now - timedelta(days=100 - i)
-            bar = OHLCVBar(
+            bar = OHLCVBarModel(
                 id=uuid4(),
                 symbol=symbol,
                 timeframe=timeframe,
@@ -291,7 +306,7 @@ class TestChartDataEndpoint:
 
         for i in range(30):
             timestamp = now - timedelta(days=30 - i)
-            bar = OHLCVBar(
+            bar = OHLCVBarModel(
                 id=uuid4(),
                 symbol=symbol,
                 timeframe=timeframe,
@@ -329,6 +344,96 @@ class TestChartDataEndpoint:
         data = response.json()
         assert len(data["bars"]) <= 10
 
+    async def test_get_chart_data_max_points_downsamples(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test wide ranges are reduced to max_points candles keeping price extremes."""
+        # Setup: 400 daily bars with one spike high and one spike low
+        symbol = "AMZN"
+        timeframe = "1d"
+        now = datetime.utcnow()
+
+        for i in range(400):
+            timestamp = now - timedelta(days=400 - i)
+            high = Decimal("190.00") if i == 123 else Decimal("105.00")
+            low = Decimal("60.00") if i == 321 else Decimal("95.00")
+            bar = OHLCVBarModel(
+                id=uuid4(),
+                symbol=symbol,
+                timeframe=timeframe,
+                timestamp=timestamp,
+                open=Decimal("100.00"),
+                high=high,
+                low=low,
+                close=Decimal("101.00"),
+                volume=1000,
+                spread=high - low,
+                spread_ratio=Decimal("1.0"),
+                volume_ratio=Decimal("1.0"),
+                created_at=now,
+            )
+            db_session.add(bar)
+
+        await db_session.commit()
+
+        # Execute: Whole range, at most 100 candles
+        response = await client.get(
+            "/api/v1/charts/data",
+            params={
+                "symbol": symbol,
+                "timeframe": "1D",
+                "start_date": (now - timedelta(days=401)).isoformat(),
+                "end_date": now.isoformat(),
+                "max_points": 100,
+            },
+        )
+
+        # Verify: 100 candles covering all 400 bars
+        assert response.status_code == 200
+        data = response.json()
+        assert data["bar_count"] == 100
+        assert max(bar["high"] for bar in data["bars"]) == 190.0
+        assert min(bar["low"] for bar in data["bars"]) == 60.0
+        assert sum(bar["volume"] for bar in data["bars"]) == 400 * 1000
+
+    async def test_get_chart_data_served_from_cache(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test repeated requests for the same window reuse the cached payload."""
+        symbol = "META"
+        now = datetime.utcnow()
+        for i in range(10):
+            db_session.add(
+                OHLCVBarModel(
+                    id=uuid4(),
+                    symbol=symbol,
+                    timeframe="1d",
+                    timestamp=now - timedelta(days=10 - i),
+                    open=Decimal("300.00"),
+                    high=Decimal("305.00"),
+                    low=Decimal("295.00"),
+                    close=Decimal("302.00"),
+                    volume=1000000,
+                    spread=Decimal("10.00"),
+                    spread_ratio=Decimal("1.0"),
+                    volume_ratio=Decimal("1.0"),
+                    created_at=now,
+                )
+            )
+        await db_session.commit()
+
+        params = {"symbol": symbol, "timeframe": "1D"}
+        first = await client.get("/api/v1/charts/data", params=params)
+        assert len(get_chart_cache()) == 1
+
+        second = await client.get("/api/v1/charts/data", params=params)
+
+        assert second.status_code == 200
+        assert second.content == first.content
+
+        # Ingesting new bars drops the cached payloads for the series
+        assert get_chart_cache().invalidate_symbol(symbol, "1d") == 1
+
     @pytest.mark.performance
     async def test_chart_data_performance(self, client: AsyncClient, db_session: AsyncSession):
         """Test chart data endpoint performance < 100ms for 500 bars.
@@ -343,7 +448,7 @@ class TestChartDataEndpoint:
         bars = []
         for i in range(500):
             timestamp = now - timedelta(days=500 - i)
-            bar = OHLCVBar(
+            bar = OHLCVBarModel(
                 id=uuid4(),
                 symbol=symbol,
                 timeframe=timeframe,
@@ -391,7 +496,7 @@ class TestChartDataEndpoint:
         now = datetime.utcnow()
 
         # Create bar
-        bar = OHLCVBar(
+        bar = OHLCVBarModel(
             id=uuid4(),
             symbol=symbol,
             timeframe=timeframe,
@@ -4,7 +4,9 @@ Integration tests for OHLCV bar data model and repository.
 These tests require a running test database with TimescaleDB extension.
 They verify end-to-end functionality including:
 - Bulk bar insertion
+- Chunked bulk ingestion (COPY / ON CONFLICT DO NOTHING)
 - Query performance
+- Validation-free (lean) reads
 - DataFrame conversion
 - Lazy loading iteration
 """
@@ -25,6 +27,7 @@ from sqlalchemy.ext.compiler import compiles
 from src.database import Base
 from src.models.converters import bars_to_dataframe, dataframe_to_bars
 from src.models.ohlcv import OHLCVBar
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
 from src.repositories.models import OHLCVBarModel
 from src.repositories.ohlcv_repository import OHLCVRepository
 
@@ -206,6 +209,120 @@ class TestBulkInsertAndQuery:
         # assert elapsed_ms < 100, f"Query took {elapsed_ms:.2f}ms, expected <100ms"
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestBulkIngestion:
+    """Test chunked bulk ingestion (insert_bars_bulk)."""
+
+    async def test_bulk_insert_counts(self, repository):
+        """Inserted and skipped counts cover new bars and re-ingestion."""
+        bars = generate_test_bars("TEST_BULK_COPY", count=1000)
+
+        first = await repository.insert_bars_bulk(bars, chunk_size=300)
+        second = await repository.insert_bars_bulk(bars, chunk_size=300)
+
+        assert (first.total, first.inserted, first.skipped, first.chunks) == (1000, 1000, 0, 4)
+        assert first.method == "insert"  # SQLite fallback
+        assert (second.inserted, second.skipped) == (0, 1000)
+        assert await repository.count_bars("TEST_BULK_COPY", "1d") == 1000
+
+    async def test_bulk_insert_skips_duplicates_within_input(self, repository):
+        """Bars repeated in the input (or overlapping the table) are skipped."""
+        existing = generate_test_bars("TEST_BULK_DUP", count=10)
+        await repository.insert_bars(existing[:5])
+
+        repeated = existing + [bar.model_copy(update={"id": uuid.uuid4()}) for bar in existing]
+        result = await repository.insert_bars_bulk(iter(repeated), chunk_size=7)
+
+        assert result.total == 20
+        assert result.inserted == 5
+        assert result.skipped == 15
+        assert await repository.count_bars("TEST_BULK_DUP", "1d") == 10
+
+    async def test_bulk_insert_multiple_symbols(self, repository):
+        bars = generate_test_bars("TEST_BULK_A", count=50) + generate_test_bars(
+            "TEST_BULK_B", count=50, timeframe="1h"
+        )
+
+        result = await repository.insert_bars_bulk(bars)
+
+        assert result.inserted == 100
+        assert await repository.count_bars("TEST_BULK_A", "1d") == 50
+        assert await repository.count_bars("TEST_BULK_B", "1h") == 50
+
+    async def test_bulk_insert_rejects_invalid_chunk_size(self, repository):
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            await repository.insert_bars_bulk([], chunk_size=0)
+
+    async def test_bulk_insert_throughput(self, repository):
+        """Benchmark rows/second for bulk vs check-then-insert ingestion."""
+        bars = generate_test_bars("TEST_BULK_RATE", count=5000)
+
+        start_time = time.perf_counter()
+        await repository.insert_bars(generate_test_bars("TEST_ORM_RATE", count=5000))
+        orm_rows_per_second = 5000 / (time.perf_counter() - start_time)
+
+        result = await repository.insert_bars_bulk(bars, chunk_size=2000)
+
+        assert result.inserted == 5000
+        assert result.rows_per_second > orm_rows_per_second
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestLeanReads:
+    """Test the validation-free read path against the ORM path."""
+
+    async def test_get_bars_lean_matches_get_bars(self, repository):
+        bars = generate_test_bars("TEST_LEAN", count=300)
+        await repository.insert_bars(bars)
+        start, end = bars[0].timestamp, bars[-1].timestamp
+
+        expected = await repository.get_bars("TEST_LEAN", "1d", start, end)
+        lean = await repository.get_bars_lean("TEST_LEAN", "1d", start, end)
+
+        assert [bar.model_dump() for bar in lean] == [bar.model_dump() for bar in expected]
+
+    async def test_get_bars_lean_limit_matches_get_latest_bars(self, repository):
+        await repository.insert_bars(generate_test_bars("TEST_LEAN_LATEST", count=50))
+
+        expected = await repository.get_latest_bars("TEST_LEAN_LATEST", "1d", count=20)
+        lean = await repository.get_bars_lean("TEST_LEAN_LATEST", "1d", limit=20)
+
+        assert [bar.timestamp for bar in lean] == [bar.timestamp for bar in expected]
+        assert [bar.close for bar in lean] == [bar.close for bar in expected]
+
+    async def test_get_bar_frame_matches_from_bars(self, repository):
+        bars = generate_test_bars("TEST_LEAN_FRAME", count=100)
+        await repository.insert_bars(bars)
+
+        frame = await repository.get_bar_frame("TEST_LEAN_FRAME", "1d")
+        expected = OHLCVFrame.from_bars(bars)
+
+        for column in ("timestamp", "open", "high", "low", "close", "volume"):
+            assert (getattr(frame, column) == getattr(expected, column)).all()
+
+    async def test_lean_read_performance_2000_bars(self, repository):
+        """Compare validated and lean fetches of a 2000-bar analysis window."""
+        bars = generate_test_bars("TEST_LEAN_PERF", count=2000)
+        await repository.insert_bars(bars)
+        start, end = bars[0].timestamp, bars[-1].timestamp
+
+        # Best of three runs to keep scheduler noise out of the comparison
+        validated_ms = lean_ms = float("inf")
+        for _ in range(3):
+            start_time = time.perf_counter()
+            await repository.get_bars("TEST_LEAN_PERF", "1d", start, end)
+            validated_ms = min(validated_ms, (time.perf_counter() - start_time) * 1000)
+
+            start_time = time.perf_counter()
+            lean = await repository.get_bars_lean("TEST_LEAN_PERF", "1d", start, end)
+            lean_ms = min(lean_ms, (time.perf_counter() - start_time) * 1000)
+
+        assert len(lean) == 2000
+        assert lean_ms < validated_ms
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 class TestDataFrameConversion:
@@ -410,6 +410,99 @@ class TestSignalStatisticsService:
         assert response.summary.total_signals >= 4  # At least 4 signals in range
 
 
+class TestSignalStatisticsRollups:
+    """Integration tests for the rollup-backed aggregation path."""
+
+    @staticmethod
+    def _rollup_service(db_session: AsyncSession) -> SignalStatisticsService:
+        return SignalStatisticsService(db_session, cache=StatisticsCache(), use_rollups=True)
+
+    @pytest.mark.asyncio
+    async def test_rollups_match_signal_scan(
+        self,
+        db_session: AsyncSession,
+        statistics_service: SignalStatisticsService,
+        sample_signals: list[Signal],
+    ):
+        """Rollup aggregations equal the signal-scan aggregations."""
+        start = date.today() - timedelta(days=30)
+        end = date.today()
+
+        expected = await statistics_service.get_statistics(start, end, use_cache=False)
+        actual = await self._rollup_service(db_session).get_statistics(start, end, use_cache=False)
+
+        assert actual.summary == expected.summary
+        assert actual.win_rate_by_pattern == expected.win_rate_by_pattern
+        assert actual.rejection_breakdown == expected.rejection_breakdown
+        assert actual.symbol_performance == expected.symbol_performance
+
+    @pytest.mark.asyncio
+    async def test_rollups_follow_signal_updates(
+        self,
+        db_session: AsyncSession,
+        sample_signals: list[Signal],
+    ):
+        """Closing a signal through the ORM moves it between rollup rows."""
+        service = self._rollup_service(db_session)
+        start = date.today() - timedelta(days=30)
+        end = date.today()
+        before = await service.get_summary(
+            datetime.combine(start, datetime.min.time(), tzinfo=UTC),
+            datetime.combine(end, datetime.max.time(), tzinfo=UTC),
+        )
+
+        open_signal = next(s for s in sample_signals if s.lifecycle_state != "closed")
+        open_signal.lifecycle_state = "closed"
+        open_signal.trade_outcome = {"pnl_dollars": "100.00", "r_multiple": "1.0"}
+        await db_session.commit()
+
+        after = await service.get_summary(
+            datetime.combine(start, datetime.min.time(), tzinfo=UTC),
+            datetime.combine(end, datetime.max.time(), tzinfo=UTC),
+        )
+
+        assert after.total_signals == before.total_signals
+        assert after.total_pnl == before.total_pnl + Decimal("100.00")
+
+    @pytest.mark.asyncio
+    async def test_rollups_follow_signal_deletes(
+        self,
+        db_session: AsyncSession,
+        sample_signals: list[Signal],
+    ):
+        """Deleting signals through the ORM removes their contribution."""
+        for signal in sample_signals:
+            await db_session.delete(signal)
+        await db_session.commit()
+
+        response = await self._rollup_service(db_session).get_statistics(
+            date.today() - timedelta(days=30), date.today(), use_cache=False
+        )
+
+        assert response.summary.total_signals == 0
+        assert response.win_rate_by_pattern == []
+        assert response.symbol_performance == []
+
+    @pytest.mark.asyncio
+    async def test_rebuild_rollups_matches_incremental(
+        self,
+        db_session: AsyncSession,
+        sample_signals: list[Signal],
+    ):
+        """Rebuilding from signals reproduces the incrementally maintained rollups."""
+        service = self._rollup_service(db_session)
+        start = date.today() - timedelta(days=30)
+        end = date.today()
+        expected = await service.get_statistics(start, end, use_cache=False)
+
+        rebuilt = await service.rebuild_rollups()
+        actual = await service.get_statistics(start, end, use_cache=False)
+
+        assert rebuilt == len(sample_signals)
+        assert actual.summary == expected.summary
+        assert actual.symbol_performance == expected.symbol_performance
+
+
 class TestSignalStatisticsAPI:
     """Integration tests for signal statistics API endpoint."""
 
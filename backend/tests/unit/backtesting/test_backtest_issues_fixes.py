@@ -629,6 +629,65 @@ class TestPhase7TrailingStop:
         # The stop logic only activates when enable_trailing_stop is True
 
 
+class TestVolatilitySpikeExit:
+    """Opt-in ATR spike exit driven by the engine's per-symbol ExitIndicatorState."""
+
+    class LateSignalDetector:
+        """Emit one LONG signal once 15 bars exist (the 14-bar ATR is ready)."""
+
+        def detect(self, bars, index):
+            if index == 15:
+                return make_signal(
+                    entry=Decimal("100"),
+                    stop=Decimal("50"),
+                    target=Decimal("200"),
+                    symbol=bars[0].symbol,
+                )
+            return None
+
+    class ZeroCost:
+        def calculate_commission(self, order):
+            return Decimal("0")
+
+        def calculate_slippage(self, order, bar):
+            return Decimal("0")
+
+    def _run(self, enable_volatility_exit: bool):
+        config = EngineConfig(
+            enable_cost_model=False,
+            enable_volatility_exit=enable_volatility_exit,
+        )
+        engine = UnifiedBacktestEngine(
+            self.LateSignalDetector(),
+            self.ZeroCost(),
+            PositionManager(config.initial_capital),
+            config,
+        )
+        # 17 quiet bars (true range 2; fill on bar 16), then 40-point ranges
+        # that never reach the stop or target
+        bars = [make_bar(day_offset=i) for i in range(17)]
+        bars += [
+            make_bar(open_price=100, high=120, low=80, close=100 + i, day_offset=17 + i)
+            for i in range(3)
+        ]
+        return engine.run(bars)
+
+    def test_exits_when_atr_reaches_threshold(self):
+        result = self._run(enable_volatility_exit=True)
+
+        # ATR after two wide bars: (12 * 2 + 2 * 40) / 14 = 7.4 >= 2.5 * 2
+        assert len(result.trades) == 1
+        assert result.trades[0].exit_price == Decimal("101")
+
+    def test_disabled_by_default(self):
+        assert EngineConfig().enable_volatility_exit is False
+        assert self._run(enable_volatility_exit=False).trades == []
+
+    def test_threshold_must_exceed_one(self):
+        with pytest.raises(ValueError, match="volatility_spike_threshold"):
+            EngineConfig(volatility_spike_threshold=Decimal("1"))
+
+
 # ===========================================================================
 # Bug C-1: Preview Engine Look-Ahead Bias (verified fixed)
 # ===========================================================================
@@ -12,7 +12,7 @@ from decimal import Decimal
 
 import pytest
 
-from src.backtesting.bar_sequence import BacktestBarSequence, LiveBarSequence
+from src.backtesting.bar_sequence import BacktestBarSequence, BarView, LiveBarSequence
 from src.models.ohlcv import OHLCVBar
 
 
@@ -323,3 +323,63 @@ class TestLiveVsBacktestComparison:
         # Backtest: future bar raises IndexError (look-ahead bias)
         with pytest.raises(IndexError):
             backtest_sequence.get_bar(6)
+
+
+class TestBarView:
+    """Test zero-copy BarView used by the backtest engine."""
+
+    def test_view_matches_list_slice(self, sample_bars):
+        """Test that a view exposes the same bars as the equivalent list slice."""
+        view = BarView(sample_bars, 0, 6)
+        assert len(view) == 6
+        assert list(view) == sample_bars[:6]
+        assert view[5] is sample_bars[5]
+        assert view[-1] is sample_bars[5]
+
+    def test_slicing_returns_view_without_copy(self, sample_bars):
+        """Test that slicing a view returns another view over the same storage."""
+        view = BarView(sample_bars, 0, 8)
+        recent = view[-3:]
+        assert isinstance(recent, BarView)
+        assert list(recent) == sample_bars[5:8]
+        assert recent[0] is sample_bars[5]
+        assert view[2:5] == sample_bars[2:5]
+        assert view[6:2] == []
+
+    def test_future_access_raises(self, sample_bars):
+        """Test that indexing past the view end raises IndexError."""
+        view = BarView(sample_bars, 0, 4)
+        with pytest.raises(IndexError):
+            view[4]
+        # Slices are clamped to the view, never exposing future bars
+        assert list(view[0:100]) == sample_bars[:4]
+
+    def test_invalid_bounds_raise(self, sample_bars):
+        """Test that bounds outside the backing list raise ValueError."""
+        with pytest.raises(ValueError):
+            BarView(sample_bars, 0, 11)
+        with pytest.raises(ValueError):
+            BarView(sample_bars, 5, 3)
+
+    def test_backtest_sequence_view(self, sample_bars):
+        """Test BacktestBarSequence.view() is bounded by current_index."""
+        sequence = BacktestBarSequence(sample_bars, current_index=5)
+        view = sequence.view()
+        assert list(view) == sequence.get_bars(0, 5)
+        assert list(sequence.view(3)) == sample_bars[3:6]
+
+        with pytest.raises(IndexError):
+            sequence.view(6)
+
+    def test_backtest_sequence_advance(self, sample_bars):
+        """Test advancing the sequence extends the view but not backwards."""
+        sequence = BacktestBarSequence(sample_bars, current_index=2)
+        earlier = sequence.view()
+        sequence.advance(7)
+        assert sequence.length() == 8
+        assert len(sequence.view()) == 8
+        # Views taken earlier keep their original bounds
+        assert len(earlier) == 3
+
+        with pytest.raises(ValueError):
+            sequence.advance(3)
@@ -0,0 +1,246 @@
+"""
+Unit Tests for ParquetBarStore
+
+Purpose:
+--------
+Verifies year partitioning, duplicate-free appends, date-range reads
+(frames and bars), lossless Decimal storage and incremental sync from the
+OHLCV repository at both ends of the stored range.
+"""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from src.backtesting.bar_store import ParquetBarStore
+from src.models.ohlcv import OHLCVBar
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+def make_bars(start: datetime, count: int, symbol: str = "AAPL", timeframe: str = "1d"):
+    """Daily bars with 8-decimal prices starting at start."""
+    bars = []
+    for i in range(count):
+        open_price = Decimal("150.12345678") + Decimal(i) / 4
+        bars.append(
+            OHLCVBar(
+                symbol=symbol,
+                timeframe=timeframe,
+                timestamp=start + timedelta(days=i),
+                open=open_price,
+                high=open_price + Decimal("2.5"),
+                low=open_price - Decimal("1.25"),
+                close=open_price + Decimal("0.75"),
+                volume=1_000_000 + i,
+                spread=Decimal("3.75"),
+                spread_ratio=Decimal("0.9876"),
+                volume_ratio=Decimal("1.2345"),
+                low_history_flag=True if i < 20 else None,
+            )
+        )
+    return bars
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ParquetBarStore(tmp_path / "bars")
+
+
+@pytest.fixture
+def year_end_bars():
+    """40 bars spanning the 2023/2024 year boundary."""
+    return make_bars(datetime(2023, 12, 10, tzinfo=UTC), 40)
+
+
+# ============================================================================
+# Writes
+# ============================================================================
+
+
+def test_append_partitions_by_year(store, year_end_bars):
+    assert store.append_bars(year_end_bars) == 40
+
+    assert store.years("AAPL", "1d") == [2023, 2024]
+    assert (store.root / "symbol=AAPL" / "timeframe=1d" / "year=2023.parquet").exists()
+    assert store.latest_timestamp("AAPL", "1d") == year_end_bars[-1].timestamp
+
+
+def test_append_skips_stored_and_repeated_timestamps(store, year_end_bars):
+    store.append_bars(year_end_bars[:30])
+
+    # Overlaps the stored range and repeats bars within the batch
+    written = store.append_bars(year_end_bars[20:] + year_end_bars[35:])
+
+    assert written == 10
+    assert len(store.read_bars("AAPL", "1d")) == 40
+
+
+def test_append_out_of_order_is_read_back_sorted(store, year_end_bars):
+    store.append_bars(list(reversed(year_end_bars)))
+
+    timestamps = [bar.timestamp for bar in store.read_bars("AAPL", "1d")]
+
+    assert timestamps == [bar.timestamp for bar in year_end_bars]
+
+
+def test_symbols_with_slash_are_stored(store):
+    bars = make_bars(datetime(2024, 1, 1, tzinfo=UTC), 5, symbol="EUR/USD")
+
+    store.append_bars(bars)
+
+    assert [bar.symbol for bar in store.read_bars("EUR/USD", "1d")] == ["EUR/USD"] * 5
+
+
+# ============================================================================
+# Reads
+# ============================================================================
+
+
+def test_read_bars_round_trips_values(store, year_end_bars):
+    store.append_bars(year_end_bars)
+
+    bars = store.read_bars("AAPL", "1d")
+
+    for stored, original in zip(bars, year_end_bars, strict=True):
+        assert stored.timestamp == original.timestamp
+        assert (stored.open, stored.high, stored.low, stored.close) == (
+            original.open,
+            original.high,
+            original.low,
+            original.close,
+        )
+        assert stored.volume == original.volume
+        assert stored.spread == original.spread
+        assert stored.spread_ratio == original.spread_ratio
+        assert stored.volume_ratio == original.volume_ratio
+        assert stored.low_history_flag is original.low_history_flag
+
+
+def test_prices_beyond_float_precision_round_trip(store):
+    # 18 significant digits do not survive a float64
+    bar = make_bars(datetime(2024, 1, 1, tzinfo=UTC), 1)[0].model_copy(
+        update={"close": Decimal("1234567890.12345678")}
+    )
+    store.append_bars([bar])
+
+    assert store.read_bars("AAPL", "1d")[0].close == Decimal("1234567890.12345678")
+
+
+def test_read_date_range_is_inclusive(store, year_end_bars):
+    store.append_bars(year_end_bars)
+    start, end = year_end_bars[15].timestamp, year_end_bars[25].timestamp
+
+    bars = store.read_bars("AAPL", "1d", start, end)
+
+    assert [bar.timestamp for bar in bars] == [bar.timestamp for bar in year_end_bars[15:26]]
+
+
+def test_read_frame_matches_from_bars(store, year_end_bars):
+    store.append_bars(year_end_bars)
+
+    frame = store.read_frame("AAPL", "1d")
+    expected = OHLCVFrame.from_bars(year_end_bars)
+
+    for column in ("timestamp", "open", "high", "low", "close", "volume"):
+        assert np.array_equal(getattr(frame, column), getattr(expected, column))
+
+
+def test_single_partition_read_is_zero_copy(store, year_end_bars):
+    store.append_bars(year_end_bars)
+
+    frame = store.read_frame("AAPL", "1d", end_date=datetime(2023, 12, 31, tzinfo=UTC))
+
+    assert len(frame) == 22
+    # Views of the Arrow buffers are read-only
+    assert not frame.timestamp.flags.writeable
+
+
+def test_read_missing_series_is_empty(store):
+    assert store.read_bars("MISSING", "1d") == []
+    assert len(store.read_frame("MISSING", "1d")) == 0
+    assert store.latest_timestamp("MISSING", "1d") is None
+    assert store.earliest_timestamp("MISSING", "1d") is None
+
+
+# ============================================================================
+# Sync
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_sync_fetches_only_newer_bars(store, year_end_bars):
+    store.append_bars(year_end_bars[:30])
+    store._write_synced_from("AAPL", "1d", None)
+    repository = MagicMock()
+    repository.get_bars_lean = AsyncMock(return_value=year_end_bars[30:])
+
+    appended = await store.sync_from_repository(repository, "AAPL", "1d")
+
+    assert appended == 10
+    start_date = repository.get_bars_lean.call_args.kwargs["start_date"]
+    assert year_end_bars[29].timestamp < start_date <= year_end_bars[30].timestamp
+    assert store.latest_timestamp("AAPL", "1d") == year_end_bars[-1].timestamp
+
+
+@pytest.mark.asyncio
+async def test_sync_empty_store_fetches_everything(store, year_end_bars):
+    repository = MagicMock()
+    repository.get_bars_lean = AsyncMock(return_value=year_end_bars)
+
+    assert await store.sync_from_repository(repository, "AAPL", "1d") == 40
+    assert repository.get_bars_lean.call_args.kwargs["start_date"] is None
+
+
+@pytest.mark.asyncio
+async def test_sync_backfills_missing_head_range(store, year_end_bars):
+    # Store synced from bar 10; older history is backfilled in the database later
+    repository = MagicMock()
+    repository.get_bars_lean = AsyncMock(return_value=year_end_bars[10:])
+    await store.sync_from_repository(
+        repository, "AAPL", "1d", start_date=year_end_bars[10].timestamp
+    )
+
+    repository.get_bars_lean = AsyncMock(side_effect=[year_end_bars[:10], []])
+    appended = await store.sync_from_repository(
+        repository, "AAPL", "1d", start_date=year_end_bars[0].timestamp
+    )
+
+    assert appended == 10
+    head_call = repository.get_bars_lean.call_args_list[0].kwargs
+    assert head_call["start_date"] == year_end_bars[0].timestamp
+    assert year_end_bars[9].timestamp <= head_call["end_date"] < year_end_bars[10].timestamp
+    assert store.earliest_timestamp("AAPL", "1d") == year_end_bars[0].timestamp
+    assert store.covers_start("AAPL", "1d", year_end_bars[0].timestamp)
+
+
+@pytest.mark.asyncio
+async def test_sync_skips_head_range_once_covered(store, year_end_bars):
+    repository = MagicMock()
+    repository.get_bars_lean = AsyncMock(return_value=year_end_bars)
+    start = year_end_bars[0].timestamp - timedelta(days=30)
+    await store.sync_from_repository(repository, "AAPL", "1d", start_date=start)
+
+    # Nothing before the first bar exists; later syncs only ask for newer bars
+    repository.get_bars_lean = AsyncMock(return_value=[])
+    await store.sync_from_repository(repository, "AAPL", "1d", start_date=start)
+
+    assert repository.get_bars_lean.await_count == 1
+    assert repository.get_bars_lean.call_args.kwargs["start_date"] > year_end_bars[-1].timestamp
+
+
+def test_covers_start_requires_a_sync(store, year_end_bars):
+    store.append_bars(year_end_bars)
+    assert not store.covers_start("AAPL", "1d", year_end_bars[0].timestamp)
+
+    store._write_synced_from("AAPL", "1d", year_end_bars[5].timestamp)
+
+    assert store.covers_start("AAPL", "1d", year_end_bars[5].timestamp)
+    assert not store.covers_start("AAPL", "1d", year_end_bars[4].timestamp)
+    assert not store.covers_start("AAPL", "1d", None)
@@ -0,0 +1,187 @@
+"""
+Unit Tests for Exit Indicator State
+
+Purpose:
+--------
+Verifies that ExitIndicatorState produces exactly the values the list-based
+exit checks compute from recent_bars, bar by bar, and that the checks give
+identical decisions when fed the incremental state.
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.backtesting.exit import ExitIndicatorState
+from src.backtesting.exit_logic_refinements import (
+    ExitLogicRefinements,
+    calculate_atr,
+    check_volatility_spike,
+    detect_failed_rallies,
+    detect_lower_high,
+    detect_uptrend_break,
+    wyckoff_exit_logic_unified,
+)
+from src.backtesting.intraday_campaign_detector import Campaign, CampaignState
+from src.models.ohlcv import OHLCVBar
+from src.models.wyckoff_phase import WyckoffPhase
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def random_walk_bars():
+    """Random-walk hourly bars on a 0.05 tick grid (ties between highs are common)."""
+    rng = random.Random(42)
+    base_timestamp = datetime(2024, 1, 1, tzinfo=UTC)
+    bars = []
+    price = 10000  # in 0.01 units
+    for i in range(120):
+        price += rng.choice((-40, -20, -5, 0, 5, 20, 40))
+        high = price + rng.choice((5, 10, 30))
+        low = price - rng.choice((5, 10, 30))
+        bars.append(
+            OHLCVBar(
+                symbol="TEST",
+                timeframe="1h",
+                timestamp=base_timestamp + timedelta(hours=i),
+                open=Decimal(price) / 100,
+                high=Decimal(high) / 100,
+                low=Decimal(low) / 100,
+                close=Decimal(rng.randint(low, high)) / 100,
+                volume=rng.randint(500_000, 1_500_000),
+                spread=Decimal(high - low) / 100,
+            )
+        )
+    return bars
+
+
+def phase_e_campaign(**overrides) -> Campaign:
+    """Phase E campaign with no jump/resistance (exercises the max-high fallback)."""
+    campaign = Campaign(
+        state=CampaignState.ACTIVE,
+        current_phase=WyckoffPhase.E,
+        entry_atr=Decimal("0.10"),
+    )
+    for name, value in overrides.items():
+        setattr(campaign, name, value)
+    return campaign
+
+
+# ============================================================================
+# Indicator parity
+# ============================================================================
+
+
+def test_atr_matches_calculate_atr(random_walk_bars):
+    state = ExitIndicatorState()
+
+    for n, bar in enumerate(random_walk_bars, start=1):
+        state.update(bar)
+        assert state.atr == calculate_atr(random_walk_bars[:n], period=14)
+
+
+def test_rolling_volume_and_max_high(random_walk_bars):
+    state = ExitIndicatorState()
+
+    for n, bar in enumerate(random_walk_bars, start=1):
+        state.update(bar)
+        window = random_walk_bars[max(0, n - 20) : n]
+        assert state.max_high == max(b.high for b in window)
+        if n >= 20:
+            assert state.avg_volume == sum(b.volume for b in window) / Decimal("20")
+        else:
+            assert state.avg_volume is None
+
+
+def test_exit_checks_match_list_path(random_walk_bars):
+    """Every check returns the same decision from state as from recent_bars."""
+    state = ExitIndicatorState()
+    campaign_list = phase_e_campaign()
+    campaign_state = phase_e_campaign()
+    seen_exits = set()
+
+    for n, bar in enumerate(random_walk_bars, start=1):
+        recent_bars = random_walk_bars[:n]
+        state.update(bar)
+
+        expected = [
+            check_volatility_spike(bar, campaign_list, recent_bars),
+            detect_uptrend_break(campaign_list, bar, recent_bars),
+            detect_lower_high(campaign_list, recent_bars, lookback=10),
+            detect_failed_rallies(campaign_list, recent_bars, lookback=20),
+        ]
+        actual = [
+            check_volatility_spike(bar, campaign_state, recent_bars, indicators=state),
+            detect_uptrend_break(campaign_state, bar, recent_bars, indicators=state),
+            detect_lower_high(campaign_state, recent_bars, lookback=10, indicators=state),
+            detect_failed_rallies(campaign_state, recent_bars, lookback=20, indicators=state),
+        ]
+
+        assert actual == expected, f"bar {n}"
+        assert campaign_state.max_atr_seen == campaign_list.max_atr_seen
+        seen_exits.update(i for i, (should_exit, _) in enumerate(expected) if should_exit)
+
+    # The walk must exercise more than one exit condition to be meaningful
+    assert len(seen_exits) >= 2
+
+
+def test_unified_exit_with_indicators_matches(random_walk_bars):
+    state = ExitIndicatorState()
+
+    for n, bar in enumerate(random_walk_bars, start=1):
+        state.update(bar)
+        recent_bars = random_walk_bars[:n]
+        expected = wyckoff_exit_logic_unified(bar, phase_e_campaign(), recent_bars, n)
+        actual = wyckoff_exit_logic_unified(
+            bar, phase_e_campaign(), recent_bars, n, indicators=state
+        )
+        assert actual[:2] == expected[:2], f"bar {n}"
+
+
+# ============================================================================
+# Feeding
+# ============================================================================
+
+
+def test_update_ignores_seen_bars(random_walk_bars):
+    state = ExitIndicatorState()
+
+    assert state.update(random_walk_bars[0]) is True
+    assert state.update(random_walk_bars[0]) is False
+    assert state.bar_count == 1
+
+
+def test_sync_applies_only_unseen_tail(random_walk_bars):
+    state = ExitIndicatorState()
+
+    assert state.sync(random_walk_bars[:30]) == 30
+    assert state.sync(random_walk_bars[:30]) == 0
+    # Windowed recent_bars overlapping the seen history
+    assert state.sync(random_walk_bars[10:33]) == 3
+    assert state.bar_count == 33
+    assert state.atr == calculate_atr(random_walk_bars[:33], period=14)
+
+
+@pytest.mark.asyncio
+async def test_process_exit_drops_campaign_state(random_walk_bars):
+    exit_logic = ExitLogicRefinements(MagicMock())
+    exit_logic._state_manager.handle_exit = AsyncMock()
+    campaign_id = uuid4()
+    campaign = phase_e_campaign(campaign_id=str(campaign_id))
+
+    await exit_logic.evaluate_exit(campaign, random_walk_bars[29], random_walk_bars[:30], 30)
+    assert len(exit_logic._indicator_states) == 1
+
+    # The facade's callers pass the UUID, not the campaign's str id
+    await exit_logic.process_exit(
+        campaign_id=campaign_id, position_id=uuid4(), exit_signal=MagicMock()
+    )
+
+    assert exit_logic._indicator_states == {}
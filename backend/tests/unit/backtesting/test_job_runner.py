@@ -0,0 +1,263 @@
+"""
+Unit tests for the backtest job runner.
+
+Most tests inject a ThreadPoolExecutor so jobs run in-process; one test uses
+the real spawn-based process pool end to end.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+
+from src.backtesting.job_runner import (
+    BacktestJobRunner,
+    JobCancelledError,
+    JobStatus,
+    ProgressReporter,
+)
+
+# ---------------------------------------------------------------------------
+# Job functions (module level so they pickle for the process-pool test)
+# ---------------------------------------------------------------------------
+
+
+def add_job(a: int, b: int, *, progress: ProgressReporter) -> int:
+    progress.report(step=1)
+    return a + b
+
+
+async def async_job(value: str, *, progress: ProgressReporter) -> str:
+    await asyncio.sleep(0)
+    return value.upper()
+
+
+def failing_job(*, progress: ProgressReporter) -> None:
+    raise ValueError("boom")
+
+
+def blocking_job(started: threading.Event, release: threading.Event, *, progress) -> str:
+    started.set()
+    release.wait(5)
+    return "done"
+
+
+def looping_job(started: threading.Event, *, progress: ProgressReporter) -> int:
+    """Reports progress until cancelled (or 5s elapse)."""
+    started.set()
+    deadline = time.monotonic() + 5
+    steps = 0
+    while time.monotonic() < deadline:
+        progress.report(step=steps)
+        steps += 1
+        time.sleep(0.01)
+    return steps
+
+
+@pytest.fixture
+async def runner():
+    executor = ThreadPoolExecutor(max_workers=4)
+    job_runner = BacktestJobRunner(
+        max_workers=4, concurrency={"backtest": 1, "preview": 2}, executor=executor
+    )
+    yield job_runner
+    await job_runner.shutdown()
+    executor.shutdown(wait=True)
+
+
+class TestJobExecution:
+    """Tests for running jobs to completion."""
+
+    @pytest.mark.asyncio
+    async def test_sync_job_returns_result(self, runner):
+        job_id = uuid4()
+
+        assert await runner.run("backtest", add_job, 2, 3, job_id=job_id) == 5
+        job = runner.get_job(job_id)
+        assert job.status is JobStatus.COMPLETED
+        assert job.started_at is not None
+        assert job.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_async_job_runs_in_worker_loop(self, runner):
+        assert await runner.run("preview", async_job, "spy") == "SPY"
+
+    @pytest.mark.asyncio
+    async def test_progress_forwarded_to_callback(self, runner):
+        received = []
+
+        async def on_progress(**payload):
+            received.append(payload)
+
+        await runner.run("backtest", add_job, 1, 1, on_progress=on_progress)
+        for _ in range(50):
+            if received:
+                break
+            await asyncio.sleep(0.01)
+
+        assert received == [{"step": 1}]
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_and_marks_failed(self, runner):
+        job_id = uuid4()
+
+        with pytest.raises(ValueError, match="boom"):
+            await runner.run("backtest", failing_job, job_id=job_id)
+
+        job = runner.get_job(job_id)
+        assert job.status is JobStatus.FAILED
+        assert job.error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_type_rejected(self, runner):
+        with pytest.raises(ValueError, match="Unknown job type"):
+            await runner.run("nightly", add_job, 1, 2)
+
+
+class TestQueueingAndCancellation:
+    """Tests for per-type concurrency limits and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_beyond_limit_wait_in_queue(self, runner):
+        started, release = threading.Event(), threading.Event()
+        first_id, second_id = uuid4(), uuid4()
+
+        first = asyncio.create_task(
+            runner.run("backtest", blocking_job, started, release, job_id=first_id)
+        )
+        await asyncio.to_thread(started.wait, 5)
+        second = asyncio.create_task(runner.run("backtest", add_job, 1, 2, job_id=second_id))
+        await asyncio.sleep(0.05)
+
+        assert runner.get_job(first_id).status is JobStatus.RUNNING
+        assert runner.get_job(second_id).status is JobStatus.QUEUED
+        assert runner.get_stats()["backtest"] == {"queued": 1, "running": 1, "limit": 1}
+
+        release.set()
+        assert await first == "done"
+        assert await second == 3
+
+    @pytest.mark.asyncio
+    async def test_other_job_types_not_blocked(self, runner):
+        started, release = threading.Event(), threading.Event()
+        blocked = asyncio.create_task(runner.run("backtest", blocking_job, started, release))
+        await asyncio.to_thread(started.wait, 5)
+
+        assert await runner.run("preview", add_job, 4, 4) == 8
+
+        release.set()
+        await blocked
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_job(self, runner):
+        started, release = threading.Event(), threading.Event()
+        queued_id = uuid4()
+
+        running = asyncio.create_task(runner.run("backtest", blocking_job, started, release))
+        await asyncio.to_thread(started.wait, 5)
+        queued = asyncio.create_task(runner.run("backtest", add_job, 1, 2, job_id=queued_id))
+        await asyncio.sleep(0.05)
+
+        assert runner.cancel(queued_id) is True
+        with pytest.raises(JobCancelledError):
+            await queued
+        assert runner.get_job(queued_id).status is JobStatus.CANCELLED
+
+        release.set()
+        assert await running == "done"
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job_stops_at_next_report(self, runner):
+        started = threading.Event()
+        job_id = uuid4()
+
+        task = asyncio.create_task(runner.run("backtest", looping_job, started, job_id=job_id))
+        await asyncio.to_thread(started.wait, 5)
+
+        assert runner.cancel(job_id) is True
+        with pytest.raises(JobCancelledError):
+            await task
+        assert runner.get_job(job_id).status is JobStatus.CANCELLED
+
+        # Slot is released once the worker observes the flag and exits
+        assert await asyncio.wait_for(runner.run("backtest", add_job, 1, 1), timeout=2) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_finished_job_returns_false(self, runner):
+        job_id = uuid4()
+        await runner.run("backtest", add_job, 1, 1, job_id=job_id)
+
+        assert runner.cancel(job_id) is False
+        assert runner.cancel(uuid4()) is False
+
+
+class TestBarProgressCallback:
+    """Tests for the UnifiedBacktestEngine progress adapter."""
+
+    def test_reports_only_on_percent_change(self):
+        progress_queue = queue.Queue()
+        reporter = ProgressReporter(uuid4(), progress_queue, {})
+        callback = reporter.bar_progress_callback()
+
+        for i in range(1, 1001):
+            callback(i, 1000)
+
+        payloads = [progress_queue.get_nowait()[1] for _ in range(progress_queue.qsize())]
+        assert len(payloads) == 101  # 0%..100%
+        assert payloads[-1] == {"bars_analyzed": 1000, "total_bars": 1000, "percent_complete": 100}
+
+    def test_raises_when_cancelled(self):
+        job_id = uuid4()
+        reporter = ProgressReporter(job_id, queue.Queue(), {job_id: True})
+
+        with pytest.raises(JobCancelledError):
+            reporter.bar_progress_callback()(1, 10)
+
+
+class TestStepProgressCallback:
+    """Tests for the per-symbol/per-window progress adapter."""
+
+    def test_reports_every_step(self):
+        progress_queue = queue.Queue()
+        reporter = ProgressReporter(uuid4(), progress_queue, {})
+        callback = reporter.step_progress_callback()
+
+        for i in range(4):
+            callback(i, 3)
+
+        payloads = [progress_queue.get_nowait()[1] for _ in range(progress_queue.qsize())]
+        assert [p["steps_completed"] for p in payloads] == [0, 1, 2, 3]
+        assert payloads[-1] == {"steps_completed": 3, "total_steps": 3, "percent_complete": 100}
+
+    def test_raises_when_cancelled(self):
+        job_id = uuid4()
+        reporter = ProgressReporter(job_id, queue.Queue(), {job_id: True})
+
+        with pytest.raises(JobCancelledError):
+            reporter.step_progress_callback()(0, 3)
+
+
+class TestProcessPool:
+    """End-to-end test with the real spawn-based process pool."""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_in_worker_process(self):
+        job_runner = BacktestJobRunner(max_workers=1)
+        received = []
+
+        async def on_progress(**payload):
+            received.append(payload)
+
+        try:
+            assert await job_runner.run("backtest", add_job, 20, 22, on_progress=on_progress) == 42
+            for _ in range(100):
+                if received:
+                    break
+                await asyncio.sleep(0.02)
+            assert received == [{"step": 1}]
+        finally:
+            await job_runner.shutdown()
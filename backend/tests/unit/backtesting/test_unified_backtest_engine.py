@@ -15,6 +15,7 @@ from uuid import uuid4
 
 import pytest
 
+from src.backtesting.bar_sequence import BarView
 from src.backtesting.engine import (
     EngineConfig,
     UnifiedBacktestEngine,
@@ -220,6 +221,28 @@ class TestUnifiedBacktestEngineRun:
         # Detector should be called for each bar
         assert len(mock_detector.detect_calls) == len(sample_bars)
 
+    def test_run_passes_bounded_bar_views(
+        self,
+        sample_bars: list[OHLCVBar],
+        default_config: EngineConfig,
+        mock_detector: MockSignalDetector,
+        mock_cost_model: MockCostModel,
+    ):
+        """Detector receives zero-copy views limited to bars[0:index+1]."""
+        position_manager = PositionManager(default_config.initial_capital)
+        engine = UnifiedBacktestEngine(
+            mock_detector, mock_cost_model, position_manager, default_config
+        )
+
+        engine.run(sample_bars)
+
+        for bars, index in mock_detector.detect_calls:
+            assert isinstance(bars, BarView)
+            assert len(bars) == index + 1
+            assert bars[-1] is sample_bars[index]
+            with pytest.raises(IndexError):
+                bars[index + 1]
+
     def test_run_returns_backtest_result(
         self,
         sample_bars: list[OHLCVBar],
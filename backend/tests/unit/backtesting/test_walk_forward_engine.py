@@ -14,6 +14,7 @@ from uuid import uuid4
 
 import pytest
 
+from src.backtesting.job_runner import JobCancelledError
 from src.backtesting.walk_forward_engine import WalkForwardEngine
 from src.models.backtest import (
     BacktestConfig,
@@ -371,6 +372,37 @@ class TestWalkForwardTest:
         assert window.validate_metrics.win_rate == Decimal("0.54")
         assert window.performance_ratio == Decimal("0.9000")
 
+    @patch.object(WalkForwardEngine, "_run_backtest_for_window")
+    def test_progress_reported_per_window(self, mock_run_backtest):
+        mock_run_backtest.side_effect = lambda symbol, start, end, cfg: _mock_backtest_result(
+            start, end
+        )
+        config = _two_window_config()
+        reported = []
+
+        WalkForwardEngine().walk_forward_test(
+            ["AAPL"], config, progress_callback=lambda done, total: reported.append((done, total))
+        )
+
+        assert reported == [(0, 2), (1, 2), (2, 2)]
+
+    @patch.object(WalkForwardEngine, "_run_backtest_for_window")
+    def test_progress_callback_exception_stops_test(self, mock_run_backtest):
+        """A cancelled job's progress hook raises; the remaining windows are skipped."""
+        mock_run_backtest.side_effect = lambda symbol, start, end, cfg: _mock_backtest_result(
+            start, end
+        )
+
+        def cancel_after_first_window(done, total):
+            if done == 1:
+                raise JobCancelledError("job")
+
+        with pytest.raises(JobCancelledError):
+            WalkForwardEngine().walk_forward_test(
+                ["AAPL"], _two_window_config(), progress_callback=cancel_after_first_window
+            )
+        assert mock_run_backtest.call_count == 2
+
     def test_walk_forward_invalid_config(self):
         """Test walk-forward with invalid configuration."""
         from pydantic import ValidationError
@@ -851,6 +883,38 @@ class TestPlaceholderWindowTracking:
 # Helper functions
 
 
+def _mock_backtest_result(start_date: date, end_date: date) -> BacktestResult:
+    return BacktestResult(
+        backtest_run_id=uuid4(),
+        symbol="AAPL",
+        start_date=start_date,
+        end_date=end_date,
+        config=BacktestConfig(symbol="AAPL", start_date=start_date, end_date=end_date),
+        summary=BacktestMetrics(
+            win_rate=Decimal("0.60"),
+            average_r_multiple=Decimal("2.0"),
+            profit_factor=Decimal("1.8"),
+            sharpe_ratio=Decimal("1.5"),
+        ),
+        created_at=datetime.now(UTC),
+    )
+
+
+def _two_window_config() -> WalkForwardConfig:
+    return WalkForwardConfig(
+        symbols=["AAPL"],
+        overall_start_date=date(2020, 1, 1),
+        overall_end_date=date(2020, 12, 31),
+        train_period_months=6,
+        validate_period_months=3,
+        backtest_config=BacktestConfig(
+            symbol="AAPL",
+            start_date=date(2020, 1, 1),
+            end_date=date(2020, 12, 31),
+        ),
+    )
+
+
 def _create_validation_window(
     window_num: int,
     train_win_rate: Decimal = Decimal("0.60"),
@@ -891,3 +955,117 @@ def _create_validation_window(
         degradation_detected=degradation,
         is_placeholder=is_placeholder,
     )
+
+
+class TestParallelExecution:
+    """Test parallel (process pool) execution and multi-symbol runs."""
+
+    def _make_bars(self, symbol: str, start_date: date, num_days: int, step: str) -> list:
+        """Generate weekday bars with a symbol-specific trend."""
+        from datetime import timedelta
+
+        from src.models.ohlcv import OHLCVBar
+
+        bars = []
+        for i in range(num_days):
+            bar_date = start_date + timedelta(days=i)
+            if bar_date.weekday() >= 5:
+                continue
+            price = Decimal("100.00") + Decimal(str(i)) * Decimal(step)
+            bars.append(
+                OHLCVBar(
+                    symbol=symbol,
+                    timeframe="1d",
+                    timestamp=datetime(bar_date.year, bar_date.month, bar_date.day, tzinfo=UTC),
+                    open=price,
+                    high=price + Decimal("1.00"),
+                    low=price - Decimal("0.50"),
+                    close=price + Decimal("0.50"),
+                    volume=1000000 + (i % 7) * 50000,
+                    spread=Decimal("1.50"),
+                )
+            )
+        return bars
+
+    def _config(self, symbols: list[str]) -> WalkForwardConfig:
+        return WalkForwardConfig(
+            symbols=symbols,
+            overall_start_date=date(2020, 1, 1),
+            overall_end_date=date(2021, 6, 30),
+            train_period_months=6,
+            validate_period_months=3,
+            backtest_config=BacktestConfig(
+                symbol=symbols[0],
+                start_date=date(2020, 1, 1),
+                end_date=date(2021, 6, 30),
+            ),
+        )
+
+    @staticmethod
+    def _window_summary(result) -> list[tuple]:
+        return [
+            (
+                w.window_number,
+                w.symbol,
+                w.train_start_date,
+                w.validate_end_date,
+                w.train_metrics.model_dump(),
+                w.validate_metrics.model_dump(),
+                w.performance_ratio,
+            )
+            for w in result.windows
+        ]
+
+    def test_parallel_matches_sequential(self):
+        """Process-pool results are identical to the sequential path."""
+        market_data = {
+            "AAPL": self._make_bars("AAPL", date(2020, 1, 1), 550, "0.10"),
+            "MSFT": self._make_bars("MSFT", date(2020, 1, 1), 550, "-0.05"),
+        }
+        config = self._config(["AAPL", "MSFT"])
+
+        sequential = WalkForwardEngine(market_data=market_data).walk_forward_test(
+            ["AAPL", "MSFT"], config
+        )
+        parallel = WalkForwardEngine(
+            market_data=market_data, parallel=True, max_workers=2
+        ).walk_forward_test(["AAPL", "MSFT"], config)
+
+        assert sequential.windows
+        assert self._window_summary(parallel) == self._window_summary(sequential)
+        assert parallel.stability_score == sequential.stability_score
+        assert parallel.degradation_windows == sequential.degradation_windows
+
+    def test_all_symbols_tested_with_per_symbol_data(self):
+        """Per-symbol market data runs every symbol, numbering windows symbol-major."""
+        market_data = {
+            "AAPL": self._make_bars("AAPL", date(2020, 1, 1), 550, "0.10"),
+            "MSFT": self._make_bars("MSFT", date(2020, 1, 1), 550, "0.20"),
+        }
+        engine = WalkForwardEngine(market_data=market_data)
+
+        result = engine.walk_forward_test(["AAPL", "MSFT"], self._config(["AAPL", "MSFT"]))
+
+        num_periods = len(engine._generate_windows(self._config(["AAPL"])))
+        assert [w.symbol for w in result.windows] == ["AAPL"] * num_periods + ["MSFT"] * num_periods
+        assert [w.window_number for w in result.windows] == list(range(1, 2 * num_periods + 1))
+        assert result.chart_data.window_labels[0] == "AAPL Window 1"
+
+    def test_symbols_without_data_are_skipped(self):
+        market_data = {"AAPL": self._make_bars("AAPL", date(2020, 1, 1), 550, "0.10")}
+        engine = WalkForwardEngine(market_data=market_data)
+
+        result = engine.walk_forward_test(["AAPL", "TSLA"], self._config(["AAPL", "TSLA"]))
+
+        assert result.windows
+        assert {w.symbol for w in result.windows} == {None}
+
+    def test_single_bar_list_keeps_first_symbol_behaviour(self):
+        """A plain bar list still tests symbols[0] only, without a symbol tag."""
+        bars = self._make_bars("AAPL", date(2020, 1, 1), 550, "0.10")
+        engine = WalkForwardEngine(market_data=bars)
+
+        result = engine.walk_forward_test(["AAPL", "MSFT"], self._config(["AAPL", "MSFT"]))
+
+        assert all(w.symbol is None for w in result.windows)
+        assert result.chart_data.window_labels[0] == "Window 1"
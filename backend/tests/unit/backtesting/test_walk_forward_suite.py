@@ -350,6 +350,34 @@ class TestWalkForwardSuiteRunner:
         assert result.symbol_results[0].error is not None
         assert "Data fetch failed" in result.symbol_results[0].error
 
+    @patch("src.backtesting.walk_forward_suite.WalkForwardEngine")
+    def test_run_suite_loads_missing_symbols_from_bar_store(self, MockEngine):
+        """Symbols without passed market data are read from the bar store."""
+        MockEngine.return_value.walk_forward_test.side_effect = RuntimeError("stop")
+        stored_bars = [MagicMock()]
+        bar_store = MagicMock()
+        bar_store.read_bars.return_value = stored_bars
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = WalkForwardSuiteConfig(
+                symbols=[
+                    SymbolSuiteConfig(
+                        symbol="EURUSD",
+                        asset_class="forex",
+                        start_date=date(2024, 1, 1),
+                        end_date=date(2025, 12, 31),
+                    ),
+                ],
+                baselines_dir=tmpdir,
+            )
+
+            WalkForwardSuite(config, bar_store=bar_store).run()
+
+        symbol, timeframe, start, end = bar_store.read_bars.call_args.args
+        assert (symbol, timeframe) == ("EURUSD", "1d")
+        assert (start.date(), end.date()) == (date(2024, 1, 1), date(2025, 12, 31))
+        assert MockEngine.call_args.kwargs["market_data"] is stored_bars
+
 
 class TestBaselineComparison:
     """Test baseline loading and comparison."""
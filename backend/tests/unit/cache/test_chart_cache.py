@@ -0,0 +1,70 @@
+"""
+Unit tests for ChartDataCache.
+
+Tests cover:
+- Get/set and TTL expiration
+- LRU eviction
+- Per-symbol/timeframe invalidation
+"""
+
+from unittest.mock import patch
+
+from src.cache.chart_cache import ChartCacheKey, ChartDataCache
+
+
+def make_key(symbol: str = "AAPL", timeframe: str = "1d", limit: int = 500) -> ChartCacheKey:
+    return ChartCacheKey(
+        symbol=symbol,
+        timeframe=timeframe,
+        start_date=None,
+        end_date=None,
+        limit=limit,
+        max_points=None,
+    )
+
+
+class TestChartDataCache:
+    """Tests for ChartDataCache."""
+
+    def test_get_returns_stored_payload(self):
+        cache = ChartDataCache()
+        cache.set(make_key(), b'{"bars": []}')
+
+        assert cache.get(make_key()) == b'{"bars": []}'
+        assert cache.get(make_key(limit=100)) is None
+
+    def test_entries_expire_after_ttl(self):
+        cache = ChartDataCache(ttl_seconds=60)
+        with patch("src.cache.chart_cache.time.monotonic", return_value=1000.0):
+            cache.set(make_key(), b"payload")
+
+        with patch("src.cache.chart_cache.time.monotonic", return_value=1059.0):
+            assert cache.get(make_key()) == b"payload"
+        with patch("src.cache.chart_cache.time.monotonic", return_value=1061.0):
+            assert cache.get(make_key()) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = ChartDataCache(max_entries=2)
+        cache.set(make_key("AAPL"), b"a")
+        cache.set(make_key("MSFT"), b"m")
+        cache.get(make_key("AAPL"))
+
+        cache.set(make_key("TSLA"), b"t")
+
+        assert cache.get(make_key("MSFT")) is None
+        assert cache.get(make_key("AAPL")) == b"a"
+        assert cache.get(make_key("TSLA")) == b"t"
+
+    def test_invalidate_symbol_and_timeframe(self):
+        cache = ChartDataCache()
+        cache.set(make_key("AAPL", "1d"), b"daily")
+        cache.set(make_key("AAPL", "1d", limit=100), b"daily-100")
+        cache.set(make_key("AAPL", "1H"), b"hourly")
+        cache.set(make_key("MSFT", "1d"), b"other")
+
+        assert cache.invalidate_symbol("aapl", "1d") == 2
+        assert cache.get(make_key("AAPL", "1H")) == b"hourly"
+
+        assert cache.invalidate_symbol("AAPL") == 1
+        assert cache.get(make_key("MSFT", "1d")) == b"other"
@@ -0,0 +1,182 @@
+"""
+Unit tests for the incremental rolling ratio engine.
+
+Verifies parity with volume_analyzer.calculate_volume_ratio /
+calculate_spread_ratio and that MarketDataCoordinator computes live ratios
+from memory once a window is hydrated.
+"""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.config import Settings
+from src.market_data.rolling_ratios import RollingRatioEngine, RollingRatioWindow
+from src.market_data.service import MarketDataCoordinator
+from src.models.ohlcv import OHLCVBar
+from src.pattern_engine.volume_analyzer import calculate_spread_ratio, calculate_volume_ratio
+
+
+def _make_bars(count: int, symbol: str = "AAPL") -> list[OHLCVBar]:
+    """Build bars with irregular volumes and spreads."""
+    base = datetime(2024, 1, 2, 14, 30, tzinfo=UTC)
+    bars = []
+    for i in range(count):
+        low = Decimal("150.00") + Decimal(i % 11) / 7
+        high = low + Decimal("0.13") + Decimal((i * 37) % 17) / 9
+        high = high.quantize(Decimal("0.0001"))
+        low = low.quantize(Decimal("0.0001"))
+        bars.append(
+            OHLCVBar(
+                symbol=symbol,
+                timeframe="1m",
+                timestamp=base + timedelta(minutes=i),
+                open=low,
+                high=high,
+                low=low,
+                close=high,
+                volume=10_000 + (i * 7919) % 50_000,
+                spread=high - low,
+            )
+        )
+    return bars
+
+
+class TestRollingRatioWindow:
+    """Tests for the ring-buffer window."""
+
+    def test_parity_with_volume_analyzer(self):
+        """Float ratios are bit-identical to the batch functions at every bar."""
+        bars = _make_bars(150)
+        window = RollingRatioWindow()
+
+        for i, bar in enumerate(bars):
+            spread = float(bar.high - bar.low)
+            assert window.volume_ratio(bar.volume) == calculate_volume_ratio(bars, i)
+            assert window.spread_ratio(spread) == calculate_spread_ratio(bars, i)
+            window.push(bar)
+
+    def test_running_sums_match_window(self):
+        """Running sums equal the exact sums of the last 20 bars."""
+        bars = _make_bars(47)
+        window = RollingRatioWindow()
+        for bar in bars:
+            window.push(bar)
+
+        assert len(window) == 20
+        assert window.is_full
+        assert window.volume_sum == sum(b.volume for b in bars[-20:])
+        assert window.spread_sum == sum(b.spread for b in bars[-20:])
+
+    def test_partial_window_returns_none(self):
+        window = RollingRatioWindow()
+        for bar in _make_bars(19):
+            window.push(bar)
+
+        assert window.volume_ratio(1000) is None
+        assert window.spread_ratio(1.0) is None
+
+    def test_zero_spread_returns_zero(self):
+        window = RollingRatioWindow()
+        for bar in _make_bars(20):
+            window.push(bar)
+
+        assert window.spread_ratio(0.0) == 0.0
+
+    def test_invalid_size_raises(self):
+        with pytest.raises(ValueError):
+            RollingRatioWindow(size=0)
+
+
+class TestRollingRatioEngine:
+    """Tests for keyed window management."""
+
+    def test_hydrate_keeps_last_window_bars(self):
+        bars = _make_bars(60)
+        engine = RollingRatioEngine()
+        window = engine.hydrate("AAPL", "1m", bars)
+
+        assert engine.is_hydrated("AAPL", "1m")
+        assert window.volume_sum == sum(b.volume for b in bars[-20:])
+
+    def test_update_ignores_unhydrated_keys(self):
+        engine = RollingRatioEngine()
+        bar = _make_bars(1, symbol="MSFT")[0]
+
+        assert engine.update(bar) is False
+        assert engine.get("MSFT", "1m") is None
+
+    def test_update_advances_window(self):
+        bars = _make_bars(21)
+        engine = RollingRatioEngine()
+        engine.hydrate("AAPL", "1m", bars[:20])
+
+        assert engine.update(bars[20]) is True
+        assert engine.get("AAPL", "1m").volume_sum == sum(b.volume for b in bars[1:21])
+
+
+class TestCoordinatorRatios:
+    """Tests for MarketDataCoordinator's use of the engine."""
+
+    @pytest.fixture
+    def coordinator(self) -> MarketDataCoordinator:
+        adapter = MagicMock()
+        adapter.connect = AsyncMock()
+        adapter.subscribe = AsyncMock()
+        return MarketDataCoordinator(adapter, Settings())
+
+    @pytest.mark.asyncio
+    async def test_hydrates_once_then_computes_in_memory(self, coordinator):
+        """Only the first bar for a symbol reads the database."""
+        bars = _make_bars(20)
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+        session_maker.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_repo = MagicMock()
+        mock_repo.get_latest_bars = AsyncMock(return_value=bars)
+
+        with (
+            patch("src.market_data.service.async_session_maker", session_maker),
+            patch("src.market_data.service.OHLCVRepository", return_value=mock_repo),
+        ):
+            first = await coordinator._compute_ratios("AAPL", "1m", 2000, Decimal("2.00"))
+            second = await coordinator._compute_ratios("AAPL", "1m", 4000, Decimal("2.00"))
+
+        mock_repo.get_latest_bars.assert_awaited_once()
+        avg_volume = Decimal(sum(b.volume for b in bars)) / 20
+        avg_spread = sum(Decimal(str(b.spread)) for b in bars) / Decimal(20)
+        assert first == (Decimal("2000") / avg_volume, Decimal("2.00") / avg_spread, False)
+        assert second[0] == Decimal("4000") / avg_volume
+
+    @pytest.mark.asyncio
+    async def test_insufficient_history(self, coordinator):
+        coordinator._ratio_engine.hydrate("AAPL", "1m", _make_bars(8))
+
+        volume_ratio, spread_ratio, low_history = await coordinator._compute_ratios(
+            "AAPL", "1m", 1000, Decimal("1.00")
+        )
+
+        bars = _make_bars(8)
+        assert volume_ratio == Decimal(1000) / (Decimal(sum(b.volume for b in bars)) / 8)
+        assert low_history is True
+
+    @pytest.mark.asyncio
+    async def test_no_history_defaults(self, coordinator):
+        coordinator._ratio_engine.hydrate("AAPL", "1m", [])
+
+        assert await coordinator._compute_ratios("AAPL", "1m", 1000, Decimal("1.00")) == (
+            Decimal("1.0"),
+            Decimal("1.0"),
+            True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_hydration_failure_does_not_block_start(self, coordinator):
+        with patch.object(
+            coordinator, "_get_ratio_window", AsyncMock(side_effect=RuntimeError("db down"))
+        ):
+            await coordinator._hydrate_ratio_windows(["AAPL", "MSFT"], "1m")
+
+        assert not coordinator._ratio_engine.is_hydrated("AAPL", "1m")
@@ -19,6 +19,7 @@ from src.orchestrator.pipeline.context import PipelineContextBuilder
 from src.orchestrator.stages.phase_detection_stage import PhaseDetectionStage
 from src.orchestrator.stages.range_detection_stage import RangeDetectionStage
 from src.orchestrator.stages.volume_analysis_stage import VolumeAnalysisStage
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
 from src.pattern_engine.phase_detection.types import PhaseResult, PhaseType
 
 # =============================
@@ -154,7 +155,11 @@ class TestVolumeAnalysisStage:
         assert result.output is not None
         assert len(result.output) == 50
         assert result.stage_name == "volume_analysis"
-        mock_volume_analyzer.analyze.assert_called_once_with(sample_bars)
+        mock_volume_analyzer.analyze.assert_called_once()
+        frame = mock_volume_analyzer.analyze.call_args.args[0]
+        assert isinstance(frame, OHLCVFrame)
+        assert frame.bars is sample_bars
+        assert context.get("ohlcv_frame") is frame
 
     @pytest.mark.asyncio
     async def test_execute_stores_in_context(self, mock_volume_analyzer, sample_bars):
@@ -234,9 +239,11 @@ class TestRangeDetectionStage:
         assert result.output is not None
         assert len(result.output) == 1
         assert result.stage_name == "range_detection"
-        mock_range_detector.detect_ranges.assert_called_once_with(
-            sample_bars, sample_volume_analysis
-        )
+        mock_range_detector.detect_ranges.assert_called_once()
+        frame, volume_analysis = mock_range_detector.detect_ranges.call_args.args
+        assert isinstance(frame, OHLCVFrame)
+        assert frame.bars is sample_bars
+        assert volume_analysis == sample_volume_analysis
 
     @pytest.mark.asyncio
     async def test_execute_stores_in_context(
@@ -13,6 +13,7 @@ Tests cover:
 
 from unittest.mock import MagicMock
 
+from src.orchestrator.config import OrchestratorConfig
 from src.orchestrator.container import (
     OrchestratorContainer,
     reset_orchestrator_container,
@@ -44,6 +45,21 @@ class TestOrchestratorContainerInit:
         assert container.mode == "mock"
 
 
+class TestOrchestratorContainerDetectorConfig:
+    """Tests for detectors configured from OrchestratorConfig."""
+
+    def test_trading_range_detector_is_incremental_by_default(self) -> None:
+        """Realtime analysis re-runs sliding windows, so range detection is incremental."""
+        container = OrchestratorContainer()
+
+        assert container.trading_range_detector.incremental is True
+
+    def test_incremental_range_detection_can_be_disabled(self) -> None:
+        container = OrchestratorContainer(OrchestratorConfig(incremental_range_detection=False))
+
+        assert container.trading_range_detector.incremental is False
+
+
 class TestOrchestratorContainerMocking:
     """Tests for mock injection."""
 
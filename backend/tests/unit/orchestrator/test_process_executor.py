@@ -0,0 +1,244 @@
+"""
+Unit tests for the orchestrator process-pool executor.
+
+Verifies that stages 2-5 produce the same results in a worker process as on
+the event loop, and that worker events and cache entries reach the parent.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.models.ohlcv import OHLCVBar
+from src.orchestrator import process_executor
+from src.orchestrator.cache import OrchestratorCache
+from src.orchestrator.config import OrchestratorConfig
+from src.orchestrator.container import OrchestratorContainer
+from src.orchestrator.event_bus import EventBus
+from src.orchestrator.events import VolumeAnalyzedEvent
+from src.orchestrator.master_orchestrator import AnalysisStages, MasterOrchestrator
+from src.orchestrator.process_executor import (
+    BarPayload,
+    ProcessPoolStageExecutor,
+    RecordingEventBus,
+    shutdown_process_pools,
+)
+
+
+@pytest.fixture
+def sample_bars() -> list[OHLCVBar]:
+    """Create 60 daily bars with varying volume."""
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    bars = []
+    for i in range(60):
+        low = Decimal("98.25") + Decimal(i % 9)
+        high = low + Decimal("3.5") + Decimal(i % 4) / 2
+        bars.append(
+            OHLCVBar(
+                symbol="AAPL",
+                timeframe="1d",
+                timestamp=base + timedelta(days=i),
+                open=low + Decimal("1.10"),
+                high=high,
+                low=low,
+                close=high - Decimal("0.75"),
+                volume=1_000_000 + (i % 5) * 120_000,
+                spread=high - low,
+            )
+        )
+    return bars
+
+
+class TestRecordingEventBus:
+    """Tests for the worker-side event recorder."""
+
+    @pytest.mark.asyncio
+    async def test_records_and_drains_in_order(self):
+        bus = RecordingEventBus()
+        received = []
+        bus.subscribe("volume_analyzed", AsyncMock(side_effect=received.append))
+
+        events = [
+            VolumeAnalyzedEvent(
+                correlation_id=uuid4(),
+                symbol="AAPL",
+                timeframe="1d",
+                close_position=0.5,
+                effort_result="NORMAL",
+                bars_analyzed=n,
+            )
+            for n in (1, 2)
+        ]
+        for event in events:
+            await bus.publish(event)
+
+        assert received == []
+        assert bus.drain() == events
+        assert bus.drain() == []
+
+
+class TestBarPayload:
+    """Tests for the bar payload sent to workers."""
+
+    def test_round_trips_bars_exactly(self, sample_bars):
+        bars = [
+            sample_bars[0].model_copy(
+                update={
+                    "close": Decimal("1234567890.12345678"),
+                    "spread_ratio": Decimal("0.9876"),
+                    "low_history_flag": True,
+                }
+            ),
+            *sample_bars[1:],
+        ]
+
+        rebuilt = BarPayload.from_bars(bars).to_bars()
+
+        fields = (
+            "symbol",
+            "timeframe",
+            "timestamp",
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+            "spread",
+            "spread_ratio",
+            "volume_ratio",
+            "low_history_flag",
+        )
+        assert [[getattr(bar, f) for f in fields] for bar in rebuilt] == [
+            [getattr(bar, f) for f in fields] for bar in bars
+        ]
+
+
+class TestPoolLifecycle:
+    """Tests for stopping worker pools."""
+
+    def test_shutdown_process_pools_stops_started_pools(self):
+        config = OrchestratorConfig(executor_mode="process", process_pool_workers=1)
+        started = ProcessPoolStageExecutor(config, EventBus(), OrchestratorCache(config))
+        idle = ProcessPoolStageExecutor(config, EventBus(), OrchestratorCache(config))
+        started._get_pool()
+
+        shutdown_process_pools()
+
+        assert started._pool is None
+        assert idle._pool is None
+        assert started not in process_executor._live_executors
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_shuts_down_without_waiting(self, sample_bars, monkeypatch):
+        config = OrchestratorConfig(executor_mode="process", enable_caching=False)
+        executor = ProcessPoolStageExecutor(config, EventBus(), OrchestratorCache(config))
+        threads = ThreadPoolExecutor(max_workers=1)
+        executor._get_pool = Mock(return_value=threads)
+        executor.shutdown = Mock()
+        monkeypatch.setattr(
+            process_executor, "_run_stages_in_worker", Mock(side_effect=BrokenProcessPool)
+        )
+
+        try:
+            with pytest.raises(BrokenProcessPool):
+                await executor.run(sample_bars, "AAPL", "1d", uuid4())
+        finally:
+            threads.shutdown()
+
+        executor.shutdown.assert_called_once_with(wait=False)
+
+
+class TestExecutorMode:
+    """Tests for executor_mode wiring in MasterOrchestrator."""
+
+    def test_asyncio_mode_has_no_executor(self):
+        orchestrator = MasterOrchestrator(
+            config=OrchestratorConfig(),
+            container=OrchestratorContainer(mode="mock"),
+            event_bus=EventBus(),
+        )
+        assert orchestrator._process_executor is None
+
+    def test_process_mode_starts_pool_lazily(self):
+        config = OrchestratorConfig(executor_mode="process", process_pool_workers=2)
+        orchestrator = MasterOrchestrator(
+            config=config,
+            container=OrchestratorContainer(mode="mock"),
+            event_bus=EventBus(),
+        )
+
+        executor = orchestrator._process_executor
+        assert isinstance(executor, ProcessPoolStageExecutor)
+        assert executor.max_workers == 2
+        assert executor._pool is None
+        orchestrator.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_process_mode_dispatches_analysis_stages(self, sample_bars):
+        config = OrchestratorConfig(executor_mode="process", enable_caching=False)
+        orchestrator = MasterOrchestrator(
+            config=config,
+            container=OrchestratorContainer(mode="mock"),
+            event_bus=EventBus(),
+        )
+        orchestrator._fetch_bars = AsyncMock(
+            return_value=AsyncMock(success=True, output=sample_bars)
+        )
+        orchestrator._process_executor.run = AsyncMock(return_value=AnalysisStages())
+        orchestrator._run_analysis_stages = AsyncMock()
+
+        signals = await orchestrator.analyze_symbol("AAPL", "1d")
+
+        assert signals == []
+        orchestrator._process_executor.run.assert_awaited_once()
+        assert orchestrator._process_executor.run.await_args.args[0] is sample_bars
+        orchestrator._run_analysis_stages.assert_not_awaited()
+
+
+class TestProcessPoolParity:
+    """Runs real worker processes against the production detectors."""
+
+    @pytest.mark.asyncio
+    async def test_worker_matches_in_loop_stages(self, sample_bars):
+        config = OrchestratorConfig(
+            executor_mode="process", process_pool_workers=1, enable_caching=True
+        )
+        correlation_id = uuid4()
+
+        in_loop = MasterOrchestrator(
+            config=OrchestratorConfig(enable_caching=False),
+            container=OrchestratorContainer(OrchestratorConfig()),
+            event_bus=EventBus(),
+            cache=OrchestratorCache(config),
+        )
+        expected = await in_loop._run_analysis_stages(sample_bars, "AAPL", "1d", correlation_id)
+
+        event_bus = EventBus()
+        received = []
+        event_bus.subscribe("volume_analyzed", AsyncMock(side_effect=received.append))
+        cache = OrchestratorCache(config)
+        executor = ProcessPoolStageExecutor(config, event_bus, cache)
+        try:
+            actual = await executor.run(sample_bars, "AAPL", "1d", correlation_id)
+        finally:
+            executor.shutdown()
+
+        assert actual.volume.success
+        assert [
+            (v.bar.timestamp, v.volume_ratio, v.spread_ratio, v.close_position, v.effort_result)
+            for v in actual.volume.output
+        ] == [
+            (v.bar.timestamp, v.volume_ratio, v.spread_ratio, v.close_position, v.effort_result)
+            for v in expected.volume.output
+        ]
+        assert (actual.range is None) == (expected.range is None)
+        assert actual.patterns == expected.patterns == []
+
+        assert len(received) == 1
+        assert received[0].correlation_id == correlation_id
+        assert cache.get_volume_analysis("AAPL", "1d") is not None
@@ -0,0 +1,169 @@
+"""
+Unit tests for OHLCVFrame columnar bar store.
+
+Verifies that pattern-engine stages produce identical results whether they
+receive a list of OHLCVBar objects or an OHLCVFrame built from the same bars.
+"""
+
+import math
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.models.ohlcv import OHLCVBar
+from src.pattern_engine.ohlcv_frame import (
+    OHLCVFrame,
+    datetime_to_epoch_ns,
+    epoch_ns_to_datetime,
+)
+from src.pattern_engine.pivot_detector import detect_pivots
+from src.pattern_engine.volume_analyzer import (
+    VolumeAnalyzer,
+    calculate_close_positions_batch,
+    calculate_spread_ratios_batch,
+    calculate_volume_ratios_batch,
+)
+
+
+@pytest.fixture
+def wave_bars() -> list[OHLCVBar]:
+    """Oscillating price series with varying volume (produces pivots)."""
+    bars = []
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    for i in range(120):
+        mid = Decimal("100") + Decimal(str(round(8 * math.sin(i / 6), 2)))
+        high = mid + Decimal("1.5") + Decimal(i % 3) / 4
+        low = mid - Decimal("1.25")
+        bars.append(
+            OHLCVBar(
+                symbol="AAPL",
+                timeframe="1d",
+                timestamp=base + timedelta(days=i),
+                open=mid,
+                high=high,
+                low=low,
+                close=mid + Decimal("0.5"),
+                volume=1_000_000 + (i % 7) * 150_000 + (3_000_000 if i == 60 else 0),
+                spread=high - low,
+            )
+        )
+    return bars
+
+
+class TestOHLCVFrameConstruction:
+    """Test building frames from bars."""
+
+    def test_from_bars_columns(self, wave_bars):
+        """Columns mirror the source bars as float64/int64."""
+        frame = OHLCVFrame.from_bars(wave_bars)
+
+        assert len(frame) == len(wave_bars)
+        assert frame.symbol == "AAPL"
+        assert frame.timeframe == "1d"
+        assert frame.high.dtype == np.float64
+        assert frame.timestamp.dtype == np.int64
+        assert frame.high[5] == float(wave_bars[5].high)
+        assert frame.volume[60] == wave_bars[60].volume
+        assert frame.timestamp_at(7) == wave_bars[7].timestamp
+
+    def test_from_empty_bars_raises(self):
+        """Empty input is rejected."""
+        with pytest.raises(ValueError):
+            OHLCVFrame.from_bars([])
+
+    def test_mismatched_columns_raise(self):
+        """All columns must have the same length."""
+        with pytest.raises(ValueError):
+            OHLCVFrame(
+                symbol="AAPL",
+                timeframe="1d",
+                timestamp=np.zeros(3, dtype=np.int64),
+                open=np.zeros(3),
+                high=np.zeros(3),
+                low=np.zeros(2),
+                close=np.zeros(3),
+                volume=np.zeros(3),
+            )
+
+    def test_epoch_round_trip(self):
+        """Epoch nanosecond conversion is exact at microsecond precision."""
+        ts = datetime(2024, 3, 15, 14, 30, 5, 123456, tzinfo=UTC)
+        assert epoch_ns_to_datetime(datetime_to_epoch_ns(ts)) == ts
+
+    def test_slice_shares_storage(self, wave_bars):
+        """Sub-frames are views over the parent arrays."""
+        frame = OHLCVFrame.from_bars(wave_bars)
+        sub = frame.slice(10, 30)
+
+        assert len(sub) == 20
+        assert np.shares_memory(sub.high, frame.high)
+        assert sub.bar(0) is wave_bars[10]
+
+    def test_bar_without_source(self, wave_bars):
+        """Frames without source bars construct equivalent OHLCVBar rows."""
+        full = OHLCVFrame.from_bars(wave_bars)
+        frame = OHLCVFrame(
+            symbol=full.symbol,
+            timeframe=full.timeframe,
+            timestamp=full.timestamp,
+            open=full.open,
+            high=full.high,
+            low=full.low,
+            close=full.close,
+            volume=full.volume,
+        )
+        bar = frame.bar(3)
+
+        assert bar.high == wave_bars[3].high
+        assert bar.low == wave_bars[3].low
+        assert bar.timestamp == wave_bars[3].timestamp
+        assert bar.volume == wave_bars[3].volume
+
+    def test_to_dataframe(self, wave_bars):
+        """DataFrame layout matches what PhaseClassifier expects."""
+        df = OHLCVFrame.from_bars(wave_bars).to_dataframe()
+
+        assert list(df.columns) == ["timestamp", "open", "high", "low", "close", "volume"]
+        assert len(df) == len(wave_bars)
+        assert df["timestamp"].iloc[0] == wave_bars[0].timestamp
+
+
+class TestStageParity:
+    """Stages return identical results for list and frame inputs."""
+
+    def test_volume_ratios_batch(self, wave_bars):
+        frame = OHLCVFrame.from_bars(wave_bars)
+        assert calculate_volume_ratios_batch(frame) == calculate_volume_ratios_batch(wave_bars)
+
+    def test_spread_ratios_batch(self, wave_bars):
+        frame = OHLCVFrame.from_bars(wave_bars)
+        assert calculate_spread_ratios_batch(frame) == calculate_spread_ratios_batch(wave_bars)
+
+    def test_close_positions_batch(self, wave_bars):
+        frame = OHLCVFrame.from_bars(wave_bars)
+        assert calculate_close_positions_batch(frame) == calculate_close_positions_batch(wave_bars)
+
+    def test_volume_analyzer(self, wave_bars):
+        analyzer = VolumeAnalyzer()
+        from_list = analyzer.analyze(wave_bars)
+        from_frame = analyzer.analyze(OHLCVFrame.from_bars(wave_bars))
+
+        assert len(from_frame) == len(from_list)
+        for a, b in zip(from_list, from_frame, strict=True):
+            assert a.bar is b.bar
+            assert a.volume_ratio == b.volume_ratio
+            assert a.spread_ratio == b.spread_ratio
+            assert a.close_position == b.close_position
+            assert a.effort_result == b.effort_result
+
+    @pytest.mark.parametrize("lookback", [1, 3, 5, 10])
+    def test_detect_pivots(self, wave_bars, lookback):
+        from_list = detect_pivots(wave_bars, lookback=lookback)
+        from_frame = detect_pivots(OHLCVFrame.from_bars(wave_bars), lookback=lookback)
+
+        assert from_list
+        assert [(p.index, p.type, p.price) for p in from_frame] == [
+            (p.index, p.type, p.price) for p in from_list
+        ]
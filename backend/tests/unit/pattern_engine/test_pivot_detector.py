@@ -5,6 +5,7 @@ Tests the detect_pivots function with synthetic data, edge cases,
 and different lookback values.
 """
 
+import random
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -13,6 +14,8 @@ import pytest
 from src.models.ohlcv import OHLCVBar
 from src.models.pivot import Pivot, PivotType
 from src.pattern_engine.pivot_detector import (
+    STREAMING_MAX_PIVOTS,
+    StreamingPivotDetector,
     detect_pivots,
     get_pivot_highs,
     get_pivot_lows,
@@ -529,3 +532,92 @@ class TestPivotModelSerialization:
         assert (
             abs((reconstructed_pivot.timestamp - original_pivot.timestamp).total_seconds()) < 0.001
         )
+
+
+def generate_random_walk_bars(num_bars: int, seed: int, tick: str = "0.5") -> list[OHLCVBar]:
+    """Random-walk bars on a coarse price grid so equal highs/lows are common."""
+    rng = random.Random(seed)
+    step = Decimal(tick)
+    level = 200
+    bars = []
+    for i in range(num_bars):
+        level = max(level + rng.randint(-3, 3), 10)
+        low = Decimal(level) * step
+        high = low + Decimal(rng.randint(0, 4)) * step
+        bars.append(create_test_bar(i, high, low))
+    return bars
+
+
+class TestStreamingPivotDetector:
+    """Test StreamingPivotDetector parity with detect_pivots and confirmation timing."""
+
+    @pytest.mark.parametrize("lookback", [1, 2, 3, 5, 8])
+    @pytest.mark.parametrize("seed", [1, 7, 42])
+    def test_matches_batch_detection(self, lookback, seed):
+        """Streaming pivots equal detect_pivots over the same bars, ties included."""
+        bars = generate_random_walk_bars(400, seed)
+        detector = StreamingPivotDetector(lookback=lookback)
+
+        for bar in bars:
+            detector.update(bar)
+
+        assert detector.pivots == detect_pivots(bars, lookback=lookback)
+        assert detector.bars_seen == 400
+
+    def test_pivot_emitted_when_lookback_bars_confirm(self):
+        """Each pivot is returned by the update that supplies its last right-hand bar."""
+        bars = generate_random_walk_bars(300, seed=3)
+        detector = StreamingPivotDetector(lookback=4)
+
+        for t, bar in enumerate(bars):
+            confirmed = detector.update(bar)
+            expected = [p for p in detect_pivots(bars[: t + 1], lookback=4) if p.index == t - 4]
+            assert confirmed == expected
+
+    def test_flat_prices_produce_no_pivots(self):
+        bars = [create_test_bar(i, Decimal("101.00"), Decimal("99.00")) for i in range(30)]
+        detector = StreamingPivotDetector(lookback=3)
+
+        for bar in bars:
+            assert detector.update(bar) == []
+
+    def test_max_pivots_and_prune_before(self):
+        bars = generate_random_walk_bars(300, seed=11)
+        all_pivots = detect_pivots(bars, lookback=2)
+        detector = StreamingPivotDetector(lookback=2, max_pivots=5)
+
+        for bar in bars:
+            detector.update(bar)
+
+        assert detector.pivots == all_pivots[-5:]
+        detector.prune_before(all_pivots[-2].index)
+        assert all(p.index >= all_pivots[-2].index for p in detector.pivots)
+
+    def test_retention_is_bounded_by_default(self):
+        bars = generate_random_walk_bars(1500, seed=13)
+        all_pivots = detect_pivots(bars, lookback=1)
+        assert len(all_pivots) > STREAMING_MAX_PIVOTS
+        detector = StreamingPivotDetector(lookback=1)
+
+        for bar in bars:
+            detector.update(bar)
+
+        assert detector.pivots == all_pivots[-STREAMING_MAX_PIVOTS:]
+
+    def test_reset_restarts_index(self):
+        bars = generate_random_walk_bars(60, seed=5)
+        detector = StreamingPivotDetector(lookback=3)
+        for bar in bars:
+            detector.update(bar)
+
+        detector.reset()
+        for bar in bars[:30]:
+            detector.update(bar)
+
+        assert detector.bars_seen == 30
+        assert detector.pivots == detect_pivots(bars[:30], lookback=3)
+
+    @pytest.mark.parametrize("lookback", [0, 101])
+    def test_invalid_lookback_raises_error(self, lookback):
+        with pytest.raises(ValueError, match="lookback"):
+            StreamingPivotDetector(lookback=lookback)
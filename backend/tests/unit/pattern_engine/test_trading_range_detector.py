@@ -16,6 +16,7 @@ import pytest
 from src.models.ohlcv import OHLCVBar
 from src.models.trading_range import RangeStatus
 from src.models.volume_analysis import VolumeAnalysis
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
 from src.pattern_engine.trading_range_detector import (
     TradingRangeDetector,
     get_active_ranges,
@@ -558,6 +559,163 @@ class TestTradingRangeDetector:
         assert len(ranges) >= 0, "Should complete successfully"
 
 
+def range_fingerprint(ranges):
+    """Comparable view of detected ranges (ids are regenerated on every build)."""
+    return [
+        (
+            r.start_index,
+            r.end_index,
+            r.status,
+            r.quality_score,
+            r.support,
+            r.resistance,
+            r.creek.price,
+            r.ice.price,
+            r.jump.price,
+            [(z.zone_type, z.touch_count, z.last_touch_timestamp) for z in r.supply_zones],
+            [(z.zone_type, z.touch_count, z.last_touch_timestamp) for z in r.demand_zones],
+        )
+        for r in ranges
+    ]
+
+
+class TestIncrementalMode:
+    """Test incremental detection on appended bars."""
+
+    def test_matches_full_detection_bar_by_bar(self):
+        """Appending one bar at a time gives the same ranges as a full run."""
+        bars, volume_analysis = generate_trading_range_scenario()
+        detector = TradingRangeDetector(incremental=True, cache_enabled=False)
+
+        for n in range(20, len(bars) + 1):
+            incremental = detector.detect_ranges(bars[:n], volume_analysis[:n])
+            full = TradingRangeDetector(cache_enabled=False).detect_ranges(
+                bars[:n], volume_analysis[:n]
+            )
+            assert range_fingerprint(incremental) == range_fingerprint(full), f"bar {n}"
+
+    def test_frame_input_matches_list_input(self):
+        bars, volume_analysis = generate_trading_range_scenario()
+        detector = TradingRangeDetector(incremental=True, cache_enabled=False)
+
+        for n in (60, 61, 80, 100):
+            ranges = detector.detect_ranges(OHLCVFrame.from_bars(bars[:n]), volume_analysis[:n])
+
+        full = TradingRangeDetector(cache_enabled=False).detect_ranges(bars, volume_analysis)
+        assert ranges and range_fingerprint(ranges) == range_fingerprint(full)
+
+    def test_bar_without_new_pivot_reuses_ranges(self):
+        """Ranges are reused until a new pivot changes the clusters."""
+        bars, volume_analysis = generate_trading_range_scenario()
+        detector = TradingRangeDetector(incremental=True, cache_enabled=False)
+
+        first = detector.detect_ranges(bars[:90], volume_analysis[:90])
+        second = detector.detect_ranges(bars[:91], volume_analysis[:91])
+
+        assert first
+        assert range_fingerprint(second) == range_fingerprint(first)
+        assert detector.detect_ranges(bars[:91], volume_analysis[:91]) is not second
+        assert detector._cache_hits == 1
+
+    def test_returned_ranges_are_independent_copies(self):
+        """Later calls never mutate ranges handed out earlier, and vice versa."""
+        bars, volume_analysis = generate_trading_range_scenario()
+        detector = TradingRangeDetector(incremental=True, cache_enabled=False)
+
+        first = detector.detect_ranges(bars[:90], volume_analysis[:90])
+        snapshot = range_fingerprint(first)
+        for n in range(91, len(bars) + 1):
+            detector.detect_ranges(bars[:n], volume_analysis[:n])
+        assert range_fingerprint(first) == snapshot
+
+        latest = detector.detect_ranges(bars, volume_analysis)
+        original_status = latest[0].status
+        latest[0].status = RangeStatus.ARCHIVED
+        assert detector.detect_ranges(bars, volume_analysis)[0].status == original_status
+
+    def test_sliding_window_matches_full_detection(self):
+        """A fixed-size window sliding one bar at a time updates incrementally."""
+        bars, volume_analysis = generate_trading_range_scenario()
+        detector = TradingRangeDetector(incremental=True, cache_enabled=False)
+        window = 60
+
+        for end in range(window, len(bars) + 1):
+            start = end - window
+            slid = detector.detect_ranges(bars[start:end], volume_analysis[start:end])
+            full = TradingRangeDetector(cache_enabled=False).detect_ranges(
+                bars[start:end], volume_analysis[start:end]
+            )
+            assert range_fingerprint(slid) == range_fingerprint(full), f"window end {end}"
+
+        state = detector._incremental_state["AAPL:1d"]
+        assert len(state.bars) == window
+        assert state.base == len(bars) - window
+        assert all(p.index >= state.base + detector.lookback for p in state.pivot_detector.pivots)
+
+    def test_gap_in_series_rebuilds(self):
+        """A window that does not overlap the cached one is rebuilt."""
+        bars, volume_analysis = generate_trading_range_scenario()
+        detector = TradingRangeDetector(incremental=True, cache_enabled=False)
+        detector.detect_ranges(bars[:40], volume_analysis[:40])
+
+        rebuilt = detector.detect_ranges(bars[50:100], volume_analysis[50:100])
+        full = TradingRangeDetector(cache_enabled=False).detect_ranges(
+            bars[50:100], volume_analysis[50:100]
+        )
+
+        assert range_fingerprint(rebuilt) == range_fingerprint(full)
+        state = detector._incremental_state["AAPL:1d"]
+        assert state.bars[0] is bars[50]
+        assert state.base == 0
+
+    def test_breakout_triggers_single_rebuild(self):
+        bars, volume_analysis = generate_trading_range_scenario()
+        detector = TradingRangeDetector(incremental=True, cache_enabled=False)
+        ranges = detector.detect_ranges(bars[:90], volume_analysis[:90])
+        current = get_most_recent_range(ranges)
+        breakout_bar = create_test_bar(
+            90,
+            high=current.ice.price + Decimal("3.00"),
+            low=current.ice.price,
+            close=current.ice.price + Decimal("2.00"),
+        )
+
+        broken = detector._find_breakout(ranges, [breakout_bar], None)
+
+        assert broken == (current.start_index, current.end_index)
+        assert detector._find_breakout(ranges, [breakout_bar], broken) is None
+
+        # A bar closing between Creek and Ice keeps the range intact
+        midpoint = (current.creek.price + current.ice.price) / 2
+        inside_bar = create_test_bar(
+            90,
+            high=midpoint + Decimal("0.50"),
+            low=midpoint - Decimal("0.50"),
+            close=midpoint,
+        )
+        assert current.creek.price < inside_bar.close < current.ice.price
+        assert detector._find_breakout(ranges, [inside_bar], None) is None
+
+    def test_non_sequential_appended_bar_raises(self):
+        bars, volume_analysis = generate_trading_range_scenario()
+        detector = TradingRangeDetector(incremental=True)
+        detector.detect_ranges(bars[:50], volume_analysis[:50])
+
+        stale = create_test_bar(48, Decimal("180.00"), Decimal("178.00"))
+        appended = bars[:50] + [stale]
+        with pytest.raises(ValueError, match="Bars must have sequential timestamps"):
+            detector.detect_ranges(appended, volume_analysis[:50] + [volume_analysis[0]])
+
+    def test_invalidate_symbol_clears_state(self):
+        bars, volume_analysis = generate_trading_range_scenario()
+        detector = TradingRangeDetector(incremental=True)
+        detector.detect_ranges(bars, volume_analysis)
+
+        detector.invalidate_symbol("AAPL")
+
+        assert detector._incremental_state == {}
+
+
 class TestHelperFunctions:
     """Test suite for helper functions"""
 
@@ -6,6 +6,7 @@ Tests cover:
 - Supply zone detection (AC 4, Task 12)
 - Zone strength classification (AC 5, Task 13)
 - Zone touch counting (AC 5, Task 14)
+- Batched touch counting and invalidation (parity with scalar functions)
 - Proximity calculation (AC 7, Task 15)
 - Significance scoring (AC 7, Task 16)
 - Zone filtering validation (Task 18)
@@ -31,8 +32,10 @@ from src.pattern_engine.zone_mapper import (
     check_zone_invalidation,
     classify_zone_strength,
     count_zone_touches,
+    count_zone_touches_batch,
     detect_demand_zones,
     detect_supply_zones,
+    find_zone_invalidations,
     map_supply_demand_zones,
 )
 
@@ -897,3 +900,115 @@ def test_check_zone_invalidation_supply_zone():
     is_invalidated = check_zone_invalidation(zone, bars, 0)
 
     assert is_invalidated is True, "Supply zone should be invalidated"
+
+
+# Batched touch counting and invalidation
+
+
+def _random_zones_and_bars(seed: int, zone_count: int, bar_count: int):
+    """Random walk bars on a 0.05 tick grid so bar prices often equal zone bounds."""
+    import random
+    from datetime import timedelta
+
+    rng = random.Random(seed)
+    base_timestamp = datetime(2024, 1, 1, 9, 30, tzinfo=UTC)
+    bars = []
+    price = 10000  # in 0.01 units
+    for i in range(bar_count):
+        price += rng.choice((-10, -5, 0, 5, 10))
+        low = price - rng.choice((5, 10, 15))
+        high = price + rng.choice((5, 10, 15))
+        close = rng.randint(low, high)
+        bars.append(
+            OHLCVBar(
+                symbol="TEST",
+                timeframe="1d",
+                timestamp=base_timestamp + timedelta(days=i),
+                open=Decimal(price) / 100,
+                high=Decimal(high) / 100,
+                low=Decimal(low) / 100,
+                close=Decimal(close) / 100,
+                volume=1000000,
+                spread=Decimal(high - low) / 100,
+                volume_ratio=rng.choice((Decimal("1.0"), Decimal("1.5"), Decimal("2.0"))),
+            )
+        )
+
+    zones = []
+    for _ in range(zone_count):
+        formation_index = rng.randrange(bar_count)
+        formation_bar = bars[formation_index]
+        zones.append(
+            Zone(
+                zone_type=rng.choice((ZoneType.DEMAND, ZoneType.SUPPLY)),
+                price_range=PriceRange(
+                    low=formation_bar.low,
+                    high=formation_bar.high,
+                    midpoint=(formation_bar.low + formation_bar.high) / 2,
+                    width_pct=(
+                        (formation_bar.high - formation_bar.low) / formation_bar.low
+                    ).quantize(Decimal("0.0001")),
+                ),
+                formation_bar_index=formation_index,
+                formation_timestamp=formation_bar.timestamp,
+                strength=ZoneStrength.FRESH,
+                touch_count=0,
+                formation_volume=1000000,
+                formation_volume_ratio=Decimal("1.8"),
+                formation_spread_ratio=Decimal("0.6"),
+                volume_avg=Decimal("1000000"),
+                close_position=Decimal("0.5"),
+                significance_score=50,
+            )
+        )
+    return zones, bars
+
+
+def test_count_zone_touches_batch_matches_scalar():
+    """Batched counts and last-touch timestamps equal count_zone_touches()."""
+    zones, bars = _random_zones_and_bars(seed=7, zone_count=60, bar_count=300)
+
+    batch_results = count_zone_touches_batch(zones, bars)
+
+    expected = [count_zone_touches(zone, bars, zone.formation_bar_index + 1) for zone in zones]
+    assert batch_results == expected
+    assert any(count > 0 for count, _ in batch_results)
+
+
+def test_count_zone_touches_batch_explicit_start_indices():
+    zones, bars = _random_zones_and_bars(seed=11, zone_count=10, bar_count=80)
+    starts = [0] * len(zones)
+
+    batch_results = count_zone_touches_batch(zones, bars, start_indices=starts)
+
+    assert batch_results == [count_zone_touches(zone, bars, 0) for zone in zones]
+    with pytest.raises(ValueError, match="start_indices count"):
+        count_zone_touches_batch(zones, bars, start_indices=starts[:-1])
+
+
+def test_count_zone_touches_batch_empty_inputs():
+    zones, bars = _random_zones_and_bars(seed=3, zone_count=2, bar_count=5)
+
+    assert count_zone_touches_batch([], bars) == []
+    assert count_zone_touches_batch(zones, []) == [(0, None), (0, None)]
+
+
+def test_find_zone_invalidations_matches_scalar():
+    """First invalidating bar equals a scan with check_zone_invalidation()."""
+    zones, bars = _random_zones_and_bars(seed=5, zone_count=60, bar_count=300)
+
+    batch_results = find_zone_invalidations(zones, bars)
+
+    expected = [
+        next(
+            (
+                i
+                for i in range(zone.formation_bar_index + 1, len(bars))
+                if check_zone_invalidation(zone, bars, i)
+            ),
+            None,
+        )
+        for zone in zones
+    ]
+    assert batch_results == expected
+    assert any(index is not None for index in batch_results)
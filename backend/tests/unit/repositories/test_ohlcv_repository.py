@@ -6,13 +6,16 @@ Uses mocked database session to test repository methods without actual database.
 
 from datetime import UTC, datetime
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+import numpy as np
 import pytest
 from sqlalchemy.exc import IntegrityError
 
 from src.models.ohlcv import OHLCVBar
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
 from src.repositories.ohlcv_repository import OHLCVRepository
 
 
@@ -281,6 +284,87 @@ class TestGetLatestBars:
         assert bars[2].timestamp == datetime(2024, 1, 3, tzinfo=UTC)
 
 
+def lean_row(day: int, **overrides) -> SimpleNamespace:
+    """Plain column row as returned by the lean read selects."""
+    values = {
+        "id": uuid4(),
+        "symbol": "AAPL",
+        "timeframe": "1d",
+        "timestamp": datetime(2024, 1, day, tzinfo=UTC),
+        "open": Decimal("150.00"),
+        "high": Decimal("155.00"),
+        "low": Decimal("148.00"),
+        "close": Decimal("153.00"),
+        "volume": 1000000 + day,
+        "spread": Decimal("7.00"),
+        "spread_ratio": Decimal("1.0"),
+        "volume_ratio": Decimal("1.0"),
+        "low_history_flag": None,
+        "created_at": datetime(2024, 2, 1, tzinfo=UTC),
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestLeanReads:
+    """Test get_bars_lean and get_bar_frame."""
+
+    @pytest.mark.asyncio
+    async def test_get_bars_lean_matches_validated_bars(self, repository, mock_session):
+        rows = [lean_row(1), lean_row(2, timestamp=datetime(2024, 1, 2))]  # naive from SQLite
+        mock_result = MagicMock()
+        mock_result.all.return_value = list(rows)
+        mock_session.execute.return_value = mock_result
+
+        bars = await repository.get_bars_lean("AAPL", "1d")
+
+        assert [bar.model_dump() for bar in bars] == [
+            OHLCVBar.model_validate(row).model_dump() for row in rows
+        ]
+        assert bars[1].timestamp.tzinfo is UTC
+        assert bars[0].id == rows[0].id
+
+    @pytest.mark.asyncio
+    async def test_get_bars_lean_limit_returns_chronological_order(self, repository, mock_session):
+        mock_result = MagicMock()
+        mock_result.all.return_value = [lean_row(3), lean_row(2), lean_row(1)]  # DESC
+        mock_session.execute.return_value = mock_result
+
+        bars = await repository.get_bars_lean("AAPL", "1d", limit=3)
+
+        assert [bar.timestamp.day for bar in bars] == [1, 2, 3]
+        stmt = str(mock_session.execute.call_args.args[0])
+        assert "DESC" in stmt and "LIMIT" in stmt
+
+    @pytest.mark.asyncio
+    async def test_get_bar_frame_columns(self, repository, mock_session):
+        rows = [lean_row(1), lean_row(2, close=Decimal("154.25"))]
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            (row.timestamp, row.open, row.high, row.low, row.close, row.volume) for row in rows
+        ]
+        mock_session.execute.return_value = mock_result
+
+        frame = await repository.get_bar_frame("AAPL", "1d")
+        expected = OHLCVFrame.from_bars([OHLCVBar.model_validate(row) for row in rows])
+
+        assert frame.bars is None
+        for column in ("timestamp", "open", "high", "low", "close", "volume"):
+            assert np.array_equal(getattr(frame, column), getattr(expected, column))
+            assert getattr(frame, column).flags["C_CONTIGUOUS"]
+
+    @pytest.mark.asyncio
+    async def test_get_bar_frame_empty(self, repository, mock_session):
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        frame = await repository.get_bar_frame("AAPL", "1d")
+
+        assert len(frame) == 0
+        assert frame.symbol == "AAPL"
+
+
 class TestBarExists:
     """Test bar_exists method."""
 
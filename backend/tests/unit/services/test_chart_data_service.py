@@ -0,0 +1,62 @@
+"""
+Unit tests for chart data downsampling.
+
+Verifies that downsample_ohlc buckets consecutive bars into candles that keep
+the bucket's open, close, price extremes and total volume.
+"""
+
+import numpy as np
+
+from src.pattern_engine.ohlcv_frame import OHLCVFrame
+from src.services.chart_data_service import downsample_ohlc
+
+
+def make_frame(count: int, seed: int = 7) -> OHLCVFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, count))
+    open_ = np.concatenate(([100.0], close[:-1]))
+    return OHLCVFrame(
+        symbol="AAPL",
+        timeframe="1h",
+        timestamp=np.arange(count, dtype=np.int64) * 3_600_000_000_000,
+        open=open_,
+        high=np.maximum(open_, close) + rng.uniform(0, 2, count),
+        low=np.minimum(open_, close) - rng.uniform(0, 2, count),
+        close=close,
+        volume=rng.integers(1_000, 10_000, count).astype(np.float64),
+    )
+
+
+def test_small_frame_is_returned_unchanged():
+    frame = make_frame(50)
+
+    assert downsample_ohlc(frame, 100) is frame
+
+
+def test_buckets_keep_open_close_extremes_and_volume():
+    frame = make_frame(1000)
+
+    result = downsample_ohlc(frame, 300)
+
+    assert len(result) == 300
+    assert result.open[0] == frame.open[0]
+    assert result.close[-1] == frame.close[-1]
+    assert result.high.max() == frame.high.max()
+    assert result.low.min() == frame.low.min()
+    assert result.volume.sum() == frame.volume.sum()
+    assert np.all(np.diff(result.timestamp) > 0)
+
+
+def test_each_candle_matches_its_bucket():
+    frame = make_frame(10)
+
+    result = downsample_ohlc(frame, 4)
+
+    # Buckets of 10 bars into 4 candles: [0, 2), [2, 5), [5, 7), [7, 10)
+    for candle, (start, stop) in enumerate([(0, 2), (2, 5), (5, 7), (7, 10)]):
+        assert result.timestamp[candle] == frame.timestamp[start]
+        assert result.open[candle] == frame.open[start]
+        assert result.close[candle] == frame.close[stop - 1]
+        assert result.high[candle] == frame.high[start:stop].max()
+        assert result.low[candle] == frame.low[start:stop].min()
+        assert result.volume[candle] == frame.volume[start:stop].sum()
@@ -17,6 +17,7 @@ Test Coverage:
 Author: Story 8.10
 """
 
+import asyncio
 from datetime import UTC, datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, Mock
@@ -1229,3 +1230,272 @@ async def test_process_pattern_returns_rejected_on_validation_fail(
 
     assert isinstance(result, RejectedSignal)
     assert result.rejection_stage == "VOLUME"
+
+
+# ============================================================================
+# Test: Historical Replay
+# ============================================================================
+
+
+def _replay_orchestrator(mock_validators, mock_repositories, detector, bars):
+    """Orchestrator whose volume validator rejects every pattern."""
+    mock_validators["volume"].validate = AsyncMock(
+        return_value=StageValidationResult(
+            stage="VOLUME",
+            status=ValidationStatus.FAIL,
+            reason="Volume too high",
+            validator_id="VOLUME_VALIDATOR",
+        )
+    )
+    mock_repositories["rejection"].log_rejection = AsyncMock(side_effect=lambda r: r)
+
+    market_data_service = Mock()
+    market_data_service.fetch_historical = AsyncMock(return_value=list(bars))
+    market_data_service.fetch_bars = AsyncMock(side_effect=AssertionError("Should not be called"))
+    trading_range_service = Mock()
+    trading_range_service.get_ranges = AsyncMock(
+        return_value=[
+            Mock(
+                start_timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+                end_timestamp=datetime(2024, 1, 2, tzinfo=UTC),
+            ),
+            # Still forming: stored state includes bars through Jan 4
+            Mock(
+                start_timestamp=datetime(2024, 1, 2, tzinfo=UTC),
+                end_timestamp=datetime(2024, 1, 4, tzinfo=UTC),
+            ),
+        ]
+    )
+    volume_service = Mock()
+    volume_service.get_analysis = AsyncMock(return_value=Mock())
+
+    return MasterOrchestrator(
+        market_data_service=market_data_service,
+        trading_range_service=trading_range_service,
+        volume_service=volume_service,
+        pattern_detectors=[detector],
+        volume_validator=mock_validators["volume"],
+        phase_validator=mock_validators["phase"],
+        level_validator=mock_validators["level"],
+        risk_validator=mock_validators["risk"],
+        strategy_validator=mock_validators["strategy"],
+        rejection_repository=mock_repositories["rejection"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_historical_replay_is_point_in_time(mock_validators, mock_repositories):
+    """Test each bar only sees bars and ranges up to its own timestamp."""
+    bars = [Mock(timestamp=datetime(2024, 1, day, tzinfo=UTC)) for day in range(1, 6)]
+    seen: list[tuple[int, int]] = []
+
+    def detect(window, ranges):
+        seen.append((len(window), len(ranges)))
+        assert window[-1] is bars[len(window) - 1]
+        return []
+
+    detector = Mock()
+    detector.detect = Mock(side_effect=detect)
+    orchestrator = _replay_orchestrator(mock_validators, mock_repositories, detector, bars)
+
+    result = await orchestrator.analyze_historical_period(
+        "AAPL", "1d", datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 5, tzinfo=UTC)
+    )
+
+    assert seen == [(1, 0), (2, 1), (3, 1), (4, 2), (5, 2)]
+    orchestrator.market_data_service.fetch_historical.assert_awaited_once()
+    orchestrator.trading_range_service.get_ranges.assert_awaited_once()
+    assert result.metrics.stage_latency_ms["bar"]["count"] == 5
+    assert result.metrics.stage_latency_ms["pattern_detection"]["count"] == 5
+
+
+@pytest.mark.asyncio
+async def test_historical_replay_hides_open_range_until_last_update(
+    mock_validators, mock_repositories
+):
+    """Test an open range is not visible with its final levels from its first bar."""
+    bars = [Mock(timestamp=datetime(2024, 1, day, tzinfo=UTC)) for day in range(1, 6)]
+    # Active since Jan 1, Creek/Ice last moved on Jan 3
+    updated = Mock(
+        start_timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+        end_timestamp=None,
+        updated_at=datetime(2024, 1, 3, tzinfo=UTC),
+    )
+    # No record of when its levels were set
+    unknown = Mock(
+        start_timestamp=datetime(2024, 1, 1, tzinfo=UTC), end_timestamp=None, updated_at=None
+    )
+    seen: list[list[Mock]] = []
+
+    detector = Mock()
+    detector.detect = Mock(side_effect=lambda window, ranges: seen.append(ranges) or [])
+    orchestrator = _replay_orchestrator(mock_validators, mock_repositories, detector, bars)
+    orchestrator.trading_range_service.get_ranges = AsyncMock(return_value=[updated, unknown])
+
+    await orchestrator.analyze_historical_period(
+        "AAPL", "1d", datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 5, tzinfo=UTC)
+    )
+
+    assert seen == [[], [], [updated], [updated], [updated]]
+
+
+@pytest.mark.asyncio
+async def test_historical_replay_validates_each_pattern_once(mock_validators, mock_repositories):
+    """Test a pattern re-detected on later bars is validated only once."""
+    bars = [Mock(timestamp=datetime(2024, 1, day, tzinfo=UTC)) for day in range(1, 5)]
+    pattern = {
+        "id": uuid4(),
+        "pattern_type": "SPRING",
+        "symbol": "AAPL",
+        "entry_price": Decimal("150.00"),
+        "stop_loss": Decimal("148.00"),
+        "target_price": Decimal("156.00"),
+        "bar_timestamp": datetime(2024, 1, 2, tzinfo=UTC),
+    }
+
+    detector = Mock()
+    detector.detect = Mock(side_effect=lambda window, ranges: [pattern] if len(window) > 1 else [])
+    orchestrator = _replay_orchestrator(mock_validators, mock_repositories, detector, bars)
+
+    result = await orchestrator.analyze_historical_period(
+        "AAPL", "1d", datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 4, tzinfo=UTC)
+    )
+
+    assert result.metrics.total_patterns_detected == 1
+    assert result.metrics.total_signals_rejected == 1
+    assert result.metrics.rejection_by_stage == {"VOLUME": 1}
+    assert mock_validators["volume"].validate.await_count == 1
+    assert result.metrics.stage_latency_ms["validation_chain"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_historical_replay_requests_context_as_of_bar(mock_validators, mock_repositories):
+    """Test replayed patterns get market and portfolio context as of their bar."""
+    bars = [Mock(timestamp=datetime(2024, 1, day, tzinfo=UTC)) for day in range(1, 4)]
+    pattern = {
+        "id": uuid4(),
+        "pattern_type": "SPRING",
+        "bar_timestamp": datetime(2024, 1, 2, tzinfo=UTC),
+        "trading_range_id": uuid4(),
+    }
+
+    detector = Mock()
+    detector.detect = Mock(side_effect=lambda window, ranges: [pattern] if len(window) > 1 else [])
+    orchestrator = _replay_orchestrator(mock_validators, mock_repositories, detector, bars)
+    # Stored range was last updated after the bar that detects the pattern
+    orchestrator.trading_range_service.get_by_id = AsyncMock(
+        return_value=Mock(end_timestamp=datetime(2024, 1, 3, tzinfo=UTC))
+    )
+    orchestrator.portfolio_service = Mock()
+    orchestrator.portfolio_service.get_current_context = AsyncMock(return_value={})
+    orchestrator.market_context_builder = Mock()
+    orchestrator.market_context_builder.build = AsyncMock(return_value={})
+    contexts = []
+    orchestrator.run_validation_chain = AsyncMock(
+        side_effect=lambda pattern, context, correlation_id: contexts.append(context)
+    )
+    orchestrator.generate_signal_from_pattern = AsyncMock(return_value=None)
+
+    await orchestrator.analyze_historical_period(
+        "AAPL", "1d", datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 3, tzinfo=UTC)
+    )
+
+    as_of = datetime(2024, 1, 2, tzinfo=UTC)
+    orchestrator.portfolio_service.get_current_context.assert_awaited_once_with(as_of=as_of)
+    assert orchestrator.market_context_builder.build.await_args.kwargs["as_of"] == as_of
+    assert [context.trading_range for context in contexts] == [None]
+
+
+# ============================================================================
+# Test: Validation Context Cache
+# ============================================================================
+
+
+def _context_orchestrator(**kwargs):
+    """Orchestrator with counting volume, portfolio and market context services."""
+    volume_service = Mock()
+    volume_service.get_analysis = AsyncMock(return_value=Mock())
+    portfolio_service = Mock()
+    portfolio_service.get_current_context = AsyncMock(return_value={"total_heat": Decimal("2")})
+    market_context_builder = Mock()
+    market_context_builder.build = AsyncMock(return_value={"market_regime": "RANGING"})
+    return MasterOrchestrator(
+        volume_service=volume_service,
+        portfolio_service=portfolio_service,
+        market_context_builder=market_context_builder,
+        **kwargs,
+    )
+
+
+def _bar_pattern(pattern_type: str) -> dict:
+    return {
+        "id": uuid4(),
+        "pattern_type": pattern_type,
+        "bar_timestamp": datetime(2024, 1, 1, 9, 0, tzinfo=UTC),
+    }
+
+
+@pytest.mark.asyncio
+async def test_context_assembly_shares_fetches_across_patterns():
+    """Test patterns on the same symbol/bar share one fetch of each context input."""
+    orchestrator = _context_orchestrator()
+
+    contexts = await asyncio.gather(
+        orchestrator.build_validation_context(_bar_pattern("SPRING"), "AAPL", "1h"),
+        orchestrator.build_validation_context(_bar_pattern("LPS"), "AAPL", "1h"),
+    )
+
+    assert all(context is not None for context in contexts)
+    assert contexts[0].portfolio_context.total_heat == Decimal("2")
+    orchestrator.volume_service.get_analysis.assert_awaited_once()
+    orchestrator.portfolio_service.get_current_context.assert_awaited_once()
+    orchestrator.market_context_builder.build.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_context_cache_invalidation():
+    """Test fills, new cycles and new bars drop the matching cached inputs."""
+    orchestrator = _context_orchestrator()
+    pattern = _bar_pattern("SPRING")
+
+    await orchestrator.build_validation_context(pattern, "AAPL", "1h")
+    orchestrator.invalidate_portfolio_context()
+    await orchestrator.build_validation_context(pattern, "AAPL", "1h")
+
+    assert orchestrator.portfolio_service.get_current_context.await_count == 2
+    assert orchestrator.market_context_builder.build.await_count == 1
+
+    orchestrator._context_cache.begin_cycle()
+    await orchestrator.build_validation_context(pattern, "AAPL", "1h")
+
+    assert orchestrator.portfolio_service.get_current_context.await_count == 3
+    assert orchestrator.market_context_builder.build.await_count == 2
+    assert orchestrator.volume_service.get_analysis.await_count == 2
+
+    orchestrator._invalidate_cache("AAPL")
+    await orchestrator.build_validation_context(pattern, "AAPL", "1h")
+
+    assert orchestrator.portfolio_service.get_current_context.await_count == 3
+    assert orchestrator.volume_service.get_analysis.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_position_change_event_drops_portfolio_context():
+    """Test a position_changed event on the bus invalidates the portfolio context."""
+    from src.orchestrator.event_bus import EventBus
+    from src.orchestrator.events import PositionChangedEvent
+
+    event_bus = EventBus()
+    orchestrator = _context_orchestrator(event_bus=event_bus)
+    pattern = _bar_pattern("SPRING")
+
+    await orchestrator.build_validation_context(pattern, "AAPL", "1h")
+    await event_bus.publish(
+        PositionChangedEvent(
+            correlation_id=uuid4(), symbol="AAPL", position_id=uuid4(), change="OPENED"
+        )
+    )
+    await orchestrator.build_validation_context(pattern, "AAPL", "1h")
+
+    assert orchestrator.portfolio_service.get_current_context.await_count == 2
+    assert orchestrator.market_context_builder.build.await_count == 1
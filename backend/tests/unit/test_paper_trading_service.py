@@ -908,6 +908,38 @@ class TestUpdatePositions:
         assert position_repo.positions[0].status == "OPEN"
 
 
+class TestPositionChangeEvents:
+    """Fills publish position_changed so cached portfolio context is dropped."""
+
+    @pytest.mark.asyncio
+    async def test_open_and_close_publish_position_changed(self):
+        from src.orchestrator.event_bus import get_event_bus, reset_event_bus
+
+        reset_event_bus()
+        received = []
+
+        async def handler(event):
+            received.append((event.position_id, event.change))
+
+        get_event_bus().subscribe("position_changed", handler)
+        broker = PaperBrokerAdapter(PaperTradingConfig())
+        account_repo = MockPaperAccountRepository()
+        position_repo = MockPaperPositionRepository()
+        service = PaperTradingService(
+            account_repo, position_repo, MockPaperTradeRepository(), broker
+        )
+
+        try:
+            position = await service.execute_signal(create_test_signal(), Decimal("150.00"))
+            await service._close_position(
+                position, Decimal("148.00"), "STOP_LOSS", account_repo.account
+            )
+        finally:
+            reset_event_bus()
+
+        assert received == [(position.id, "OPENED"), (position.id, "CLOSED")]
+
+
 # ---------------------------------------------------------------------------
 # Story 23.8a: calculate_performance_metrics with no account
 # ---------------------------------------------------------------------------
@@ -0,0 +1,236 @@
+"""
+Unit Tests for Paper Trading Background Task (Story 12.8 Task 7)
+
+Tests batched mark-to-market: price sources, stop/target classification,
+one quote lookup per symbol and a single bulk position update.
+
+Author: Story 12.8
+"""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.brokers.paper_broker_adapter import PaperBrokerAdapter
+from src.market_data.realtime.bar_buffer import BarBuffer, get_live_bar_buffer
+from src.models.ohlcv import OHLCVBar
+from src.models.paper_trading import PaperPosition, PaperTradingConfig
+from src.tasks.paper_trading_tasks import (
+    BarBufferPriceSource,
+    PaperTradingTask,
+    StaticPriceSource,
+    mark_to_market,
+)
+
+
+def create_position(symbol: str = "AAPL") -> PaperPosition:
+    """Create an open position: entry 100, stop 95, targets 110/120"""
+    return PaperPosition(
+        signal_id=uuid4(),
+        symbol=symbol,
+        entry_time=datetime.now(UTC),
+        entry_price=Decimal("100.00"),
+        quantity=Decimal("10"),
+        stop_loss=Decimal("95.00"),
+        target_1=Decimal("110.00"),
+        target_2=Decimal("120.00"),
+        current_price=Decimal("100.00"),
+        unrealized_pnl=Decimal("0"),
+        commission_paid=Decimal("1.00"),
+        slippage_cost=Decimal("0.50"),
+    )
+
+
+def create_bar(symbol: str, close: Decimal, timestamp: datetime) -> OHLCVBar:
+    return OHLCVBar(
+        symbol=symbol,
+        timeframe="1m",
+        open=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=1000,
+        spread=Decimal("0"),
+        timestamp=timestamp,
+    )
+
+
+class SessionFactory:
+    """Async context manager factory yielding a mock session"""
+
+    def __init__(self):
+        self.session = AsyncMock()
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def broker():
+    return PaperBrokerAdapter(PaperTradingConfig())
+
+
+def test_mark_to_market_classifies_exits(broker):
+    """Stop beats targets, TARGET_2 beats TARGET_1, the rest are marked"""
+    positions = [create_position(s) for s in ("STOP", "T1", "T2", "OPEN", "EDGE")]
+    prices = {
+        "STOP": Decimal("94.00"),
+        "T1": Decimal("110.00"),
+        "T2": Decimal("125.00"),
+        "OPEN": Decimal("105.00"),
+        "EDGE": Decimal("95.00"),
+    }
+
+    result = mark_to_market(positions, prices, broker, datetime.now(UTC))
+
+    assert [(p.symbol, reason) for p, _, reason in result.exits] == [
+        ("STOP", "STOP_LOSS"),
+        ("T1", "TARGET_1"),
+        ("T2", "TARGET_2"),
+        ("EDGE", "STOP_LOSS"),
+    ]
+    assert [p.symbol for p in result.marked] == ["OPEN"]
+    # (105 - 100) * 10 - 1.00 commission - 0.50 slippage
+    assert result.marked[0].unrealized_pnl == Decimal("48.50")
+    assert result.marked[0].current_price == Decimal("105.00")
+
+
+def test_mark_to_market_matches_broker_checks(broker):
+    """Classification agrees with the broker's per-position checks"""
+    positions = [create_position(f"S{i}") for i in range(40)]
+    prices = {p.symbol: Decimal("90") + Decimal(i) for i, p in enumerate(positions)}
+
+    result = mark_to_market(positions, prices, broker, datetime.now(UTC))
+
+    for position, price, reason in result.exits:
+        if reason == "STOP_LOSS":
+            assert broker.check_stop_hit(position, price)
+        else:
+            assert broker.check_target_hit(position, price) == reason
+    for position in result.marked:
+        assert not broker.check_stop_hit(position, position.current_price)
+        assert broker.check_target_hit(position, position.current_price) is None
+
+
+@pytest.mark.asyncio
+async def test_bar_buffer_price_source_skips_stale_bars():
+    """Only symbols with a fresh latest bar are quoted"""
+    buffer = BarBuffer()
+    now = datetime.now(UTC)
+    buffer.add_bar(create_bar("AAPL", Decimal("150.25"), now - timedelta(minutes=1)))
+    buffer.add_bar(create_bar("MSFT", Decimal("300.00"), now - timedelta(hours=2)))
+
+    source = BarBufferPriceSource(buffer, max_age=timedelta(minutes=5))
+    prices = await source.get_prices(["AAPL", "MSFT", "TSLA"])
+
+    assert prices == {"AAPL": Decimal("150.25")}
+
+
+@pytest.mark.asyncio
+async def test_update_positions_batches_quotes_and_writes(broker):
+    """One quote lookup per cycle and one bulk update for open positions"""
+    positions = [create_position(s) for s in ("AAPL", "AAPL", "MSFT", "TSLA", "SPY")]
+    price_source = StaticPriceSource(
+        {"AAPL": Decimal("105"), "MSFT": Decimal("90"), "TSLA": Decimal("104")}
+    )
+    account = SimpleNamespace(total_unrealized_pnl=Decimal("0"))
+    service = SimpleNamespace(
+        broker=broker,
+        account_repo=SimpleNamespace(get_account=AsyncMock(return_value=account)),
+        position_repo=SimpleNamespace(
+            list_open_positions=AsyncMock(return_value=positions),
+            bulk_update_marks=AsyncMock(),
+            update_position=AsyncMock(),
+        ),
+        _close_position=AsyncMock(),
+        _update_account_metrics=AsyncMock(),
+    )
+    session_factory = SessionFactory()
+    task = PaperTradingTask(session_factory, price_source=price_source)
+    task._create_service = AsyncMock(return_value=service)
+
+    await task._update_positions()
+
+    assert len(price_source.lookups) == 1
+    assert sorted(price_source.lookups[0]) == ["AAPL", "MSFT", "SPY", "TSLA"]
+
+    service.position_repo.bulk_update_marks.assert_awaited_once()
+    marked = service.position_repo.bulk_update_marks.call_args.args[0]
+    assert [p.symbol for p in marked] == ["AAPL", "AAPL", "TSLA"]
+    service.position_repo.update_position.assert_not_awaited()
+
+    service._close_position.assert_awaited_once_with(
+        positions[2], Decimal("90"), "STOP_LOSS", account
+    )
+    service._update_account_metrics.assert_awaited_once_with(account)
+    session_factory.session.commit.assert_awaited_once()
+
+
+def test_update_positions_defaults_to_live_bar_buffer():
+    """Without an explicit source, quotes come from the live feed's bar buffer"""
+    task = PaperTradingTask(SessionFactory())
+
+    assert isinstance(task.price_source, BarBufferPriceSource)
+    assert task.price_source.bar_source is get_live_bar_buffer()
+
+
+@pytest.mark.asyncio
+async def test_update_positions_without_quotes_skips_writes(broker):
+    """No quotes means no marks and no commit"""
+    position_repo = SimpleNamespace(
+        list_open_positions=AsyncMock(return_value=[create_position()]),
+        bulk_update_marks=AsyncMock(),
+    )
+    service = SimpleNamespace(
+        broker=broker,
+        account_repo=SimpleNamespace(get_account=AsyncMock(return_value=SimpleNamespace())),
+        position_repo=position_repo,
+    )
+    session_factory = SessionFactory()
+    task = PaperTradingTask(session_factory, price_source=StaticPriceSource())
+    task._create_service = AsyncMock(return_value=service)
+
+    await task._update_positions()
+
+    position_repo.bulk_update_marks.assert_not_awaited()
+    session_factory.session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_mark_write_does_not_block_exits(broker):
+    """Stop-loss closes run before the bulk mark write, which fails in isolation"""
+    positions = [create_position("STOP"), create_position("OPEN")]
+    price_source = StaticPriceSource({"STOP": Decimal("94"), "OPEN": Decimal("105")})
+    account = SimpleNamespace(total_unrealized_pnl=Decimal("0"))
+    service = SimpleNamespace(
+        broker=broker,
+        account_repo=SimpleNamespace(get_account=AsyncMock(return_value=account)),
+        position_repo=SimpleNamespace(
+            list_open_positions=AsyncMock(return_value=positions),
+            bulk_update_marks=AsyncMock(side_effect=RuntimeError("deadlock")),
+        ),
+        _close_position=AsyncMock(),
+        _update_account_metrics=AsyncMock(),
+    )
+    session_factory = SessionFactory()
+    task = PaperTradingTask(session_factory, price_source=price_source)
+    task._create_service = AsyncMock(return_value=service)
+
+    await task._update_positions()
+
+    service._close_position.assert_awaited_once_with(
+        positions[0], Decimal("94"), "STOP_LOSS", account
+    )
+    session_factory.session.rollback.assert_awaited_once()
+    service._update_account_metrics.assert_awaited_once_with(account)
+    session_factory.session.commit.assert_awaited_once()
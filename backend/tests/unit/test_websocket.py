@@ -7,13 +7,21 @@ Tests ConnectionManager functionality:
 - Broadcast to all connections
 - Event emission methods
 - Graceful disconnect handling
+- Topic subscriptions
 """
 
+import asyncio
+import json
 from unittest.mock import AsyncMock
 
 import pytest
 
-from src.api.websocket import ConnectionManager
+from src.api.websocket import ConnectionManager, message_topics
+
+
+def _frames(ws) -> list[dict]:
+    """Broadcast frames sent to a mock WebSocket (pre-serialized text)."""
+    return [json.loads(call.args[0]) for call in ws.send_text.call_args_list]
 
 
 @pytest.fixture
@@ -130,19 +138,17 @@ async def test_broadcast_sends_to_all_connections(manager):
 
     # Act
     await manager.broadcast({"type": "broadcast_test", "data": "hello"})
+    await manager.drain()
 
-    # Assert
-    ws1.send_json.assert_called_once()
-    ws2.send_json.assert_called_once()
-
-    # Verify both received message with different sequence numbers
-    msg1 = ws1.send_json.call_args[0][0]
-    msg2 = ws2.send_json.call_args[0][0]
+    # Assert: same pre-serialized frame (one global sequence number) to both
+    ws1.send_text.assert_called_once()
+    ws2.send_text.assert_called_once()
+    assert ws1.send_text.call_args[0][0] == ws2.send_text.call_args[0][0]
 
+    msg1 = _frames(ws1)[0]
     assert msg1["type"] == "broadcast_test"
-    assert msg2["type"] == "broadcast_test"
     assert msg1["sequence_number"] == 1  # First message after connected
-    assert msg2["sequence_number"] == 1  # First message after connected
+    assert len(manager._message_buffer) == 1  # Buffered once, not per client
 
 
 @pytest.mark.asyncio
@@ -161,10 +167,11 @@ async def test_emit_pattern_detected_broadcasts_correct_format(manager, mock_web
         phase="C",
         test_confirmed=True,
     )
+    await manager.drain()
 
     # Assert
-    mock_websocket.send_json.assert_called_once()
-    sent_message = mock_websocket.send_json.call_args[0][0]
+    mock_websocket.send_text.assert_called_once()
+    sent_message = _frames(mock_websocket)[0]
 
     assert sent_message["type"] == "pattern_detected"
     assert sent_message["sequence_number"] == 1
@@ -194,10 +201,11 @@ async def test_emit_signal_generated_broadcasts_correct_format(manager, mock_web
 
     # Act
     await manager.emit_signal_generated(signal_data)
+    await manager.drain()
 
     # Assert
-    mock_websocket.send_json.assert_called_once()
-    sent_message = mock_websocket.send_json.call_args[0][0]
+    mock_websocket.send_text.assert_called_once()
+    sent_message = _frames(mock_websocket)[0]
 
     assert sent_message["type"] == "signal:new"
     assert sent_message["data"] == signal_data
@@ -212,10 +220,11 @@ async def test_emit_portfolio_updated_broadcasts_correct_format(manager, mock_we
 
     # Act
     await manager.emit_portfolio_updated(total_heat="0.75", available_capacity="0.25")
+    await manager.drain()
 
     # Assert
-    mock_websocket.send_json.assert_called_once()
-    sent_message = mock_websocket.send_json.call_args[0][0]
+    mock_websocket.send_text.assert_called_once()
+    sent_message = _frames(mock_websocket)[0]
 
     assert sent_message["type"] == "portfolio:updated"
     assert sent_message["data"]["total_heat"] == "0.75"
@@ -234,10 +243,11 @@ async def test_emit_campaign_updated_broadcasts_correct_format(manager, mock_web
     await manager.emit_campaign_updated(
         campaign_id="campaign-789", risk_allocated="0.35", positions_count=5
     )
+    await manager.drain()
 
     # Assert
-    mock_websocket.send_json.assert_called_once()
-    sent_message = mock_websocket.send_json.call_args[0][0]
+    mock_websocket.send_text.assert_called_once()
+    sent_message = _frames(mock_websocket)[0]
 
     assert sent_message["type"] == "campaign:updated"
     assert sent_message["data"]["campaign_id"] == "campaign-789"
@@ -299,3 +309,217 @@ async def test_multiple_connections_tracked_independently(manager):
     # Verify sequence number for second connection starts at 1
     assert ws2.send_json.call_count == 1
     assert ws2.send_json.call_args[0][0]["sequence_number"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_delay_others(manager):
+    """Test that a blocked client only delays its own writer task."""
+    release = asyncio.Event()
+
+    async def blocked_send(frame):
+        await release.wait()
+
+    slow_ws = AsyncMock()
+    slow_ws.send_text = AsyncMock(side_effect=blocked_send)
+    fast_ws = AsyncMock()
+
+    await manager.connect(slow_ws)
+    fast_id = await manager.connect(fast_ws)
+
+    for i in range(3):
+        await manager.broadcast({"type": "tick", "data": i})
+    await asyncio.wait_for(manager.active_connections[fast_id].queue.join(), timeout=1)
+
+    assert [frame["data"] for frame in _frames(fast_ws)] == [0, 1, 2]
+    assert slow_ws.send_text.call_count == 1
+
+    release.set()
+    await asyncio.wait_for(manager.drain(), timeout=1)
+    assert slow_ws.send_text.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_drain_returns_after_writer_send_fails(manager):
+    """Test frames queued behind a failed send do not block drain()."""
+    ws = AsyncMock()
+    ws.send_text = AsyncMock(side_effect=RuntimeError("socket closed"))
+    connection_id = await manager.connect(ws)
+    client = manager.active_connections[connection_id]
+
+    for i in range(3):
+        await manager.broadcast({"type": "tick", "data": i})
+    await asyncio.wait_for(client.queue.join(), timeout=1)
+
+    assert client.queue.empty()
+    assert connection_id not in manager.active_connections
+    assert ws.send_text.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_drain_returns_when_writer_is_cancelled(manager):
+    """Test drain() waiting on a client completes once its writer is cancelled."""
+    blocked = asyncio.Event()
+
+    async def blocked_send(frame):
+        await blocked.wait()
+
+    ws = AsyncMock()
+    ws.send_text = AsyncMock(side_effect=blocked_send)
+    connection_id = await manager.connect(ws)
+
+    for i in range(3):
+        await manager.broadcast({"type": "tick", "data": i})
+    drain = asyncio.create_task(manager.drain())
+    await asyncio.sleep(0)
+
+    await manager.disconnect(connection_id)
+    await asyncio.wait_for(drain, timeout=1)
+
+    assert ws.send_text.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_frames():
+    """Test drop_oldest keeps the newest frames of a backed-up client."""
+    manager = ConnectionManager(queue_size=2, overflow_policy="drop_oldest")
+    ws = AsyncMock()
+    connection_id = await manager.connect(ws)
+
+    # No await between broadcasts: the writer cannot drain in between
+    for i in range(5):
+        await manager.broadcast({"type": "tick", "data": i})
+    client = manager.active_connections[connection_id]
+    await manager.drain()
+
+    assert client.dropped == 3
+    assert [frame["data"] for frame in _frames(ws)] == [3, 4]
+    # Dropped frames remain recoverable
+    assert [m["data"] for m in manager.get_messages_since(0)] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_disconnects_slow_client():
+    """Test disconnect policy removes and closes a backed-up client."""
+    manager = ConnectionManager(queue_size=1, overflow_policy="disconnect")
+    ws = AsyncMock()
+    connection_id = await manager.connect(ws)
+
+    await manager.broadcast({"type": "tick", "data": 0})
+    await manager.broadcast({"type": "tick", "data": 1})
+    assert len(manager._close_tasks) == 1
+    await asyncio.gather(*manager._close_tasks)
+
+    assert connection_id not in manager.active_connections
+    ws.close.assert_awaited_once()
+    assert not manager._close_tasks
+
+
+def test_message_buffer_since_after_wraparound():
+    """Test recovery lookups across the ring buffer wrap point."""
+    manager = ConnectionManager()
+    buffer = manager._message_buffer
+    for seq in range(1, 701):
+        buffer.append((seq, float(seq), {"sequence_number": seq}))
+
+    assert len(buffer) == 500
+    assert buffer[0][0] == 201
+    assert buffer[-1][0] == 700
+    assert [m["sequence_number"] for m in buffer.since(697, 0.0)] == [698, 699, 700]
+    assert [m["sequence_number"] for m in buffer.since(0, 698.0)] == [699, 700]
+    assert len(buffer.since(0, 0.0)) == 500
+
+
+@pytest.mark.asyncio
+async def test_subscribed_client_receives_only_its_topics(manager):
+    """Test emits reach subscribers of their topics plus unsubscribed clients."""
+    aapl_ws, portfolio_ws, all_ws = AsyncMock(), AsyncMock(), AsyncMock()
+    aapl_id = await manager.connect(aapl_ws)
+    portfolio_id = await manager.connect(portfolio_ws)
+    await manager.connect(all_ws)
+
+    manager.subscribe(aapl_id, ["symbol:aapl"])
+    manager.subscribe(portfolio_id, ["type:portfolio:updated"])
+
+    await manager.emit_pattern_detected("p1", "AAPL", "SPRING", 85, "C", True)
+    await manager.emit_pattern_detected("p2", "MSFT", "SOS", 80, "D", False)
+    await manager.emit_portfolio_updated("5.0", "5.0")
+    await manager.drain()
+
+    assert [f["data"]["id"] for f in _frames(aapl_ws)] == ["p1"]
+    assert [f["type"] for f in _frames(portfolio_ws)] == ["portfolio:updated"]
+    assert len(_frames(all_ws)) == 3
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_last_topic_restores_full_stream(manager, mock_websocket):
+    """Test a client without topics receives every event again."""
+    connection_id = await manager.connect(mock_websocket)
+
+    assert manager.subscribe(connection_id, ["campaign:c-1", "symbol:SPY"]) == {
+        "campaign:c-1",
+        "symbol:SPY",
+    }
+    assert manager.unsubscribe(connection_id, ["campaign:c-1", "symbol:SPY"]) == set()
+    assert manager._subscribers == {}
+
+    await manager.emit_portfolio_updated("1.0", "9.0")
+    await manager.drain()
+    assert len(_frames(mock_websocket)) == 1
+
+
+@pytest.mark.asyncio
+async def test_disconnect_removes_subscriptions(manager, mock_websocket):
+    """Test disconnect clears the topic index."""
+    connection_id = await manager.connect(mock_websocket)
+    manager.subscribe(connection_id, ["symbol:AAPL"])
+
+    await manager.disconnect(connection_id)
+
+    assert manager._subscribers == {}
+    assert connection_id not in manager._unfiltered
+
+
+@pytest.mark.asyncio
+async def test_client_subscription_messages(manager, mock_websocket):
+    """Test subscribe requests from the client are applied and acknowledged."""
+    connection_id = await manager.connect(mock_websocket)
+
+    await manager.handle_client_message(
+        connection_id, json.dumps({"action": "subscribe", "topics": ["symbol:aapl"]})
+    )
+    await manager.handle_client_message(
+        connection_id, json.dumps({"action": "subscribe", "topics": ["sector:TECH"]})
+    )
+    await manager.handle_client_message(connection_id, "ping")
+    await manager.drain()
+
+    ack, error = _frames(mock_websocket)
+    assert ack["type"] == "subscriptions"
+    assert ack["topics"] == ["symbol:AAPL"]
+    assert error["type"] == "error"
+    assert manager.active_connections[connection_id].topics == {"symbol:AAPL"}
+
+
+@pytest.mark.asyncio
+async def test_batch_update_routed_by_item_symbols(manager):
+    """Test batch updates reach subscribers of any symbol in the batch."""
+    spy_ws, qqq_ws = AsyncMock(), AsyncMock()
+    manager.subscribe(await manager.connect(spy_ws), ["symbol:SPY"])
+    manager.subscribe(await manager.connect(qqq_ws), ["symbol:QQQ"])
+
+    await manager.emit_batch_update([{"symbol": "SPY"}], [{"symbol": "IWM"}])
+    await manager.drain()
+
+    assert [f["type"] for f in _frames(spy_ws)] == ["batch_update"]
+    assert _frames(qqq_ws) == []
+
+
+def test_message_topics():
+    """Test topics derived from message type, symbol and campaign id."""
+    message = {"type": "signal:new", "data": {"symbol": "aapl", "campaign_id": "c-9"}}
+
+    assert message_topics(message) == {"type:signal:new", "symbol:AAPL", "campaign:c-9"}
+    assert message_topics({"type": "signal_approved", "symbol": "SPY"}) == {
+        "type:signal_approved",
+        "symbol:SPY",
+    }